@@ -0,0 +1,452 @@
+# Copyright (C) 2023 IBM CORPORATION
+# Author(s): Sanjaikumaar M <sanjaikumaar.m@ibm.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+import sys
+import threading
+
+from ansible.module_utils._text import to_native
+from ansible.plugins.action import ActionBase
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import (
+    IBMSVCRestApi,
+    IBMSVCRestApiError,
+    SVCClusterExit,
+    SVCPluginModule,
+    get_command_plan,
+    get_logger,
+    get_perf_recorder,
+    run_concurrently
+)
+
+# The entries are validated as the modules would, which needs
+# ansible-core 2.11 or later
+try:
+    from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+    from ansible.module_utils.errors import UnsupportedError
+except ImportError:
+    ArgumentSpecValidator = None
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_sv_desired_state import (
+    DESIRED_STATE_KINDS,
+    desired_state_argument_spec
+)
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_sv_manage_provisioning_policy import IBMSVProvisioningPolicy
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_sv_manage_replication_policy import IBMSVReplicationPolicy
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_sv_manage_snapshotpolicy import IBMSVCSnapshotPolicy
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_svc_host import IBMSVChost
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_svc_hostcluster import IBMSVChostcluster
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_svc_manage_volume import IBMSVCvolume
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_svc_manage_volumegroup import IBMSVCVG
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_svc_mdiskgrp import IBMSVCmdiskgrp
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_svc_vol_map import IBMSVCvdiskhostmap
+
+# Module class, listing command and options, attribute naming the listed
+# objects, method probing an object, and dependency level of every kind.
+# Objects of a level only depend on objects of lower levels.
+KINDS = {
+    'provisioningpolicies': (IBMSVProvisioningPolicy, 'lsprovisioningpolicy', None, 'name', 'is_pp_exists', 0),
+    'replicationpolicies': (IBMSVReplicationPolicy, 'lsreplicationpolicy', None, 'name', 'is_rp_exists', 0),
+    'snapshotpolicies': (IBMSVCSnapshotPolicy, 'lssnapshotschedule', None, 'policy_name', 'policy_exists', 0),
+    'hostclusters': (IBMSVChostcluster, 'lshostcluster', None, 'name', 'get_existing_hostcluster', 0),
+    'pools': (IBMSVCmdiskgrp, 'lsmdiskgrp', None, 'name', 'mdiskgrp_exists', 1),
+    'hosts': (IBMSVChost, 'lshost', None, 'name', 'get_existing_host', 1),
+    'volumegroups': (IBMSVCVG, 'lsvolumegroup', None, 'name', 'get_existing_vg', 2),
+    'volumes': (IBMSVCvolume, 'lsvdisk', {'bytes': True}, 'name', 'get_existing_volume', 3),
+    'mappings': (IBMSVCvdiskhostmap, 'lshostvdiskmap', None, None, None, 4)
+}
+
+# Parameters every entry takes from the task
+CONNECTION_PARAMETERS = ('clustername', 'domain', 'username', 'password', 'token', 'validate_certs',
+                         'log_path', 'token_cache_path', 'pool_size', 'idle_timeout', 'perf_summary')
+
+# Parameters of the modules that entries cannot take
+UNSUPPORTED_PARAMETERS = {
+    'volumes': ('volumes', 'parallelism')
+}
+
+MAPPING_PARAMETERS = ('volume', 'host', 'hostcluster', 'state')
+
+# Keyword arguments of AnsibleModule that ArgumentSpecValidator checks too
+VALIDATION_RULES = ('mutually_exclusive', 'required_together', 'required_one_of', 'required_if', 'required_by')
+
+# Serializes the instantiation of module classes, which replaces the
+# AnsibleModule of their module for a while
+_construct_lock = threading.Lock()
+
+
+class SVCEntryModule(object):
+    """ Stands in for the AnsibleModule of a module class instantiated for
+    one entry of the desired state. The entry is validated against the
+    argument_spec of the module, and exit_json and fail_json raise
+    SVCClusterExit instead of exiting.
+    """
+
+    def __init__(self, argument_spec, rules, params, check_mode):
+        validated = ArgumentSpecValidator(argument_spec, **rules).validate(params)
+        if validated.error_messages:
+            msg = validated.errors.msg
+            if isinstance(validated.errors[0], UnsupportedError):
+                msg = 'Unsupported parameters: {0}'.format(msg)
+            raise SVCClusterExit(dict(failed=True, msg=msg))
+        self.params = validated.validated_parameters
+        self.check_mode = check_mode
+        # The result of the task carries the summary of all requests, and
+        # the commands planned for every entry
+        self._svc_perf_reported = True
+        self._svc_plan_reported = True
+
+    def jsonify(self, data):
+        return json.dumps(data)
+
+    def exit_json(self, **kwargs):
+        raise SVCClusterExit(kwargs)
+
+    def fail_json(self, msg, **kwargs):
+        kwargs.update(msg=msg, failed=True)
+        raise SVCClusterExit(kwargs)
+
+
+def construct(cls, params, check_mode):
+    """
+    Instantiates the class of a module for params instead of the arguments
+    of a module run.
+
+    :param cls: class of the module, such as IBMSVChost
+    :param params: parameters of the module
+    :type params: dict
+    :param check_mode: whether changes are only planned
+    :type check_mode: bool
+    :returns: instance of cls
+    """
+    namespace = vars(sys.modules[cls.__module__])
+
+    def entry_module(argument_spec, **kwargs):
+        rules = dict((key, value) for key, value in kwargs.items() if key in VALIDATION_RULES)
+        return SVCEntryModule(argument_spec, rules, params, check_mode)
+
+    with _construct_lock:
+        ansible_module = namespace['AnsibleModule']
+        namespace['AnsibleModule'] = entry_module
+        try:
+            return cls()
+        finally:
+            namespace['AnsibleModule'] = ansible_module
+
+
+class SVCSnapshotRestApi(object):
+    """ Answers the listings of the snapshot, and passes every other
+    request on to the REST API
+    """
+
+    def __init__(self, restapi, listings):
+        self.restapi = restapi
+        self.listings = listings
+
+    def __getattr__(self, name):
+        return getattr(self.restapi, name)
+
+    def svc_obj_info(self, cmd, cmdopts, cmdargs, timeout=10, stream=False, cache=True):
+        key = listing_key(cmd, cmdopts)
+        if cmdargs is None and key in self.listings:
+            return list(self.listings[key])
+        return self.restapi.svc_obj_info(cmd, cmdopts, cmdargs, timeout=timeout, stream=stream, cache=cache)
+
+
+def listing_key(cmd, cmdopts):
+    return cmd, json.dumps(cmdopts or {}, sort_keys=True)
+
+
+class SVCDesiredState(object):
+    """ Reconciles a storage system with the desired state described by the
+    task arguments
+    """
+
+    def __init__(self, params, check_mode):
+        self.params = params
+        self.check_mode = check_mode
+        self.parallelism = params['parallelism']
+
+        log = get_logger(self.__class__.__name__, params['log_path'])
+        self.log = log.info
+
+        self.restapi = IBMSVCRestApi(
+            module=SVCPluginModule(params),
+            clustername=params['clustername'],
+            domain=params['domain'],
+            username=params['username'],
+            password=params['password'],
+            validate_certs=params['validate_certs'],
+            log_path=params['log_path'],
+            token=params['token'],
+            token_cache_path=params['token_cache_path'],
+            pool_size=params['pool_size'],
+            idle_timeout=params['idle_timeout']
+        )
+
+        # Listings of the snapshot, and the objects of every kind by name,
+        # kept up to date with the entries applied
+        self.listings = {}
+        self.objects = dict((kind, {}) for kind in DESIRED_STATE_KINDS)
+
+    def entry_params(self, kind, entry):
+        """ Parameters of the module of kind for an entry """
+        supported = [key for key in entry if key not in CONNECTION_PARAMETERS + UNSUPPORTED_PARAMETERS.get(kind, ())]
+        if len(supported) != len(entry):
+            raise SVCClusterExit(dict(failed=True, msg='Parameters {0} not supported in [{1}].'.format(
+                sorted(set(entry) - set(supported)), kind)))
+        params = dict(entry, state=entry.get('state') or 'present')
+        if params['state'] not in ('present', 'absent'):
+            raise SVCClusterExit(dict(failed=True, msg='Invalid state [{0}] in [{1}].'.format(params['state'], kind)))
+        params.update((key, self.params[key]) for key in CONNECTION_PARAMETERS)
+        # Instantiating does not authenticate, the REST API session of the
+        # task replaces the one of the instance
+        params.update(token=self.restapi.token, token_cache_path=None, perf_summary=False)
+        return params
+
+    def mapping_groups(self, entries):
+        """ Mappings grouped per state and host or host cluster, as the
+        parameters of ibm_svc_vol_map for each group
+        """
+        groups = {}
+        for entry in entries:
+            unsupported = sorted(set(entry) - set(MAPPING_PARAMETERS))
+            if unsupported:
+                raise SVCClusterExit(dict(failed=True, msg='Parameters {0} not supported in [mappings].'.format(unsupported)))
+            if not entry.get('volume') or bool(entry.get('host')) == bool(entry.get('hostcluster')):
+                raise SVCClusterExit(dict(failed=True, msg='Every entry of [mappings] requires a volume, '
+                                                           'and either a host or a hostcluster.'))
+            kind = 'host' if entry.get('host') else 'hostcluster'
+            key = (entry.get('state') or 'present', kind, entry[kind])
+            groups.setdefault(key, []).append(entry['volume'])
+        return [dict(state=state, volumes=volumes, **{kind + 's': [target]})
+                for (state, kind, target), volumes in sorted(groups.items())]
+
+    def probe(self, kind, instance):
+        """ Makes instance answer whether its object exists from the
+        snapshot, and only fetch the detailed view of an existing object
+        when its attributes are compared
+        """
+        getter = KINDS[kind][4]
+        original = getattr(instance, getter)
+        objects = self.objects[kind]
+
+        def detailed():
+            if instance.state != 'present':
+                return False
+            if kind == 'hosts':
+                return bool(instance.fcwwpn or instance.iscsiname or instance.nqn or instance.type)
+            if kind == 'volumes':
+                return instance.needs_volume_details()
+            return kind != 'hostclusters'
+
+        def get_existing(*args, **kwargs):
+            name = (args[0] if args else kwargs.get('name')) or instance.name
+            record = objects.get(name)
+            if record is None:
+                return {}
+            if detailed():
+                return original(*args, **kwargs)
+            return [record] if kind == 'volumes' else record
+
+        setattr(instance, getter, get_existing)
+        if kind == 'hosts':
+            instance.get_existing_hostcluster = lambda: self.objects['hostclusters'].get(instance.hostcluster)
+
+    def plan(self):
+        """ Instantiates the module of every entry, which validates it,
+        before anything is listed or changed
+        :return: entries with their kind, name, state, level and instance,
+                 and the errors of the invalid ones
+        :rtype: tuple
+        """
+        entries = []
+        errors = []
+        for kind in DESIRED_STATE_KINDS:
+            items = self.params[kind] or []
+            try:
+                if kind == 'mappings':
+                    items = self.mapping_groups(items)
+                else:
+                    names = [item.get('name') for item in items]
+                    duplicates = sorted(set(name for name in names if name and names.count(name) > 1))
+                    if duplicates:
+                        raise SVCClusterExit(dict(failed=True, msg='Duplicate names in [{0}]: {1}'.format(kind, duplicates)))
+            except SVCClusterExit as e:
+                errors.append('[{0}] {1}'.format(kind, e.result['msg']))
+                continue
+            cls, level = KINDS[kind][0], KINDS[kind][5]
+            for index, item in enumerate(items):
+                try:
+                    instance = construct(cls, self.entry_params(kind, item), self.check_mode)
+                except SVCClusterExit as e:
+                    errors.append('[{0}] entry {1}: {2}'.format(kind, index, e.result['msg']))
+                    continue
+                instance.restapi = self.restapi
+                entries.append(dict(kind=kind, state=instance.state, level=level, instance=instance,
+                                    name=getattr(instance, 'name', None)))
+        return entries, errors
+
+    def snapshot(self, entries):
+        """ Lists the objects of every kind described, concurrently """
+        listings = set()
+        for entry in entries:
+            listings.add(listing_key(*KINDS[entry['kind']][1:3]))
+            if entry['kind'] == 'hosts' and entry['instance'].hostcluster:
+                listings.add(listing_key('lshostcluster', None))
+            if entry['kind'] == 'mappings' and entry['instance'].hostclusters:
+                listings.add(listing_key('lshostclustervolumemap', None))
+        listings = sorted(listings)
+
+        def fetch(key):
+            cmd, cmdopts = key[0], json.loads(key[1]) or None
+            return list(self.restapi.svc_obj_info(cmd, cmdopts, None, stream=True) or [])
+
+        outcomes = run_concurrently(fetch, listings, self.parallelism)
+        for key, outcome in zip(listings, outcomes):
+            if isinstance(outcome, Exception):
+                raise outcome
+            self.listings[key] = outcome
+            self.log("snapshot %s: %d objects", key[0], len(outcome))
+
+        for kind, spec in KINDS.items():
+            cmd, cmdopts, attribute = spec[1], spec[2], spec[3]
+            if attribute:
+                self.objects[kind] = dict((item[attribute], item)
+                                          for item in self.listings.get(listing_key(cmd, cmdopts), []))
+
+        for entry in entries:
+            if entry['kind'] == 'mappings':
+                entry['instance'].restapi = SVCSnapshotRestApi(self.restapi, self.listings)
+            else:
+                self.probe(entry['kind'], entry['instance'])
+
+    def stages(self, entries):
+        """ Groups the entries into stages, deletions from the highest level
+        down first, then the other entries from the lowest level up
+        """
+        levels = sorted(set(entry['level'] for entry in entries))
+        stages = []
+        for state, order in (('absent', reversed(levels)), ('present', levels)):
+            for level in order:
+                stage = [entry for entry in entries if entry['level'] == level and entry['state'] == state]
+                if stage:
+                    stages.append(stage)
+        return stages
+
+    def apply_entry(self, entry):
+        try:
+            entry['instance'].apply()
+        except SVCClusterExit as e:
+            return e.result
+        return dict(changed=False)
+
+    def entry_results(self, entry, outcome):
+        """ Results of an entry, one per mapping for a group of mappings """
+        if isinstance(outcome, IBMSVCRestApiError):
+            outcome = dict(failed=True, msg=outcome.msg)
+        elif isinstance(outcome, Exception):
+            outcome = dict(failed=True, msg='Module failed. Error [%s].' % to_native(outcome))
+        result = dict(kind=entry['kind'], state=entry['state'], changed=bool(outcome.get('changed')),
+                      msg=outcome.get('msg'))
+        if outcome.get('failed'):
+            result['failed'] = True
+        if entry['kind'] != 'mappings':
+            return [dict(result, name=entry['name'])]
+
+        instance = entry['instance']
+        mappings = outcome.get('mappings') or [
+            {'volume': volume, 'host' if instance.hosts else 'hostcluster': target}
+            for target in (instance.hosts or instance.hostclusters) for volume in instance.volumes
+        ]
+        results = []
+        for mapping in mappings:
+            mapping = dict(mapping)
+            mapping_result = dict(result, name=mapping.pop('volume'), changed=mapping.pop('changed', False))
+            if 'error' in mapping:
+                mapping_result.update(failed=True, msg=mapping.pop('error'))
+            mapping_result.update(mapping)
+            results.append(mapping_result)
+        return results
+
+    def apply(self):
+        entries, errors = self.plan()
+        if errors:
+            return dict(failed=True, changed=False, msg='Invalid desired state: {0}'.format('; '.join(errors)),
+                        results=[], stages=[])
+
+        plan = get_command_plan()
+        if self.check_mode:
+            plan.reset()
+        self.snapshot(entries)
+        stages = self.stages(entries)
+        results = []
+        failed = False
+        for index, stage in enumerate(stages):
+            if failed:
+                outcomes = [dict(skipped=True, msg='skipped after a failure in an earlier stage')] * len(stage)
+            else:
+                self.log("stage %d: %d %s entries", index, len(stage), stage[0]['state'])
+                outcomes = run_concurrently(self.apply_entry, stage, self.parallelism)
+            for entry, outcome in zip(stage, outcomes):
+                entry_results = self.entry_results(entry, outcome)
+                for result in entry_results:
+                    result['stage'] = index
+                    if isinstance(outcome, dict) and outcome.get('skipped'):
+                        result['skipped'] = True
+                results.extend(entry_results)
+                if any(result.get('failed') for result in entry_results):
+                    failed = True
+                elif entry['kind'] != 'mappings':
+                    # Later stages see the objects planned or changed by this one
+                    if entry['state'] == 'present':
+                        self.objects[entry['kind']].setdefault(entry['name'], {'name': entry['name']})
+                    else:
+                        self.objects[entry['kind']].pop(entry['name'], None)
+
+        result = dict(
+            changed=any(r['changed'] for r in results),
+            results=results,
+            stages=[dict(state=stage[0]['state'], kinds=sorted(set(entry['kind'] for entry in stage)))
+                    for stage in stages]
+        )
+        failures = ['{0}/{1}'.format(r['kind'], r['name']) for r in results if r.get('failed')]
+        if failures:
+            result.update(failed=True, msg='Failed to reconcile {0}.'.format(', '.join(failures)))
+        elif self.check_mode:
+            result['msg'] = 'skipping changes due to check mode'
+        else:
+            result['msg'] = '%d entries applied in %d stages, %d changed.' % (
+                len(results), len(stages), len([r for r in results if r['changed']]))
+        if self.check_mode:
+            result.update(plan.summary())
+        return result
+
+
+class ActionModule(ActionBase):
+
+    _supports_check_mode = True
+    _supports_async = False
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        if ArgumentSpecValidator is None:
+            result.update(failed=True, changed=False,
+                          msg='ibm_sv_desired_state requires ansible-core 2.11 or later.')
+            return result
+
+        _, params = self.validate_argument_spec(argument_spec=desired_state_argument_spec())
+        perf = get_perf_recorder()
+        perf.reset()
+        try:
+            result.update(SVCDesiredState(params, self._task.check_mode).apply())
+        except (IBMSVCRestApiError, SVCClusterExit) as e:
+            result.update(failed=True, changed=False, msg=to_native(e))
+        if params['perf_summary']:
+            result['_perf'] = perf.summary()
+        return result
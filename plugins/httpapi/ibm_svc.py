@@ -0,0 +1,115 @@
+# Copyright (C) 2023 IBM CORPORATION
+# Author(s): Sanjaikumaar M <sanjaikumaar.m@ibm.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: ibm_svc
+short_description: HttpApi plugin for the REST API of IBM Spectrum Virtualize family storage systems
+version_added: '1.13.0'
+description:
+  - Keeps an authenticated REST API session to an IBM Spectrum Virtualize family storage system,
+    and its keep-alive HTTPS connections, in the persistent connection process.
+  - The REST API modules of this collection send their requests through this session when they run
+    with C(ansible_connection=ansible.netcommon.httpapi) and C(ansible_network_os=ibm.spectrum_virtualize.ibm_svc),
+    so that the tasks of a play share one token and its connections instead of authenticating and
+    connecting again in every task.
+  - The storage system is the one in C(ansible_host), the REST API user is C(ansible_user) and its
+    password is C(ansible_httpapi_password).
+  - The REST API is reached over HTTPS, whatever C(ansible_httpapi_use_ssl) is, on port 7443 unless
+    C(ansible_httpapi_port) is set. Certificates are validated unless C(ansible_httpapi_validate_certs) is false.
+  - An expired or revoked token is replaced automatically, and the request retried once.
+author:
+  - Sanjaikumaar M (@sanjaikumaar)
+notes:
+  - The I(clustername) of the modules remains required, but I(username), I(password), I(token),
+    I(domain) and I(validate_certs) are ignored when the requests go through this plugin.
+  - Remote clusters, such as the I(remote_clustername) of M(ibm.spectrum_virtualize.ibm_sv_manage_ip_partnership),
+    are still reached directly with the credentials given to the module.
+  - M(ibm.spectrum_virtualize.ibm_svc_auth) does not apply, the session obtains and renews its token itself.
+  - The I(clustername) of a module must be C(ansible_host), or C(ansible_host) once qualified with I(domain),
+    otherwise the module fails.
+  - The session opens its own keep-alive HTTPS connections, with the proxy set in the environment of the
+    persistent connection process. The transport options of the httpapi connection other than
+    C(ansible_host), C(ansible_httpapi_port) and C(ansible_httpapi_validate_certs) are ignored, among them
+    C(ansible_httpapi_use_proxy), C(ansible_httpapi_ca_path), the client certificate options
+    and C(ansible_command_timeout). Each request times out after the timeout of its module.
+'''
+
+from ansible.module_utils._text import to_text
+from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.six import binary_type
+from ansible.plugins.httpapi import HttpApiBase
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import (
+    IBMSVCRestApi,
+    SVCPluginModule
+)
+
+DEFAULT_PORT = 7443
+
+
+class SVCSession(IBMSVCRestApi):
+    """ REST API session taking its endpoint from the httpapi connection """
+
+    def __init__(self, connection, username, password):
+        self.connection_port = connection.get_option('port')
+        super(SVCSession, self).__init__(
+            module=SVCPluginModule(error=ConnectionError),
+            clustername=connection.get_option('host'),
+            domain=None,
+            username=username,
+            password=password,
+            validate_certs=connection.get_option('validate_certs'),
+            log_path=None,
+            token=None
+        )
+
+    @property
+    def port(self):
+        return str(self.connection_port or DEFAULT_PORT)
+
+
+class HttpApi(HttpApiBase):
+
+    def __init__(self, connection):
+        super(HttpApi, self).__init__(connection)
+        self.session = None
+
+    def login(self, username, password):
+        """ Authenticate, keeping the token for the life of the connection """
+        self.session = SVCSession(self.connection, username, password)
+
+    def logout(self):
+        self.session = None
+
+    def svc_request(self, cmd, cmdopts=None, cmdargs=None, timeout=10):
+        """ Run an SVC command through the session, on behalf of
+        IBMSVCRestApi in a module
+        :param cmd: svc command to run
+        :type cmd: string
+        :param cmdopts: svc command options, name parameter and value
+        :type cmdopts: dict
+        :param cmdargs: svc command arguments, non-named parameters
+        :type cmdargs: list
+        :param timeout: socket timeout for the http gateway
+        :type timeout: int
+        :return: dict of command results, as IBMSVCRestApi._svc_rest returns
+        :rtype: dict
+        """
+        if self.session is None:
+            self.login(self.connection.get_option('remote_user'),
+                       self.connection.get_option('password'))
+        rest = self.session._svc_token_wrap(cmd, cmdopts, cmdargs, timeout)
+        # The result goes back to the module as JSON
+        if isinstance(rest['out'], binary_type):
+            rest['out'] = to_text(rest['out'], errors='surrogate_or_replace')
+        return rest
+
+    def send_request(self, data, **message_kwargs):
+        """ Run the SVC command data, with the cmdopts, cmdargs and timeout
+        of svc_request as keyword arguments """
+        return self.svc_request(data, **message_kwargs)
@@ -0,0 +1,259 @@
+# Copyright (C) 2023 IBM CORPORATION
+# Author(s): Sanjaikumaar M <sanjaikumaar.m@ibm.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: ibm_svc
+short_description: Inventory of IBM Spectrum Virtualize family storage systems and their objects
+version_added: '1.13.0'
+description:
+  - Builds an inventory from the REST API of IBM Spectrum Virtualize family storage systems.
+  - Every storage system becomes an inventory host in the group C(svc_clusters), with the
+    attributes of C(lssystem) as C(svc_) prefixed variables.
+  - The hosts and volumes of the storage systems become inventory hosts too, depending on I(objects),
+    with their attributes of C(lshost) or C(lsvdisk) as C(svc_) prefixed variables, C(svc_cluster) and
+    C(svc_object_type).
+  - "Hosts are grouped by host cluster and site, in C(svc_hostcluster_<name>) and C(svc_site_<name>).
+    Volumes are grouped by pool, I/O group, volume group and site of their pool, in C(svc_pool_<name>),
+    C(svc_iogrp_<name>), C(svc_volumegroup_<name>) and C(svc_site_<name>). Both are in C(svc_hosts) or
+    C(svc_volumes), and in C(svc_cluster_<name>) of their storage system."
+  - The REST API is queried in full once per storage system. Enable the inventory cache to reuse the
+    result for I(cache_timeout) seconds across runs instead.
+  - The configuration file name must end with C(ibm_svc.yml) or C(ibm_svc.yaml).
+author:
+  - Sanjaikumaar M (@sanjaikumaar)
+extends_documentation_fragment:
+  - constructed
+  - inventory_cache
+options:
+  plugin:
+    description: Marks the file as a configuration of this plugin.
+    required: true
+    type: str
+    choices: [ ibm.spectrum_virtualize.ibm_svc ]
+  clusters:
+    description:
+      - Storage systems to build the inventory of.
+      - Every entry takes the keys C(clustername), which is required, C(domain), C(username), C(password)
+        and C(validate_certs), each defaulting to the option of the same name.
+    required: true
+    type: list
+    elements: dict
+  domain:
+    description:
+      - Domain of the storage systems, appended to their C(clustername).
+    type: str
+  username:
+    description:
+      - REST API username for the storage systems.
+    type: str
+  password:
+    description:
+      - REST API password for the storage systems.
+    type: str
+  validate_certs:
+    description:
+      - Validates certification.
+    type: bool
+    default: false
+  objects:
+    description:
+      - Objects of the storage systems that become inventory hosts, besides the storage systems.
+    type: list
+    elements: str
+    choices: [ host, volume ]
+    default: [ host ]
+  prefix_cluster:
+    description:
+      - If C(true), the inventory hosts of hosts and volumes are named C(<clustername>_<name>), so that
+        objects of the same name on several storage systems stay apart.
+      - Otherwise they are named after the object, and a host and a volume of the same name are merged.
+    type: bool
+    default: false
+  cluster_parallelism:
+    description:
+      - Maximum number of storage systems queried concurrently.
+    type: int
+    default: 8
+  log_path:
+    description:
+      - Path of debug log file.
+    type: path
+notes:
+  - A storage system that cannot be queried is left out of the inventory with a warning, and the
+    inventory is not cached, so that the next run queries every storage system again.
+'''
+
+EXAMPLES = '''
+# inventory.ibm_svc.yml
+plugin: ibm.spectrum_virtualize.ibm_svc
+clusters:
+  - clustername: cluster1.example.com
+  - clustername: cluster2.example.com
+    username: admin2
+    password: passw0rd2
+username: admin
+password: passw0rd
+objects: [ host, volume ]
+prefix_cluster: true
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/ibm_svc_inventory
+cache_timeout: 600
+keyed_groups:
+  - key: svc_protocol
+    prefix: protocol
+'''
+
+from ansible.errors import AnsibleParserError
+from ansible.module_utils._text import to_native
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import (
+    IBMSVCRestApi,
+    SVCPluginModule,
+    run_concurrently
+)
+
+# Attributes of volumes and hosts grouping them, by group name prefix
+VOLUME_GROUPS = (('pool', 'mdisk_grp_name'), ('iogrp', 'IO_group_name'),
+                 ('volumegroup', 'volume_group_name'), ('site', 'site_name'))
+HOST_GROUPS = (('hostcluster', 'host_cluster_name'), ('site', 'site_name'))
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+
+    NAME = 'ibm.spectrum_virtualize.ibm_svc'
+
+    def verify_file(self, path):
+        return (super(InventoryModule, self).verify_file(path)
+                and path.endswith(('ibm_svc.yml', 'ibm_svc.yaml')))
+
+    def cluster_options(self, cluster):
+        options = dict((key, self.get_option(key))
+                       for key in ('domain', 'username', 'password', 'validate_certs'))
+        options.update((k, v) for k, v in cluster.items() if v is not None)
+        if not options.get('clustername'):
+            raise AnsibleParserError('Every entry of clusters requires a clustername')
+        return options
+
+    def fetch_cluster(self, cluster):
+        """ Query the topology of one storage system
+        :param cluster: options of the storage system
+        :type cluster: dict
+        :return: lssystem output, and the pools, hosts and volumes listed
+        :rtype: dict
+        """
+        restapi = IBMSVCRestApi(
+            module=SVCPluginModule(),
+            clustername=cluster['clustername'],
+            domain=cluster['domain'],
+            username=cluster['username'],
+            password=cluster['password'],
+            validate_certs=cluster['validate_certs'],
+            log_path=self.get_option('log_path'),
+            token=None
+        )
+        objects = self.get_option('objects')
+        topology = {
+            'system': restapi.svc_obj_info('lssystem', None, None) or {},
+            'pools': restapi.svc_obj_info('lsmdiskgrp', None, None) or [],
+            'hosts': [],
+            'volumes': []
+        }
+        if 'host' in objects:
+            topology['hosts'] = restapi.svc_obj_info('lshost', None, None) or []
+        if 'volume' in objects:
+            topology['volumes'] = list(restapi.svc_obj_info('lsvdisk', {'bytes': True}, None, stream=True) or [])
+        return topology
+
+    def fetch(self):
+        """ Query the topology of every storage system concurrently
+        :return: topologies by cluster name, and whether all were queried
+        :rtype: tuple
+        """
+        clusters = [self.cluster_options(cluster) for cluster in self.get_option('clusters')]
+        outcomes = run_concurrently(self.fetch_cluster, clusters, self.get_option('cluster_parallelism'))
+        topologies = {}
+        for cluster, outcome in zip(clusters, outcomes):
+            if isinstance(outcome, Exception):
+                self.display.warning('Failed to query the storage system %s: %s'
+                                     % (cluster['clustername'], to_native(outcome)))
+                continue
+            topologies[cluster['clustername']] = dict(outcome, domain=cluster['domain'])
+        return topologies, len(topologies) == len(clusters)
+
+    def add_object(self, name, variables, groups):
+        self.inventory.add_host(name)
+        for key, value in variables.items():
+            self.inventory.set_variable(name, key, value)
+        for group in groups:
+            self.inventory.add_child(self.inventory.add_group(group), name)
+
+        strict = self.get_option('strict')
+        self._set_composite_vars(self.get_option('compose'), variables, name, strict=strict)
+        self._add_host_to_composed_groups(self.get_option('groups'), variables, name, strict=strict)
+        self._add_host_to_keyed_groups(self.get_option('keyed_groups'), variables, name, strict=strict)
+
+    def object_groups(self, record, grouping):
+        groups = []
+        for prefix, attribute in grouping:
+            value = record.get(attribute)
+            if value and value != 'many':
+                groups.append(self._sanitize_group_name('svc_%s_%s' % (prefix, value)))
+        return groups
+
+    def object_variables(self, clustername, object_type, record):
+        variables = dict(('svc_%s' % key, value) for key, value in record.items())
+        variables.update(svc_cluster=clustername, svc_object_type=object_type)
+        return variables
+
+    def populate(self, topologies):
+        self.inventory.add_group('svc_clusters')
+        for clustername in sorted(topologies):
+            topology = topologies[clustername]
+            cluster_group = self._sanitize_group_name('svc_cluster_%s' % clustername)
+            prefix = '%s_' % clustername if self.get_option('prefix_cluster') else ''
+
+            variables = self.object_variables(clustername, 'cluster', topology['system'])
+            variables['ansible_host'] = ('%s.%s' % (clustername, topology['domain'])
+                                         if topology['domain'] else clustername)
+            self.add_object(clustername, variables, ['svc_clusters', cluster_group])
+
+            for host in topology['hosts']:
+                groups = ['svc_hosts', cluster_group] + self.object_groups(host, HOST_GROUPS)
+                self.add_object(prefix + host['name'], self.object_variables(clustername, 'host', host), groups)
+
+            sites = dict((pool['name'], pool.get('site_name')) for pool in topology['pools'])
+            for volume in topology['volumes']:
+                # Volumes are in the site of their pool
+                volume = dict(volume, site_name=sites.get(volume.get('mdisk_grp_name')) or '')
+                groups = ['svc_volumes', cluster_group] + self.object_groups(volume, VOLUME_GROUPS)
+                self.add_object(prefix + volume['name'], self.object_variables(clustername, 'volume', volume), groups)
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache)
+        self._read_config_data(path)
+
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option('cache') and cache
+        update_cache = self.get_option('cache') and not cache
+
+        topologies = None
+        if use_cache:
+            try:
+                topologies = self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+
+        if topologies is None:
+            topologies, complete = self.fetch()
+            # A partial inventory is not kept, the next run queries again
+            if update_cache and complete:
+                self._cache[cache_key] = topologies
+
+        self.populate(topologies)
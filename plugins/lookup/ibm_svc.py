@@ -0,0 +1,221 @@
+# Copyright (C) 2023 IBM CORPORATION
+# Author(s): Sanjaikumaar M <sanjaikumaar.m@ibm.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: ibm_svc
+short_description: Look up objects of IBM Spectrum Virtualize family storage systems
+version_added: '1.13.0'
+description:
+  - Returns the records of objects listed by an C(ls) command of the REST API, or one attribute of them.
+  - The listing is fetched once and the objects are picked from it by name or id, so that any number
+    of lookups of the same command share one request.
+  - Listings are kept in the Ansible process for I(cache_timeout) seconds, as are the authenticated
+    REST API sessions, and lookups made while a listing is being fetched wait for it.
+author:
+  - Sanjaikumaar M (@sanjaikumaar)
+options:
+  _terms:
+    description:
+      - The C(ls) command, such as C(lsvdisk), followed by the names or ids of the objects to return.
+      - Every object listed is returned if no name is given.
+    required: true
+    type: list
+    elements: str
+  clustername:
+    description:
+      - The hostname or management IP of the Spectrum Virtualize storage system.
+    required: true
+    type: str
+  domain:
+    description:
+      - Domain for the Spectrum Virtualize storage system.
+      - Valid when the hostname is used for the parameter I(clustername).
+    type: str
+  username:
+    description:
+      - REST API username for the Spectrum Virtualize storage system.
+      - The parameters I(username) and I(password) are required if not using I(token) to authenticate a user.
+    type: str
+  password:
+    description:
+      - REST API password for the Spectrum Virtualize storage system.
+      - The parameters I(username) and I(password) are required if not using I(token) to authenticate a user.
+    type: str
+  token:
+    description:
+      - The authentication token to verify a user on the Spectrum Virtualize storage system.
+    type: str
+  validate_certs:
+    description:
+      - Validates certification.
+    type: bool
+    default: false
+  log_path:
+    description:
+      - Path of debug log file.
+    type: path
+  token_cache_path:
+    description:
+      - Directory in which authentication tokens are cached per cluster and user, so that lookups in
+        other Ansible processes reuse them instead of authenticating again.
+    type: path
+  cmdopts:
+    description:
+      - Options of the C(ls) command, such as C(bytes=true) to list capacities in bytes.
+    type: dict
+  attribute:
+    description:
+      - Attribute of the objects to return, instead of their records.
+    type: str
+  detailed:
+    description:
+      - If C(true), the detailed view of every object is fetched, with one request per object, for the
+        attributes the listing does not show, such as the WWPNs of a host.
+      - Every object looked up must be named then.
+    type: bool
+    default: false
+  cache_timeout:
+    description:
+      - Seconds a listing is reused by later lookups. C(0) fetches it again for every lookup.
+      - A listing is fetched again when an object looked up is missing from it, since it may have been created since.
+    type: int
+    default: 60
+notes:
+  - An object that does not exist fails the lookup.
+  - Lookups run in the Ansible process templating the task, so listings are reused by the lookups of a
+    task, and of later tasks only when they are templated by the same process.
+'''
+
+EXAMPLES = '''
+- name: Show the UID of a volume
+  ansible.builtin.debug:
+    msg: "{{ lookup('ibm.spectrum_virtualize.ibm_svc', 'lsvdisk', 'vol0', attribute='vdisk_UID', clustername=cluster,
+             username=username, password=password) }}"
+
+- name: Map the UIDs of many volumes with a single listing
+  ansible.builtin.set_fact:
+    uids: "{{ dict(volumes | zip(query('ibm.spectrum_virtualize.ibm_svc', 'lsvdisk', volumes, attribute='vdisk_UID',
+                                       clustername=cluster, username=username, password=password))) }}"
+
+- name: Show the free capacity of a pool in bytes
+  ansible.builtin.debug:
+    msg: "{{ lookup('ibm.spectrum_virtualize.ibm_svc', 'lsmdiskgrp', 'Pool0', attribute='free_capacity',
+             cmdopts={'bytes': true}, clustername=cluster, username=username, password=password) }}"
+
+- name: Show the details of a host, including its WWPNs
+  ansible.builtin.debug:
+    msg: "{{ lookup('ibm.spectrum_virtualize.ibm_svc', 'lshost', 'host0', detailed=true, clustername=cluster,
+             username=username, password=password) }}"
+'''
+
+RETURN = '''
+_list:
+  description:
+    - Records of the objects looked up, in the order of the terms, or the value of I(attribute) of each.
+  type: list
+  elements: raw
+'''
+
+import json
+import threading
+
+from ansible.errors import AnsibleLookupError
+from ansible.module_utils._text import to_text
+from ansible.module_utils.six import string_types
+from ansible.plugins.lookup import LookupBase
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import (
+    IBMSVCRestApi,
+    SVCListingCache,
+    SVCPluginModule
+)
+
+# REST API sessions and listings, shared by the lookups of the process
+_sessions = {}
+_sessions_lock = threading.Lock()
+_listings = SVCListingCache()
+
+
+class LookupModule(LookupBase):
+
+    def session(self):
+        """ REST API session of the options, reused across lookups """
+        options = tuple(self.get_option(key) for key in ('clustername', 'domain', 'username', 'password',
+                                                         'token', 'validate_certs'))
+        with _sessions_lock:
+            if options not in _sessions:
+                _sessions[options] = IBMSVCRestApi(
+                    module=SVCPluginModule(error=AnsibleLookupError),
+                    clustername=self.get_option('clustername'),
+                    domain=self.get_option('domain'),
+                    username=self.get_option('username'),
+                    password=self.get_option('password'),
+                    validate_certs=self.get_option('validate_certs'),
+                    log_path=self.get_option('log_path'),
+                    token=self.get_option('token'),
+                    token_cache_path=self.get_option('token_cache_path')
+                )
+            return options, _sessions[options]
+
+    def fetch(self, cmd, names):
+        """ Look the objects up in the cached listing, or their detailed
+        views up one by one
+        :return: records in the order of names, None for the objects that
+                 do not exist, or every record listed if names is empty
+        :rtype: list
+        """
+        key, restapi = self.session()
+        cmdopts = self.get_option('cmdopts')
+        key += (cmd, json.dumps(cmdopts or {}, sort_keys=True))
+        ttl = self.get_option('cache_timeout')
+
+        # An object missing from a cached output may have been created
+        # since, so it is looked up again
+        if self.get_option('detailed'):
+            return [_listings.get_or_fetch(key + (name,),
+                                           lambda name=name: restapi.svc_obj_info(cmd, cmdopts, [name], cache=False), ttl,
+                                           reuse=lambda record: record is not None)
+                    for name in names]
+
+        def index():
+            out = restapi.svc_obj_info(cmd, cmdopts, None, cache=False) or []
+            records = out if isinstance(out, list) else [out]
+            objects = dict((record.get('id'), record) for record in records)
+            objects.update((record.get('name'), record) for record in records)
+            return records, objects
+
+        records, objects = _listings.get_or_fetch(key, index, ttl,
+                                                  reuse=lambda listing: all(name in listing[1] for name in names))
+        if not names:
+            return list(records)
+        return [objects.get(name) for name in names]
+
+    def run(self, terms, variables=None, **kwargs):
+        self.set_options(var_options=variables, direct=kwargs)
+
+        terms = list(terms)
+        if not terms or not terms[0]:
+            raise AnsibleLookupError('The ls command to run, such as lsvdisk, is required')
+        cmd = terms.pop(0)
+        if not cmd.startswith('ls'):
+            raise AnsibleLookupError("Only ls commands can be looked up, not '%s'" % cmd)
+        names = []
+        for term in terms:
+            names.extend(to_text(name) for name in ([term] if isinstance(term, string_types) else term))
+        if self.get_option('detailed') and not names:
+            raise AnsibleLookupError('Objects must be named to fetch their detailed view')
+
+        records = self.fetch(cmd, names)
+        missing = [name for name, record in zip(names, records) if record is None]
+        if missing:
+            raise AnsibleLookupError('%s found no object named %s' % (cmd, ', '.join(missing)))
+
+        attribute = self.get_option('attribute')
+        if attribute:
+            return [record.get(attribute) for record in records]
+        return records
@@ -86,6 +86,35 @@ class IBMSVCssh(object):
     def is_connected(self):
         return self.is_client_connected
 
+    def svc_run_batch(self, commands):
+        """
+        Run several CLI commands one after the other over the SSH session
+        of this client, which is connected and authenticated only once.
+        The restricted CLI of the cluster runs a single command per
+        request, so every command gets its own channel of the session.
+        The batch stops at the first failing command.
+        :param commands: CLI commands to run in order
+        :type commands: list
+        :return: dict with command, rc, stdout and stderr of every command
+                 that ran
+        :rtype: list
+        """
+        self.log("Executing %d CLI commands in one session", len(commands))
+        results = []
+        for cmd in commands:
+            self.log("Executing CLI command: %s", cmd)
+            stdin, stdout, stderr = self.client.exec_command(cmd)
+            output = stdout.read().decode('utf-8')
+            rc = stdout.channel.recv_exit_status()
+            results.append({'command': cmd,
+                            'rc': rc,
+                            'stdout': output,
+                            'stderr': stderr.read().decode('utf-8')})
+            self.log("CLI command %s completed with rc %d", cmd, rc)
+            if rc > 0:
+                break
+        return results
+
     def _svc_disconnect(self):
         """
         Disconnect from the SSH server.
@@ -9,12 +9,58 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import base64
+import codecs
+import copy
+import errno
+import hashlib
 import json
 import logging
+import os
+import random
+import socket
+import ssl
+import threading
+import time
 
-from ansible.module_utils.urls import open_url
-from ansible.module_utils.six.moves.urllib.parse import quote
-from ansible.module_utils.six.moves.urllib.error import HTTPError
+from multiprocessing.pool import ThreadPool
+
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.parse import quote, unquote, urlparse
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
+from ansible.module_utils._text import to_bytes, to_native, to_text
+from ansible.module_utils.connection import Connection, ConnectionError
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Number of idle keep-alive connections kept per REST endpoint
+DEFAULT_POOL_SIZE = 4
+# Seconds after which an idle connection is discarded instead of reused
+DEFAULT_IDLE_TIMEOUT = 30
+# Errors of a reused connection the server closed while it was idle, the
+# request is sent again on a new connection unless an svctask command
+# was sent completely
+STALE_CONNECTION_ERRNOS = (errno.EPIPE, errno.ECONNRESET)
+# Bytes read from the response at once when streaming records
+STREAM_CHUNK_SIZE = 65536
+# Seconds a cached token is reused. The REST API expires tokens after
+# 60 minutes of inactivity by default, so stay well below that.
+DEFAULT_TOKEN_TTL = 3000
+# Seconds before the first and the longest interval between two polls
+DEFAULT_POLL_INTERVAL = 1
+DEFAULT_MAX_POLL_INTERVAL = 30
+# Clusters processed concurrently by a fleet run
+DEFAULT_CLUSTER_PARALLELISM = 8
+# Seconds a listing is reused by lookups in the same process
+DEFAULT_LISTING_TTL = 60
+# Counters of the REST API request summary, besides the per command totals
+PERF_COUNTERS = ('requests', 'errors', 'retries', 'connections_opened',
+                 'connections_reused', 'reauthentications', 'cache_hits')
+# Attributes identifying a listed object between two snapshots
+SNAPSHOT_KEY_ATTRIBUTES = ('id', 'vdisk_id', 'host_id', 'copy_id', 'SCSI_id', 'sequence_number')
 
 
 def svc_argument_spec():
@@ -31,7 +77,11 @@ def svc_argument_spec():
         username=dict(type='str'),
         password=dict(type='str', no_log=True),
         log_path=dict(type='str'),
-        token=dict(type='str', no_log=True)
+        token=dict(type='str', no_log=True),
+        token_cache_path=dict(type='path'),
+        pool_size=dict(type='int', default=DEFAULT_POOL_SIZE),
+        idle_timeout=dict(type='int', default=DEFAULT_IDLE_TIMEOUT),
+        perf_summary=dict(type='bool', default=False)
     )
 
 
@@ -51,6 +101,47 @@ def svc_ssh_argument_spec():
     )
 
 
+def svc_fleet_argument_spec(ssh=False):
+    """
+    Returns argument_spec of options common to modules that can run the
+    same operation against several clusters
+
+    :param ssh: whether the clusters are reached through SSH
+    :type ssh: bool
+    :returns: argument_spec
+    :rtype: dict
+    """
+    options = dict(
+        clustername=dict(type='str', required=True),
+        username=dict(type='str'),
+        password=dict(type='str', no_log=True)
+    )
+    if not ssh:
+        options.update(
+            domain=dict(type='str'),
+            token=dict(type='str', no_log=True),
+            validate_certs=dict(type='bool')
+        )
+    return dict(
+        clusters=dict(type='list', elements='dict', options=options),
+        cluster_parallelism=dict(type='int', default=DEFAULT_CLUSTER_PARALLELISM)
+    )
+
+
+def svc_wait_argument_spec():
+    """
+    Returns argument_spec of options common to modules that can wait for
+    a long-running operation to complete
+
+    :returns: argument_spec
+    :rtype: dict
+    """
+    return dict(
+        wait=dict(type='bool', default=False),
+        wait_timeout=dict(type='int', default=300)
+    )
+
+
 def strtobool(val):
     '''
     Converts a string representation to boolean.
@@ -79,6 +170,970 @@ def get_logger(module_name, log_file_name, log_level=logging.INFO):
     return log
 
 
+class IBMSVCRestApiError(Exception):
+    """ Raised instead of failing the module when a REST call fails inside
+    a worker thread of run_concurrently(). The main thread is expected to
+    call fail_json(msg=e.msg) for it.
+    """
+
+    def __init__(self, msg):
+        super(IBMSVCRestApiError, self).__init__(str(msg))
+        self.msg = msg
+
+
+# Marks threads started by run_concurrently(), where fail_json must not be
+# called because it would exit a worker thread instead of the module.
+_worker = threading.local()
+
+
+def run_concurrently(func, items, parallelism):
+    """
+    Calls func for each entry of items on a bounded pool of threads.
+
+    An exception raised by func is returned in place of its result, so that
+    the caller can report failures in a deterministic order from the main
+    thread.
+
+    :param func: callable taking one entry of items
+    :param items: entries to process
+    :type items: list
+    :param parallelism: maximum number of concurrent calls
+    :type parallelism: int
+    :returns: results in the order of items
+    :rtype: list
+    """
+    items = list(items)
+
+    def call(item):
+        # func may itself call run_concurrently() in the same thread
+        active = getattr(_worker, 'active', False)
+        _worker.active = True
+        try:
+            return func(item)
+        except Exception as e:
+            return e
+        finally:
+            _worker.active = active
+
+    if parallelism <= 1 or len(items) <= 1:
+        return [call(item) for item in items]
+
+    pool = ThreadPool(min(parallelism, len(items)))
+    try:
+        return pool.map(call, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def poll_until(fetch, condition, timeout, interval=DEFAULT_POLL_INTERVAL,
+               max_interval=DEFAULT_MAX_POLL_INTERVAL, backoff=2, jitter=0.1,
+               sleep=None, clock=None):
+    """
+    Calls fetch until condition holds for its result or timeout expires.
+
+    The first check happens immediately, so an operation that already
+    completed costs a single call. The interval between checks then grows
+    by backoff up to max_interval, with a random jitter so that parallel
+    tasks polling the same cluster do not stay in lockstep. The last sleep
+    is cut short at the deadline.
+
+    :param fetch: callable returning the current state
+    :param condition: callable taking the state and returning True when done
+    :param timeout: seconds to wait for the condition
+    :type timeout: int
+    :param interval: seconds before the second check
+    :type interval: float
+    :param max_interval: upper bound of the interval between checks
+    :type max_interval: float
+    :param backoff: factor applied to the interval after each check
+    :type backoff: float
+    :param jitter: fraction of the interval added or removed at random
+    :type jitter: float
+    :param sleep: replaces time.sleep
+    :param clock: replaces time.time
+    :returns: whether the condition was met, and the last state fetched
+    :rtype: tuple
+    """
+    sleep = sleep or time.sleep
+    clock = clock or time.time
+    deadline = clock() + timeout
+    while True:
+        state = fetch()
+        if condition(state):
+            return True, state
+        remaining = deadline - clock()
+        if remaining <= 0:
+            return False, state
+        delay = interval * (1 + random.uniform(-jitter, jitter))
+        sleep(max(0, min(delay, remaining)))
+        interval = min(interval * backoff, max_interval)
+
+
+class SVCClusterExit(Exception):
+    """ Raised by SVCClusterModule instead of exiting the module, with the
+    result of the cluster
+    """
+
+    def __init__(self, result):
+        super(SVCClusterExit, self).__init__(result.get('msg'))
+        self.result = result
+
+
+class SVCClusterModule(object):
+    """ Stands in for the AnsibleModule while one cluster of a fleet run is
+    processed in a worker thread. Its parameters are those of the module,
+    overridden by the entry of the cluster, and exit_json and fail_json
+    raise SVCClusterExit instead of exiting the module.
+    """
+
+    def __init__(self, module, cluster):
+        self.module = module
+        self.params = dict(module.params, clusters=None)
+        self.params.update((k, v) for k, v in cluster.items() if v is not None)
+        # The result of the fleet run carries the summary of all requests
+        self._svc_perf_reported = True
+
+    def __getattr__(self, name):
+        return getattr(self.module, name)
+
+    def exit_json(self, **kwargs):
+        raise SVCClusterExit(kwargs)
+
+    def fail_json(self, msg, **kwargs):
+        kwargs.update(msg=msg, failed=True)
+        raise SVCClusterExit(kwargs)
+
+
+class SVCPluginModule(object):
+    """ Stands in for the AnsibleModule when IBMSVCRestApi is used by a
+    plugin on the controller rather than by a module. exit_json and
+    fail_json raise error with their message instead of exiting.
+    """
+
+    def __init__(self, params=None, error=IBMSVCRestApiError):
+        self.params = params or {}
+        self.check_mode = False
+        self.error = error
+
+    def jsonify(self, data):
+        return json.dumps(data)
+
+    def exit_json(self, msg='', **kwargs):
+        raise self.error(to_native(msg))
+
+    def fail_json(self, msg, **kwargs):
+        raise self.error(to_native(msg))
+
+
+def svc_fleet_run(module, operation, parallelism):
+    """
+    Runs an operation against every entry of the clusters parameter, on a
+    bounded pool of threads shared by all clusters.
+
+    :param module: the AnsibleModule
+    :param operation: callable taking the SVCClusterModule of a cluster,
+                      which ends with its exit_json or fail_json, or
+                      returns the result of the cluster
+    :param parallelism: maximum number of clusters processed concurrently
+    :type parallelism: int
+    :returns: results keyed by cluster name, and the names of the clusters
+              that failed or were unreachable
+    :rtype: tuple
+    """
+    clusters = module.params['clusters']
+
+    def run(cluster):
+        try:
+            return operation(SVCClusterModule(module, cluster))
+        except SVCClusterExit as e:
+            return e.result
+
+    results = {}
+    outcomes = run_concurrently(run, clusters, parallelism)
+    for cluster, outcome in zip(clusters, outcomes):
+        if isinstance(outcome, IBMSVCRestApiError):
+            outcome = dict(failed=True, msg=outcome.msg)
+        elif isinstance(outcome, Exception):
+            outcome = dict(failed=True, msg='Module failed. Error [%s].' % to_native(outcome))
+        results[cluster['clustername']] = outcome
+    failed = sorted(name for name, result in results.items()
+                    if result.get('failed') or result.get('unreachable'))
+    return results, failed
+
+
+def svc_perf_report(module, log):
+    """
+    Adds the summary of the REST API requests of the run to the module
+    result as _perf, and logs it, whichever way the module exits.
+
+    :param module: the AnsibleModule
+    :param log: callable logging a message
+    """
+    if getattr(module, '_svc_perf_reported', False):
+        return
+    module._svc_perf_reported = True
+    perf = get_perf_recorder()
+
+    def report(result_func):
+        def wrapper(*args, **kwargs):
+            kwargs['_perf'] = perf.summary()
+            log("svc_perf summary %s", json.dumps(kwargs['_perf'], sort_keys=True))
+            return result_func(*args, **kwargs)
+        return wrapper
+
+    module.exit_json = report(module.exit_json)
+    module.fail_json = report(module.fail_json)
+
+
+def svc_plan_report(module):
+    """
+    Adds the commands planned in check mode to the module result as
+    command_plan, with the number of read and write round trips they take
+    as round_trips, whichever way the module exits.
+
+    :param module: the AnsibleModule
+    """
+    if getattr(module, '_svc_plan_reported', False):
+        return
+    module._svc_plan_reported = True
+    plan = get_command_plan()
+
+    def report(result_func):
+        def wrapper(*args, **kwargs):
+            kwargs.update(plan.summary())
+            return result_func(*args, **kwargs)
+        return wrapper
+
+    module.exit_json = report(module.exit_json)
+    module.fail_json = report(module.fail_json)
+
+
+class SVCConnectionPool(object):
+    """ Pool of keep-alive HTTP(S) connections to SVC REST endpoints
+    Connections are kept per (protocol, host, port, validate_certs) so that
+    every IBMSVCRestApi talking to the same cluster during a module run
+    reuses an already established TCP + TLS session.
+    """
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE,
+                 idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        """ Initialize an empty pool
+        :param pool_size: maximum idle connections kept per endpoint
+        :type pool_size: int
+        :param idle_timeout: seconds an idle connection may be reused
+        :type idle_timeout: int
+        """
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def _proxy(self, protocol, host):
+        """ Proxy set in the environment for the endpoint, as open_url
+        would use it
+        :return: tuple of proxy host, port and tunnel headers, or None
+        :rtype: tuple
+        """
+        proxy = getproxies().get(protocol)
+        if not proxy or proxy_bypass(host):
+            return None
+        if '://' not in proxy:
+            proxy = 'http://' + proxy
+        parsed = urlparse(proxy)
+        headers = {}
+        if parsed.username:
+            credentials = '%s:%s' % (unquote(parsed.username),
+                                     unquote(parsed.password or ''))
+            headers['Proxy-Authorization'] = 'Basic %s' % to_native(
+                base64.b64encode(to_bytes(credentials)))
+        return parsed.hostname, parsed.port or 80, headers
+
+    def _new_connection(self, endpoint, timeout):
+        protocol, host, port, validate_certs = endpoint
+        # Through a proxy the connection is a CONNECT tunnel to the cluster
+        proxy = self._proxy(protocol, host)
+        address = proxy[:2] if proxy else (host, port)
+        if protocol == 'http':
+            conn = http_client.HTTPConnection(address[0], address[1],
+                                              timeout=timeout)
+        else:
+            context = ssl.create_default_context()
+            if not validate_certs:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            conn = http_client.HTTPSConnection(address[0], address[1],
+                                               timeout=timeout,
+                                               context=context)
+        if proxy:
+            conn.set_tunnel(host, port, headers=proxy[2])
+        return conn
+
+    def acquire(self, endpoint, timeout):
+        """ Get a connection for the endpoint
+        :param endpoint: (protocol, host, port, validate_certs)
+        :type endpoint: tuple
+        :param timeout: socket timeout for the connection
+        :type timeout: int
+        :return: tuple of connection and whether it was reused
+        :rtype: tuple
+        """
+        now = time.time()
+        with self._lock:
+            idle = self._idle.get(endpoint, [])
+            while idle:
+                conn, last_used = idle.pop()
+                if now - last_used < self.idle_timeout:
+                    conn.timeout = timeout
+                    if conn.sock:
+                        conn.sock.settimeout(timeout)
+                    return conn, True
+                conn.close()
+        return self._new_connection(endpoint, timeout), False
+
+    def release(self, endpoint, conn):
+        """ Return a healthy connection to the pool
+        :param endpoint: (protocol, host, port, validate_certs)
+        :type endpoint: tuple
+        :param conn: connection obtained from acquire()
+        """
+        with self._lock:
+            idle = self._idle.setdefault(endpoint, [])
+            if len(idle) < self.pool_size:
+                idle.append((conn, time.time()))
+                return
+        conn.close()
+
+    def close_all(self):
+        """ Close every idle connection held by the pool """
+        with self._lock:
+            for idle in self._idle.values():
+                for conn, dummy in idle:
+                    conn.close()
+            self._idle = {}
+
+
+_connection_pools = {}
+_connection_pools_lock = threading.Lock()
+
+
+def _is_stale_connection_error(error, sent, cmd):
+    """
+    Whether a request on a reused connection failed because the server
+    had closed it, so that it can safely be sent again: either sending
+    failed, or the server closed the connection without a response to a
+    listing. A timeout is never one, the server may still process the
+    request, and neither is a reset after an svctask command was sent,
+    since the cluster may have run it already.
+
+    :param error: exception raised by the request
+    :param sent: whether the request was sent completely
+    :type sent: bool
+    :param cmd: svc command of the request
+    :type cmd: string
+    :rtype: bool
+    """
+    if isinstance(error, socket.timeout):
+        return False
+    if not sent:
+        return True
+    if not (cmd or '').startswith('ls'):
+        return False
+    remote_disconnected = getattr(http_client, 'RemoteDisconnected', None)
+    if remote_disconnected and isinstance(error, remote_disconnected):
+        return True
+    return getattr(error, 'errno', None) in STALE_CONNECTION_ERRNOS
+
+
+def get_connection_pool(pool_size=DEFAULT_POOL_SIZE,
+                        idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    """
+    Returns the process wide connection pool for the given settings, so
+    that all IBMSVCRestApi objects of a module run share their sessions.
+
+    :returns: connection pool
+    :rtype: SVCConnectionPool
+    """
+    key = (pool_size, idle_timeout)
+    with _connection_pools_lock:
+        if key not in _connection_pools:
+            _connection_pools[key] = SVCConnectionPool(pool_size, idle_timeout)
+        return _connection_pools[key]
+
+
+class SVCPerfSample(object):
+    """ Timing of one REST API request, split into phases
+    A phase lasts from the end of the previous one until mark() is called
+    with its name: connect (including the TLS handshake), send, server
+    (until the response headers arrive), read and parse.
+    """
+
+    def __init__(self, recorder, cmd, bytes_sent):
+        self.recorder = recorder
+        self.cmd = cmd
+        self.bytes_sent = bytes_sent
+        self.bytes_received = 0
+        self.status = None
+        self.error = False
+        self.retries = 0
+        self.reused = None
+        self.streaming = False
+        self.phases = {}
+        self.start = self._last = time.time()
+
+    def mark(self, phase):
+        now = time.time()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    def finish(self):
+        """ Record the request in the recorder
+        :return: machine readable record of the request
+        :rtype: dict
+        """
+        record = {
+            'cmd': self.cmd,
+            'status': self.status,
+            'error': self.error,
+            'retries': self.retries,
+            'reused': self.reused,
+            'seconds': round(time.time() - self.start, 6),
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'phases': dict((k, round(v, 6)) for k, v in self.phases.items())
+        }
+        self.recorder.add(record)
+        return record
+
+
+class SVCPerfRecorder(object):
+    """ Aggregated timings of the REST API requests of a module run
+    Requests are summed up per command, so the summary stays small however
+    many requests the run makes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """ Forget every request recorded so far """
+        with self._lock:
+            self.counters = dict((key, 0) for key in PERF_COUNTERS)
+            self.phases = {}
+            self.commands = {}
+
+    def sample(self, cmd, bytes_sent):
+        """ Start timing a request
+        :param cmd: svc command run by the request
+        :type cmd: string
+        :param bytes_sent: size of the request body
+        :type bytes_sent: int
+        :rtype: SVCPerfSample
+        """
+        return SVCPerfSample(self, cmd, bytes_sent)
+
+    def count(self, counter):
+        with self._lock:
+            self.counters[counter] += 1
+
+    def add(self, record):
+        with self._lock:
+            self.counters['requests'] += 1
+            self.counters['errors'] += 1 if record['error'] else 0
+            self.counters['retries'] += record['retries']
+            if record['reused'] is not None:
+                self.counters['connections_reused' if record['reused'] else 'connections_opened'] += 1
+            for phase, seconds in record['phases'].items():
+                self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+            command = self.commands.setdefault(record['cmd'], {
+                'requests': 0, 'errors': 0, 'seconds': 0.0, 'max_seconds': 0.0,
+                'bytes_sent': 0, 'bytes_received': 0
+            })
+            command['requests'] += 1
+            command['errors'] += 1 if record['error'] else 0
+            command['seconds'] += record['seconds']
+            command['max_seconds'] = max(command['max_seconds'], record['seconds'])
+            command['bytes_sent'] += record['bytes_sent']
+            command['bytes_received'] += record['bytes_received']
+
+    def summary(self):
+        """ Totals of the requests recorded so far
+        :return: counters, total and per phase seconds, and per command
+                 totals, slowest commands first
+        :rtype: dict
+        """
+        with self._lock:
+            commands = sorted(self.commands.items(), key=lambda item: -item[1]['seconds'])
+            summary = dict(self.counters)
+            summary.update(
+                seconds=round(sum(c['seconds'] for name, c in commands), 6),
+                bytes_sent=sum(c['bytes_sent'] for name, c in commands),
+                bytes_received=sum(c['bytes_received'] for name, c in commands),
+                phases=dict((k, round(v, 6)) for k, v in self.phases.items()),
+                commands=[dict(c, cmd=name, seconds=round(c['seconds'], 6),
+                               max_seconds=round(c['max_seconds'], 6))
+                          for name, c in commands]
+            )
+            return summary
+
+
+_perf_recorder = SVCPerfRecorder()
+
+
+def get_perf_recorder():
+    """
+    Returns the process wide recorder of REST API request timings, so
+    that the requests of all IBMSVCRestApi objects of a module run are
+    summed up together.
+
+    :rtype: SVCPerfRecorder
+    """
+    return _perf_recorder
+
+
+class SVCCommandPlan(object):
+    """ Commands modules would run, recorded in check mode instead of being
+    run, in the order they were planned
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """ Forget every command planned so far """
+        with self._lock:
+            self.commands = []
+
+    def add(self, clustername, cmd, cmdopts, cmdargs):
+        """ Plan a command
+        :param clustername: cluster the command would run on
+        :type clustername: string
+        :param cmd: svc command
+        :type cmd: string
+        :param cmdopts: svc command options
+        :type cmdopts: dict
+        :param cmdargs: svc command arguments
+        :type cmdargs: list
+        """
+        with self._lock:
+            self.commands.append(dict(cluster=clustername, cmd=cmd, opts=dict(cmdopts or {}),
+                                      args=list(cmdargs or [])))
+
+    def summary(self):
+        """ Commands planned so far, and the round trips of the run
+        Reads are the ls requests made so far, writes the commands planned.
+        :return: command_plan and round_trips, or nothing if no command was
+                 planned
+        :rtype: dict
+        """
+        with self._lock:
+            commands = [dict(command) for command in self.commands]
+        if not commands:
+            return {}
+        reads = sum(c['requests'] for c in get_perf_recorder().summary()['commands']
+                    if c['cmd'].startswith('ls'))
+        return dict(command_plan=commands, round_trips=dict(reads=reads, writes=len(commands)))
+
+
+_command_plan = SVCCommandPlan()
+
+
+def get_command_plan():
+    """
+    Returns the process wide plan of the commands of a check mode run, so
+    that the commands of all IBMSVCRestApi objects of a module run are
+    planned together.
+
+    :rtype: SVCCommandPlan
+    """
+    return _command_plan
+
+
+class SVCJsonStream(object):
+    """ Incremental decoder for the JSON arrays returned by ls commands
+    Records are decoded as soon as they are complete, so neither the raw
+    response body nor its text have to be held in memory at once.
+    """
+
+    def __init__(self, fileobj, chunk_size=STREAM_CHUNK_SIZE):
+        """ Initialize the decoder
+        :param fileobj: file like object providing read(size)
+        :param chunk_size: bytes read at once
+        :type chunk_size: int
+        """
+        self.fileobj = fileobj
+        self.chunk_size = chunk_size
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        self.bytes_read = 0
+
+    def _fill(self):
+        """ Append the next chunk to the buffer, dropping consumed text
+        :return: False at end of input
+        """
+        if self._eof:
+            return False
+        chunk = self.fileobj.read(self.chunk_size)
+        self.bytes_read += len(chunk)
+        if chunk:
+            text = self._text.decode(chunk)
+        else:
+            self._eof = True
+            text = self._text.decode(b'', True)
+        self._buf = self._buf[self._pos:] + text
+        self._pos = 0
+        return True
+
+    def peek(self):
+        """ Skip whitespace and return the next character
+        :return: next character or empty string at end of input
+        """
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buf) or not self._fill():
+                return self._buf[self._pos:self._pos + 1]
+
+    def read_all(self):
+        """ Decode the remaining input as one JSON document """
+        while self._fill():
+            pass
+        return json.loads(self._buf[self._pos:])
+
+    def __iter__(self):
+        if self.peek() != '[':
+            raise ValueError('Expecting JSON array')
+        self._pos += 1
+        first = True
+        while True:
+            char = self.peek()
+            if char == ']':
+                self._pos += 1
+                return
+            if not first:
+                if char != ',':
+                    raise ValueError('Expecting , or ] in JSON array')
+                self._pos += 1
+                self.peek()
+            first = False
+            while True:
+                try:
+                    record, self._pos = self._json.raw_decode(self._buf, self._pos)
+                    break
+                except ValueError:
+                    # The record is not complete yet
+                    if not self._fill():
+                        raise
+            yield record
+
+
+class SVCTokenCache(object):
+    """ File backed cache of REST API tokens
+    One file per cluster and user is kept in the cache directory. Access is
+    serialized with an exclusive file lock, so that parallel Ansible forks
+    share one token instead of each authenticating on their own.
+    """
+
+    def __init__(self, path, ttl=DEFAULT_TOKEN_TTL):
+        """ Initialize the cache
+        :param path: directory holding the cached tokens
+        :type path: string
+        :param ttl: seconds a token is reused after it was obtained
+        :type ttl: int
+        """
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    def _file(self, resturl, username):
+        key = hashlib.sha256(to_bytes('%s\n%s' % (resturl, username))).hexdigest()
+        return os.path.join(self.path, key)
+
+    def _open(self, filename):
+        try:
+            os.makedirs(self.path, 0o700)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+        fd = os.open(filename, os.O_RDWR | os.O_CREAT, 0o600)
+        if fcntl:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        return fd
+
+    def _close(self, fd):
+        if fcntl:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+    def _read(self, fd):
+        os.lseek(fd, 0, os.SEEK_SET)
+        content = b''
+        while True:
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                break
+            content += chunk
+        try:
+            entry = json.loads(to_text(content))
+        except ValueError:
+            return None
+        if not isinstance(entry, dict) or entry.get('expires', 0) <= time.time():
+            return None
+        return entry.get('token')
+
+    def _write(self, fd, entry):
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.ftruncate(fd, 0)
+        if entry:
+            os.write(fd, to_bytes(json.dumps(entry)))
+
+    def get_or_create(self, resturl, username, create):
+        """ Return the cached token, or obtain and cache a new one
+        :param resturl: REST API url of the cluster
+        :type resturl: string
+        :param username: SVC username
+        :type username: string
+        :param create: callable returning a new token or None
+        :return: None or token string
+        """
+        with self._lock:
+            fd = self._open(self._file(resturl, username))
+            try:
+                token = self._read(fd)
+                if token:
+                    return token
+                token = create()
+                if token:
+                    self._write(fd, {'token': token,
+                                     'expires': time.time() + self.ttl})
+                return token
+            finally:
+                self._close(fd)
+
+    def invalidate(self, resturl, username, token):
+        """ Drop a token that the cluster rejected, unless another process
+        has already replaced it with a new one.
+        :param resturl: REST API url of the cluster
+        :type resturl: string
+        :param username: SVC username
+        :type username: string
+        :param token: rejected token
+        :type token: string
+        """
+        with self._lock:
+            fd = self._open(self._file(resturl, username))
+            try:
+                if self._read(fd) == token:
+                    self._write(fd, None)
+            finally:
+                self._close(fd)
+
+
+class SVCListingCache(object):
+    """ In-process cache of command outputs, each reused until it expires
+    Callers asking for an output while another caller fetches it wait for
+    that fetch instead of starting their own.
+    """
+
+    def __init__(self, ttl=DEFAULT_LISTING_TTL):
+        """ Initialize the cache
+        :param ttl: default seconds an output is reused after it was fetched
+        :type ttl: int
+        """
+        self.ttl = ttl
+        self._entries = {}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+
+    def get_or_fetch(self, key, fetch, ttl=None, reuse=None):
+        """ Return the cached output for key, fetching it if there is
+        none or it expired
+        :param key: hashable identifier of the output
+        :param fetch: callable returning the output
+        :param ttl: seconds to reuse the fetched output, default self.ttl,
+                    0 not to cache it
+        :type ttl: int
+        :param reuse: callable telling whether a cached output may be
+                      returned, it is fetched again otherwise
+        :returns: the output
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return fetch()
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.time() and (reuse is None or reuse(entry[1])):
+                get_perf_recorder().count('cache_hits')
+                return entry[1]
+            value = fetch()
+            self._entries[key] = (time.time() + ttl, value)
+            return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+
+
+class SVCStateStore(object):
+    """ File backed store of the state a module keeps between runs
+    One JSON file per key is kept in the store directory. A file is
+    replaced atomically, so that a concurrent reader never sees a partly
+    written state.
+    """
+
+    def __init__(self, path):
+        """ Initialize the store
+        :param path: directory holding the state files
+        :type path: string
+        """
+        self.path = path
+
+    def _file(self, key):
+        digest = hashlib.sha256(to_bytes(json.dumps(key))).hexdigest()
+        return os.path.join(self.path, digest + '.json')
+
+    def load(self, key):
+        """ Return the state saved under key
+        :param key: list of strings identifying the state
+        :type key: list
+        :return: None or state dict
+        """
+        try:
+            with open(self._file(key), 'rb') as f:
+                state = json.loads(to_text(f.read()))
+        except (IOError, OSError, ValueError):
+            return None
+        return state if isinstance(state, dict) else None
+
+    def save(self, key, state):
+        """ Save the state under key, replacing the previous one
+        :param key: list of strings identifying the state
+        :type key: list
+        :param state: JSON serializable state
+        :type state: dict
+        """
+        try:
+            os.makedirs(self.path, 0o700)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+        filename = self._file(key)
+        temp = '%s.%d.%d' % (filename, os.getpid(), threading.current_thread().ident)
+        fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, to_bytes(json.dumps(state, sort_keys=True)))
+        finally:
+            os.close(fd)
+        os.rename(temp, filename)
+
+
+def svc_fingerprint(record):
+    """
+    Returns a short digest of a record, that changes whenever any of
+    its attributes changes.
+
+    :param record: listed object
+    :type record: dict
+    :returns: digest
+    :rtype: str
+    """
+    return hashlib.sha256(to_bytes(json.dumps(record, sort_keys=True))).hexdigest()[:16]
+
+
+def svc_snapshot_delta(records, snapshot):
+    """
+    Compares a listing with the snapshot of a previous one. Objects are
+    identified by their SNAPSHOT_KEY_ATTRIBUTES, or by their fingerprint
+    when they have none, and compared by fingerprint.
+
+    :param records: listed objects
+    :type records: list
+    :param snapshot: snapshot of the previous listing, as returned here
+    :type snapshot: dict
+    :returns: (added, changed, removed, new snapshot), where added and
+              changed are lists of (key, object) and removed a list of keys
+    :rtype: tuple
+    """
+    snapshot = snapshot or {}
+    current = {}
+    added = []
+    changed = []
+    for record in records:
+        fingerprint = svc_fingerprint(record)
+        key = '/'.join(str(record[attr]) for attr in SNAPSHOT_KEY_ATTRIBUTES if attr in record)
+        if not key or key in current:
+            key = '%s#%s' % (key, fingerprint)
+        current[key] = fingerprint
+        if key not in snapshot:
+            added.append((key, record))
+        elif snapshot[key] != fingerprint:
+            changed.append((key, record))
+    removed = sorted(key for key in snapshot if key not in current)
+    return added, changed, removed, current
+
+
+def svc_job_handle(clustername, kind, names, state):
+    """
+    Returns the handle of an operation started on several objects, which
+    a later task passes back to report the progress of the operation.
+
+    :param clustername: cluster the operation runs on
+    :type clustername: str
+    :param kind: type of the objects, such as fcmap or rcrelationship
+    :type kind: str
+    :param names: names of the objects
+    :type names: list
+    :param state: state requested for the objects
+    :type state: str
+    :returns: handle
+    :rtype: dict
+    """
+    return dict(cluster=clustername, kind=kind, names=list(names),
+                state=state, submitted=int(time.time()))
+
+
+def svc_job_report(records, names, complete, fields):
+    """
+    Reports the progress of an operation from a single listing of the
+    objects it runs on. The listing may hold other objects, which are
+    skipped.
+
+    :param records: listed objects, possibly streamed
+    :param names: names of the objects of the operation
+    :type names: list
+    :param complete: callable taking a listed object and returning True
+                     once the operation completed on it
+    :param fields: attributes reported per object, when listed
+    :type fields: tuple
+    :returns: objects, the reported attributes and completion of every
+              object found; pending and missing, the names of the objects
+              not yet complete and not found; complete, whether no object
+              is pending; progress, the mean progress of the objects that
+              report one, or None
+    :rtype: dict
+    """
+    wanted = set(names)
+    objects = {}
+    for record in records or ():
+        if record.get('name') in wanted:
+            report = dict((field, record[field]) for field in fields if field in record)
+            report['complete'] = bool(complete(record))
+            objects[record['name']] = report
+    pending = [name for name in names if name in objects and not objects[name]['complete']]
+    missing = [name for name in names if name not in objects]
+    progress = [int(o['progress']) for o in objects.values() if str(o.get('progress', '')).isdigit()]
+    return dict(objects=objects, pending=pending, missing=missing, complete=not pending,
+                progress=sum(progress) // len(progress) if progress else None)
+
+
 class IBMSVCRestApi(object):
     """ Communicate with SVC through RestApi
     SVC commands usually have the format
@@ -89,7 +1144,11 @@ class IBMSVCRestApi(object):
     """
 
     def __init__(self, module, clustername, domain, username, password,
-                 validate_certs, log_path, token):
+                 validate_certs, log_path, token,
+                 token_cache_path=None,
+                 pool_size=DEFAULT_POOL_SIZE,
+                 idle_timeout=DEFAULT_IDLE_TIMEOUT,
+                 perf_summary=False):
         """ Initialize module with what we need for initial connection
         :param clustername: name of the SVC cluster
         :type clustername: string
@@ -101,6 +1160,15 @@ class IBMSVCRestApi(object):
         :type password: string
         :param validate_certs: whether or not the connection is insecure
         :type validate_certs: bool
+        :param token_cache_path: directory to cache tokens in, if any
+        :type token_cache_path: string
+        :param pool_size: idle keep-alive connections kept per endpoint
+        :type pool_size: int
+        :param idle_timeout: seconds an idle connection may be reused
+        :type idle_timeout: int
+        :param perf_summary: return the summary of the REST API requests
+                             of the run in the module result, as _perf
+        :type perf_summary: bool
         """
         self.module = module
         self.clustername = clustername
@@ -109,23 +1177,55 @@ class IBMSVCRestApi(object):
         self.password = password
         self.validate_certs = validate_certs
         self.token = token
+        self.token_cache = SVCTokenCache(token_cache_path) if token_cache_path else None
+        self.pool = get_connection_pool(pool_size, idle_timeout)
+        self._auth_lock = threading.Lock()
+        # Output of ls commands run so far, dropped by any other command
+        self._read_cache = {}
+        self._read_cache_lock = threading.Lock()
+        self.perf = get_perf_recorder()
 
         # logging setup
         log = get_logger(self.__class__.__name__, log_path)
         self.log = log.info
 
+        if perf_summary:
+            self._svc_perf_report()
+
+        # With connection: httpapi the requests to the host of the connection
+        # go through the session the ibm_svc httpapi plugin keeps in the
+        # persistent connection process. Remote clusters some modules talk
+        # to as well are reached directly.
+        self.connection = None
+        if getattr(module, '_socket_path', None) and clustername == module.params.get('clustername'):
+            connection = Connection(module._socket_path)
+            host = connection.get_option('host')
+            if host not in (clustername, '%s.%s' % (clustername, domain) if domain else clustername):
+                module.fail_json(msg="clustername [%s] is not the host [%s] of the httpapi connection. "
+                                     "Set ansible_host to the clustername, or run the task with another connection."
+                                     % (clustername, host))
+            self.connection = connection
+            self.log("Sending requests through the persistent connection")
+            return
+
         # Make sure we can connect through the RestApi
         if self.token is None:
             if not self.username or not self.password:
                 self.module.fail_json(msg="You must pass in either pre-acquired token"
                                           " or username/password to generate new token")
-            self.token = self._svc_authorize()
+            self.token = self._svc_cached_authorize()
         else:
             self.log("Token already passed: %s", self.token)
 
         if not self.token:
             self.module.exit_json(msg='Failed to obtain access token', unreachable=True)
 
+    def _svc_perf_report(self):
+        """ Add the summary of the REST API requests of the run to the
+        module result as _perf, and log it, whichever way the module exits.
+        """
+        svc_perf_report(self.module, self.log)
+
     @property
     def port(self):
         return getattr(self, '_port', None) or '7443'
@@ -152,7 +1252,8 @@ class IBMSVCRestApi(object):
     def token(self, value):
         return setattr(self, '_token', value)
 
-    def _svc_rest(self, method, headers, cmd, cmdopts, cmdargs, timeout=10):
+    def _svc_rest(self, method, headers, cmd, cmdopts, cmdargs, timeout=10,
+                  stream=False):
         """ Run SVC command with token info added into header
         :param method: http method, POST or GET
         :type method: string
@@ -164,7 +1265,9 @@ class IBMSVCRestApi(object):
         :type cmdopts: dict
         :param cmdargs: svc command arguments, non-named paramaters
         :type timeout: int
-        :param timeout: open_url argument to set timeout for http gateway
+        :param timeout: socket timeout for the http gateway
+        :param stream: return JSON arrays as an iterator of records
+        :type stream: bool
         :return: dict of command results
         :rtype: dict
         """
@@ -190,30 +1293,145 @@ class IBMSVCRestApi(object):
         r['data'] = cmdopts  # Original payload data has nicer formatting
         self.log("_svc_rest: payload=%s", payload)
 
+        parsed = urlparse(url)
+        endpoint = (parsed.scheme, parsed.hostname, parsed.port,
+                    self.validate_certs)
+
+        sample = self.perf.sample(cmd, len(data))
         try:
-            o = open_url(url, method=method, headers=headers, timeout=timeout,
-                         validate_certs=self.validate_certs, data=bytes(data))
-        except HTTPError as e:
-            self.log('_svc_rest: httperror %s', str(e))
-            r['code'] = e.getcode()
-            r['out'] = e.read()
-            r['err'] = "HTTPError %s", str(e)
-            return r
-        except Exception as e:
-            self.log('_svc_rest: exception : %s', str(e))
-            r['err'] = "Exception %s", str(e)
+            return self._svc_rest_request(r, method, headers, parsed.path, data,
+                                          endpoint, timeout, stream, sample)
+        finally:
+            # A streamed listing is recorded once it has been read
+            if not sample.streaming:
+                self.log("svc_perf %s", json.dumps(sample.finish(), sort_keys=True))
+
+    def _svc_rest_request(self, r, method, headers, path, data, endpoint,
+                          timeout, stream, sample):
+        """ Send the request of _svc_rest and decode its response
+        :return: dict of command results
+        :rtype: dict
+        """
+        # A reused keep-alive connection may have been closed by the
+        # server meanwhile, in which case retry once on a new connection.
+        for attempt in range(2):
+            conn, reused = self.pool.acquire(endpoint, timeout)
+            sample.reused = reused
+            sent = False
+            try:
+                if conn.sock is None:
+                    conn.connect()
+                sample.mark('connect')
+                conn.request(method, path, body=bytes(data),
+                             headers=headers)
+                sent = True
+                sample.mark('send')
+                response = conn.getresponse()
+                sample.mark('server')
+                sample.status = response.status
+                if not stream or response.status >= 400:
+                    body = response.read()
+                    sample.mark('read')
+                    sample.bytes_received = len(body)
+            except Exception as e:
+                conn.close()
+                if reused and attempt == 0 and _is_stale_connection_error(e, sent, sample.cmd):
+                    self.log('_svc_rest: stale connection, retrying : %s', str(e))
+                    sample.retries += 1
+                    continue
+                self.log('_svc_rest: exception : %s', str(e))
+                sample.error = True
+                r['err'] = "Exception %s", str(e)
+                return r
+            break
+
+        if stream and response.status < 400:
+            return self._svc_rest_stream(r, endpoint, conn, response, sample)
+
+        self._svc_release(endpoint, conn, response)
+
+        if response.status >= 400:
+            e = 'HTTP Error %d: %s' % (response.status, response.reason)
+            self.log('_svc_rest: httperror %s', e)
+            sample.error = True
+            r['code'] = response.status
+            r['out'] = body
+            r['err'] = "HTTPError %s", e
             return r
 
         try:
-            j = json.load(o)
+            j = json.loads(to_text(body))
         except ValueError as e:
             self.log("_svc_rest: value error pass: %s", str(e))
             # pass, will mean both data and error are None.
             return r
+        finally:
+            sample.mark('parse')
 
         r['out'] = j
         return r
 
+    def _svc_release(self, endpoint, conn, response):
+        """ Return the connection to the pool once its response is read """
+        if response.will_close:
+            conn.close()
+        else:
+            self.pool.release(endpoint, conn)
+
+    def _svc_rest_stream(self, r, endpoint, conn, response, sample):
+        """ Decode a successful response incrementally
+        A JSON array is returned in r['out'] as an iterator of its records,
+        which keeps the connection until it is exhausted. Anything else is
+        decoded at once, as _svc_rest does.
+        :return: dict of command results
+        :rtype: dict
+        """
+        reader = SVCJsonStream(response)
+        try:
+            is_array = reader.peek() == '['
+            if not is_array:
+                r['out'] = reader.read_all()
+        except ValueError as e:
+            self.log("_svc_rest: value error pass: %s", str(e))
+            is_array = False
+        except Exception as e:
+            conn.close()
+            self.log('_svc_rest: exception : %s', str(e))
+            sample.error = True
+            r['err'] = "Exception %s", str(e)
+            return r
+        finally:
+            sample.bytes_received = reader.bytes_read
+
+        if is_array:
+            sample.streaming = True
+            r['out'] = self._svc_stream_records(reader, endpoint, conn, response, sample)
+        else:
+            sample.mark('read')
+            self._svc_release(endpoint, conn, response)
+        return r
+
+    def _svc_stream_records(self, reader, endpoint, conn, response, sample):
+        count = 0
+        done = False
+        try:
+            for record in reader:
+                count += 1
+                yield record
+            done = True
+        finally:
+            if done:
+                self._svc_release(endpoint, conn, response)
+                self.log("_svc_rest: streamed %d records", count)
+            else:
+                # Abandoned or failed half way, the connection is unusable
+                conn.close()
+                sample.error = True
+            # Reading and decoding the records overlap, both count as read
+            sample.mark('read')
+            sample.bytes_received = reader.bytes_read
+            self.log("svc_perf %s", json.dumps(sample.finish(), sort_keys=True))
+
     def _svc_authorize(self):
         """ Obtain a token if we are authoized to connect
         :return: None or token string
@@ -238,7 +1456,41 @@ class IBMSVCRestApi(object):
 
         return None
 
-    def _svc_token_wrap(self, cmd, cmdopts, cmdargs, timeout=10):
+    def _svc_cached_authorize(self):
+        """ Obtain a token through the token cache, if one is configured
+        :return: None or token string
+        """
+        if self.token_cache:
+            return self.token_cache.get_or_create(self.resturl, self.username,
+                                                  self._svc_authorize)
+        return self._svc_authorize()
+
+    def _svc_reauthorize(self, rejected):
+        """ Replace a token the cluster rejected by a new one. Concurrent
+        callers that hit the same rejected token authenticate only once.
+        :param rejected: the rejected token
+        :type rejected: string
+        :return: None or token string
+        """
+        with self._auth_lock:
+            if self.token != rejected:
+                return self.token
+            self.log("Token rejected, authenticating again")
+            self.perf.count('reauthentications')
+            if self.token_cache:
+                self.token_cache.invalidate(self.resturl, self.username, rejected)
+            self.token = self._svc_cached_authorize()
+            return self.token
+
+    def _fail(self, msg):
+        """ Fail the module, or raise IBMSVCRestApiError when running
+        inside a run_concurrently() worker thread.
+        """
+        if getattr(_worker, 'active', False):
+            raise IBMSVCRestApiError(msg)
+        self.module.fail_json(msg=msg)
+
+    def _svc_token_wrap(self, cmd, cmdopts, cmdargs, timeout=10, stream=False):
         """ Run SVC command with token info added into header
         :param cmd: svc command to run
         :type cmd: string
@@ -246,22 +1498,66 @@ class IBMSVCRestApi(object):
         :type cmdopts: dict
         :param cmdargs: svc command arguments, non-named paramaters
         :type cmdargs: list
-        :param timeout: open_url argument to set timeout for http gateway
+        :param timeout: socket timeout for the http gateway
         :type timeout: int
+        :param stream: return JSON arrays as an iterator of records
+        :type stream: bool
         :returns: command results
         """
 
+        if self.connection:
+            return self._svc_connection_request(cmd, cmdopts, cmdargs, timeout, stream)
+
         if self.token is None:
             self.module.fail_json(msg="No authorize token")
             # Abort
 
+        token = self.token
         headers = {
             'Content-Type': 'application/json',
-            'X-Auth-Token': self.token
+            'X-Auth-Token': token
         }
 
-        return self._svc_rest(method='POST', headers=headers, cmd=cmd,
-                              cmdopts=cmdopts, cmdargs=cmdargs, timeout=timeout)
+        rest = self._svc_rest(method='POST', headers=headers, cmd=cmd,
+                              cmdopts=cmdopts, cmdargs=cmdargs, timeout=timeout,
+                              stream=stream)
+
+        # The token expired or was revoked, authenticate again and retry
+        # once if we have the credentials to do so.
+        if rest['code'] in (401, 403) and self.username and self.password:
+            token = self._svc_reauthorize(token)
+            if token:
+                headers['X-Auth-Token'] = token
+                rest = self._svc_rest(method='POST', headers=headers, cmd=cmd,
+                                      cmdopts=cmdopts, cmdargs=cmdargs,
+                                      timeout=timeout, stream=stream)
+
+        return rest
+
+    def _svc_connection_request(self, cmd, cmdopts, cmdargs, timeout, stream):
+        """ Run SVC command through the persistent connection, whose
+        httpapi plugin authenticates again if the token was rejected
+        :returns: command results, as _svc_rest returns them
+        :rtype: dict
+        """
+        sample = self.perf.sample(cmd, len(self.module.jsonify(cmdopts or None)))
+        try:
+            rest = self.connection.svc_request(cmd, cmdopts, cmdargs, timeout)
+        except ConnectionError as e:
+            self.log('_svc_rest: connection error : %s', to_native(e))
+            sample.error = True
+            rest = {'url': None, 'code': None, 'out': None, 'data': cmdopts,
+                    'err': ("Exception %s", to_native(e))}
+        finally:
+            sample.mark('server')
+        sample.status = rest['code']
+        sample.error = sample.error or bool(rest['err'])
+        self.log("svc_perf %s", json.dumps(sample.finish(), sort_keys=True))
+
+        # The records arrived at once, but callers iterate a stream
+        if stream and isinstance(rest['out'], list):
+            rest['out'] = (record for record in rest['out'])
+        return rest
 
     def svc_run_command(self, cmd, cmdopts, cmdargs, timeout=10):
         """ Generic execute a SVC command
@@ -271,23 +1567,42 @@ class IBMSVCRestApi(object):
         :type cmdopts: dict
         :param cmdargs: svc command arguments, non-named parameters
         :type cmdargs: list
-        :param timeout: open_url argument to set timeout for http gateway
+        :param timeout: socket timeout for the http gateway
         :type timeout: int
         :returns: command output
         """
 
-        rest = self._svc_token_wrap(cmd, cmdopts, cmdargs, timeout)
+        try:
+            rest = self._svc_token_wrap(cmd, cmdopts, cmdargs, timeout)
+        finally:
+            if not cmd.startswith('ls'):
+                self.svc_cache_clear()
         self.log("svc_run_command rest=%s", rest)
 
         if rest['err']:
             msg = rest
-            self.module.fail_json(msg=msg)
+            self._fail(msg)
             # Aborts
 
         # Might be None
         return rest['out']
 
-    def svc_obj_info(self, cmd, cmdopts, cmdargs, timeout=10):
+    def svc_plan_command(self, cmd, cmdopts, cmdargs):
+        """ Plan a command instead of running it, in check mode. The commands
+        planned are added to the module result as command_plan.
+        :param cmd: svc command that would run
+        :type cmd: string
+        :param cmdopts: svc command options, name parameter and value
+        :type cmdopts: dict
+        :param cmdargs: svc command arguments, non-named parameters
+        :type cmdargs: list
+        """
+        self.log("svc_plan_command cmd=%s opts=%s args=%s", cmd, cmdopts, cmdargs)
+        get_command_plan().add(self.clustername, cmd, cmdopts, cmdargs)
+        svc_plan_report(self.module)
+
+    def svc_obj_info(self, cmd, cmdopts, cmdargs, timeout=10, stream=False,
+                     cache=True):
         """ Obtain information about an SVC object through the ls command
         :param cmd: svc command to run
         :type cmd: string
@@ -295,34 +1610,96 @@ class IBMSVCRestApi(object):
         :type cmdopts: dict
         :param cmdargs: svc command arguments, non-named paramaters
         :type cmdargs: list
-        :param timeout: open_url argument to set timeout for http gateway
+        :param timeout: socket timeout for the http gateway
         :type timeout: int
+        :param stream: return a list output as an iterator, which decodes
+                       the records while they are read from the cluster
+        :type stream: bool
+        :param cache: reuse the output of an identical earlier call, unless
+                      a command that changes the configuration ran since
+        :type cache: bool
         :returns: command output
         :rtype: dict
         """
 
-        rest = self._svc_token_wrap(cmd, cmdopts, cmdargs, timeout)
+        # Streamed output can only be consumed once, so it is never cached
+        cache = cache and not stream
+        if cache:
+            key = self._svc_cache_key(cmd, cmdopts, cmdargs)
+            with self._read_cache_lock:
+                if key in self._read_cache:
+                    self.log("svc_obj_info cache hit %s %s", cmd, cmdargs)
+                    self.perf.count('cache_hits')
+                    return copy.deepcopy(self._read_cache[key])
+
+        rest = self._svc_token_wrap(cmd, cmdopts, cmdargs, timeout, stream)
         self.log("svc_obj_info rest=%s", rest)
 
         if rest['code']:
             if rest['code'] == 500:
                 # Object did not exist, which is quite valid.
+                if cache:
+                    with self._read_cache_lock:
+                        self._read_cache[key] = None
                 return None
 
         # Fail for anything else
         if rest['err']:
-            self.module.fail_json(msg=rest)
+            self._fail(rest)
             # Aborts
 
+        if cache:
+            with self._read_cache_lock:
+                self._read_cache[key] = copy.deepcopy(rest['out'])
+
         # Might be None
         return rest['out']
 
+    def _svc_cache_key(self, cmd, cmdopts, cmdargs):
+        return (cmd, json.dumps(cmdopts or {}, sort_keys=True),
+                tuple(cmdargs or ()))
+
+    def svc_cache_clear(self):
+        """ Forget the output of all ls commands run so far """
+        with self._read_cache_lock:
+            self._read_cache.clear()
+
+    def svc_wait(self, cmd, cmdopts, cmdargs, condition, timeout,
+                 interval=DEFAULT_POLL_INTERVAL,
+                 max_interval=DEFAULT_MAX_POLL_INTERVAL):
+        """ Poll an ls command until its output satisfies condition
+        :param cmd: svc command to run
+        :type cmd: string
+        :param cmdopts: svc command options, name parameter and value
+        :type cmdopts: dict
+        :param cmdargs: svc command arguments, non-named paramaters
+        :type cmdargs: list
+        :param condition: callable taking the command output, which is None
+                          if the object does not exist
+        :param timeout: seconds to wait for the condition
+        :type timeout: int
+        :param interval: seconds before the second poll
+        :type interval: float
+        :param max_interval: upper bound of the interval between polls
+        :type max_interval: float
+        :returns: whether the condition was met, and the last output
+        :rtype: tuple
+        """
+        start = time.time()
+        done, data = poll_until(
+            lambda: self.svc_obj_info(cmd, cmdopts, cmdargs, cache=False),
+            condition, timeout, interval, max_interval
+        )
+        self.log("svc_wait %s %s: done=%s after %.1fs", cmd, cmdargs,
+                 done, time.time() - start)
+        return done, data
+
     def get_auth_token(self):
         """ Obtain information about an SVC object through the ls command
         :returns: authentication token
         """
         # Make sure we can connect through the RestApi
-        self.token = self._svc_authorize()
+        self.token = self._svc_cached_authorize()
         self.log("_connect by using token")
         if not self.token:
             self.module.exit_json(msg='Failed to obtain access token', unreachable=True)
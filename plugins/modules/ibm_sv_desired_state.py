@@ -0,0 +1,298 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2023 IBM CORPORATION
+# Author(s): Sanjaikumaar M <sanjaikumaar.m@ibm.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+module: ibm_sv_desired_state
+short_description: This module reconciles IBM Spectrum Virtualize family storage systems with a desired state
+version_added: '1.13.0'
+description:
+  - Brings the policies, pools, host clusters, hosts, volume groups, volumes and volume mappings of a
+    storage system to the state described by a single document.
+  - Every entry is handled by the module managing its kind of object, which decides whether and how
+    the object is created, modified or deleted, exactly as if that module ran for the entry.
+  - The objects of every kind described are listed once, before any change. Whether an object exists
+    is answered from these listings, so only the objects whose attributes have to be compared fetch
+    their detailed view.
+  - Entries are applied in stages, in the order of their dependencies. Deletions go first, from volume
+    mappings down to policies, then creations and modifications, from policies up to volume mappings.
+    The entries of a stage are independent and are applied concurrently, up to I(parallelism).
+  - If an entry fails, the stage is completed but the later stages are skipped.
+options:
+    clustername:
+        description:
+            - The hostname or management IP of the Spectrum Virtualize storage system.
+        required: true
+        type: str
+    domain:
+        description:
+            - Domain for the Spectrum Virtualize storage system.
+            - Valid when the hostname is used for the parameter I(clustername).
+        type: str
+    username:
+        description:
+            - REST API username for the Spectrum Virtualize storage system.
+            - The parameters I(username) and I(password) are required if not using I(token) to authenticate a user.
+        type: str
+    password:
+        description:
+            - REST API password for the Spectrum Virtualize storage system.
+            - The parameters I(username) and I(password) are required if not using I(token) to authenticate a user.
+        type: str
+    token:
+        description:
+            - The authentication token to verify a user on the Spectrum Virtualize storage system.
+            - To generate a token, use the M(ibm.spectrum_virtualize.ibm_svc_auth) module.
+        type: str
+    log_path:
+        description:
+            - Path of debug log file.
+        type: str
+    token_cache_path:
+        description:
+            - Directory in which authentication tokens are cached per cluster and user.
+            - Tasks that run against the same cluster as the same user reuse the cached token
+              instead of authenticating again.
+            - An expired or rejected token is replaced automatically when I(username) and I(password) are given.
+            - If not specified, tokens are not cached.
+        type: path
+    perf_summary:
+        description:
+            - If C(true), a summary of the REST API requests made by the task is returned in C(_perf),
+              and logged to I(log_path). It holds the number of requests, their time split into
+              phases, byte counts, and per command totals, slowest commands first.
+            - Every request is logged to I(log_path) with its timings, whether or not this is set.
+        type: bool
+        default: false
+    pool_size:
+        description:
+            - Maximum number of idle keep-alive connections to the cluster kept for reuse by the task.
+        type: int
+        default: 4
+        version_added: '1.13.0'
+    idle_timeout:
+        description:
+            - Seconds an idle keep-alive connection to the cluster may be reused.
+            - Older connections are closed and a new one is opened.
+        type: int
+        default: 30
+        version_added: '1.13.0'
+    validate_certs:
+        description:
+            - Validates certification.
+        default: false
+        type: bool
+    provisioningpolicies:
+        description:
+            - Provisioning policies, each taking the parameters of
+              M(ibm.spectrum_virtualize.ibm_sv_manage_provisioning_policy).
+            - The parameter I(state) of every entry defaults to C(present).
+        type: list
+        elements: dict
+    replicationpolicies:
+        description:
+            - Replication policies, each taking the parameters of
+              M(ibm.spectrum_virtualize.ibm_sv_manage_replication_policy).
+            - The parameter I(state) of every entry defaults to C(present).
+        type: list
+        elements: dict
+    snapshotpolicies:
+        description:
+            - Snapshot policies, each taking the parameters of M(ibm.spectrum_virtualize.ibm_sv_manage_snapshotpolicy).
+            - The parameter I(state) of every entry defaults to C(present). C(suspend) and C(resume) are not supported.
+        type: list
+        elements: dict
+    pools:
+        description:
+            - Pools, each taking the parameters of M(ibm.spectrum_virtualize.ibm_svc_mdiskgrp).
+            - The parameter I(state) of every entry defaults to C(present).
+        type: list
+        elements: dict
+    hostclusters:
+        description:
+            - Host clusters, each taking the parameters of M(ibm.spectrum_virtualize.ibm_svc_hostcluster).
+            - The parameter I(state) of every entry defaults to C(present).
+        type: list
+        elements: dict
+    hosts:
+        description:
+            - Hosts, each taking the parameters of M(ibm.spectrum_virtualize.ibm_svc_host).
+            - The parameter I(state) of every entry defaults to C(present).
+        type: list
+        elements: dict
+    volumegroups:
+        description:
+            - Volume groups, each taking the parameters of M(ibm.spectrum_virtualize.ibm_svc_manage_volumegroup).
+            - The parameter I(state) of every entry defaults to C(present).
+        type: list
+        elements: dict
+    volumes:
+        description:
+            - Volumes, each taking the parameters of M(ibm.spectrum_virtualize.ibm_svc_manage_volume),
+              except I(volumes) and I(parallelism).
+            - The parameter I(state) of every entry defaults to C(present).
+        type: list
+        elements: dict
+    mappings:
+        description:
+            - Volume mappings, each taking the keys C(volume), either C(host) or C(hostcluster), and C(state),
+              which defaults to C(present).
+            - The mappings of a host or host cluster are changed together by
+              M(ibm.spectrum_virtualize.ibm_svc_vol_map), which assigns their SCSI IDs.
+        type: list
+        elements: dict
+    parallelism:
+        description:
+            - Maximum number of entries of a stage applied concurrently.
+        type: int
+        default: 1
+author:
+    - Sanjaikumaar M (@sanjaikumaar)
+notes:
+    - This module runs on the Ansible controller, through its action plugin.
+    - This module requires ansible-core 2.11 or later.
+    - This module supports C(check_mode). In check mode, every entry is probed as its module would
+      in check mode, and objects planned by earlier stages are taken as existing by the later ones.
+    - In check mode, the commands that would run for the host clusters, hosts, volumes and volume mappings
+      are returned in C(command_plan), with the round trips of the task.
+    - The connection parameters apply to every entry and cannot be given in the entries.
+    - Objects that are not described are left as they are.
+'''
+
+EXAMPLES = '''
+- name: Reconcile the storage of an application
+  ibm.spectrum_virtualize.ibm_sv_desired_state:
+    clustername: "{{ cluster }}"
+    username: "{{ username }}"
+    password: "{{ password }}"
+    parallelism: 8
+    hostclusters:
+      - name: app-cluster
+    hosts:
+      - name: app-host0
+        fcwwpn: 10000090FA0B2B30
+        hostcluster: app-cluster
+      - name: app-host1
+        fcwwpn: 10000090FA0B2B31
+        hostcluster: app-cluster
+      - name: retired-host
+        state: absent
+    volumegroups:
+      - name: app-vg
+    volumes:
+      - name: app-data
+        pool: Pool0
+        size: 100
+        unit: gb
+        volumegroup: app-vg
+      - name: app-logs
+        pool: Pool0
+        size: 20
+        unit: gb
+        volumegroup: app-vg
+    mappings:
+      - volume: app-data
+        hostcluster: app-cluster
+      - volume: app-logs
+        hostcluster: app-cluster
+'''
+
+RETURN = '''
+results:
+    description:
+        - Outcome of every entry, in the order they were applied.
+        - Mappings have the key C(host) or C(hostcluster), and C(scsi) when they are created.
+    returned: always
+    type: list
+    elements: dict
+    sample: [{"kind": "hosts", "name": "app-host0", "state": "present", "stage": 2, "changed": true,
+              "msg": "host app-host0 has been created and added to hostcluster."}]
+    contains:
+        kind:
+            description: Option of the entry.
+            type: str
+        name:
+            description: Name of the object, or of the volume of a mapping.
+            type: str
+        state:
+            description: State requested for the object.
+            type: str
+        stage:
+            description: Index of the stage in I(stages) that applied the entry.
+            type: int
+        changed:
+            description: Whether the object was changed.
+            type: bool
+        msg:
+            description: Message of the module that handled the entry.
+            type: str
+        failed:
+            description: Present and C(true) if the entry failed.
+            type: bool
+        skipped:
+            description: Present and C(true) if the entry was not applied because an earlier stage failed.
+            type: bool
+stages:
+    description: Stages applied, in order, with the state and kinds of objects of their entries.
+    returned: always
+    type: list
+    elements: dict
+    sample: [{"state": "absent", "kinds": ["hosts"]}, {"state": "present", "kinds": ["hostclusters"]}]
+command_plan:
+    description:
+        - Commands that would run for the entries, in the order they were planned, each with the cluster
+          it would run on, its options and its arguments.
+        - Commands of the entries of a stage may be listed in a different order from one run to the next.
+    returned: in check mode, when changes are needed
+    type: list
+    elements: dict
+    sample: [{"cluster": "10.10.10.1", "cmd": "mkhostcluster", "opts": {"name": "app-cluster"}, "args": []}]
+round_trips:
+    description:
+        - REST API round trips of the task, C(reads) for the C(ls) requests made and C(writes) for the commands planned.
+    returned: in check mode, when changes are needed
+    type: dict
+    sample: {"reads": 5, "writes": 7}
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import (
+    svc_argument_spec
+)
+
+# Options describing objects, in the order of their dependencies
+DESIRED_STATE_KINDS = ('provisioningpolicies', 'replicationpolicies', 'snapshotpolicies', 'pools',
+                       'hostclusters', 'hosts', 'volumegroups', 'volumes', 'mappings')
+
+
+def desired_state_argument_spec():
+    """
+    Returns argument_spec of ibm_sv_desired_state, shared with its
+    action plugin
+
+    :returns: argument_spec
+    :rtype: dict
+    """
+    argument_spec = svc_argument_spec()
+    argument_spec.update((kind, dict(type='list', elements='dict')) for kind in DESIRED_STATE_KINDS)
+    argument_spec.update(parallelism=dict(type='int', default=1))
+    return argument_spec
+
+
+def main():
+    module = AnsibleModule(argument_spec=desired_state_argument_spec(),
+                           supports_check_mode=True)
+    module.fail_json(msg='This module runs on the Ansible controller through its action plugin, '
+                         'which was not found.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,295 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2023 IBM CORPORATION
+# Author(s): Sanjaikumaar M <sanjaikumaar.m@ibm.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+module: ibm_sv_eventlog_info
+short_description: This module reads new event log entries from IBM Spectrum Virtualize family storage systems
+version_added: '1.13.0'
+description:
+  - Reads the event log entries logged since the previous run, in sequence number order.
+  - The last sequence number read is kept per cluster on the Ansible controller, so that
+    successive runs only return the entries that are new.
+options:
+    clustername:
+        description:
+            - The hostname or management IP of the Spectrum Virtualize storage system.
+        required: true
+        type: str
+    domain:
+        description:
+            - Domain for the Spectrum Virtualize storage system.
+            - Valid when the hostname is used for the parameter I(clustername).
+        type: str
+    username:
+        description:
+            - REST API username for the Spectrum Virtualize storage system.
+            - The parameters I(username) and I(password) are required if not using I(token) to authenticate a user.
+        type: str
+    password:
+        description:
+            - REST API password for the Spectrum Virtualize storage system.
+            - The parameters I(username) and I(password) are required if not using I(token) to authenticate a user.
+        type: str
+    token:
+        description:
+            - The authentication token to verify a user on the Spectrum Virtualize storage system.
+            - To generate a token, use the M(ibm.spectrum_virtualize.ibm_svc_auth) module.
+        type: str
+    log_path:
+        description:
+            - Path of debug log file.
+        type: str
+    token_cache_path:
+        description:
+            - Directory in which authentication tokens are cached per cluster and user.
+            - Tasks that run against the same cluster as the same user reuse the cached token
+              instead of authenticating again.
+            - An expired or rejected token is replaced automatically when I(username) and I(password) are given.
+            - If not specified, tokens are not cached.
+        type: path
+    perf_summary:
+        description:
+            - If C(true), a summary of the REST API requests made by the task is returned in C(_perf),
+              and logged to I(log_path). It holds the number of requests, their time split into
+              phases, byte counts, and per command totals, slowest commands first.
+            - Every request is logged to I(log_path) with its timings, whether or not this is set.
+        type: bool
+        default: false
+    pool_size:
+        description:
+            - Maximum number of idle keep-alive connections to the cluster kept for reuse by the task.
+        type: int
+        default: 4
+        version_added: '1.13.0'
+    idle_timeout:
+        description:
+            - Seconds an idle keep-alive connection to the cluster may be reused.
+            - Older connections are closed and a new one is opened.
+        type: int
+        default: 30
+        version_added: '1.13.0'
+    validate_certs:
+        description:
+            - Validates certification.
+        default: false
+        type: bool
+    state_path:
+        description:
+            - Directory on the Ansible controller in which the last sequence number read is kept,
+              per cluster and per combination of I(status) and I(fixed).
+            - If not specified, and I(since_sequence_number) is not specified either, every entry is read.
+        type: path
+    since_sequence_number:
+        description:
+            - Read only the entries with a sequence number greater than this one.
+            - Overrides the sequence number kept in I(state_path), which is still updated.
+        type: int
+    status:
+        description:
+            - Kinds of entries to read. The filter is applied by the storage system.
+        type: list
+        elements: str
+        choices: [ alert, message, monitoring, expired ]
+    fixed:
+        description:
+            - If C(true), fixed alerts are read too. The filter is applied by the storage system.
+        type: bool
+    output_path:
+        description:
+            - File to append the entries read to, one JSON document per line, for log forwarders to tail.
+            - If specified, the entries are not returned in I(events), only counted.
+        type: path
+author:
+    - Sanjaikumaar M (@sanjaikumaar)
+notes:
+    - This module supports C(check_mode). In check mode, the entries are read but neither written
+      to I(output_path) nor recorded in I(state_path).
+    - The storage system cannot filter the event log by sequence number, so the listing is read
+      in full and filtered while it is received, without holding the whole log in memory.
+'''
+
+EXAMPLES = '''
+- name: Forward new alerts to a log file
+  ibm.spectrum_virtualize.ibm_sv_eventlog_info:
+    clustername: "{{ cluster }}"
+    username: "{{ username }}"
+    password: "{{ password }}"
+    state_path: /var/lib/ansible/svc_eventlog
+    status: alert
+    output_path: /var/log/svc/{{ cluster }}.jsonl
+- name: Read the entries logged after sequence number 400
+  ibm.spectrum_virtualize.ibm_sv_eventlog_info:
+    clustername: "{{ cluster }}"
+    username: "{{ username }}"
+    password: "{{ password }}"
+    since_sequence_number: 400
+'''
+
+RETURN = '''
+events:
+    description:
+        - Entries read, in sequence number order.
+        - Empty when I(output_path) is specified.
+    returned: success
+    type: list
+    elements: dict
+    sample: [{"sequence_number": "401", "status": "alert", "fixed": "no", "event_id": "080004", "...": "..."}]
+count:
+    description: Number of entries read.
+    returned: success
+    type: int
+    sample: 1
+last_sequence_number:
+    description:
+        - Highest sequence number read, or the one read in a previous run if no entry is new.
+        - Null if no entry was ever read.
+    returned: success
+    type: int
+    sample: 401
+'''
+
+import json
+import os
+from traceback import format_exc
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import (
+    IBMSVCRestApi,
+    SVCStateStore,
+    svc_argument_spec,
+    get_logger
+)
+from ansible.module_utils._text import to_bytes, to_native
+
+
+class IBMSVEventlogInfo(object):
+
+    def __init__(self):
+        argument_spec = svc_argument_spec()
+        argument_spec.update(
+            dict(
+                state_path=dict(type='path'),
+                since_sequence_number=dict(type='int'),
+                status=dict(type='list', elements='str',
+                            choices=['alert', 'message', 'monitoring', 'expired']),
+                fixed=dict(type='bool'),
+                output_path=dict(type='path')
+            )
+        )
+
+        self.module = AnsibleModule(argument_spec=argument_spec,
+                                    supports_check_mode=True)
+
+        # Optional
+        self.state_path = self.module.params['state_path']
+        self.since_sequence_number = self.module.params['since_sequence_number']
+        self.status = self.module.params['status']
+        self.fixed = self.module.params['fixed']
+        self.output_path = self.module.params['output_path']
+
+        # logging setup
+        self.log_path = self.module.params['log_path']
+        log = get_logger(self.__class__.__name__, self.log_path)
+        self.log = log.info
+
+        self.store = SVCStateStore(self.state_path) if self.state_path else None
+        self.state_key = [self.module.params['clustername'], 'eventlog',
+                          sorted(self.status or []), self.fixed]
+
+        self.restapi = IBMSVCRestApi(
+            module=self.module,
+            clustername=self.module.params['clustername'],
+            domain=self.module.params['domain'],
+            username=self.module.params['username'],
+            password=self.module.params['password'],
+            validate_certs=self.module.params['validate_certs'],
+            log_path=self.log_path,
+            token=self.module.params['token'],
+            token_cache_path=self.module.params['token_cache_path'],
+            pool_size=self.module.params['pool_size'],
+            idle_timeout=self.module.params['idle_timeout'],
+            perf_summary=self.module.params['perf_summary']
+        )
+
+    def cmdopts(self):
+        cmdopts = {}
+        if self.status:
+            for status in ('alert', 'message', 'monitoring', 'expired'):
+                cmdopts[status] = 'yes' if status in self.status else 'no'
+        if self.fixed is not None:
+            cmdopts['fixed'] = 'yes' if self.fixed else 'no'
+        return cmdopts or None
+
+    def last_sequence_number(self):
+        if self.since_sequence_number is not None:
+            return self.since_sequence_number
+        state = self.store.load(self.state_key) if self.store else None
+        return state.get('sequence_number') if state else None
+
+    def read_new_events(self, since):
+        """
+        Streams lseventlog, keeping only the entries logged after the
+        given sequence number.
+
+        :param since: sequence number, None to keep every entry
+        :type since: int
+        :returns: the new entries, in sequence number order
+        :rtype: list
+        """
+        events = self.restapi.svc_obj_info(cmd='lseventlog', cmdopts=self.cmdopts(),
+                                           cmdargs=None, stream=True) or []
+        if since is not None:
+            events = (event for event in events if int(event['sequence_number']) > since)
+        return sorted(events, key=lambda event: int(event['sequence_number']))
+
+    def write_events(self, events):
+        fd = os.open(self.output_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        try:
+            os.write(fd, b''.join(to_bytes(json.dumps(event, sort_keys=True) + '\n') for event in events))
+        finally:
+            os.close(fd)
+
+    def apply(self):
+        if self.since_sequence_number is not None and self.since_sequence_number < 0:
+            self.module.fail_json(msg='since_sequence_number(%d) must not be negative' % self.since_sequence_number)
+
+        since = self.last_sequence_number()
+        events = self.read_new_events(since)
+        last = int(events[-1]['sequence_number']) if events else since
+        self.log('Read %d event log entries after sequence number %s', len(events), since)
+
+        if not self.module.check_mode:
+            # The entries are written before the sequence number is recorded,
+            # so that a failed run reads them again instead of losing them
+            if self.output_path and events:
+                self.write_events(events)
+            if self.store and last is not None:
+                self.store.save(self.state_key, {'sequence_number': last})
+
+        self.module.exit_json(
+            changed=False,
+            events=[] if self.output_path else events,
+            count=len(events),
+            last_sequence_number=last
+        )
+
+
+def main():
+    v = IBMSVEventlogInfo()
+    try:
+        v.apply()
+    except Exception as e:
+        v.log('Exception in apply(): \n%s', format_exc())
+        v.module.fail_json(msg='Module failed. Error [%s].' % to_native(e))
+
+
+if __name__ == '__main__':
+    main()
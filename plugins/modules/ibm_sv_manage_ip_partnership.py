@@ -143,6 +143,37 @@ options:
         description:
             - Path of debug log file.
         type: str
+    token_cache_path:
+        description:
+            - Directory in which authentication tokens are cached per cluster and user.
+            - Tasks that run against the same cluster as the same user reuse the cached token
+              instead of authenticating again.
+            - An expired or rejected token is replaced automatically when I(username) and I(password) are given.
+            - If not specified, tokens are not cached.
+        type: path
+        version_added: '1.13.0'
+    perf_summary:
+        description:
+            - If C(true), a summary of the REST API requests made by the task is returned in C(_perf),
+              and logged to I(log_path). It holds the number of requests, their time split into
+              phases, byte counts, and per command totals, slowest commands first.
+            - Every request is logged to I(log_path) with its timings, whether or not this is set.
+        type: bool
+        default: false
+        version_added: '1.13.0'
+    pool_size:
+        description:
+            - Maximum number of idle keep-alive connections to the cluster kept for reuse by the task.
+        type: int
+        default: 4
+        version_added: '1.13.0'
+    idle_timeout:
+        description:
+            - Seconds an idle keep-alive connection to the cluster may be reused.
+            - Older connections are closed and a new one is opened.
+        type: int
+        default: 30
+        version_added: '1.13.0'
 author:
     - Sreshtant Bohidar(@Sreshtant-Bohidar)
 notes:
@@ -266,7 +297,11 @@ class IBMSVCIPPartnership(object):
             password=self.module.params['password'],
             validate_certs=self.module.params['validate_certs'],
             log_path=log_path,
-            token=self.module.params['token']
+            token=self.module.params['token'],
+            token_cache_path=self.module.params['token_cache_path'],
+            pool_size=self.module.params['pool_size'],
+            idle_timeout=self.module.params['idle_timeout'],
+            perf_summary=self.module.params['perf_summary']
         )
         # creating an instance of IBMSVCRestApi for remote system
         self.restapi_remote = IBMSVCRestApi(
@@ -277,7 +312,11 @@ class IBMSVCIPPartnership(object):
             password=self.module.params['remote_password'],
             validate_certs=self.module.params['remote_validate_certs'],
             log_path=log_path,
-            token=self.module.params['remote_token']
+            token=self.module.params['remote_token'],
+            token_cache_path=self.module.params['token_cache_path'],
+            pool_size=self.module.params['pool_size'],
+            idle_timeout=self.module.params['idle_timeout'],
+            perf_summary=self.module.params['perf_summary']
         )
 
     # perform some basic checks
@@ -0,0 +1,408 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2023 IBM CORPORATION
+# Author(s): Sanjaikumaar M <sanjaikumaar.m@ibm.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+module: ibm_sv_stats_info
+short_description: This module samples performance statistics of IBM Spectrum Virtualize family storage systems
+version_added: '1.13.0'
+description:
+  - Samples the system, node, node canister and enclosure performance statistics, and aligns the samples
+    into one time series per object and statistic.
+  - The statistics are either sampled by the module at a regular interval, or read from the statistics
+    history kept by the storage system for the last five minutes.
+options:
+    clustername:
+        description:
+            - The hostname or management IP of the Spectrum Virtualize storage system.
+        required: true
+        type: str
+    domain:
+        description:
+            - Domain for the Spectrum Virtualize storage system.
+            - Valid when the hostname is used for the parameter I(clustername).
+        type: str
+    username:
+        description:
+            - REST API username for the Spectrum Virtualize storage system.
+            - The parameters I(username) and I(password) are required if not using I(token) to authenticate a user.
+        type: str
+    password:
+        description:
+            - REST API password for the Spectrum Virtualize storage system.
+            - The parameters I(username) and I(password) are required if not using I(token) to authenticate a user.
+        type: str
+    token:
+        description:
+            - The authentication token to verify a user on the Spectrum Virtualize storage system.
+            - To generate a token, use the M(ibm.spectrum_virtualize.ibm_svc_auth) module.
+        type: str
+    log_path:
+        description:
+            - Path of debug log file.
+        type: str
+    token_cache_path:
+        description:
+            - Directory in which authentication tokens are cached per cluster and user.
+            - Tasks that run against the same cluster as the same user reuse the cached token
+              instead of authenticating again.
+            - An expired or rejected token is replaced automatically when I(username) and I(password) are given.
+            - If not specified, tokens are not cached.
+        type: path
+    perf_summary:
+        description:
+            - If C(true), a summary of the REST API requests made by the task is returned in C(_perf),
+              and logged to I(log_path). It holds the number of requests, their time split into
+              phases, byte counts, and per command totals, slowest commands first.
+            - Every request is logged to I(log_path) with its timings, whether or not this is set.
+        type: bool
+        default: false
+    pool_size:
+        description:
+            - Maximum number of idle keep-alive connections to the cluster kept for reuse by the task.
+        type: int
+        default: 4
+        version_added: '1.13.0'
+    idle_timeout:
+        description:
+            - Seconds an idle keep-alive connection to the cluster may be reused.
+            - Older connections are closed and a new one is opened.
+        type: int
+        default: 30
+        version_added: '1.13.0'
+    validate_certs:
+        description:
+            - Validates certification.
+        default: false
+        type: bool
+    stats:
+        description:
+            - Statistics to sample.
+            - C(system) lists the statistics of the system, by using C(lssystemstats).
+            - C(node) lists the statistics of every node, by using C(lsnodestats).
+            - C(nodecanister) lists the statistics of every node canister, by using C(lsnodecanisterstats).
+            - C(enclosure) lists the statistics of every enclosure, by using C(lsenclosurestats).
+        type: list
+        elements: str
+        choices: [ system, node, nodecanister, enclosure ]
+        default: [ system ]
+    metrics:
+        description:
+            - Names of the statistics to keep, for example C(vdisk_ms) or C(vdisk_io).
+            - If not specified, every statistic is kept.
+            - Required when I(mode=history).
+        type: list
+        elements: str
+    mode:
+        description:
+            - C(sample) lists the current value of the statistics every I(interval) seconds for I(duration) seconds.
+            - C(history) lists the samples kept by the storage system once, by using the C(-history) option.
+        type: str
+        choices: [ sample, history ]
+        default: sample
+    interval:
+        description:
+            - Seconds between two samples.
+            - Valid when I(mode=sample).
+        type: int
+        default: 5
+    duration:
+        description:
+            - Seconds during which the statistics are sampled.
+            - Valid when I(mode=sample).
+        type: int
+        default: 60
+    output_path:
+        description:
+            - File to write the samples to, one row per sample time.
+            - If specified, the series are not returned, only named.
+        type: path
+    output_format:
+        description:
+            - Format of I(output_path). C(csv) has a C(timestamp) column followed by one column per series.
+              C(ndjson) has one JSON document per line, holding the C(timestamp) and the value of every series.
+        type: str
+        choices: [ csv, ndjson ]
+        default: ndjson
+    compress:
+        description:
+            - If C(true), I(output_path) is compressed with gzip.
+        type: bool
+        default: false
+author:
+    - Sanjaikumaar M (@sanjaikumaar)
+notes:
+    - This module supports C(check_mode). In check mode, the statistics are sampled but not written to I(output_path).
+    - The sample times are in the C(YYMMDDHHMMSS) format used by the storage system. In sample mode, they are
+      taken from the clock of the Ansible controller.
+'''
+
+EXAMPLES = '''
+- name: Sample the latency and throughput of every node for ten minutes
+  ibm.spectrum_virtualize.ibm_sv_stats_info:
+    clustername: "{{ cluster }}"
+    username: "{{ username }}"
+    password: "{{ password }}"
+    stats: node
+    metrics: [vdisk_ms, vdisk_io, vdisk_mb]
+    interval: 10
+    duration: 600
+    output_path: /var/lib/svc/baseline.csv.gz
+    output_format: csv
+    compress: true
+- name: Read the system statistics history
+  ibm.spectrum_virtualize.ibm_sv_stats_info:
+    clustername: "{{ cluster }}"
+    username: "{{ username }}"
+    password: "{{ password }}"
+    mode: history
+    metrics: [vdisk_ms, vdisk_io]
+  register: stats
+'''
+
+RETURN = '''
+timestamps:
+    description:
+        - Sample times, in ascending order.
+        - Empty when I(output_path) is specified.
+    returned: success
+    type: list
+    elements: str
+    sample: ["230512134500", "230512134505"]
+series:
+    description:
+        - Values of every statistic, keyed by C(<object>.<statistic>), and aligned with I(timestamps).
+          The object is C(system), or the name of the node, node canister or enclosure.
+        - A value is null when the statistic was not listed at that time.
+        - Empty when I(output_path) is specified.
+    returned: success
+    type: dict
+    sample: {"node1.vdisk_ms": [1, 2], "node2.vdisk_ms": [0, null]}
+series_names:
+    description: Names of the series, in the order of the I(output_path) columns.
+    returned: success
+    type: list
+    elements: str
+    sample: ["node1.vdisk_ms", "node2.vdisk_ms"]
+samples:
+    description: Number of sample times.
+    returned: success
+    type: int
+    sample: 2
+'''
+
+import csv
+import gzip
+import io
+import json
+import time
+from collections import defaultdict
+from traceback import format_exc
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import (
+    IBMSVCRestApi,
+    svc_argument_spec,
+    get_logger
+)
+from ansible.module_utils._text import to_bytes, to_native, to_text
+
+# Statistics listing, object listing and object name attribute of each statistics kind
+STATS_COMMANDS = {
+    'system': ('lssystemstats', None, None),
+    'node': ('lsnodestats', 'lsnode', 'node_name'),
+    'nodecanister': ('lsnodecanisterstats', 'lsnodecanister', 'node_name'),
+    'enclosure': ('lsenclosurestats', 'lsenclosure', 'enclosure_id')
+}
+
+
+def to_number(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return value
+
+
+class IBMSVStatsInfo(object):
+
+    def __init__(self):
+        argument_spec = svc_argument_spec()
+        argument_spec.update(
+            dict(
+                stats=dict(type='list', elements='str', default=['system'],
+                           choices=['system', 'node', 'nodecanister', 'enclosure']),
+                metrics=dict(type='list', elements='str'),
+                mode=dict(type='str', default='sample', choices=['sample', 'history']),
+                interval=dict(type='int', default=5),
+                duration=dict(type='int', default=60),
+                output_path=dict(type='path'),
+                output_format=dict(type='str', default='ndjson', choices=['csv', 'ndjson']),
+                compress=dict(type='bool', default=False)
+            )
+        )
+
+        self.module = AnsibleModule(argument_spec=argument_spec,
+                                    supports_check_mode=True)
+
+        # Optional
+        self.stats = self.module.params['stats']
+        self.metrics = self.module.params['metrics']
+        self.mode = self.module.params['mode']
+        self.interval = self.module.params['interval']
+        self.duration = self.module.params['duration']
+        self.output_path = self.module.params['output_path']
+        self.output_format = self.module.params['output_format']
+        self.compress = self.module.params['compress']
+
+        # logging setup
+        self.log_path = self.module.params['log_path']
+        log = get_logger(self.__class__.__name__, self.log_path)
+        self.log = log.info
+
+        # Dynamic variables
+        self.samples = defaultdict(dict)
+
+        self.restapi = IBMSVCRestApi(
+            module=self.module,
+            clustername=self.module.params['clustername'],
+            domain=self.module.params['domain'],
+            username=self.module.params['username'],
+            password=self.module.params['password'],
+            validate_certs=self.module.params['validate_certs'],
+            log_path=self.log_path,
+            token=self.module.params['token'],
+            token_cache_path=self.module.params['token_cache_path'],
+            pool_size=self.module.params['pool_size'],
+            idle_timeout=self.module.params['idle_timeout'],
+            perf_summary=self.module.params['perf_summary']
+        )
+
+    def basic_checks(self):
+        if self.mode == 'history' and not self.metrics:
+            self.module.fail_json(msg='Missing mandatory parameter: metrics (required when mode=history)')
+        if self.mode == 'sample':
+            if self.interval < 1:
+                self.module.fail_json(msg='interval(%d) must be greater than zero' % self.interval)
+            if self.duration < 0:
+                self.module.fail_json(msg='duration(%d) must not be negative' % self.duration)
+        if self.compress and not self.output_path:
+            self.module.fail_json(msg='Parameter compress is valid only with output_path')
+
+    def record(self, timestamp, obj, row, value_key):
+        if self.metrics and row['stat_name'] not in self.metrics:
+            return
+        self.samples[timestamp]['%s.%s' % (obj, row['stat_name'])] = to_number(row[value_key])
+
+    def list_stats(self, kind, cmdopts=None, cmdargs=None):
+        cmd = STATS_COMMANDS[kind][0]
+        return self.restapi.svc_obj_info(cmd=cmd, cmdopts=cmdopts, cmdargs=cmdargs, cache=False) or []
+
+    def sample_once(self, timestamp):
+        for kind in self.stats:
+            name_attr = STATS_COMMANDS[kind][2]
+            for row in self.list_stats(kind):
+                obj = row[name_attr] if name_attr else kind
+                self.record(timestamp, obj, row, 'stat_current')
+
+    def sample(self):
+        """
+        Lists the current statistics every interval seconds. The sample
+        times are scheduled from the start, so that the time spent
+        listing does not make the samples drift.
+        """
+        start = time.time()
+        count = 0
+        while True:
+            self.sample_once(time.strftime('%y%m%d%H%M%S', time.localtime(time.time())))
+            count += 1
+            scheduled = start + count * self.interval
+            if scheduled > start + self.duration:
+                break
+            time.sleep(max(0, scheduled - time.time()))
+        self.log('Sampled %s statistics %d times', ', '.join(self.stats), count)
+
+    def history(self):
+        cmdopts = {'history': ':'.join(self.metrics)}
+        for kind in self.stats:
+            _, list_cmd, name_attr = STATS_COMMANDS[kind]
+            if not list_cmd:
+                for row in self.list_stats(kind, cmdopts):
+                    self.record(row['sample_time'], kind, row, 'stat_value')
+                continue
+            objects = self.restapi.svc_obj_info(cmd=list_cmd, cmdopts=None, cmdargs=None) or []
+            for obj in objects:
+                # The history of a node or enclosure is listed for one object at a time
+                obj_id = obj['id']
+                for row in self.list_stats(kind, cmdopts, [obj_id]):
+                    name = row.get(name_attr) or obj.get('name') or obj_id
+                    self.record(row['sample_time'], name, row, 'stat_value')
+
+    def align(self):
+        """
+        Aligns the samples into series sharing one list of timestamps.
+
+        :returns: (timestamps, series names, series)
+        :rtype: tuple
+        """
+        timestamps = sorted(self.samples)
+        names = sorted(set(name for values in self.samples.values() for name in values))
+        series = dict((name, [self.samples[t].get(name) for t in timestamps]) for name in names)
+        return timestamps, names, series
+
+    def write(self, timestamps, names, series):
+        buf = io.StringIO()
+        if self.output_format == 'csv':
+            writer = csv.writer(buf, lineterminator='\n')
+            writer.writerow(['timestamp'] + names)
+            for i, timestamp in enumerate(timestamps):
+                writer.writerow([timestamp] + ['' if series[name][i] is None else series[name][i] for name in names])
+        else:
+            for i, timestamp in enumerate(timestamps):
+                row = dict((name, series[name][i]) for name in names)
+                row['timestamp'] = timestamp
+                buf.write(to_text(json.dumps(row, sort_keys=True)) + u'\n')
+        content = to_bytes(buf.getvalue())
+        opener = gzip.open if self.compress else open
+        with opener(self.output_path, 'wb') as f:
+            f.write(content)
+
+    def apply(self):
+        self.basic_checks()
+
+        if self.mode == 'history':
+            self.history()
+        else:
+            self.sample()
+
+        timestamps, names, series = self.align()
+        result = dict(changed=False, samples=len(timestamps), series_names=names)
+        if self.output_path:
+            if not self.module.check_mode:
+                self.write(timestamps, names, series)
+            result.update(timestamps=[], series={})
+        else:
+            result.update(timestamps=timestamps, series=series)
+        self.module.exit_json(**result)
+
+
+def main():
+    v = IBMSVStatsInfo()
+    try:
+        v.apply()
+    except Exception as e:
+        v.log('Exception in apply(): \n%s', format_exc())
+        v.module.fail_json(msg='Module failed. Error [%s].' % to_native(e))
+
+
+if __name__ == '__main__':
+    main()
@@ -128,6 +128,37 @@ options:
         description:
             - Path of debug log file.
         type: str
+    token_cache_path:
+        description:
+            - Directory in which authentication tokens are cached per cluster and user.
+            - Tasks that run against the same cluster as the same user reuse the cached token
+              instead of authenticating again.
+            - An expired or rejected token is replaced automatically when I(username) and I(password) are given.
+            - If not specified, tokens are not cached.
+        type: path
+        version_added: '1.13.0'
+    perf_summary:
+        description:
+            - If C(true), a summary of the REST API requests made by the task is returned in C(_perf),
+              and logged to I(log_path). It holds the number of requests, their time split into
+              phases, byte counts, and per command totals, slowest commands first.
+            - Every request is logged to I(log_path) with its timings, whether or not this is set.
+        type: bool
+        default: false
+        version_added: '1.13.0'
+    pool_size:
+        description:
+            - Maximum number of idle keep-alive connections to the cluster kept for reuse by the task.
+        type: int
+        default: 4
+        version_added: '1.13.0'
+    idle_timeout:
+        description:
+            - Seconds an idle keep-alive connection to the cluster may be reused.
+            - Older connections are closed and a new one is opened.
+        type: int
+        default: 30
+        version_added: '1.13.0'
     validate_certs:
         description:
             - Validates certification.
@@ -138,6 +169,7 @@ author:
     - Rohit Kumar (@rohitk-github)
 notes:
     - This module supports C(check_mode).
+    - In check mode, the commands that would run are returned in C(command_plan), with the round trips they take.
 '''
 
 EXAMPLES = '''
@@ -210,7 +242,23 @@ EXAMPLES = '''
     state: absent
 '''
 
-RETURN = '''#'''
+RETURN = '''
+command_plan:
+    description:
+        - Commands that would run to bring the objects to the requested state, in the order they were planned,
+          each with the cluster it would run on, its options and its arguments.
+    returned: in check mode, when changes are needed
+    type: list
+    elements: dict
+    sample: [{"cluster": "10.10.10.1", "cmd": "mkhost", "opts": {"name": "host0", "force": true,
+              "fcwwpn": "10000090FA0B2B30", "protocol": "scsi"}, "args": []}]
+round_trips:
+    description:
+        - REST API round trips of the run, C(reads) for the C(ls) requests made and C(writes) for the commands planned.
+    returned: in check mode, when changes are needed
+    type: dict
+    sample: {"reads": 2, "writes": 2}
+'''
 
 from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule
@@ -309,7 +357,11 @@ class IBMSVChost(object):
             password=self.module.params['password'],
             validate_certs=self.module.params['validate_certs'],
             log_path=log_path,
-            token=self.module.params['token']
+            token=self.module.params['token'],
+            token_cache_path=self.module.params['token_cache_path'],
+            pool_size=self.module.params['pool_size'],
+            idle_timeout=self.module.params['idle_timeout'],
+            perf_summary=self.module.params['perf_summary']
         )
 
     def basic_checks(self):
@@ -420,10 +472,6 @@ class IBMSVChost(object):
             self.module.fail_json(msg="You must not pass in both hostcluster and "
                                       "nohostcluster to the module.")
 
-        if self.module.check_mode:
-            self.changed = True
-            return
-
         self.log("creating host '%s'", self.name)
 
         # Make command
@@ -449,6 +497,11 @@ class IBMSVChost(object):
         self.log("creating host command '%s' opts '%s'",
                  self.fcwwpn, self.type)
 
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(cmd, cmdopts, None)
+            self.changed = True
+            return
+
         # Run command
         result = self.restapi.svc_run_command(cmd, cmdopts, cmdargs=None)
         self.log("create host result '%s'", result)
@@ -460,10 +513,17 @@ class IBMSVChost(object):
             self.module.fail_json(
                 msg="Failed to create host [%s]" % self.name)
 
+    def run_command(self, cmd, cmdopts, cmdargs):
+        # In check mode, the command is planned instead of being run
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(cmd, cmdopts, cmdargs)
+            return None
+        return self.restapi.svc_run_command(cmd, cmdopts, cmdargs)
+
     def host_fcwwpn_update(self):
         to_be_removed = ':'.join(list(set(self.existing_fcwwpn) - set(self.input_fcwwpn)))
         if to_be_removed:
-            self.restapi.svc_run_command(
+            self.run_command(
                 'rmhostport',
                 {'fcwwpn': to_be_removed, 'force': True},
                 [self.name]
@@ -471,7 +531,7 @@ class IBMSVChost(object):
             self.log('%s removed from %s', to_be_removed, self.name)
         to_be_added = ':'.join(list(set(self.input_fcwwpn) - set(self.existing_fcwwpn)))
         if to_be_added:
-            self.restapi.svc_run_command(
+            self.run_command(
                 'addhostport',
                 {'fcwwpn': to_be_added, 'force': True},
                 [self.name]
@@ -481,7 +541,7 @@ class IBMSVChost(object):
     def host_iscsiname_update(self):
         to_be_removed = ','.join(list(set(self.existing_iscsiname) - set(self.input_iscsiname)))
         if to_be_removed:
-            self.restapi.svc_run_command(
+            self.run_command(
                 'rmhostport',
                 {'iscsiname': to_be_removed, 'force': True},
                 [self.name]
@@ -489,7 +549,7 @@ class IBMSVChost(object):
             self.log('%s removed from %s', to_be_removed, self.name)
         to_be_added = ','.join(list(set(self.input_iscsiname) - set(self.existing_iscsiname)))
         if to_be_added:
-            self.restapi.svc_run_command(
+            self.run_command(
                 'addhostport',
                 {'iscsiname': to_be_added, 'force': True},
                 [self.name]
@@ -499,7 +559,7 @@ class IBMSVChost(object):
     def host_nqn_update(self):
         to_be_removed = ','.join(list(set(self.existing_nqn) - set(self.input_nqn)))
         if to_be_removed:
-            self.restapi.svc_run_command(
+            self.run_command(
                 'rmhostport',
                 {'nqn': to_be_removed, 'force': True},
                 [self.name]
@@ -507,7 +567,7 @@ class IBMSVChost(object):
             self.log('%s removed from %s', to_be_removed, self.name)
         to_be_added = ','.join(list(set(self.input_nqn) - set(self.existing_nqn)))
         if to_be_added:
-            self.restapi.svc_run_command(
+            self.run_command(
                 'addhostport',
                 {'nqn': to_be_added, 'force': True},
                 [self.name]
@@ -544,24 +604,20 @@ class IBMSVChost(object):
             cmdopts['portset'] = self.portset
         if cmdopts:
             cmdargs = [self.name]
-            self.restapi.svc_run_command(cmd, cmdopts, cmdargs)
+            self.run_command(cmd, cmdopts, cmdargs)
             # Any error will have been raised in svc_run_command
             # chhost does not output anything when successful.
             self.changed = True
             self.log("type of %s updated", self.name)
 
     def host_delete(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
-
         self.log("deleting host '%s'", self.name)
 
         cmd = 'rmhost'
         cmdopts = {}
         cmdargs = [self.name]
 
-        self.restapi.svc_run_command(cmd, cmdopts, cmdargs)
+        self.run_command(cmd, cmdopts, cmdargs)
 
         # Any error will have been raised in svc_run_command
         # chhost does not output anything when successful.
@@ -576,10 +632,6 @@ class IBMSVChost(object):
         return data
 
     def addhostcluster(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
-
         self.log("Adding host '%s' in hostcluster %s", self.name, self.hostcluster)
 
         cmd = 'addhostclustermember'
@@ -588,17 +640,13 @@ class IBMSVChost(object):
 
         cmdopts['host'] = self.name
 
-        self.restapi.svc_run_command(cmd, cmdopts, cmdargs)
+        self.run_command(cmd, cmdopts, cmdargs)
 
         # Any error will have been raised in svc_run_command
         # chhost does not output anything when successful.
         self.changed = True
 
     def removehostcluster(self, data):
-        if self.module.check_mode:
-            self.changed = True
-            return
-
         self.log("removing host '%s' from hostcluster %s", self.name, data['host_cluster_name'])
 
         hostcluster_name = data['host_cluster_name']
@@ -610,7 +658,7 @@ class IBMSVChost(object):
         cmdopts['host'] = self.name
         cmdopts['keepmappings'] = True
 
-        self.restapi.svc_run_command(cmd, cmdopts, cmdargs)
+        self.run_command(cmd, cmdopts, cmdargs)
 
         # Any error will have been raised in svc_run_command
         # chhost does not output anything when successful.
@@ -628,11 +676,7 @@ class IBMSVChost(object):
         elif not old_host_data and host_data:
             msg = "Host with name [{0}] already exists.".format(self.name)
         elif old_host_data and not host_data:
-            # when check_mode is enabled
-            if self.module.check_mode:
-                self.changed = True
-                return
-            self.restapi.svc_run_command('chhost', {'name': self.name}, [self.old_name])
+            self.run_command('chhost', {'name': self.name}, [self.old_name])
             self.changed = True
             msg = "Host [{0}] has been successfully rename to [{1}].".format(self.old_name, self.name)
         return msg
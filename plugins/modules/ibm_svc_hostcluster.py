@@ -76,6 +76,37 @@ options:
         description:
             - Path of debug log file.
         type: str
+    token_cache_path:
+        description:
+            - Directory in which authentication tokens are cached per cluster and user.
+            - Tasks that run against the same cluster as the same user reuse the cached token
+              instead of authenticating again.
+            - An expired or rejected token is replaced automatically when I(username) and I(password) are given.
+            - If not specified, tokens are not cached.
+        type: path
+        version_added: '1.13.0'
+    perf_summary:
+        description:
+            - If C(true), a summary of the REST API requests made by the task is returned in C(_perf),
+              and logged to I(log_path). It holds the number of requests, their time split into
+              phases, byte counts, and per command totals, slowest commands first.
+            - Every request is logged to I(log_path) with its timings, whether or not this is set.
+        type: bool
+        default: false
+        version_added: '1.13.0'
+    pool_size:
+        description:
+            - Maximum number of idle keep-alive connections to the cluster kept for reuse by the task.
+        type: int
+        default: 4
+        version_added: '1.13.0'
+    idle_timeout:
+        description:
+            - Seconds an idle keep-alive connection to the cluster may be reused.
+            - Older connections are closed and a new one is opened.
+        type: int
+        default: 30
+        version_added: '1.13.0'
     validate_certs:
         description:
             - Validates certification.
@@ -85,6 +116,7 @@ author:
     - Shilpi Jain (@Shilpi-J)
 notes:
     - This module supports C(check_mode).
+    - In check mode, the commands that would run are returned in C(command_plan), with the round trips they take.
 '''
 
 EXAMPLES = '''
@@ -120,7 +152,22 @@ EXAMPLES = '''
     removeallhosts: True
 '''
 
-RETURN = '''#'''
+RETURN = '''
+command_plan:
+    description:
+        - Commands that would run to bring the objects to the requested state, in the order they were planned,
+          each with the cluster it would run on, its options and its arguments.
+    returned: in check mode, when changes are needed
+    type: list
+    elements: dict
+    sample: [{"cluster": "10.10.10.1", "cmd": "mkhostcluster", "opts": {"name": "hostcluster0"}, "args": []}]
+round_trips:
+    description:
+        - REST API round trips of the run, C(reads) for the C(ls) requests made and C(writes) for the commands planned.
+    returned: in check mode, when changes are needed
+    type: dict
+    sample: {"reads": 1, "writes": 1}
+'''
 
 from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule
@@ -174,7 +221,11 @@ class IBMSVChostcluster(object):
             password=self.module.params['password'],
             validate_certs=self.module.params['validate_certs'],
             log_path=log_path,
-            token=self.module.params['token']
+            token=self.module.params['token'],
+            token_cache_path=self.module.params['token_cache_path'],
+            pool_size=self.module.params['pool_size'],
+            idle_timeout=self.module.params['idle_timeout'],
+            perf_summary=self.module.params['perf_summary']
         )
 
     def get_existing_hostcluster(self):
@@ -216,10 +267,6 @@ class IBMSVChostcluster(object):
         if self.removeallhosts:
             self.module.fail_json(msg="Parameter 'removeallhosts' cannot be passed while creating hostcluster")
 
-        if self.module.check_mode:
-            self.changed = True
-            return
-
         # Make command
         cmd = 'mkhostcluster'
         cmdopts = {'name': self.name}
@@ -230,6 +277,11 @@ class IBMSVChostcluster(object):
         self.log("creating host cluster command opts '%s'",
                  self.ownershipgroup)
 
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(cmd, cmdopts, None)
+            self.changed = True
+            return
+
         # Run command
         result = self.restapi.svc_run_command(cmd, cmdopts, cmdargs=None)
         self.log("create host cluster result '%s'", result)
@@ -242,10 +294,6 @@ class IBMSVChostcluster(object):
                 msg="Failed to create host cluster [%s]" % self.name)
 
     def hostcluster_update(self, modify):
-        if self.module.check_mode:
-            self.changed = True
-            return
-
         self.log("updating host cluster '%s'", self.name)
         cmd = 'chhostcluster'
         cmdopts = {}
@@ -254,6 +302,12 @@ class IBMSVChostcluster(object):
         elif 'noownershipgroup' in modify:
             cmdopts['noownershipgroup'] = self.noownershipgroup
 
+        if self.module.check_mode:
+            if cmdopts:
+                self.restapi.svc_plan_command(cmd, cmdopts, [self.name])
+            self.changed = True
+            return
+
         if cmdopts:
             cmdargs = [self.name]
             self.restapi.svc_run_command(cmd, cmdopts, cmdargs)
@@ -263,10 +317,6 @@ class IBMSVChostcluster(object):
             self.log("Properties of %s updated", self.name)
 
     def hostcluster_delete(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
-
         self.log("deleting host cluster '%s'", self.name)
 
         cmd = 'rmhostcluster'
@@ -277,6 +327,11 @@ class IBMSVChostcluster(object):
             cmdopts = {'force': True}
             cmdopts['removeallhosts'] = self.removeallhosts
 
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(cmd, cmdopts, cmdargs)
+            self.changed = True
+            return
+
         self.restapi.svc_run_command(cmd, cmdopts, cmdargs)
 
         # Any error will have been raised in svc_run_command
@@ -27,8 +27,8 @@ options:
     description:
     - The hostname or management IP of the
       Spectrum Virtualize storage system.
+    - Required unless I(clusters) is specified.
     type: str
-    required: true
   domain:
     description:
     - Domain for the Spectrum Virtualize storage system.
@@ -54,6 +54,37 @@ options:
     description:
     - Path of debug log file.
     type: str
+  token_cache_path:
+    description:
+    - Directory in which authentication tokens are cached per cluster and user.
+    - Tasks that run against the same cluster as the same user reuse the cached token
+      instead of authenticating again.
+    - An expired or rejected token is replaced automatically when I(username) and I(password) are given.
+    - If not specified, tokens are not cached.
+    type: path
+    version_added: '1.13.0'
+  perf_summary:
+    description:
+    - If C(true), a summary of the REST API requests made by the task is returned in C(_perf),
+      and logged to I(log_path). It holds the number of requests, their time split into
+      phases, byte counts, and per command totals, slowest commands first.
+    - Every request is logged to I(log_path) with its timings, whether or not this is set.
+    type: bool
+    default: false
+    version_added: '1.13.0'
+  pool_size:
+    description:
+    - Maximum number of idle keep-alive connections to the cluster kept for reuse by the task.
+    type: int
+    default: 4
+    version_added: '1.13.0'
+  idle_timeout:
+    description:
+    - Seconds an idle keep-alive connection to the cluster may be reused.
+    - Older connections are closed and a new one is opened.
+    type: int
+    default: 30
+    version_added: '1.13.0'
   validate_certs:
     description:
     - Validates certification.
@@ -143,6 +174,102 @@ options:
                'truststore', 'callhome', 'ip', 'portset', 'safeguardedpolicy',
                'mdisk', 'safeguardedpolicyschedule', 'cloudimportcandidate', 'eventlog', all]
     default: "all"
+  filters:
+    description:
+    - Filters the listed instances on the Spectrum Virtualize storage system, so that only matching
+      instances are returned.
+    - The value is passed as the C(filtervalue) of the listing command, in the format
+      C(attribute=value[:attribute=value]), for example C(mdisk_grp_name=Pool0:name=vol*).
+    - Valid only when a single entity is specified in I(gather_subset).
+    - Mutually exclusive with I(objectname).
+    type: str
+    version_added: '1.13.0'
+  attributes:
+    description:
+    - List of attributes to return for each instance. All other attributes are dropped before the
+      result is returned.
+    - Applies to every entity specified in I(gather_subset).
+    - If not specified, all attributes are returned.
+    type: list
+    elements: str
+    version_added: '1.13.0'
+  parallelism:
+    description:
+    - Maximum number of I(gather_subset) entities that are listed concurrently.
+    - The concurrent requests share the same REST API session.
+    - By default, the entities are listed one after another.
+    type: int
+    default: 1
+    version_added: '1.13.0'
+  topology:
+    description:
+    - If set to C(true), the listed entities are also returned as a cross-indexed topology model in
+      I(Topology), so that consumers do not have to join the flat lists themselves.
+    - The indexes are built from the entities listed through I(gather_subset). For the full model,
+      list C(vol), C(vdiskcopy), C(hostvdiskmap), C(pool), C(mdisk), C(fcmap), C(rcrelationship)
+      and C(volumegroup), or use C(all).
+    - In the model, attributes holding integer or decimal values are converted from strings to numbers.
+      Volumes, pools and MDisks are then listed with their capacities in bytes, in I(Topology) as well
+      as in their own lists.
+    - Not supported with I(attributes), because the indexes rely on the relationship attributes.
+    type: bool
+    default: false
+    version_added: '1.13.0'
+  since_snapshot:
+    description:
+    - Directory on the Ansible controller where a snapshot of each listing is kept between runs, per
+      cluster and per I(gather_subset) entity.
+    - If specified, only the instances added or changed since the previous run are returned for each
+      entity, and I(Delta) reports the added, changed and removed instances.
+    - A snapshot holds a short fingerprint of each instance, not the instance itself.
+    - The first run with a new snapshot directory returns every instance as added.
+    - In check mode, the snapshots are compared but not updated.
+    - Mutually exclusive with I(topology).
+    type: path
+    version_added: '1.13.0'
+  clusters:
+    description:
+    - Gathers the same information from several Spectrum Virtualize storage systems in one run,
+      instead of from I(clustername).
+    - The storage systems are processed concurrently by a single Ansible process, up to
+      I(cluster_parallelism) at a time, and their information is returned in I(Clusters).
+    - The options of an entry override I(domain), I(username), I(password), I(token) and I(validate_certs)
+      for that storage system.
+    type: list
+    elements: dict
+    version_added: '1.13.0'
+    suboptions:
+      clustername:
+        description:
+        - The hostname or management IP of the Spectrum Virtualize storage system.
+        type: str
+        required: true
+      domain:
+        description:
+        - Domain for the Spectrum Virtualize storage system.
+        type: str
+      username:
+        description:
+        - REST API username for the Spectrum Virtualize storage system.
+        type: str
+      password:
+        description:
+        - REST API password for the Spectrum Virtualize storage system.
+        type: str
+      token:
+        description:
+        - The authentication token to verify a user on the Spectrum Virtualize storage system.
+        type: str
+      validate_certs:
+        description:
+        - Validates certification.
+        type: bool
+  cluster_parallelism:
+    description:
+    - Maximum number of storage systems of I(clusters) that are processed concurrently.
+    type: int
+    default: 8
+    version_added: '1.13.0'
 notes:
     - This module supports C(check_mode).
 '''
@@ -173,6 +300,62 @@ EXAMPLES = '''
     password: "{{password}}"
     log_path: /tmp/ansible.log
     gather_subset: pool
+- name: Get name and capacity of the volumes in pool Pool0
+  ibm.spectrum_virtualize.ibm_svc_info:
+    clustername: "{{clustername}}"
+    domain: "{{domain}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    log_path: /tmp/ansible.log
+    gather_subset: vol
+    filters: mdisk_grp_name=Pool0
+    attributes:
+      - name
+      - capacity
+- name: Get all info, listing up to 8 entities concurrently
+  ibm.spectrum_virtualize.ibm_svc_info:
+    clustername: "{{clustername}}"
+    domain: "{{domain}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    log_path: /tmp/ansible.log
+    gather_subset: all
+    parallelism: 8
+- name: Get the hosts every volume is mapped to
+  ibm.spectrum_virtualize.ibm_svc_info:
+    clustername: "{{clustername}}"
+    domain: "{{domain}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    log_path: /tmp/ansible.log
+    gather_subset: [vol, hostvdiskmap]
+    topology: true
+  register: result
+- debug:
+    msg: "{{ result.Topology.volume_hosts }}"
+- name: Get the volumes and hosts changed since the previous run
+  ibm.spectrum_virtualize.ibm_svc_info:
+    clustername: "{{clustername}}"
+    domain: "{{domain}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    log_path: /tmp/ansible.log
+    gather_subset: [vol, host]
+    since_snapshot: /var/lib/ansible/svc_snapshots
+- name: Get pool info from every storage system of the estate
+  ibm.spectrum_virtualize.ibm_svc_info:
+    username: "{{username}}"
+    password: "{{password}}"
+    log_path: /tmp/ansible.log
+    gather_subset: pool
+    cluster_parallelism: 16
+    clusters:
+      - clustername: cluster1.example.com
+      - clustername: cluster2.example.com
+        password: "{{cluster2_password}}"
+  register: estate
+- debug:
+    msg: "{{ estate.Clusters['cluster1.example.com'].Pool }}"
 '''
 
 RETURN = '''
@@ -611,13 +794,77 @@ EnclosureStatsHistory:
     type: list
     elements: dict
     sample: [{...}]
+Topology:
+    description:
+        - Data will be populated when I(topology=true)
+        - Cross-indexed model of the listed entities. I(volumes), I(hosts), I(pools) and I(volumegroups)
+          map names to the normalized records. The remaining keys map a name to the sorted names of the
+          related entities.
+    returned: success
+    type: dict
+    sample: {
+        "volumes": {"vol0": {"id": 0, "name": "vol0", "mdisk_grp_name": "Pool0", "...": "..."}},
+        "hosts": {"host0": {"id": 0, "name": "host0", "...": "..."}},
+        "pools": {"Pool0": {"id": 0, "name": "Pool0", "...": "..."}},
+        "volumegroups": {"vg0": {"id": 0, "name": "vg0", "...": "..."}},
+        "volume_hosts": {"vol0": ["host0"]},
+        "host_volumes": {"host0": ["vol0"]},
+        "pool_volumes": {"Pool0": ["vol0"]},
+        "pool_mdisks": {"Pool0": ["mdisk0"]},
+        "volume_fcmaps": {"vol0": ["fcmap0"]},
+        "volume_rcrelationships": {"vol0": ["rcrel0"]},
+        "volumegroup_volumes": {"vg0": ["vol0"]}
+    }
+Delta:
+    description:
+        - Data will be populated when I(since_snapshot) is specified
+        - For each listed entity, the keys of the instances added, changed and removed since the
+          previous run. A key is made of the C(id) attributes of the instance.
+    returned: success
+    type: dict
+    sample: {
+        "Volume": {"added": ["12"], "changed": ["3"], "removed": ["7"]}
+    }
+Clusters:
+    description:
+        - Data will be populated when I(clusters) is specified
+        - For each storage system, keyed by its I(clustername), the information it returns on its own,
+          or C(failed) and C(msg) if it could not be gathered.
+    returned: success
+    type: dict
+    sample: {
+        "cluster1.example.com": {"Pool": [{"name": "Pool0", "...": "..."}], "Volume": [], "...": "..."},
+        "cluster2.example.com": {"failed": true, "msg": "Failed to obtain access token"}
+    }
 '''
 
+import copy
+import re
+from collections import defaultdict
 from traceback import format_exc
+from types import GeneratorType
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi, svc_argument_spec, get_logger
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import (
+    IBMSVCRestApi,
+    IBMSVCRestApiError,
+    SVCStateStore,
+    svc_argument_spec,
+    svc_fleet_argument_spec,
+    svc_fleet_run,
+    svc_perf_report,
+    svc_snapshot_delta,
+    get_logger,
+    run_concurrently
+)
 from ansible.module_utils._text import to_native
 
+# Attributes that look numeric but are identifiers, and must stay strings
+IDENTIFIER_ATTRIBUTES = re.compile(r'(^|_)(name|UID|WWPN|WWNN|iqn|IQN|serial_number|cluster_id)$|^ctrl_LUN_#$')
+# Values with leading zeros are hexadecimal identifiers, and stay strings too
+NUMBER = re.compile(r'^-?(0|[1-9]\d*)(\.\d+)?$')
+# Listings whose capacities are requested in bytes for the topology model
+TOPOLOGY_BYTES_COMMANDS = ('lsvdisk', 'lsmdiskgrp', 'lsmdisk')
+
 
 class IBMSVCGatherInfo(object):
     def __init__(self):
@@ -684,26 +931,52 @@ class IBMSVCGatherInfo(object):
                                             'enclosurestatshistory',
                                             'all'
                                             ]),
+                filters=dict(type='str'),
+                attributes=dict(type='list', elements='str'),
+                parallelism=dict(type='int', default=1),
+                topology=dict(type='bool', default=False),
+                since_snapshot=dict(type='path'),
             )
         )
+        argument_spec.update(svc_fleet_argument_spec())
+        argument_spec['clustername']['required'] = False
 
         self.module = AnsibleModule(argument_spec=argument_spec,
+                                    mutually_exclusive=[['clustername', 'clusters']],
+                                    required_one_of=[['clustername', 'clusters']],
                                     supports_check_mode=True)
 
         # logging setup
         log_path = self.module.params['log_path']
         self.log = get_logger(self.__class__.__name__, log_path)
         self.objectname = self.module.params['objectname']
+        self.filters = self.module.params['filters']
+        self.attributes = self.module.params['attributes']
+        self.parallelism = self.module.params['parallelism']
+        self.topology = self.module.params['topology']
+        self.since_snapshot = self.module.params['since_snapshot']
+        self.snapshots = SVCStateStore(self.since_snapshot) if self.since_snapshot else None
+        self.delta = {}
+        self.clusters = self.module.params['clusters']
+        self.cluster_parallelism = self.module.params['cluster_parallelism']
+
+        # With clusters, every storage system is connected to in apply_fleet()
+        self.restapi = None if self.clusters else self.connect()
 
-        self.restapi = IBMSVCRestApi(
+    def connect(self):
+        return IBMSVCRestApi(
             module=self.module,
             clustername=self.module.params['clustername'],
             domain=self.module.params['domain'],
             username=self.module.params['username'],
             password=self.module.params['password'],
             validate_certs=self.module.params['validate_certs'],
-            log_path=log_path,
-            token=self.module.params['token']
+            log_path=self.module.params['log_path'],
+            token=self.module.params['token'],
+            token_cache_path=self.module.params['token_cache_path'],
+            pool_size=self.module.params['pool_size'],
+            idle_timeout=self.module.params['idle_timeout'],
+            perf_summary=self.module.params['perf_summary']
         )
 
     def validate(self, subset):
@@ -726,30 +999,190 @@ class IBMSVCGatherInfo(object):
             cmdargs=[self.objectname]
         )
 
+    def project(self, data):
+        """Drops every attribute not requested in attributes. Streamed
+        records are projected one by one while they are read."""
+        if isinstance(data, (list, GeneratorType)):
+            return [self.project(item) for item in data]
+        if isinstance(data, dict) and self.attributes:
+            return dict((k, v) for k, v in data.items() if k in self.attributes)
+        return data
+
+    def fetch_list(self, subset, op_key, cmd):
+        output = {}
+        exceptions = {'cloudbackupgeneration', 'enclosurestatshistory'}
+        if subset in exceptions:
+            output[op_key] = self.project(getattr(self, subset))
+        else:
+            cmdargs = [self.objectname] if self.objectname else None
+            cmdopts = {'filtervalue': self.filters} if self.filters else {}
+            if self.topology and cmd in TOPOLOGY_BYTES_COMMANDS:
+                cmdopts['bytes'] = True
+            cmdopts = cmdopts or None
+            # A listing is consumed record by record, instead of
+            # decoding the whole response before projecting it
+            output[op_key] = self.project(self.restapi.svc_obj_info(cmd=cmd,
+                                                                    cmdopts=cmdopts,
+                                                                    cmdargs=cmdargs,
+                                                                    stream=not self.objectname))
+        if self.snapshots and isinstance(output[op_key], list):
+            output[op_key] = self.compare_snapshot(subset, op_key, output[op_key])
+        self.log.info('Successfully listed %d %s info '
+                      'from cluster %s', len(subset), subset,
+                      self.module.params['clustername'])
+        return output
+
+    def compare_snapshot(self, subset, op_key, records):
+        """
+        Compares a listing with the snapshot of the previous run, and
+        replaces the snapshot unless running in check mode.
+
+        :returns: the added and changed records
+        :rtype: list
+        """
+        key = [self.module.params['clustername'], subset, self.objectname, self.filters, self.attributes]
+        added, changed, removed, snapshot = svc_snapshot_delta(records, self.snapshots.load(key))
+        if not self.module.check_mode:
+            self.snapshots.save(key, snapshot)
+        self.delta[op_key] = {
+            'added': [k for k, record in added],
+            'changed': [k for k, record in changed],
+            'removed': removed
+        }
+        return [record for k, record in added + changed]
+
     def get_list(self, subset, op_key, cmd, validate):
         try:
             if validate:
                 self.validate(subset)
-            output = {}
-            exceptions = {'cloudbackupgeneration', 'enclosurestatshistory'}
-            if subset in exceptions:
-                output[op_key] = getattr(self, subset)
-            else:
-                cmdargs = [self.objectname] if self.objectname else None
-                output[op_key] = self.restapi.svc_obj_info(cmd=cmd,
-                                                           cmdopts=None,
-                                                           cmdargs=cmdargs)
-            self.log.info('Successfully listed %d %s info '
-                          'from cluster %s', len(subset), subset,
-                          self.module.params['clustername'])
-            return output
+            return self.fetch_list(subset, op_key, cmd)
         except Exception as e:
             msg = 'Get %s info from cluster %s failed with error %s ' % \
                   (subset, self.module.params['clustername'], str(e))
             self.log.error(msg)
             self.module.fail_json(msg=msg)
 
+    @staticmethod
+    def normalize(record):
+        """Converts the numeric attributes of a record from strings."""
+        normalized = {}
+        for key, value in record.items():
+            if isinstance(value, str) and NUMBER.match(value) and not IDENTIFIER_ATTRIBUTES.search(key):
+                value = float(value) if '.' in value else int(value)
+            normalized[key] = value
+        return normalized
+
+    def build_topology(self, result):
+        """
+        Builds the name indexes relating volumes, hosts, pools, MDisks,
+        FlashCopy mappings, remote copy relationships and volume groups,
+        in a single pass over each listed entity.
+
+        :param result: the listed entities, keyed the way they are returned
+        :type result: dict
+        :returns: the topology model
+        :rtype: dict
+        """
+        relations = dict((key, defaultdict(set)) for key in (
+            'volume_hosts', 'host_volumes', 'pool_volumes', 'pool_mdisks',
+            'volume_fcmaps', 'volume_rcrelationships', 'volumegroup_volumes'))
+
+        def relate(forward, backward, left, right):
+            if left and right:
+                relations[forward][left].add(right)
+                if backward:
+                    relations[backward][right].add(left)
+
+        def index(op_key):
+            return dict((item['name'], self.normalize(item)) for item in result.get(op_key) or [])
+
+        topology = {
+            'volumes': index('Volume'),
+            'hosts': index('Host'),
+            'pools': index('Pool'),
+            'volumegroups': index('VolumeGroup')
+        }
+
+        for volume in result.get('Volume') or []:
+            # A mirrored volume reports 'many' pools, its copies are related below
+            if volume.get('mdisk_grp_name') != 'many':
+                relate('pool_volumes', None, volume.get('mdisk_grp_name'), volume['name'])
+            relate('volumegroup_volumes', None, volume.get('volume_group_name'), volume['name'])
+        for copy in result.get('VdiskCopy') or []:
+            relate('pool_volumes', None, copy.get('mdisk_grp_name'), copy.get('vdisk_name'))
+        for mapping in result.get('HostVdiskMap') or []:
+            relate('host_volumes', 'volume_hosts', mapping.get('name'), mapping.get('vdisk_name'))
+        for mapping in result.get('VdiskHostMap') or []:
+            relate('volume_hosts', 'host_volumes', mapping.get('name'), mapping.get('host_name'))
+        for mdisk in result.get('Mdisk') or []:
+            relate('pool_mdisks', None, mdisk.get('mdisk_grp_name'), mdisk['name'])
+        for fcmap in result.get('FCMap') or []:
+            relate('volume_fcmaps', None, fcmap.get('source_vdisk_name'), fcmap['name'])
+            relate('volume_fcmaps', None, fcmap.get('target_vdisk_name'), fcmap['name'])
+        for rcrel in result.get('RemoteCopy') or []:
+            relate('volume_rcrelationships', None, rcrel.get('master_vdisk_name'), rcrel['name'])
+            relate('volume_rcrelationships', None, rcrel.get('aux_vdisk_name'), rcrel['name'])
+
+        for key, relation in relations.items():
+            topology[key] = dict((name, sorted(related)) for name, related in relation.items())
+        return topology
+
+    def get_lists_concurrently(self, subsets, cmd_mappings):
+        """
+        Lists the given subsets on a pool of at most self.parallelism
+        threads. Failures are reported in subset order, the same way
+        get_list() reports them.
+        """
+        for key in subsets:
+            if cmd_mappings[key][2]:
+                self.validate(key)
+
+        def fetch(key):
+            op_key, cmd = cmd_mappings[key][:2]
+            return self.fetch_list(key, op_key, cmd)
+
+        result = {}
+        outputs = run_concurrently(fetch, subsets, self.parallelism)
+        for key, output in zip(subsets, outputs):
+            if isinstance(output, IBMSVCRestApiError):
+                self.module.fail_json(msg=output.msg)
+            elif isinstance(output, Exception):
+                msg = 'Get %s info from cluster %s failed with error %s ' % \
+                      (key, self.module.params['clustername'], str(output))
+                self.log.error(msg)
+                self.module.fail_json(msg=msg)
+            result.update(output)
+        return result
+
+    def gather_cluster(self, module):
+        """
+        Gathers the information of one storage system of clusters, on a
+        copy of this object bound to the SVCClusterModule of the system.
+        Runs in a worker thread, and ends with module.exit_json() or
+        module.fail_json(), which raise instead of exiting.
+        """
+        gatherer = copy.copy(self)
+        gatherer.module = module
+        gatherer.clusters = None
+        gatherer.delta = {}
+        gatherer.restapi = gatherer.connect()
+        gatherer.apply()
+
+    def apply_fleet(self):
+        if self.cluster_parallelism < 1:
+            self.module.fail_json(msg="cluster_parallelism(%d) must be greater than zero" % self.cluster_parallelism)
+        if self.module.params['perf_summary']:
+            svc_perf_report(self.module, self.log.info)
+        results, failed = svc_fleet_run(self.module, self.gather_cluster, self.cluster_parallelism)
+        self.log.info("Gathered info from %d clusters, %d failed", len(results), len(failed))
+        if failed:
+            self.module.fail_json(msg="Failed to gather info from clusters [%s]" % ', '.join(failed),
+                                  Clusters=results)
+        self.module.exit_json(Clusters=results)
+
     def apply(self):
+        if self.clusters:
+            return self.apply_fleet()
         subset = self.module.params['gather_subset']
         if self.objectname and len(subset) != 1:
             msg = ("objectname(%s) is specified while gather_subset(%s) is not "
@@ -757,6 +1190,18 @@ class IBMSVCGatherInfo(object):
             self.module.fail_json(msg=msg)
         if len(subset) == 0 or 'all' in subset:
             self.log.info("The default value for gather_subset is all")
+        if self.filters:
+            if self.objectname:
+                self.module.fail_json(msg="Parameters objectname and filters are mutually exclusive")
+            if len(subset) != 1 or subset[0] in ('all', 'cloudbackupgeneration', 'enclosurestatshistory'):
+                self.module.fail_json(msg="filters(%s) is specified while gather_subset(%s) is not "
+                                          "a single entity supporting filters" % (self.filters, ', '.join(subset)))
+        if self.parallelism < 1:
+            self.module.fail_json(msg="parallelism(%d) must be greater than zero" % self.parallelism)
+        if self.topology and self.attributes:
+            self.module.fail_json(msg="Parameters topology and attributes are mutually exclusive")
+        if self.topology and self.since_snapshot:
+            self.module.fail_json(msg="Parameters topology and since_snapshot are mutually exclusive")
 
         result = {
             'Volume': [],
@@ -871,17 +1316,21 @@ class IBMSVCGatherInfo(object):
         }
 
         if subset == ['all']:
-            current_set = cmd_mappings.keys()
+            current_set = [key for key, value in cmd_mappings.items() if not value[2]]
         else:
             current_set = subset
 
-        for key in current_set:
-            value_tuple = cmd_mappings[key]
-            if subset == ['all'] and value_tuple[2]:
-                continue
+        if self.parallelism > 1:
+            result.update(self.get_lists_concurrently(current_set, cmd_mappings))
+        else:
+            for key in current_set:
+                op = self.get_list(key, *cmd_mappings[key])
+                result.update(op)
 
-            op = self.get_list(key, *value_tuple)
-            result.update(op)
+        if self.topology:
+            result['Topology'] = self.build_topology(result)
+        if self.since_snapshot:
+            result['Delta'] = self.delta
 
         self.module.exit_json(**result)
 
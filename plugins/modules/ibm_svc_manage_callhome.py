@@ -183,6 +183,16 @@ options:
             - If unspecified, default value 'off' will be used.
         choices: ['on', 'off']
         type: str
+    wait_timeout:
+        description:
+            - Maximum number of seconds to wait for Call Home with cloud services to become enabled
+              before the connection test is run.
+            - The status is checked at increasing intervals, so the wait ends as soon as the
+              service is enabled.
+            - Applies when I(state=enabled) and I(callhome_type=cloud services) or I(callhome_type=both).
+        default: 20
+        type: int
+        version_added: '1.13.0'
     validate_certs:
         description:
             - Validates certification.
@@ -192,10 +202,42 @@ options:
         description:
             - Path of debug log file.
         type: str
+    token_cache_path:
+        description:
+            - Directory in which authentication tokens are cached per cluster and user.
+            - Tasks that run against the same cluster as the same user reuse the cached token
+              instead of authenticating again.
+            - An expired or rejected token is replaced automatically when I(username) and I(password) are given.
+            - If not specified, tokens are not cached.
+        type: path
+        version_added: '1.13.0'
+    perf_summary:
+        description:
+            - If C(true), a summary of the REST API requests made by the task is returned in C(_perf),
+              and logged to I(log_path). It holds the number of requests, their time split into
+              phases, byte counts, and per command totals, slowest commands first.
+            - Every request is logged to I(log_path) with its timings, whether or not this is set.
+        type: bool
+        default: false
+        version_added: '1.13.0'
+    pool_size:
+        description:
+            - Maximum number of idle keep-alive connections to the cluster kept for reuse by the task.
+        type: int
+        default: 4
+        version_added: '1.13.0'
+    idle_timeout:
+        description:
+            - Seconds an idle keep-alive connection to the cluster may be reused.
+            - Older connections are closed and a new one is opened.
+        type: int
+        default: 30
+        version_added: '1.13.0'
 author:
     - Sreshtant Bohidar(@Sreshtant-Bohidar)
 notes:
     - This module supports C(check_mode).
+    - In check mode, the commands that would run are returned in C(command_plan), with the round trips they take.
 '''
 
 EXAMPLES = '''
@@ -228,7 +270,22 @@ EXAMPLES = '''
     censorcallhome: "on"
 '''
 
-RETURN = '''#'''
+RETURN = '''
+command_plan:
+    description:
+        - Commands that would run to bring the objects to the requested state, in the order they were planned,
+          each with the cluster it would run on, its options and its arguments.
+    returned: in check mode, when changes are needed
+    type: list
+    elements: dict
+    sample: [{"cluster": "10.10.10.1", "cmd": "chcloudcallhome", "opts": {"enable": true}, "args": []}]
+round_trips:
+    description:
+        - REST API round trips of the run, C(reads) for the C(ls) requests made and C(writes) for the commands planned.
+    returned: in check mode, when changes are needed
+    type: dict
+    sample: {"reads": 4, "writes": 1}
+'''
 
 from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule
@@ -266,7 +323,8 @@ class IBMSVCCallhome(object):
                 inventory=dict(type='str', choices=['on', 'off']),
                 invemailinterval=dict(type='int'),
                 enhancedcallhome=dict(type='str', choices=['on', 'off']),
-                censorcallhome=dict(type='str', choices=['on', 'off'])
+                censorcallhome=dict(type='str', choices=['on', 'off']),
+                wait_timeout=dict(type='int', default=20)
             )
         )
 
@@ -305,6 +363,7 @@ class IBMSVCCallhome(object):
         self.invemailinterval = self.module.params.get('invemailinterval', False)
         self.enhancedcallhome = self.module.params.get('enhancedcallhome', False)
         self.censorcallhome = self.module.params.get('censorcallhome', False)
+        self.wait_timeout = self.module.params['wait_timeout']
 
         # creating an instance of IBMSVCRestApi
         self.restapi = IBMSVCRestApi(
@@ -315,7 +374,11 @@ class IBMSVCCallhome(object):
             password=self.module.params['password'],
             validate_certs=self.module.params['validate_certs'],
             log_path=log_path,
-            token=self.module.params['token']
+            token=self.module.params['token'],
+            token_cache_path=self.module.params['token_cache_path'],
+            pool_size=self.module.params['pool_size'],
+            idle_timeout=self.module.params['idle_timeout'],
+            perf_summary=self.module.params['perf_summary']
         )
 
     def basic_checks(self):
@@ -397,6 +460,10 @@ class IBMSVCCallhome(object):
         command = 'chsystem'
         command_options = modify
         cmdargs = None
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(command, command_options, cmdargs)
+            self.changed = True
+            return
         self.restapi.svc_run_command(command, command_options, cmdargs)
         self.log("Chsystem commands executed.")
 
@@ -431,9 +498,6 @@ class IBMSVCCallhome(object):
 
     # function to create an email server
     def create_email_server(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
         self.log("Creating email server '%s:%s'.", self.serverIP, self.serverPort)
         command = 'mkemailserver'
         command_options = {
@@ -441,6 +505,10 @@ class IBMSVCCallhome(object):
             'port': self.serverPort,
         }
         cmdargs = None
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(command, command_options, cmdargs)
+            self.changed = True
+            return
         result = self.restapi.svc_run_command(command, command_options, cmdargs)
         if 'message' in result:
             self.changed = True
@@ -455,14 +523,15 @@ class IBMSVCCallhome(object):
         command = "chemailuser"
         command_options = data
         cmdargs = [id]
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(command, command_options, cmdargs)
+            self.changed = True
+            return
         self.restapi.svc_run_command(command, command_options, cmdargs)
         self.log('Email user updated successfully.')
 
     # function to manage support email user
     def manage_support_email_user(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
         support_email = {}
         selected_email_id = ''
         t = -1 * ((time.timezone / 60) / 60)
@@ -489,6 +558,10 @@ class IBMSVCCallhome(object):
             if self.inventory:
                 command_options['inventory'] = self.inventory
             cmdargs = None
+            if self.module.check_mode:
+                self.restapi.svc_plan_command(command, command_options, cmdargs)
+                self.changed = True
+                return
             result = self.restapi.svc_run_command(command, command_options, cmdargs)
             if 'message' in result:
                 self.changed = True
@@ -504,7 +577,10 @@ class IBMSVCCallhome(object):
             if self.inventory:
                 if support_email['inventory'] != self.inventory:
                     modify['inventory'] = self.inventory
-            if modify:
+            if modify and self.module.check_mode:
+                self.restapi.svc_plan_command('chemailuser', modify, [support_email['id']])
+                self.changed = True
+            elif modify:
                 self.restapi.svc_run_command(
                     'chemailuser',
                     modify,
@@ -514,9 +590,6 @@ class IBMSVCCallhome(object):
 
     # function to create an email user
     def create_email_user(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
         self.log("Creating email user '%s'.", self.contact_email)
         command = 'mkemailuser'
         command_options = {
@@ -526,6 +599,10 @@ class IBMSVCCallhome(object):
         if self.inventory:
             command_options['inventory'] = self.inventory
         cmdargs = None
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(command, command_options, cmdargs)
+            self.changed = True
+            return
         result = self.restapi.svc_run_command(command, command_options, cmdargs)
         if 'message' in result:
             self.changed = True
@@ -537,32 +614,31 @@ class IBMSVCCallhome(object):
 
     # function to enable email callhome
     def enable_email_callhome(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
         command = "startemail"
         command_options = {}
         cmdargs = None
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(command, command_options, cmdargs)
+            self.changed = True
+            return
         self.restapi.svc_run_command(command, command_options, cmdargs)
         self.log("Email callhome enabled.")
 
     # function to disable email callhome
     def disable_email_callhome(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
         command = "stopemail"
         command_options = {}
         cmdargs = None
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(command, command_options, cmdargs)
+            self.changed = True
+            return
         self.restapi.svc_run_command(command, command_options, cmdargs)
         self.log("Email callhome disabled.")
 
     # function to update email data
     def update_email_data(self):
 
-        if self.module.check_mode:
-            self.changed = True
-            return
         command = "chemail"
         command_options = {}
         if self.contact_email:
@@ -588,7 +664,10 @@ class IBMSVCCallhome(object):
         if self.country:
             command_options['country'] = self.country
         cmdargs = None
-        if command_options:
+        if command_options and self.module.check_mode:
+            self.restapi.svc_plan_command(command, command_options, cmdargs)
+            self.changed = True
+        elif command_options:
             self.restapi.svc_run_command(command, command_options, cmdargs)
             self.log("Email data successfully updated.")
 
@@ -600,20 +679,18 @@ class IBMSVCCallhome(object):
 
     # function for removing a proxy
     def remove_proxy(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
         command = 'rmproxy'
         command_options = None
         cmdargs = None
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(command, command_options, cmdargs)
+            self.changed = True
+            return
         self.restapi.svc_run_command(command, command_options, cmdargs)
         self.log('Proxy removed successfully.')
 
     # function for creating a proxy
     def create_proxy(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
         command = 'mkproxy'
         command_options = {}
         if self.proxy_type == 'open_proxy':
@@ -639,6 +716,10 @@ class IBMSVCCallhome(object):
                 command_options['sslcert'] = self.sslcert
 
         cmdargs = None
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(command, command_options, cmdargs)
+            self.changed = True
+            return
         self.restapi.svc_run_command(command, command_options, cmdargs)
         self.log("Proxy created successfully.")
 
@@ -677,12 +758,13 @@ class IBMSVCCallhome(object):
 
     # function for updating a proxy
     def update_proxy(self, data):
-        if self.module.check_mode:
-            self.changed = True
-            return
         command = 'chproxy'
         command_options = data
         cmdargs = None
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(command, command_options, cmdargs)
+            self.changed = True
+            return
         self.restapi.svc_run_command(command, command_options, cmdargs)
         self.log('Proxy updated successfully.')
 
@@ -697,32 +779,36 @@ class IBMSVCCallhome(object):
 
     # function for enabling cloud callhome
     def enable_cloud_callhome(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
         command = 'chcloudcallhome'
         command_options = {
             'enable': True
         }
         cmdargs = None
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(command, command_options, cmdargs)
+            self.changed = True
+            return
         self.restapi.svc_run_command(command, command_options, cmdargs)
         self.changed = True
         self.log('Cloud callhome enabled.')
 
     # function for doing connection test for cloud callhome
     def test_connection_cloud_callhome(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
         command = 'sendcloudcallhome'
         command_options = {
             'connectiontest': True
         }
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(command, command_options, None)
+            self.changed = True
+            return
         self.restapi.svc_run_command(command, command_options, None)
         self.changed = True
         self.log('Cloud callhome connection tested.')
         # the connection testing can take some time to complete.
-        time.sleep(3)
+        self.restapi.svc_wait('lscloudcallhome', None, None,
+                              lambda data: data and data.get('connection') not in ('', 'untried'),
+                              timeout=3)
 
     # function for managing proxy server
     def manage_proxy_server(self):
@@ -745,23 +831,21 @@ class IBMSVCCallhome(object):
 
     # function for disabling cloud callhome
     def disable_cloud_callhome(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
         command = 'chcloudcallhome'
         command_options = {
             'disable': True
         }
         cmdargs = None
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(command, command_options, cmdargs)
+            self.changed = True
+            return
         self.restapi.svc_run_command(command, command_options, cmdargs)
         self.log('Cloud callhome disabled.')
 
     # function to initiate callhome with cloud
     def initiate_cloud_callhome(self):
         msg = ''
-        attempts = 0
-        limit_reached = False
-        active_status = False
         # manage proxy server
         self.manage_proxy_server()
         # update email data
@@ -773,24 +857,22 @@ class IBMSVCCallhome(object):
             self.test_connection_cloud_callhome()
         else:
             self.enable_cloud_callhome()
+            if self.module.check_mode:
+                self.changed = True
+                return "Callhome with Cloud enabled successfully."
             # cloud callhome takes some time to get enabled.
-            while not active_status:
-                attempts += 1
-                if attempts > 10:
-                    limit_reached = True
-                    break
-                lsdata = self.get_existing_cloud_callhome_data()
-                if lsdata['status'] == 'enabled':
-                    active_status = True
-                time.sleep(2)
-            if limit_reached:
+            active_status, lsdata = self.restapi.svc_wait(
+                'lscloudcallhome', None, None,
+                lambda data: data and data['status'] == 'enabled',
+                timeout=self.wait_timeout
+            )
+            if not active_status:
                 # the module will exit without performing connection test.
                 msg = "Callhome with Cloud is enabled. Please check connection to proxy."
                 self.changed = True
                 return msg
-            if active_status:
-                # perform connection test
-                self.test_connection_cloud_callhome()
+            # perform connection test
+            self.test_connection_cloud_callhome()
         msg = "Callhome with Cloud enabled successfully."
         self.changed = True
         return msg
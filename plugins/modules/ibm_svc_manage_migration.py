@@ -40,6 +40,40 @@ options:
     - Specifies the name of the volume to be created on the target system.
     - Required when I(state=initiate).
     type: str
+  volumes:
+    description:
+    - Specifies several volumes to be migrated across clusters in one run, instead of
+      I(source_volume), I(target_volume) and I(relationship_name).
+    - The partnership is discovered and both systems are authenticated once for all volumes.
+    - Target volumes and migration relationships are created, and the relationships started,
+      for up to I(parallelism) volumes at a time. The result of every volume is returned in C(volumes).
+    - Valid when I(state=initiate).
+    type: list
+    elements: dict
+    version_added: '1.13.0'
+    suboptions:
+      source_volume:
+        description:
+        - Name of the existing source volume.
+        type: str
+        required: true
+      target_volume:
+        description:
+        - Name of the volume to be created on the target system.
+        type: str
+        required: true
+      relationship_name:
+        description:
+        - Name of the migration relationship.
+        type: str
+        required: true
+  consistency_group:
+    description:
+    - Name of the remote copy consistency group to which the migration relationships created for I(volumes) are added.
+    - The consistency group is created if it does not exist, and is started as a whole.
+    - Valid when I(volumes) is specified.
+    type: str
+    version_added: '1.13.0'
   clustername:
     description:
     - The hostname or management IP of the Spectrum Virtualize storage system.
@@ -124,15 +158,72 @@ options:
     - Valid when I(state=initiate).
     default: false
     type: bool
+  parallelism:
+    description:
+    - Maximum number of hosts that are looked up, created, or mapped concurrently when I(replicate_hosts=true).
+    - Maximum number of volumes that are prepared and started concurrently when I(volumes) is specified.
+    - All requests to a system share the same REST API session.
+    - By default, the hosts are processed one after another.
+    type: int
+    default: 1
+    version_added: '1.13.0'
+  wait:
+    description:
+    - If C(true), waits until the migration relationship is synchronized after it is started, so that
+      a following I(state=switch) task can run right away.
+    - The relationship state is checked at increasing intervals, so the wait ends soon after synchronization.
+    - Valid when I(state=initiate).
+    default: false
+    type: bool
+    version_added: '1.13.0'
+  wait_timeout:
+    description:
+    - Maximum number of seconds to wait when I(wait=true).
+    - The module fails if the migration relationship is not synchronized in time.
+    default: 300
+    type: int
+    version_added: '1.13.0'
   log_path:
     description:
     - Path of debug log file.
     type: str
+  token_cache_path:
+    description:
+    - Directory in which authentication tokens are cached per cluster and user.
+    - Tasks that run against the same cluster as the same user reuse the cached token
+      instead of authenticating again.
+    - An expired or rejected token is replaced automatically when I(username) and I(password) are given.
+    - If not specified, tokens are not cached.
+    type: path
+    version_added: '1.13.0'
+  perf_summary:
+    description:
+    - If C(true), a summary of the REST API requests made by the task is returned in C(_perf),
+      and logged to I(log_path). It holds the number of requests, their time split into
+      phases, byte counts, and per command totals, slowest commands first.
+    - Every request is logged to I(log_path) with its timings, whether or not this is set.
+    type: bool
+    default: false
+    version_added: '1.13.0'
+  pool_size:
+    description:
+    - Maximum number of idle keep-alive connections to the cluster kept for reuse by the task.
+    type: int
+    default: 4
+    version_added: '1.13.0'
+  idle_timeout:
+    description:
+    - Seconds an idle keep-alive connection to the cluster may be reused.
+    - Older connections are closed and a new one is opened.
+    type: int
+    default: 30
+    version_added: '1.13.0'
 author:
     - Rohit Kumar(@rohitk-github)
     - Shilpi Jain(@Shilpi-J)
 notes:
     - This module supports C(check_mode).
+    - In check mode, the commands that would run are returned in C(command_plan), with the round trips they take.
     - This module supports both volume migration across pools and volume migration across clusters.
     - In case, user does not specify type_of_migration, the module shall proceed with migration across clusters by default.
     - In case of I(type_of_migration=across_pools), the only parameters allowed are I(new_pool) and I(source_volume) along with cluster credentials.
@@ -155,6 +246,52 @@ EXAMPLES = '''
     relationship_name: "migrate_vol"
     log_path: /tmp/ansible.log
     remote_pool: "{{ remote_pool }}"
+- name: Start a migration relationship for a volume mapped to many hosts
+  ibm.spectrum_virtualize.ibm_svc_manage_migration:
+    source_volume: "src_vol"
+    target_volume: "target_vol"
+    clustername: "{{ source_cluster }}"
+    remote_cluster: "{{ remote_cluster }}"
+    token: "{{ source_cluster_token }}"
+    state: initiate
+    replicate_hosts: true
+    parallelism: 8
+    remote_token: "{{ partner_cluster_token }}"
+    relationship_name: "migrate_vol"
+    log_path: /tmp/ansible.log
+    remote_pool: "{{ remote_pool }}"
+- name: Start a migration relationship and wait until it is synchronized
+  ibm.spectrum_virtualize.ibm_svc_manage_migration:
+    source_volume: "src_vol"
+    target_volume: "target_vol"
+    clustername: "{{ source_cluster }}"
+    remote_cluster: "{{ remote_cluster }}"
+    token: "{{ source_cluster_token }}"
+    state: initiate
+    remote_token: "{{ partner_cluster_token }}"
+    relationship_name: "migrate_vol"
+    log_path: /tmp/ansible.log
+    remote_pool: "{{ remote_pool }}"
+    wait: true
+    wait_timeout: 7200
+- name: Migrate several volumes in one consistency group
+  ibm.spectrum_virtualize.ibm_svc_manage_migration:
+    clustername: "{{ source_cluster }}"
+    remote_cluster: "{{ remote_cluster }}"
+    token: "{{ source_cluster_token }}"
+    state: initiate
+    remote_token: "{{ partner_cluster_token }}"
+    remote_pool: "{{ remote_pool }}"
+    consistency_group: "migrate_grp"
+    parallelism: 8
+    volumes:
+      - source_volume: "src_vol0"
+        target_volume: "target_vol0"
+        relationship_name: "migrate_vol0"
+      - source_volume: "src_vol1"
+        target_volume: "target_vol1"
+        relationship_name: "migrate_vol1"
+    log_path: /tmp/ansible.log
 - name: Switch replication direction
   ibm.spectrum_virtualize.ibm_svc_manage_migration:
     relationship_name: "migrate_vol"
@@ -179,11 +316,44 @@ EXAMPLES = '''
     new_pool : pool1
 '''
 
-RETURN = '''#'''
+RETURN = '''
+volumes:
+    description:
+        - Result of every volume pair when I(volumes) is specified.
+        - C(changed) tells whether the target volume or the relationship was created or started,
+          and C(error) is set for a volume that could not be migrated.
+    returned: when I(volumes) is specified
+    type: list
+    elements: dict
+    sample: [{"source_volume": "src_vol0", "target_volume": "target_vol0",
+              "relationship_name": "migrate_vol0", "changed": true, "state": "inconsistent_copying"}]
+command_plan:
+    description:
+        - Commands that would run to bring the objects to the requested state, in the order they were planned,
+          each with the cluster it would run on, its options and its arguments.
+        - Commands that would run concurrently may be listed in a different order from one run to the next.
+    returned: in check mode, when changes are needed
+    type: list
+    elements: dict
+    sample: [{"cluster": "10.10.10.2", "cmd": "mkhost", "opts": {"name": "host0", "force": true,
+              "fcwwpn": "10000090FA0B2B30"}, "args": []}]
+round_trips:
+    description:
+        - REST API round trips of the run, C(reads) for the C(ls) requests made and C(writes) for the commands planned.
+    returned: in check mode, when changes are needed
+    type: dict
+    sample: {"reads": 3, "writes": 1}
+'''
 
 from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi, svc_argument_spec, get_logger
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import (
+    IBMSVCRestApi,
+    get_logger,
+    run_concurrently,
+    svc_argument_spec,
+    svc_wait_argument_spec
+)
 from ansible.module_utils._text import to_native
 
 
@@ -198,10 +368,18 @@ class IBMSVCMigrate(object):
                 new_pool=dict(type='str', required=False),
                 source_volume=dict(type='str', required=False),
                 target_volume=dict(type='str', required=False),
+                volumes=dict(type='list', elements='dict', required=False,
+                             options=dict(
+                                 source_volume=dict(type='str', required=True),
+                                 target_volume=dict(type='str', required=True),
+                                 relationship_name=dict(type='str', required=True)
+                             )),
+                consistency_group=dict(type='str', required=False),
                 state=dict(type='str',
                            choices=['initiate', 'switch', 'cleanup']),
                 remote_pool=dict(type='str', required=False),
                 replicate_hosts=dict(type='bool', default=False),
+                parallelism=dict(type='int', default=1),
                 relationship_name=dict(type='str', required=False),
                 remote_cluster=dict(type='str', required=False),
                 remote_token=dict(type='str', required=False, no_log=True),
@@ -210,10 +388,12 @@ class IBMSVCMigrate(object):
                 remote_password=dict(type='str', required=False, no_log=True)
             )
         )
+        argument_spec.update(svc_wait_argument_spec())
 
         self.module = AnsibleModule(argument_spec=argument_spec,
                                     supports_check_mode=True)
         self.existing_rel_data = ""
+        self.changed = False
         self.source_vdisk_data = ""
         self.hosts_iscsi_flag = False
 
@@ -233,13 +413,18 @@ class IBMSVCMigrate(object):
         self.source_volume = self.module.params['source_volume']
         self.remote_pool = self.module.params['remote_pool']
         self.target_volume = self.module.params['target_volume']
+        self.volumes = self.module.params['volumes']
+        self.consistency_group = self.module.params['consistency_group']
         self.relationship_name = self.module.params['relationship_name']
         self.remote_username = self.module.params['remote_username']
         self.replicate_hosts = self.module.params['replicate_hosts']
+        self.parallelism = self.module.params['parallelism']
         self.remote_password = self.module.params['remote_password']
         self.remote_token = self.module.params['remote_token']
         self.remote_cluster = self.module.params['remote_cluster']
         self.remote_validate_certs = self.module.params['remote_validate_certs']
+        self.wait = self.module.params['wait']
+        self.wait_timeout = self.module.params['wait_timeout']
 
         self.restapi = IBMSVCRestApi(
             module=self.module,
@@ -249,7 +434,11 @@ class IBMSVCMigrate(object):
             password=self.module.params['password'],
             validate_certs=self.module.params['validate_certs'],
             log_path=log_path,
-            token=self.module.params['token']
+            token=self.module.params['token'],
+            token_cache_path=self.module.params['token_cache_path'],
+            pool_size=self.module.params['pool_size'],
+            idle_timeout=self.module.params['idle_timeout'],
+            perf_summary=self.module.params['perf_summary']
         )
 
     def get_existing_vdisk(self):
@@ -311,26 +500,38 @@ class IBMSVCMigrate(object):
                     if param not in valid_params['cleanup']:
                         self.module.fail_json(msg="Invalid parameter [%s] for state 'cleanup'" % param)
 
-    def get_source_hosts(self):
+    def get_source_hosts(self, source_volume=None):
         self.log("Entering function get_source_hosts")
         cmd = 'lsvdiskhostmap'
         cmdargs = {}
         cmdopts = {}
-        cmdargs = [self.source_volume]
+        cmdargs = [source_volume or self.source_volume]
         sourcevolume_hosts = self.restapi.svc_obj_info(cmd, cmdopts, cmdargs)
         return sourcevolume_hosts
 
-    def replicate_source_hosts(self, hosts_data):
+    def fail_on_host_errors(self, action, hosts, results):
+        """
+        Fails the module with the error of every host for which a concurrent
+        call returned an exception instead of a result. With volumes, the
+        error is raised instead, to be recorded for the volume.
+        """
+        errors = {}
+        for host, result in zip(hosts, results):
+            if isinstance(result, Exception):
+                errors[host] = to_native(result)
+        if errors:
+            msg = "Failed to %s for hosts [%s]." % (action, ', '.join(sorted(errors)))
+            if self.volumes:
+                raise Exception("%s %s" % (msg, ' '.join('%s: %s' % (host, errors[host]) for host in sorted(errors))))
+            self.module.fail_json(msg=msg, host_errors=errors)
+
+    def replicate_source_hosts(self, hosts_data, target_volume=None):
         self.log("Entering function replicate_source_hosts()")
         merged_result = []
         hosts_wwpn = {}
         hosts_iscsi = {}
         host_list = []
 
-        if self.module.check_mode:
-            self.changed = True
-            return
-
         self.log("creating vdiskhostmaps on target system")
 
         if isinstance(hosts_data, list):
@@ -342,11 +543,22 @@ class IBMSVCMigrate(object):
         for host in merged_result:
             host_list.append(host['host_name'])
 
-        for host in host_list:
+        # The concise lshost view does not list the host ports, so the
+        # detailed view of every host is needed.
+        hosts_details = run_concurrently(
+            lambda host: self.restapi.svc_obj_info(cmd='lshost', cmdopts=None, cmdargs=[host]),
+            host_list, self.parallelism
+        )
+        self.fail_on_host_errors("get host details", host_list, hosts_details)
+
+        for host, data in zip(host_list, hosts_details):
             host_wwpn_list = []
             host_iscsi_list = []
             self.log("for host %s", host)
-            data = self.restapi.svc_obj_info(cmd='lshost', cmdopts=None, cmdargs=[host])
+            if not data:
+                # The host was removed since its mapping was listed
+                self.log("host %s no longer exists, skipping", host)
+                continue
             nodes_data = data['nodes']
             for node in nodes_data:
                 if 'WWPN' in node.keys():
@@ -356,14 +568,11 @@ class IBMSVCMigrate(object):
                     host_iscsi_list.append(node['iscsi_name'])
                     hosts_iscsi[host] = host_iscsi_list
         if hosts_wwpn or hosts_iscsi:
-            self.create_remote_hosts(hosts_wwpn, hosts_iscsi)
+            self.create_remote_hosts(hosts_wwpn, hosts_iscsi, target_volume)
 
-    def create_remote_hosts(self, hosts_wwpn, hosts_iscsi):
+    def create_remote_hosts(self, hosts_wwpn, hosts_iscsi, target_volume=None):
         self.log("Entering function create_remote_hosts()")
 
-        if self.module.check_mode:
-            self.changed = True
-            return
         # Make command
         remote_hosts_list = []
         source_host_list = []
@@ -376,53 +585,70 @@ class IBMSVCMigrate(object):
                 source_host_list.append(host)
 
         cmd = 'mkhost'
+        new_hosts = []
         for host, wwpn in hosts_wwpn.items():
             if host not in remote_hosts_list:
                 cmdopts = {'name': host, 'force': True}
                 wwpn = ':'.join([str(elem) for elem in wwpn])
                 cmdopts['fcwwpn'] = wwpn
-                remote_restapi = self.construct_remote_rest()
-                remote_restapi.svc_run_command(cmd, cmdopts, cmdargs=None)
+                new_hosts.append(cmdopts)
 
         for host, iscsi in hosts_iscsi.items():
             if host not in remote_hosts_list:
                 cmdopts = {'name': host, 'force': True}
                 iscsi = ','.join([str(elem) for elem in iscsi])
                 cmdopts['iscsiname'] = iscsi
-                remote_restapi = self.construct_remote_rest()
-                remote_restapi.svc_run_command(cmd, cmdopts, cmdargs=None)
+                new_hosts.append(cmdopts)
+
+        if new_hosts and self.module.check_mode:
+            remote_restapi = self.construct_remote_rest()
+            for cmdopts in new_hosts:
+                remote_restapi.svc_plan_command(cmd, cmdopts, None)
+            self.changed = True
+        elif new_hosts:
+            remote_restapi = self.construct_remote_rest()
+            results = run_concurrently(
+                lambda cmdopts: remote_restapi.svc_run_command(cmd, cmdopts, cmdargs=None),
+                new_hosts, self.parallelism
+            )
+            self.fail_on_host_errors("create hosts on the partner system",
+                                     [cmdopts['name'] for cmdopts in new_hosts], results)
         if source_host_list:
-            self.map_host_vol_remote(source_host_list)
+            self.map_host_vol_remote(source_host_list, target_volume)
 
-    def map_host_vol_remote(self, host_list):
+    def map_host_vol_remote(self, host_list, target_volume=None):
         remote_restapi = self.construct_remote_rest()
+        cmd = 'mkvdiskhostmap'
+        cmdargs = [target_volume or self.target_volume]
         if self.module.check_mode:
+            for host in host_list:
+                remote_restapi.svc_plan_command(cmd, {'force': True, 'host': host}, cmdargs)
             self.changed = True
             return
-        for host in host_list:
+
+        def map_host(host):
             # Run command
-            cmd = 'mkvdiskhostmap'
             cmdopts = {'force': True}
             cmdopts['host'] = host
 
-            cmdargs = [self.target_volume]
             result = remote_restapi.svc_run_command(cmd, cmdopts, cmdargs)
             self.log("create vdiskhostmap result %s", result)
 
-            if 'message' in result:
-                self.changed = True
-                self.log("create vdiskhostmap result message %s", result['message'])
-            else:
-                self.module.fail_json(msg="Failed to create vdiskhostmap.")
+            if not result or 'message' not in result:
+                raise Exception("Failed to create vdiskhostmap.")
+            self.log("create vdiskhostmap result message %s", result['message'])
+            return result
+
+        results = run_concurrently(map_host, host_list, self.parallelism)
+        if any(not isinstance(result, Exception) for result in results):
+            self.changed = True
+        self.fail_on_host_errors("map the target volume", host_list, results)
 
     def vdisk_create(self, data):
         if not self.remote_pool:
             self.module.fail_json(msg="You must pass in "
                                       "remote_pool to the module.")
 
-        if self.module.check_mode:
-            self.changed = True
-            return
         self.log("creating vdisk '%s'", self.source_volume)
         size = int(data[0]['capacity'])
         # Make command
@@ -436,6 +662,10 @@ class IBMSVCMigrate(object):
         self.log("creating vdisk command %s opts %s", cmd, cmdopts)
         # Run command
         remote_restapi = self.construct_remote_rest()
+        if self.module.check_mode:
+            remote_restapi.svc_plan_command(cmd, cmdopts, None)
+            self.changed = True
+            return
         result = remote_restapi.svc_run_command(cmd, cmdopts, cmdargs=None)
         self.log("create vdisk result %s", result)
 
@@ -514,6 +744,9 @@ class IBMSVCMigrate(object):
             self.module.fail_json(msg=msg)
 
     def construct_remote_rest(self):
+        # Reuse the connection to the partner system for the whole run
+        if getattr(self, 'remote_restapi', None):
+            return self.remote_restapi
         remote_ip = self.discover_partner_system()
         self.remote_restapi = IBMSVCRestApi(
             module=self.module,
@@ -523,14 +756,15 @@ class IBMSVCMigrate(object):
             password=self.module.params['remote_password'],
             validate_certs=self.module.params['remote_validate_certs'],
             log_path=self.module.params['log_path'],
-            token=self.module.params['remote_token']
+            token=self.module.params['remote_token'],
+            token_cache_path=self.module.params['token_cache_path'],
+            pool_size=self.module.params['pool_size'],
+            idle_timeout=self.module.params['idle_timeout'],
+            perf_summary=self.module.params['perf_summary']
         )
         return self.remote_restapi
 
     def create_relationship(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
         self.log("Creating remote copy '%s'", self.relationship_name)
 
         # Make command
@@ -546,7 +780,10 @@ class IBMSVCMigrate(object):
 
         # Run command
         self.log("Command %s opts %s", cmd, cmdopts)
-        if not self.existing_rel_data:
+        if not self.existing_rel_data and self.module.check_mode:
+            self.restapi.svc_plan_command(cmd, cmdopts, None)
+            self.changed = True
+        elif not self.existing_rel_data:
             result = self.restapi.svc_run_command(cmd, cmdopts, cmdargs=None)
             self.log("create remote copy result %s", result)
 
@@ -607,6 +844,7 @@ class IBMSVCMigrate(object):
         """Start the migration relationship copy process."""
         cmdopts = {}
         if self.module.check_mode:
+            self.restapi.svc_plan_command('startrcrelationship', cmdopts, [self.relationship_name])
             self.changed = True
             return
         result = self.restapi.svc_run_command(cmd='startrcrelationship', cmdopts=cmdopts, cmdargs=[self.relationship_name])
@@ -621,6 +859,18 @@ class IBMSVCMigrate(object):
             msg = "Failed to start the rcrelationship [%s]" % self.relationship_name
             self.module.fail_json(msg=msg)
 
+    def wait_for_sync(self):
+        """Wait until the migration relationship is synchronized."""
+        if self.module.check_mode:
+            return
+        done, data = self.restapi.svc_wait('lsrcrelationship', None, [self.relationship_name],
+                                           lambda data: data and data['state'] == 'consistent_synchronized',
+                                           timeout=self.wait_timeout)
+        if not done:
+            state = data['state'] if data else 'unknown'
+            self.module.fail_json(msg="Migration relationship [%s] is not synchronized after %d seconds, current state [%s]"
+                                  % (self.relationship_name, self.wait_timeout, state))
+
     def switch(self):
         """Switch the replication direction."""
         cmdopts = {}
@@ -630,6 +880,7 @@ class IBMSVCMigrate(object):
             if rel_type != 'migration':
                 self.module.fail_json(msg="Remote Copy relationship [%s] is not a migration relationship." % self.relationship_name)
         if self.module.check_mode:
+            self.restapi.svc_plan_command('switchrcrelationship', cmdopts, [self.relationship_name])
             self.changed = True
             return
         result = self.restapi.svc_run_command(cmd='switchrcrelationship', cmdopts=cmdopts, cmdargs=[self.relationship_name])
@@ -646,14 +897,12 @@ class IBMSVCMigrate(object):
 
     def delete(self):
         """Use the rmvolume command to delete the source volume and the existing migration relationship."""
-        if self.module.check_mode:
-            self.changed = True
-            return
         cmd = 'rmvolume'
         cmdopts = {}
         cmdopts['removehostmappings'] = True
         cmdargs = [self.source_volume]
         if self.module.check_mode:
+            self.restapi.svc_plan_command(cmd, cmdopts, cmdargs)
             self.changed = True
             return
         result = self.restapi.svc_run_command(cmd, cmdopts, cmdargs)
@@ -685,7 +934,7 @@ class IBMSVCMigrate(object):
 
         invalid_params['across_pools'] = ['state', 'relationship_name', 'remote_cluster', 'remote_username',
                                           'remote_password', 'remote_token', 'remote_pool', 'remote_validate_certs',
-                                          'replicate_hosts']
+                                          'replicate_hosts', 'volumes']
         param_list = set(invalid_params['across_pools'])
 
         # Check for invalid parameters
@@ -698,10 +947,6 @@ class IBMSVCMigrate(object):
     def migrate_pools(self):
         self.basic_checks_migrate_vdisk()
 
-        if self.module.check_mode:
-            self.changed = True
-            return
-
         source_data, target_data = self.get_existing_vdisk()
         if not source_data:
             msg = "Source volume [%s] does not exist" % self.source_volume
@@ -712,6 +957,10 @@ class IBMSVCMigrate(object):
             cmdopts['mdiskgrp'] = self.new_pool
             cmdopts['vdisk'] = self.source_volume
             self.log("Command %s opts %s", cmd, cmdopts)
+            if self.module.check_mode:
+                self.restapi.svc_plan_command(cmd, cmdopts, None)
+                self.changed = True
+                return
             result = self.restapi.svc_run_command(cmd, cmdopts, cmdargs=None)
 
             if result == '':
@@ -722,9 +971,234 @@ class IBMSVCMigrate(object):
             msg = "No modifications done. New pool [%s] is same" % self.new_pool
             self.module.exit_json(msg=msg, changed=False)
 
+    def basic_checks_volumes(self):
+        self.log("Entering function basic_checks_volumes()")
+        if self.state != 'initiate':
+            self.module.fail_json(msg="Parameter [volumes] is only supported with state 'initiate'")
+        for param in ('source_volume', 'target_volume', 'relationship_name'):
+            if getattr(self, param):
+                self.module.fail_json(msg="Parameters [volumes] and [%s] are mutually exclusive" % param)
+        for param in ('remote_cluster', 'remote_pool'):
+            if not getattr(self, param):
+                self.module.fail_json(msg="Missing mandatory parameter [%s]." % param)
+        if not self.remote_token and not (self.remote_username and self.remote_password):
+            self.module.fail_json(msg="You must pass in either pre-acquired remote_token or "
+                                      "remote_username/remote_password to generate new token.")
+        names = [volume['relationship_name'] for volume in self.volumes]
+        duplicates = sorted(set(name for name in names if names.count(name) > 1))
+        if duplicates:
+            self.module.fail_json(msg="Duplicate relationship names in [volumes]: %s" % ', '.join(duplicates))
+
+    def ensure_consistency_group(self):
+        data = self.restapi.svc_obj_info(cmd='lsrcconsistgrp', cmdopts=None, cmdargs=[self.consistency_group])
+        if data:
+            if data['aux_cluster_name'] != self.remote_cluster:
+                self.module.fail_json(msg="Consistency group [%s] is configured with a different partner system"
+                                      % self.consistency_group)
+            return data
+        cmdopts = {'name': self.consistency_group, 'cluster': self.remote_cluster}
+        if self.module.check_mode:
+            self.restapi.svc_plan_command('mkrcconsistgrp', cmdopts, None)
+            self.changed = True
+            return None
+        result = self.restapi.svc_run_command('mkrcconsistgrp', cmdopts, cmdargs=None)
+        if not result or 'message' not in result:
+            self.module.fail_json(msg="Failed to create consistency group [%s]" % self.consistency_group)
+        self.changed = True
+        self.log("created consistency group %s", self.consistency_group)
+        return None
+
+    def prepare_volume_migration(self, volume):
+        """
+        Creates the target volume and the migration relationship of one
+        volume pair. Runs in a worker thread, so errors are raised instead
+        of failing the module.
+        """
+        source, target, name = volume['source_volume'], volume['target_volume'], volume['relationship_name']
+        result = dict(volume, changed=False)
+        remote_restapi = self.construct_remote_rest()
+
+        rel_data = self.restapi.svc_obj_info(cmd='lsrcrelationship', cmdopts=None, cmdargs=[name])
+        if rel_data:
+            if rel_data['copy_type'] != 'migration':
+                raise Exception("Remote Copy relationship [%s] already exists and is not a migration relationship" % name)
+            if rel_data['master_vdisk_name'] != source:
+                raise Exception("Migration relationship [%s] already exists with a different source volume" % name)
+            if rel_data['aux_vdisk_name'] != target:
+                raise Exception("Migration relationship [%s] already exists with a different target volume" % name)
+            if rel_data['primary'] != 'master':
+                raise Exception("Migration relationship [%s] replication direction is incorrect" % name)
+            if rel_data['aux_cluster_name'] != self.remote_cluster:
+                raise Exception("Migration relationship [%s] is configured with a different partner system" % name)
+            result['state'] = rel_data['state']
+            return result
+
+        source_data = self.restapi.svc_obj_info('lsvdisk', {'bytes': True}, [source])
+        target_data = remote_restapi.svc_obj_info('lsvdisk', {'bytes': True}, [target])
+        if not source_data:
+            raise Exception("Source Volume [%s] does not exist." % source)
+        if source_data[0]['RC_name']:
+            raise Exception("Source Volume [%s] is already in a relationship." % source)
+        if target_data:
+            if target_data[0]['RC_name']:
+                raise Exception("Target Volume [%s] is already in a relationship." % target)
+            if target_data[0]['mdisk_grp_name'] != self.remote_pool:
+                raise Exception("Target Volume [%s] exists on a different pool." % target)
+            if int(source_data[0]['capacity']) != int(target_data[0]['capacity']):
+                raise Exception("Remote Volume size is different than that of source volume.")
+            if remote_restapi.svc_obj_info('lsvdiskhostmap', {}, [target]):
+                raise Exception("The target volume has hostmappings, Migration relationship cannot be created.")
+
+        result['changed'] = True
+
+        if not target_data:
+            cmdopts = {'pool': self.remote_pool, 'name': target,
+                       'size': int(source_data[0]['capacity']), 'unit': 'b'}
+            if self.module.check_mode:
+                remote_restapi.svc_plan_command('mkvolume', cmdopts, None)
+            else:
+                data = remote_restapi.svc_run_command('mkvolume', cmdopts, cmdargs=None)
+                if not data or 'message' not in data:
+                    raise Exception("Failed to create volume [%s]" % target)
+                self.log("created target volume %s", target)
+
+        cmdopts = {'cluster': self.remote_cluster, 'master': source, 'aux': target,
+                   'name': name, 'migration': True}
+        if self.consistency_group:
+            cmdopts['consistgrp'] = self.consistency_group
+        if self.module.check_mode:
+            self.restapi.svc_plan_command('mkrcrelationship', cmdopts, None)
+            result['created'] = True
+            return result
+        data = self.restapi.svc_run_command('mkrcrelationship', cmdopts, cmdargs=None)
+        if not data or 'message' not in data:
+            raise Exception("Failed to create migration relationship [%s]" % name)
+        self.log("created migration relationship %s", name)
+        result['created'] = True
+        return result
+
+    def start_volume_migration(self, result):
+        """
+        Starts the migration relationship of one volume pair unless it is
+        already copying. Runs in a worker thread.
+        """
+        if result.get('state') in ('inconsistent_copying', 'consistent_synchronized'):
+            return result
+        result['changed'] = True
+        if self.module.check_mode:
+            self.restapi.svc_plan_command('startrcrelationship', {}, [result['relationship_name']])
+            return result
+        data = self.restapi.svc_run_command('startrcrelationship', {}, cmdargs=[result['relationship_name']])
+        if data != '' and (not data or 'message' not in data):
+            raise Exception("Failed to start the rcrelationship [%s]" % result['relationship_name'])
+        self.log("started migration relationship %s", result['relationship_name'])
+        return result
+
+    def wait_for_volume_sync(self, result):
+        """
+        Waits until the migration relationship of one volume pair is
+        synchronized. Runs in a worker thread.
+        """
+        done, data = self.restapi.svc_wait('lsrcrelationship', None, [result['relationship_name']],
+                                           lambda data: data and data['state'] == 'consistent_synchronized',
+                                           timeout=self.wait_timeout)
+        if not done:
+            raise Exception("Migration relationship [%s] is not synchronized after %d seconds"
+                            % (result['relationship_name'], self.wait_timeout))
+        return {'state': data['state']}
+
+    def wait_for_group_sync(self, results):
+        done, data = self.restapi.svc_wait('lsrcconsistgrp', None, [self.consistency_group],
+                                           lambda data: data and data['state'] == 'consistent_synchronized',
+                                           timeout=self.wait_timeout)
+        if not done:
+            error = Exception("Consistency group [%s] is not synchronized after %d seconds"
+                              % (self.consistency_group, self.wait_timeout))
+            return [error] * len(results)
+        return [{'state': data['state']}] * len(results)
+
+    def record_volume_errors(self, results, outcomes):
+        """
+        Stores the error of every volume whose step failed in its result,
+        and returns the results of the volumes that can proceed.
+        """
+        ready = []
+        for result, outcome in zip(results, outcomes):
+            if isinstance(outcome, Exception):
+                result['error'] = to_native(outcome)
+                self.log("migration of volume %s failed: %s", result['source_volume'], result['error'])
+            else:
+                result.update(outcome)
+                ready.append(result)
+        self.log("%d of %d volumes ready", len(ready), len(results))
+        return ready
+
+    def replicate_volume_hosts(self, result):
+        """
+        Maps the target volume of a volume pair to the hosts of its source
+        volume, creating them on the partner system if needed.
+        """
+        hosts_data = self.get_source_hosts(result['source_volume'])
+        self.replicate_source_hosts(hosts_data, result['target_volume'])
+        return {}
+
+    def migrate_volumes(self):
+        self.basic_checks_volumes()
+        # Discovers the partnership and authenticates on the partner system
+        self.construct_remote_rest()
+        if self.consistency_group:
+            self.ensure_consistency_group()
+
+        results = [dict(volume, changed=False) for volume in self.volumes]
+        ready = self.record_volume_errors(
+            results, run_concurrently(self.prepare_volume_migration, self.volumes, self.parallelism))
+
+        if self.replicate_hosts:
+            # Volumes may share hosts, so they are replicated one at a time,
+            # and a failure is recorded for its volume only.
+            created = [result for result in ready if result.get('created')]
+            self.record_volume_errors(created, run_concurrently(self.replicate_volume_hosts, created, 1))
+            ready = [result for result in ready if 'error' not in result]
+
+        if self.consistency_group:
+            if ready and any(result.get('state') not in ('inconsistent_copying', 'consistent_synchronized')
+                             for result in ready):
+                if self.module.check_mode:
+                    self.restapi.svc_plan_command('startrcconsistgrp', {}, [self.consistency_group])
+                else:
+                    self.restapi.svc_run_command('startrcconsistgrp', {}, cmdargs=[self.consistency_group])
+                for result in ready:
+                    result['changed'] = True
+        else:
+            ready = self.record_volume_errors(
+                ready, run_concurrently(self.start_volume_migration, ready, self.parallelism))
+
+        if self.wait and ready and not self.module.check_mode:
+            if self.consistency_group:
+                outcomes = self.wait_for_group_sync(ready)
+            else:
+                outcomes = run_concurrently(self.wait_for_volume_sync, ready, self.parallelism)
+            self.record_volume_errors(ready, outcomes)
+
+        for result in results:
+            result.pop('created', None)
+        changed = self.changed or any(result['changed'] for result in results)
+        failed = [result['source_volume'] for result in results if 'error' in result]
+        if failed:
+            self.module.fail_json(msg="Failed to migrate volumes [%s]." % ', '.join(failed),
+                                  volumes=results, changed=changed)
+        msg = "Migration of %d volumes has been started." % len(results)
+        if self.module.check_mode:
+            msg = "skipping changes due to check mode."
+        self.module.exit_json(msg=msg, changed=changed, volumes=results)
+
     def apply(self):
         changed = False
         msg = None
+        if self.consistency_group and not self.volumes:
+            self.module.fail_json(msg="Parameter [consistency_group] is only supported with [volumes]")
+        if self.volumes and self.type_of_migration == 'across_clusters':
+            return self.migrate_volumes()
         if self.type_of_migration == 'across_pools':
             self.migrate_pools()
             msg = "Source Volume migrated successfully to new pool [%s]." % self.new_pool
@@ -741,6 +1215,8 @@ class IBMSVCMigrate(object):
                             hosts_data = self.get_source_hosts()
                             self.replicate_source_hosts(hosts_data)
                         self.start_relationship()
+                        if self.wait:
+                            self.wait_for_sync()
                         changed = True
                         msg = "Migration Relationship [%s] has been started." % self.relationship_name
                     elif self.state == 'switch':
@@ -750,6 +1226,8 @@ class IBMSVCMigrate(object):
                 elif self.state == 'initiate':
                     self.verify_existing_rel(existing_rc_data)
                     self.start_relationship()
+                    if self.wait:
+                        self.wait_for_sync()
                     msg = "Migration Relationship [%s] has been started." % self.relationship_name
                     changed = True
                 elif self.state == 'switch':
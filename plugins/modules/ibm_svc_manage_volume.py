@@ -19,8 +19,66 @@ options:
   name:
     description:
       - Specifies the name to assign to the new volume.
-    required: true
+      - Required unless I(volumes) is specified.
     type: str
+  volumes:
+    description:
+      - Specifies several volumes to be created, updated or removed in one run, instead of I(name).
+      - Every entry is a dictionary with the I(name) of a volume, and optionally the parameters
+        that override the parameters of the same name for that volume.
+      - The existing volumes are found with a single listing, and the required changes are then made
+        for up to I(parallelism) volumes at a time.
+      - The result of every volume is returned in C(volumes).
+      - Renaming, I(old_name), is not supported with I(volumes).
+    type: list
+    elements: dict
+    version_added: '1.13.0'
+    suboptions:
+      name:
+        description:
+          - Specifies the name of the volume.
+        type: str
+        required: true
+      pool:
+        description:
+          - Specifies the name of the storage pool to use while creating the volume.
+        type: str
+      size:
+        description:
+          - Defines the size of the volume.
+        type: str
+      unit:
+        description:
+          - Specifies the data units to use with the capacity that is specified by I(size).
+        type: str
+        choices: [ b, kb, mb, gb, tb, pb ]
+      volumegroup:
+        description:
+          - Specifies the name of the volumegroup to which the volume is to be added.
+        type: str
+      thin:
+        description:
+          - Specifies that a thin-provisioned volume is to be created.
+        type: bool
+      compressed:
+        description:
+          - Specifies that a compressed volume is to be created.
+        type: bool
+      deduplicated:
+        description:
+          - Specifies that a deduplicated volume is to be created.
+        type: bool
+      buffersize:
+        description:
+          - Specifies the pool capacity that the volume will reserve as a buffer for thin-provisioned and compressed volumes.
+        type: str
+  parallelism:
+    description:
+      - Maximum number of volumes that are created, updated or removed concurrently when I(volumes) is specified.
+      - The concurrent requests share the same REST API session.
+    type: int
+    default: 1
+    version_added: '1.13.0'
   state:
     description:
       - Creates or updates (C(present)) or removes (C(absent)) a volume.
@@ -141,10 +199,42 @@ options:
     description:
       - Path of debug log file.
     type: str
+  token_cache_path:
+    description:
+      - Directory in which authentication tokens are cached per cluster and user.
+      - Tasks that run against the same cluster as the same user reuse the cached token
+        instead of authenticating again.
+      - An expired or rejected token is replaced automatically when I(username) and I(password) are given.
+      - If not specified, tokens are not cached.
+    type: path
+    version_added: '1.13.0'
+  perf_summary:
+    description:
+      - If C(true), a summary of the REST API requests made by the task is returned in C(_perf),
+        and logged to I(log_path). It holds the number of requests, their time split into
+        phases, byte counts, and per command totals, slowest commands first.
+      - Every request is logged to I(log_path) with its timings, whether or not this is set.
+    type: bool
+    default: false
+    version_added: '1.13.0'
+  pool_size:
+    description:
+      - Maximum number of idle keep-alive connections to the cluster kept for reuse by the task.
+    type: int
+    default: 4
+    version_added: '1.13.0'
+  idle_timeout:
+    description:
+      - Seconds an idle keep-alive connection to the cluster may be reused.
+      - Older connections are closed and a new one is opened.
+    type: int
+    default: 30
+    version_added: '1.13.0'
 author:
     - Sreshtant Bohidar(@Sreshtant-Bohidar)
 notes:
     - This module supports C(check_mode).
+    - In check mode, the commands that would run are returned in C(command_plan), with the round trips they take.
 '''
 
 EXAMPLES = '''
@@ -237,6 +327,26 @@ EXAMPLES = '''
     enable_cloud_snapshot: true
     cloud_account_name: "aws_acc"
     state: "present"
+- name: Create several volumes in one run
+  ibm.spectrum_virtualize.ibm_svc_manage_volume:
+    clustername: "{{ clustername }}"
+    domain: "{{ domain }}"
+    username: "{{ username }}"
+    password: "{{ password }}"
+    log_path: "{{ log_path }}"
+    state: "present"
+    pool: "pool_name"
+    unit: "gb"
+    thin: true
+    parallelism: 8
+    volumes:
+      - name: "db_data_0"
+        size: "100"
+      - name: "db_data_1"
+        size: "100"
+      - name: "db_log_0"
+        size: "20"
+        pool: "fast_pool"
 - name: Delete a volume
   ibm.spectrum_virtualize.ibm_svc_manage_volume:
     clustername: "{{ clustername }}"
@@ -248,26 +358,82 @@ EXAMPLES = '''
     state: "absent"
 '''
 
-RETURN = '''#'''
+RETURN = '''
+volumes:
+    description:
+        - Result of every entry of I(volumes) when I(volumes) is specified.
+        - C(error) is set for a volume that could not be created, updated or removed.
+    returned: when I(volumes) is specified
+    type: list
+    elements: dict
+    sample: [{"name": "db_data_0", "changed": true, "msg": "volume [db_data_0] has been created"}]
+command_plan:
+    description:
+        - Commands that would run to bring the objects to the requested state, in the order they were planned,
+          each with the cluster it would run on, its options and its arguments.
+        - Commands that would run concurrently may be listed in a different order from one run to the next.
+    returned: in check mode, when changes are needed
+    type: list
+    elements: dict
+    sample: [{"cluster": "10.10.10.1", "cmd": "mkvolume", "opts": {"pool": "Pool0", "size": 100,
+              "unit": "gb", "name": "db_data_0"}, "args": []}]
+round_trips:
+    description:
+        - REST API round trips of the run, C(reads) for the C(ls) requests made and C(writes) for the commands planned.
+    returned: in check mode, when changes are needed
+    type: dict
+    sample: {"reads": 1, "writes": 1}
+'''
 
+import copy
 from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import (
     IBMSVCRestApi,
+    IBMSVCRestApiError,
     svc_argument_spec,
     get_logger,
+    run_concurrently,
     strtobool
 )
 from ansible.module_utils._text import to_native
 
 
+class VolumeEntryModule(object):
+    """ Stands in for the AnsibleModule while an entry of volumes is
+    processed in a worker thread, where fail_json must not exit the module.
+    """
+
+    def __init__(self, module):
+        self.module = module
+
+    def __getattr__(self, name):
+        return getattr(self.module, name)
+
+    def fail_json(self, msg, **kwargs):
+        raise IBMSVCRestApiError(msg)
+
+
 class IBMSVCvolume(object):
     def __init__(self):
         argument_spec = svc_argument_spec()
 
         argument_spec.update(
             dict(
-                name=dict(type='str', required=True),
+                name=dict(type='str', required=False),
+                volumes=dict(type='list', elements='dict', required=False,
+                             options=dict(
+                                 name=dict(type='str', required=True),
+                                 pool=dict(type='str'),
+                                 size=dict(type='str'),
+                                 unit=dict(type='str', choices=['b', 'kb', 'mb', 'gb', 'tb', 'pb']),
+                                 volumegroup=dict(type='str'),
+                                 thin=dict(type='bool'),
+                                 compressed=dict(type='bool'),
+                                 deduplicated=dict(type='bool'),
+                                 buffersize=dict(type='str')
+                             )),
+                parallelism=dict(type='int', default=1),
                 state=dict(type='str', required=True, choices=['absent', 'present']),
                 pool=dict(type='str', required=False),
                 size=dict(type='str', required=False),
@@ -287,7 +453,9 @@ class IBMSVCvolume(object):
             )
         )
 
-        self.module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+        self.module = AnsibleModule(argument_spec=argument_spec,
+                                    mutually_exclusive=[['name', 'volumes']],
+                                    supports_check_mode=True)
 
         # logging setup
         log_path = self.module.params['log_path']
@@ -297,6 +465,8 @@ class IBMSVCvolume(object):
         # Required Parameters
         self.name = self.module.params['name']
         self.state = self.module.params['state']
+        self.volumes = self.module.params['volumes']
+        self.parallelism = self.module.params['parallelism']
 
         # Optional Parameters
         self.pool = self.module.params['pool']
@@ -324,7 +494,11 @@ class IBMSVCvolume(object):
             password=self.module.params['password'],
             validate_certs=self.module.params['validate_certs'],
             log_path=log_path,
-            token=self.module.params['token']
+            token=self.module.params['token'],
+            token_cache_path=self.module.params['token_cache_path'],
+            pool_size=self.module.params['pool_size'],
+            idle_timeout=self.module.params['idle_timeout'],
+            perf_summary=self.module.params['perf_summary']
         )
 
     # assemble iogrp
@@ -431,9 +605,6 @@ class IBMSVCvolume(object):
     # function to create a new volume
     def create_volume(self):
         self.volume_creation_parameter_validation()
-        if self.module.check_mode:
-            self.changed = True
-            return
         cmd = 'mkvolume'
         cmdopts = {}
         if self.pool:
@@ -456,6 +627,10 @@ class IBMSVCvolume(object):
             cmdopts['buffersize'] = self.buffersize
         if self.name:
             cmdopts['name'] = self.name
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(cmd, cmdopts, None)
+            self.changed = True
+            return
         result = self.restapi.svc_run_command(cmd, cmdopts, cmdargs=None)
         if result and 'message' in result:
             self.changed = True
@@ -464,13 +639,18 @@ class IBMSVCvolume(object):
             self.module.fail_json(
                 msg="Failed to create volume [%s]" % self.name)
 
+    # function to run a command changing the system, which is planned
+    # instead in check mode
+    def run_command(self, cmd, cmdopts, cmdargs):
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(cmd, cmdopts, cmdargs)
+            return None
+        return self.restapi.svc_run_command(cmd, cmdopts, cmdargs)
+
     # function to remove an existing volume
     def remove_volume(self):
         self.volume_deletion_parameter_validation()
-        if self.module.check_mode:
-            self.changed = True
-            return
-        self.restapi.svc_run_command(
+        self.run_command(
             'rmvolume', None, [self.name]
         )
         self.changed = True
@@ -565,7 +745,7 @@ class IBMSVCvolume(object):
 
     # function to expand an existing volume size
     def expand_volume(self, expand_size):
-        self.restapi.svc_run_command(
+        self.run_command(
             'expandvdisksize',
             {'size': expand_size, 'unit': 'b'},
             [self.name]
@@ -574,7 +754,7 @@ class IBMSVCvolume(object):
 
     # function to shrink an existing volume size
     def shrink_volume(self, shrink_size):
-        self.restapi.svc_run_command(
+        self.run_command(
             'shrinkvdisksize',
             {'size': shrink_size, 'unit': 'b'},
             [self.name]
@@ -583,7 +763,7 @@ class IBMSVCvolume(object):
 
     # add iogrp
     def add_iogrp(self, list_of_iogrp):
-        self.restapi.svc_run_command(
+        self.run_command(
             'addvdiskaccess',
             {'iogrp': ':'.join(list_of_iogrp)},
             [self.name]
@@ -592,7 +772,7 @@ class IBMSVCvolume(object):
 
     # remove iogrp
     def remove_iogrp(self, list_of_iogrp):
-        self.restapi.svc_run_command(
+        self.run_command(
             'rmvdiskaccess',
             {'iogrp': ':'.join(list_of_iogrp)},
             [self.name]
@@ -613,7 +793,7 @@ class IBMSVCvolume(object):
         if self.cloud_account_name:
             cmdopts['account'] = self.cloud_account_name
 
-        self.restapi.svc_run_command(
+        self.run_command(
             'chvdisk',
             cmdopts,
             [self.name]
@@ -630,10 +810,6 @@ class IBMSVCvolume(object):
                 unsupported_exists.append(parameter)
         if unsupported_exists:
             self.module.fail_json(msg='Update not supported for parameter: {0}'.format(unsupported_exists))
-        # when check_mode is enabled
-        if self.module.check_mode:
-            self.changed = True
-            return
         # updating iogrps of a volume
         if 'iogrp' in modify:
             if 'add' in modify['iogrp']:
@@ -657,7 +833,7 @@ class IBMSVCvolume(object):
         if 'novolumegroup' in modify:
             cmdopts['novolumegroup'] = modify['novolumegroup']['status']
         if cmdopts:
-            self.restapi.svc_run_command(
+            self.run_command(
                 'chvdisk',
                 cmdopts,
                 [self.name]
@@ -676,17 +852,121 @@ class IBMSVCvolume(object):
         elif not old_volume_data and volume_data:
             msg = "Volume with name [{0}] already exists.".format(self.name)
         elif old_volume_data and not volume_data:
-            # when check_mode is enabled
-            if self.module.check_mode:
-                self.changed = True
-                return
-            self.restapi.svc_run_command('chvdisk', {'name': self.name}, [self.old_name])
+            self.run_command('chvdisk', {'name': self.name}, [self.old_name])
             self.changed = True
             msg = "Volume [{0}] has been successfully rename to [{1}]".format(self.old_name, self.name)
         return msg
 
-    def apply(self):
+    # function to create, update or remove the volume described by volume_data
+    def manage_volume(self, volume_data):
         changed, msg, modify = False, None, {}
+        if volume_data:
+            self.validate_volume_type(volume_data)
+            if self.state == 'absent':
+                changed = True
+            elif self.state == 'present':
+                modify = self.probe_volume(volume_data)
+                if modify:
+                    changed = True
+        else:
+            if self.state == 'present':
+                changed = True
+        if changed:
+            if self.state == 'present':
+                if not volume_data:
+                    self.create_volume()
+                    if isinstance(self.iogrp, list):
+                        if len(self.iogrp) > 1:
+                            self.add_iogrp(self.iogrp[1:])
+                    msg = 'volume [%s] has been created' % self.name
+                else:
+                    if modify:
+                        self.update_volume(modify)
+                        msg = 'volume [%s] has been modified' % self.name
+            elif self.state == 'absent':
+                self.remove_volume()
+                msg = 'volume [%s] has been deleted.' % self.name
+        else:
+            if self.state == 'absent':
+                msg = "volume [%s] did not exist." % self.name
+            else:
+                msg = "volume [%s] already exists." % self.name
+        return msg
+
+    # for validating the parameters of the volumes mode
+    def volumes_parameter_validation(self):
+        if self.old_name:
+            self.module.fail_json(msg='Parameter [old_name] is not supported with [volumes].')
+        if self.volumegroup and self.novolumegroup:
+            self.module.fail_json(msg='Mutually exclusive parameters detected: [volumegroup] and [novolumegroup]')
+        names = []
+        for entry in self.volumes:
+            names.append(entry['name'])
+        duplicates = sorted(set(name for name in names if names.count(name) > 1))
+        if duplicates:
+            self.module.fail_json(msg='Duplicate volume names in [volumes]: {0}'.format(duplicates))
+
+    # whether probe_volume needs the detailed view of an existing volume,
+    # instead of its entry in the lsvdisk listing
+    def needs_volume_details(self):
+        return bool(self.thin or self.compressed or self.deduplicated or
+                    self.enable_cloud_snapshot is not None or self.cloud_account_name)
+
+    # function to manage a single entry of volumes, run in a worker thread
+    def manage_volume_entry(self, job):
+        entry, listed = job
+        volume = copy.copy(self)
+        volume.module = VolumeEntryModule(self.module)
+        volume.changed = False
+        for key, value in entry.items():
+            if value is not None:
+                setattr(volume, key, value)
+        volume_data = None
+        if listed:
+            if volume.state == 'present' and volume.needs_volume_details():
+                volume_data = volume.get_existing_volume(volume.name)
+            else:
+                volume_data = [listed]
+        msg = volume.manage_volume(volume_data)
+        return {'name': volume.name, 'changed': volume.changed, 'msg': msg}
+
+    # function to manage all entries of volumes
+    def apply_volumes(self):
+        self.volumes_parameter_validation()
+        if self.state == 'present':
+            self.assemble_iogrp()
+
+        requested = set(entry['name'] for entry in self.volumes)
+        listing = self.restapi.svc_obj_info('lsvdisk', {'bytes': True}, None, stream=True) or []
+        existing = dict((item['name'], item) for item in listing if item['name'] in requested)
+        self.log("%d of %d volumes exist", len(existing), len(requested))
+
+        jobs = [(entry, existing.get(entry['name'])) for entry in self.volumes]
+        outcomes = run_concurrently(self.manage_volume_entry, jobs, self.parallelism)
+
+        results = []
+        failed = []
+        for entry, outcome in zip(self.volumes, outcomes):
+            if isinstance(outcome, Exception):
+                result = {'name': entry['name'], 'changed': False, 'error': to_native(outcome)}
+                failed.append(entry['name'])
+            else:
+                result = outcome
+            results.append(result)
+        changed = any(result['changed'] for result in results)
+        if failed:
+            self.module.fail_json(msg='Failed to manage volumes {0}.'.format(failed),
+                                  volumes=results, changed=changed)
+        msg = '%d volumes processed, %d changed.' % (len(results), len([r for r in results if r['changed']]))
+        if self.module.check_mode:
+            msg = 'Skipping changes due to check mode.'
+            self.log('skipping changes due to check mode.')
+        self.module.exit_json(msg=msg, changed=changed, volumes=results)
+
+    def apply(self):
+        if self.volumes:
+            return self.apply_volumes()
+        msg = None
         self.mandatory_parameter_validation()
         volume_data = self.get_existing_volume(self.name)
         if self.state == "present" and self.old_name:
@@ -696,37 +976,7 @@ class IBMSVCvolume(object):
         else:
             if self.state == 'present':
                 self.assemble_iogrp()
-            if volume_data:
-                self.validate_volume_type(volume_data)
-                if self.state == 'absent':
-                    changed = True
-                elif self.state == 'present':
-                    modify = self.probe_volume(volume_data)
-                    if modify:
-                        changed = True
-            else:
-                if self.state == 'present':
-                    changed = True
-            if changed:
-                if self.state == 'present':
-                    if not volume_data:
-                        self.create_volume()
-                        if isinstance(self.iogrp, list):
-                            if len(self.iogrp) > 1:
-                                self.add_iogrp(self.iogrp[1:])
-                        msg = 'volume [%s] has been created' % self.name
-                    else:
-                        if modify:
-                            self.update_volume(modify)
-                            msg = 'volume [%s] has been modified' % self.name
-                elif self.state == 'absent':
-                    self.remove_volume()
-                    msg = 'volume [%s] has been deleted.' % self.name
-            else:
-                if self.state == 'absent':
-                    msg = "volume [%s] did not exist." % self.name
-                else:
-                    msg = "volume [%s] already exists." % self.name
+            msg = self.manage_volume(volume_data)
         if self.module.check_mode:
             msg = 'Skipping changes due to check mode.'
             self.log('skipping changes due to check mode.')
@@ -20,14 +20,48 @@ options:
     name:
         description:
             - Specifies the name of the FlashCopy mapping or FlashCopy consistency group.
-        required: true
+            - Required unless I(names) or I(job) is specified.
         type: str
+    names:
+        description:
+            - Specifies several FlashCopy mappings or FlashCopy consistency groups to be started or stopped
+              in one run, instead of I(name).
+            - Their status is read with a single listing, and the start or stop commands are then issued
+              for up to I(parallelism) of them at a time.
+            - The result of every entry is returned in C(results).
+        type: list
+        elements: str
+        version_added: '1.13.0'
+    parallelism:
+        description:
+            - Maximum number of FlashCopy mappings or FlashCopy consistency groups that are started or stopped
+              concurrently when I(names) is specified.
+        type: int
+        default: 1
+        version_added: '1.13.0'
     state:
         description:
             - Starts (C(started)) or stops (C(stopped)) a FlashCopy mapping or FlashCopy consistency group.
-        choices: [ started, stopped ]
+            - C(status) reports the progress of the FlashCopy mappings or FlashCopy consistency groups
+              in C(job_status), without changing them. They are read with a single listing, however many they are.
+        choices: [ started, stopped, status ]
         required: true
         type: str
+    track_job:
+        description:
+            - If C(true), a handle of the operation is returned in C(job) when I(state=started) or I(state=stopped).
+            - Passing the handle to I(job) with I(state=status) then reports the progress of the operation.
+        default: false
+        type: bool
+        version_added: '1.13.0'
+    job:
+        description:
+            - Handle returned in C(job) by an earlier task run with I(track_job=true).
+            - Valid when I(state=status). The FlashCopy mappings or FlashCopy consistency groups of the handle
+              are reported, and their completion is judged against the state requested by that task.
+            - Without I(job), the completion of I(name) or I(names) is judged against I(state=started).
+        type: dict
+        version_added: '1.13.0'
     clustername:
         description:
             - The hostname or management IP of the Spectrum Virtualize storage system.
@@ -66,10 +100,57 @@ options:
             - Valid when I(state=stopped), to stop a FlashCopy mapping or FlashCopy consistency group.
         required: false
         type: bool
+    wait:
+        description:
+            - If C(true), waits until the FlashCopy mapping or FlashCopy consistency group has finished
+              preparing and is copying when I(state=started), or has stopped when I(state=stopped).
+            - The status is checked at increasing intervals, so the wait ends soon after the operation completes.
+        default: false
+        type: bool
+        version_added: '1.13.0'
+    wait_timeout:
+        description:
+            - Maximum number of seconds to wait when I(wait=true).
+            - The module fails if the FlashCopy mapping or FlashCopy consistency group
+              does not reach the requested state in time.
+        default: 300
+        type: int
+        version_added: '1.13.0'
     log_path:
         description:
             - Path of debug log file.
         type: str
+    token_cache_path:
+        description:
+            - Directory in which authentication tokens are cached per cluster and user.
+            - Tasks that run against the same cluster as the same user reuse the cached token
+              instead of authenticating again.
+            - An expired or rejected token is replaced automatically when I(username) and I(password) are given.
+            - If not specified, tokens are not cached.
+        type: path
+        version_added: '1.13.0'
+    perf_summary:
+        description:
+            - If C(true), a summary of the REST API requests made by the task is returned in C(_perf),
+              and logged to I(log_path). It holds the number of requests, their time split into
+              phases, byte counts, and per command totals, slowest commands first.
+            - Every request is logged to I(log_path) with its timings, whether or not this is set.
+        type: bool
+        default: false
+        version_added: '1.13.0'
+    pool_size:
+        description:
+            - Maximum number of idle keep-alive connections to the cluster kept for reuse by the task.
+        type: int
+        default: 4
+        version_added: '1.13.0'
+    idle_timeout:
+        description:
+            - Seconds an idle keep-alive connection to the cluster may be reused.
+            - Older connections are closed and a new one is opened.
+        type: int
+        default: 30
+        version_added: '1.13.0'
     validate_certs:
         description:
             - Validates certification.
@@ -79,6 +160,11 @@ author:
     - Sreshtant Bohidar(@Sreshtant-Bohidar)
 notes:
     - This module supports C(check_mode).
+    - In check mode, the commands that would run are returned in C(command_plan), with the round trips they take.
+    - A FlashCopy mapping started with a background copy is complete once the copy has finished.
+      A FlashCopy mapping without background copy is complete once it is copying.
+    - A FlashCopy mapping created with I(autodelete) is deleted once its copy has finished,
+      and is then reported as missing.
 '''
 
 EXAMPLES = '''
@@ -120,29 +206,121 @@ EXAMPLES = '''
     name: fcconsistgrp-name
     isgroup: true
     state: stopped
+- name: Start a FlashCopy mapping and wait until it is copying
+  ibm.spectrum_virtualize.ibm_svc_start_stop_flashcopy:
+    clustername: "{{clustername}}"
+    domain: "{{domain}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    log_path: /tmp/playbook.debug
+    name: mapping-name
+    state: started
+    wait: true
+    wait_timeout: 600
+- name: Start several FlashCopy mappings and keep a handle of the operation
+  ibm.spectrum_virtualize.ibm_svc_start_stop_flashcopy:
+    clustername: "{{clustername}}"
+    domain: "{{domain}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    names: "{{ backup_mappings }}"
+    parallelism: 8
+    state: started
+    track_job: true
+  register: backup
+- name: Wait until the background copies have finished
+  ibm.spectrum_virtualize.ibm_svc_start_stop_flashcopy:
+    clustername: "{{clustername}}"
+    domain: "{{domain}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    state: status
+    job: "{{ backup.job }}"
+  register: progress
+  until: progress.job_status.complete
+  retries: 60
+  delay: 60
 '''
 
-RETURN = '''#'''
+RETURN = '''
+results:
+    description: Result of every entry of I(names).
+    returned: when I(names) is specified and I(state) is C(started) or C(stopped)
+    type: list
+    elements: dict
+    sample: [{"name": "fcmap0", "changed": true}, {"name": "fcmap1", "changed": false, "status": "copying"}]
+job:
+    description:
+        - Handle of the operation, to pass to I(job) with I(state=status).
+    returned: when I(track_job=true)
+    type: dict
+    sample: {"cluster": "cluster1", "kind": "fcmap", "names": ["fcmap0", "fcmap1"],
+             "state": "started", "submitted": 1675418400}
+job_status:
+    description:
+        - Progress of the FlashCopy mappings or FlashCopy consistency groups.
+        - C(objects) holds the status, progress and completion of every one found,
+          C(pending) and C(missing) the names of those not yet complete and not found.
+        - C(complete) is true once none is pending. C(progress) is the mean progress in percent
+          of the FlashCopy mappings, or null for FlashCopy consistency groups.
+    returned: when I(state=status)
+    type: dict
+    sample: {"objects": {"fcmap0": {"status": "copying", "progress": "40", "copy_rate": "50",
+                                    "start_time": "230203101500", "complete": false}},
+             "pending": ["fcmap0"], "missing": [], "complete": false, "progress": 40}
+command_plan:
+    description:
+        - Commands that would run to start or stop the FlashCopy mappings or FlashCopy consistency groups,
+          in the order they were planned, each with the cluster it would run on, its options and its arguments.
+    returned: in check mode, when changes are needed
+    type: list
+    elements: dict
+    sample: [{"cluster": "10.10.10.1", "cmd": "startfcmap", "opts": {"prep": true}, "args": ["fcmap0"]}]
+round_trips:
+    description:
+        - REST API round trips of the run, C(reads) for the C(ls) requests made and C(writes) for the commands planned.
+    returned: in check mode, when changes are needed
+    type: dict
+    sample: {"reads": 1, "writes": 1}
+'''
 
 from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi, svc_argument_spec, get_logger
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import (
+    IBMSVCRestApi,
+    svc_argument_spec,
+    svc_wait_argument_spec,
+    svc_job_handle,
+    svc_job_report,
+    run_concurrently,
+    get_logger
+)
 from ansible.module_utils._text import to_native
 
+# Attributes reported per FlashCopy mapping or consistency group in state=status
+STATUS_FIELDS = ('status', 'progress', 'copy_rate', 'start_time')
+
 
 class IBMSVCFlashcopyStartStop(object):
     def __init__(self):
         argument_spec = svc_argument_spec()
         argument_spec.update(
             dict(
-                name=dict(type='str', required=True),
-                state=dict(type='str', required=True, choices=['started', 'stopped']),
+                name=dict(type='str', required=False),
+                names=dict(type='list', elements='str', required=False),
+                parallelism=dict(type='int', default=1),
+                state=dict(type='str', required=True, choices=['started', 'stopped', 'status']),
                 isgroup=dict(type='bool', required=False),
                 force=dict(type='bool', required=False),
+                track_job=dict(type='bool', default=False),
+                job=dict(type='dict', required=False),
             )
         )
+        argument_spec.update(svc_wait_argument_spec())
 
-        self.module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+        self.module = AnsibleModule(argument_spec=argument_spec,
+                                    mutually_exclusive=[['name', 'names', 'job']],
+                                    supports_check_mode=True)
 
         # logging setup
         log_path = self.module.params['log_path']
@@ -154,12 +332,20 @@ class IBMSVCFlashcopyStartStop(object):
         self.state = self.module.params['state']
 
         # Optional
+        self.names = self.module.params['names']
+        self.parallelism = self.module.params['parallelism']
         self.isgroup = self.module.params.get('isgroup', False)
         self.force = self.module.params.get('force', False)
+        self.wait = self.module.params['wait']
+        self.wait_timeout = self.module.params['wait_timeout']
+        self.track_job = self.module.params['track_job']
+        self.job = self.module.params['job']
 
         # Handling missing mandatory parameters
-        if not self.name:
+        if not (self.name or self.names or self.job):
             self.module.fail_json(msg='Missing mandatory parameter: name')
+        if self.job and self.state != 'status':
+            self.module.fail_json(msg='Parameter job is only supported with state=status')
 
         self.restapi = IBMSVCRestApi(
             module=self.module,
@@ -169,9 +355,17 @@ class IBMSVCFlashcopyStartStop(object):
             password=self.module.params['password'],
             validate_certs=self.module.params['validate_certs'],
             log_path=log_path,
-            token=self.module.params['token']
+            token=self.module.params['token'],
+            token_cache_path=self.module.params['token_cache_path'],
+            pool_size=self.module.params['pool_size'],
+            idle_timeout=self.module.params['idle_timeout'],
+            perf_summary=self.module.params['perf_summary']
         )
 
+    @property
+    def kind(self):
+        return 'fcconsistgrp' if self.isgroup else 'fcmap'
+
     def get_existing_fcmapping(self):
         merged_result = {}
         data = {}
@@ -186,7 +380,7 @@ class IBMSVCFlashcopyStartStop(object):
             merged_result = data
         return merged_result
 
-    def start_fc(self):
+    def start_fc(self, name=None):
         cmd = ''
         if self.isgroup:
             cmd = 'startfcconsistgrp'
@@ -196,10 +390,13 @@ class IBMSVCFlashcopyStartStop(object):
         cmdopts['prep'] = True
         if self.force:
             cmdopts["force"] = self.force
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(cmd, cmdopts, [name or self.name])
+            return
         self.log("Starting fc mapping.. Command %s opts %s", cmd, cmdopts)
-        self.restapi.svc_run_command(cmd, cmdopts, cmdargs=[self.name])
+        self.restapi.svc_run_command(cmd, cmdopts, cmdargs=[name or self.name])
 
-    def stop_fc(self):
+    def stop_fc(self, name=None):
         cmd = ''
         if self.isgroup:
             cmd = 'stopfcconsistgrp'
@@ -208,12 +405,132 @@ class IBMSVCFlashcopyStartStop(object):
         cmdopts = {}
         if self.force:
             cmdopts["force"] = self.force
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(cmd, cmdopts, [name or self.name])
+            return
         self.log("Stopping fc mapping.. Command %s opts %s", cmd, cmdopts)
-        self.restapi.svc_run_command(cmd, cmdopts, cmdargs=[self.name])
+        self.restapi.svc_run_command(cmd, cmdopts, cmdargs=[name or self.name])
+
+    def reached_state(self, data):
+        if self.state == "started":
+            # idle_or_copied is also the status before the start, so it only
+            # counts once the start time shows that the copy was started
+            return data['status'] == 'copying' or (data['status'] == 'idle_or_copied' and bool(data.get('start_time')))
+        return data['status'] in ('stopped', 'idle_or_copied')
+
+    def wait_for_state(self):
+        cmd = 'lsfcconsistgrp' if self.isgroup else 'lsfcmap'
+        done, data = self.restapi.svc_wait(cmd, None, [self.name],
+                                           lambda data: data and self.reached_state(data),
+                                           timeout=self.wait_timeout)
+        if not done:
+            status = data['status'] if data else 'unknown'
+            self.module.fail_json(msg="fc [%s] did not reach state [%s] within %d seconds, current status [%s]"
+                                  % (self.name, self.state, self.wait_timeout, status))
+
+    def copy_complete(self, data, state):
+        """
+        Checks whether the operation requested on the FlashCopy mapping or
+        consistency group described by data has completed.
+        """
+        if state == 'stopped':
+            return data['status'] in ('stopped', 'idle_or_copied')
+        if data['status'] == 'idle_or_copied':
+            return True
+        # Without background copy the progress stays at 0 for as long as
+        # the mapping is copying
+        return data['status'] == 'copying' and (data.get('progress') == '100' or data.get('copy_rate') == '0')
+
+    def job_result(self, names):
+        if not self.track_job:
+            return {}
+        return dict(job=svc_job_handle(self.module.params['clustername'], self.kind, names, self.state))
+
+    def report_status(self):
+        state = 'started'
+        names = self.names or [self.name]
+        if self.job:
+            if self.job.get('kind') not in ('fcmap', 'fcconsistgrp') or not self.job.get('names'):
+                self.module.fail_json(msg='Parameter job is not the handle of a FlashCopy operation')
+            if self.job.get('cluster') != self.module.params['clustername']:
+                self.module.fail_json(msg='Parameter job is the handle of an operation on cluster [%s]'
+                                      % self.job.get('cluster'))
+            self.isgroup = self.job['kind'] == 'fcconsistgrp'
+            names = self.job['names']
+            state = self.job.get('state') or state
+
+        cmd = 'lsfcconsistgrp' if self.isgroup else 'lsfcmap'
+        records = self.restapi.svc_obj_info(cmd, None, None, stream=True)
+        report = svc_job_report(records, names, lambda data: self.copy_complete(data, state), STATUS_FIELDS)
+        self.log("%d of %d pending, %d missing", len(report['pending']), len(names), len(report['missing']))
+        self.module.exit_json(changed=False, job_status=report)
+
+    def apply_names(self):
+        cmd = 'lsfcconsistgrp' if self.isgroup else 'lsfcmap'
+        existing = dict((data['name'], data) for data in self.restapi.svc_obj_info(cmd, None, None) or [])
+        results = []
+        todo = []
+        for name in self.names:
+            data = existing.get(name)
+            result = {'name': name, 'changed': False}
+            if not data:
+                result['msg'] = "[%s] does not exist." % name
+            elif (data['start_time'] == '') == (self.state == 'started'):
+                result['changed'] = True
+                todo.append(name)
+            else:
+                result['status'] = data['status']
+            results.append(result)
+        self.log("%d of %d to be %s", len(todo), len(self.names), self.state)
+
+        operation = self.start_fc if self.state == 'started' else self.stop_fc
+        if self.module.check_mode:
+            for name in todo:
+                operation(name)
+        elif todo:
+            outcomes = run_concurrently(operation, todo, self.parallelism)
+            errors = dict((name, to_native(outcome)) for name, outcome in zip(todo, outcomes)
+                          if isinstance(outcome, Exception))
+            for result in results:
+                if result['name'] in errors:
+                    result['changed'] = False
+                    result['error'] = errors[result['name']]
+            if errors:
+                self.module.fail_json(msg="Failed to %s %d of %d fc [%s]"
+                                      % ('start' if self.state == 'started' else 'stop',
+                                         len(errors), len(todo), ', '.join(sorted(errors))),
+                                      results=results, changed=len(errors) < len(todo))
+            if self.wait:
+                self.wait_for_names(todo)
+
+        changed = bool(todo)
+        if self.module.check_mode:
+            msg = 'skipping changes due to check mode.'
+        else:
+            msg = "%d fc have been %s" % (len(todo), self.state)
+        self.module.exit_json(msg=msg, changed=changed, results=results, **self.job_result(self.names))
+
+    def wait_for_names(self, names):
+        """
+        Polls a single listing until all of the given FlashCopy mappings or
+        consistency groups reach the requested state.
+        """
+        cmd = 'lsfcconsistgrp' if self.isgroup else 'lsfcmap'
+        done, data = self.restapi.svc_wait(
+            cmd, None, None, lambda data: svc_job_report(data, names, self.reached_state, STATUS_FIELDS)['complete'],
+            timeout=self.wait_timeout)
+        if not done:
+            pending = svc_job_report(data, names, self.reached_state, STATUS_FIELDS)['pending']
+            self.module.fail_json(msg="fc [%s] did not reach state [%s] within %d seconds"
+                                  % (', '.join(pending), self.state, self.wait_timeout))
 
     def apply(self):
         changed = False
         msg = None
+        if self.state == 'status':
+            return self.report_status()
+        if self.names:
+            return self.apply_names()
         fcdata = self.get_existing_fcmapping()
         if fcdata:
             if self.state == "started" and fcdata["start_time"] == "":
@@ -224,13 +541,21 @@ class IBMSVCFlashcopyStartStop(object):
                 changed = True
         if changed:
             if self.module.check_mode:
+                if self.state == "started":
+                    self.start_fc()
+                else:
+                    self.stop_fc()
                 msg = 'skipping changes due to check mode.'
             else:
                 if self.state == "started":
                     self.start_fc()
+                    if self.wait:
+                        self.wait_for_state()
                     msg = "fc [%s] has been started" % self.name
                 elif self.state == "stopped":
                     self.stop_fc()
+                    if self.wait:
+                        self.wait_for_state()
                     msg = "fc [%s] has been stopped" % self.name
         else:
             if fcdata:
@@ -246,7 +571,7 @@ class IBMSVCFlashcopyStartStop(object):
                         msg = "FlashCopy Consistency Group [%s] does not exist." % self.name
                     else:
                         msg = "FlashCopy Mapping [%s] does not exist." % self.name
-        self.module.exit_json(msg=msg, changed=changed)
+        self.module.exit_json(msg=msg, changed=changed, **self.job_result([self.name]))
 
 
 def main():
@@ -22,13 +22,47 @@ options:
   name:
     description:
       - Specifies a name to assign to the new remote copy relationship or group, or to operate on the existing remote copy.
+      - Required unless I(names) or I(job) is specified.
     type: str
+  names:
+    description:
+      - Specifies several remote copy relationships or groups to be started or stopped in one run, instead of I(name).
+      - They are listed first, and the start or stop commands are issued only for those not already
+        in the requested state, for up to I(parallelism) of them at a time.
+        The result of every entry is returned in C(results).
+    type: list
+    elements: str
+    version_added: '1.13.0'
+  parallelism:
+    description:
+      - Maximum number of remote copy relationships or groups that are started or stopped concurrently
+        when I(names) is specified.
+    type: int
+    default: 1
+    version_added: '1.13.0'
   state:
     description:
       - Starts (C(started)) or stops (C(stopped)) a remote copy relationship.
-    choices: [started, stopped]
+      - C(status) reports the progress of the remote copy relationships or groups in C(job_status),
+        without changing them. They are read with a single listing, however many they are.
+    choices: [started, stopped, status]
     required: true
     type: str
+  track_job:
+    description:
+      - If C(true), a handle of the operation is returned in C(job) when I(state=started) or I(state=stopped).
+      - Passing the handle to I(job) with I(state=status) then reports the progress of the operation.
+    default: false
+    type: bool
+    version_added: '1.13.0'
+  job:
+    description:
+      - Handle returned in C(job) by an earlier task run with I(track_job=true).
+      - Valid when I(state=status). The remote copy relationships or groups of the handle are reported,
+        and their completion is judged against the state requested by that task.
+      - Without I(job), the completion of I(name) or I(names) is judged against I(state=started).
+    type: dict
+    version_added: '1.13.0'
   clustername:
     description:
     - The hostname or management IP of the Spectrum Virtualize storage system.
@@ -83,6 +117,22 @@ options:
     - Specifies that the system must process the copy operation even if it causes a temporary loss of consistency during synchronization.
     - Applies when I(state=started).
     type: bool
+  wait:
+    description:
+    - If C(true), waits until the remote copy relationship or group is synchronized when I(state=started),
+      or has stopped copying when I(state=stopped).
+    - A relationship or group with cycling mode C(multi) is considered synchronized once it is consistently copying.
+    - The state is checked at increasing intervals, so the wait ends soon after the operation completes.
+    default: false
+    type: bool
+    version_added: '1.13.0'
+  wait_timeout:
+    description:
+    - Maximum number of seconds to wait when I(wait=true).
+    - The module fails if the remote copy relationship or group does not reach the requested state in time.
+    default: 300
+    type: int
+    version_added: '1.13.0'
   validate_certs:
     description:
     - Validates certification.
@@ -92,10 +142,42 @@ options:
     description:
     - Path of debug log file.
     type: str
+  token_cache_path:
+    description:
+    - Directory in which authentication tokens are cached per cluster and user.
+    - Tasks that run against the same cluster as the same user reuse the cached token
+      instead of authenticating again.
+    - An expired or rejected token is replaced automatically when I(username) and I(password) are given.
+    - If not specified, tokens are not cached.
+    type: path
+    version_added: '1.13.0'
+  perf_summary:
+    description:
+    - If C(true), a summary of the REST API requests made by the task is returned in C(_perf),
+      and logged to I(log_path). It holds the number of requests, their time split into
+      phases, byte counts, and per command totals, slowest commands first.
+    - Every request is logged to I(log_path) with its timings, whether or not this is set.
+    type: bool
+    default: false
+    version_added: '1.13.0'
+  pool_size:
+    description:
+    - Maximum number of idle keep-alive connections to the cluster kept for reuse by the task.
+    type: int
+    default: 4
+    version_added: '1.13.0'
+  idle_timeout:
+    description:
+    - Seconds an idle keep-alive connection to the cluster may be reused.
+    - Older connections are closed and a new one is opened.
+    type: int
+    default: 30
+    version_added: '1.13.0'
 author:
     - rohit(@rohitk-github)
 notes:
     - This module supports C(check_mode).
+    - In check mode, the commands that would run are returned in C(command_plan), with the round trips they take.
 '''
 
 EXAMPLES = '''
@@ -116,16 +198,101 @@ EXAMPLES = '''
     password: "{{password}}"
     log_path: /tmp/ansible.log
     state: stopped
+- name: Start remote copy and wait until it is synchronized
+  ibm.spectrum_virtualize.ibm_svc_start_stop_replication:
+    name: sample_rcopy
+    clustername: "{{clustername}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    log_path: /tmp/ansible.log
+    state: started
+    wait: true
+    wait_timeout: 3600
+- name: Start several remote copies and keep a handle of the operation
+  ibm.spectrum_virtualize.ibm_svc_start_stop_replication:
+    names: "{{ dr_relationships }}"
+    clustername: "{{clustername}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    parallelism: 8
+    state: started
+    track_job: true
+  register: replication
+- name: Wait until the remote copies are synchronized
+  ibm.spectrum_virtualize.ibm_svc_start_stop_replication:
+    clustername: "{{clustername}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    state: status
+    job: "{{ replication.job }}"
+  register: progress
+  until: progress.job_status.complete
+  retries: 120
+  delay: 60
 '''
 
-RETURN = '''#'''
+RETURN = '''
+results:
+    description: Result of every entry of I(names).
+    returned: when I(names) is specified and I(state) is C(started) or C(stopped)
+    type: list
+    elements: dict
+    sample: [{"name": "rcrel0", "changed": true}, {"name": "rcrel1", "changed": false, "state": "consistent_synchronized"},
+             {"name": "rcrel2", "changed": false, "error": "CMMVC5753E ..."}]
+job:
+    description:
+        - Handle of the operation, to pass to I(job) with I(state=status).
+    returned: when I(track_job=true)
+    type: dict
+    sample: {"cluster": "cluster1", "kind": "rcrelationship", "names": ["rcrel0", "rcrel1"],
+             "state": "started", "submitted": 1675418400}
+job_status:
+    description:
+        - Progress of the remote copy relationships or groups.
+        - C(objects) holds the state, progress and completion of every one found,
+          C(pending) and C(missing) the names of those not yet complete and not found.
+        - C(complete) is true once none is pending. C(progress) is the mean progress in percent
+          of the relationships that report one, or null.
+    returned: when I(state=status)
+    type: dict
+    sample: {"objects": {"rcrel0": {"state": "inconsistent_copying", "progress": "62", "copy_type": "global",
+                                    "cycling_mode": "", "freeze_time": "", "complete": false}},
+             "pending": ["rcrel0"], "missing": [], "complete": false, "progress": 62}
+command_plan:
+    description:
+        - Commands that would run to start or stop the remote copy relationships or groups,
+          in the order they were planned, each with the cluster it would run on, its options and its arguments.
+    returned: in check mode, when changes are needed
+    type: list
+    elements: dict
+    sample: [{"cluster": "10.10.10.1", "cmd": "startrcrelationship", "opts": {"primary": "master"}, "args": ["rcrel0"]}]
+round_trips:
+    description:
+        - REST API round trips of the run, C(reads) for the C(ls) requests made and C(writes) for the commands planned.
+    returned: in check mode, when changes are needed
+    type: dict
+    sample: {"reads": 1, "writes": 1}
+'''
 
 
 from ansible.module_utils._text import to_native
-from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi, svc_argument_spec, get_logger
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import (
+    IBMSVCRestApi,
+    svc_argument_spec,
+    svc_wait_argument_spec,
+    svc_job_handle,
+    svc_job_report,
+    run_concurrently,
+    get_logger
+)
 from ansible.module_utils.basic import AnsibleModule
 from traceback import format_exc
 
+# Attributes reported per remote copy relationship or group in state=status
+STATUS_FIELDS = ('state', 'progress', 'copy_type', 'cycling_mode', 'freeze_time', 'sync')
+# States of a remote copy relationship or group whose copy process runs
+RUNNING_STATES = ('inconsistent_copying', 'consistent_copying', 'consistent_synchronized')
+
 
 class IBMSVCStartStopReplication(object):
     def __init__(self):
@@ -134,18 +301,24 @@ class IBMSVCStartStopReplication(object):
         argument_spec.update(
             dict(
                 name=dict(type='str'),
+                names=dict(type='list', elements='str'),
+                parallelism=dict(type='int', default=1),
                 state=dict(type='str',
                            required=True,
-                           choices=['started', 'stopped']),
+                           choices=['started', 'stopped', 'status']),
                 force=dict(type='bool', required=False),
                 primary=dict(type='str', choices=['master', 'aux']),
                 clean=dict(type='bool', default=False),
                 access=dict(type='bool', default=False),
                 isgroup=dict(type='bool', default=False),
+                track_job=dict(type='bool', default=False),
+                job=dict(type='dict'),
             )
         )
+        argument_spec.update(svc_wait_argument_spec())
 
         self.module = AnsibleModule(argument_spec=argument_spec,
+                                    mutually_exclusive=[['name', 'names', 'job']],
                                     supports_check_mode=True)
 
         # logging setup
@@ -163,10 +336,18 @@ class IBMSVCStartStopReplication(object):
         self.access = self.module.params.get('access', False)
         self.force = self.module.params.get('force', False)
         self.isgroup = self.module.params.get('isgroup', False)
+        self.wait = self.module.params['wait']
+        self.wait_timeout = self.module.params['wait_timeout']
+        self.names = self.module.params['names']
+        self.parallelism = self.module.params['parallelism']
+        self.track_job = self.module.params['track_job']
+        self.job = self.module.params['job']
 
         # Handling missing mandatory parameter name
-        if not self.name:
+        if not (self.name or self.names or self.job):
             self.module.fail_json(msg='Missing mandatory parameter: name')
+        if self.job and self.state != 'status':
+            self.module.fail_json(msg='Parameter job is only supported with state=status')
 
         self.restapi = IBMSVCRestApi(
             module=self.module,
@@ -176,16 +357,14 @@ class IBMSVCStartStopReplication(object):
             password=self.module.params['password'],
             validate_certs=self.module.params['validate_certs'],
             log_path=log_path,
-            token=self.module.params['token']
+            token=self.module.params['token'],
+            token_cache_path=self.module.params['token_cache_path'],
+            pool_size=self.module.params['pool_size'],
+            idle_timeout=self.module.params['idle_timeout'],
+            perf_summary=self.module.params['perf_summary']
         )
 
-    def start(self):
-        """
-        Starts the Metro Mirror or Global Mirror relationship copy process, set
-        the direction of copy if undefined, and (optionally) mark the secondary
-        volume of the relationship as clean. The relationship must be a
-        stand-alone relationship.
-        """
+    def start_cmdopts(self):
         cmdopts = {}
         self.log("self.primary is %s", self.primary)
         if self.primary:
@@ -194,6 +373,22 @@ class IBMSVCStartStopReplication(object):
             cmdopts['clean'] = self.clean
         if self.force:
             cmdopts['force'] = self.force
+        return cmdopts
+
+    def stop_cmdopts(self):
+        cmdopts = {}
+        if self.access:
+            cmdopts['access'] = self.access
+        return cmdopts
+
+    def start(self):
+        """
+        Starts the Metro Mirror or Global Mirror relationship copy process, set
+        the direction of copy if undefined, and (optionally) mark the secondary
+        volume of the relationship as clean. The relationship must be a
+        stand-alone relationship.
+        """
+        cmdopts = self.start_cmdopts()
         if self.isgroup:
             result = self.restapi.svc_run_command(cmd='startrcconsistgrp',
                                                   cmdopts=cmdopts,
@@ -227,9 +422,7 @@ class IBMSVCStartStopReplication(object):
         Stops the copy process for a Metro Mirror or Global Mirror stand-alone
         relationship.
         """
-        cmdopts = {}
-        if self.access:
-            cmdopts['access'] = self.access
+        cmdopts = self.stop_cmdopts()
         if self.isgroup:
             result = self.restapi.svc_run_command(cmd='stoprcconsistgrp',
                                                   cmdopts=cmdopts,
@@ -257,20 +450,169 @@ class IBMSVCStartStopReplication(object):
                 msg = "Failed to stop the rcrelationship [%s]" % self.name
                 self.module.fail_json(msg=msg)
 
+    def reached_state(self, data, state=None):
+        """
+        Checks whether the relationship or group described by the output of
+        lsrcrelationship or lsrcconsistgrp is in the requested state, or in
+        the given one.
+        """
+        if not data:
+            return False
+        if (state or self.state) == 'started':
+            return data['state'] == 'consistent_synchronized' or (
+                data['state'] == 'consistent_copying' and data.get('cycling_mode') == 'multi')
+        return data['state'] not in RUNNING_STATES
+
+    def needs_change(self, data):
+        """
+        Checks whether the relationship or group described by the output of
+        lsrcrelationship or lsrcconsistgrp has to be started or stopped.
+        """
+        if self.state == 'started':
+            return data['state'] not in RUNNING_STATES
+        # A stopped copy is stopped again to give access to the secondary
+        return data['state'] in RUNNING_STATES or (self.access and data['state'] == 'consistent_stopped')
+
+    def wait_for_state(self):
+        """
+        Polls the relationship or group until it reaches the requested state,
+        and fails if it does not within wait_timeout seconds.
+        """
+        cmd = 'lsrcconsistgrp' if self.isgroup else 'lsrcrelationship'
+        done, data = self.restapi.svc_wait(cmd, None, [self.name], self.reached_state,
+                                           timeout=self.wait_timeout)
+        if not done:
+            state = data['state'] if data else 'unknown'
+            self.module.fail_json(msg="remote copy [%s] did not reach state [%s] within %d seconds, current state [%s]"
+                                  % (self.name, self.state, self.wait_timeout, state))
+
+    def command(self):
+        """
+        Returns the command that brings a relationship or group to the
+        requested state, and its options.
+        """
+        if self.state == 'started':
+            return 'startrcconsistgrp' if self.isgroup else 'startrcrelationship', self.start_cmdopts()
+        return 'stoprcconsistgrp' if self.isgroup else 'stoprcrelationship', self.stop_cmdopts()
+
+    def run_command(self, name):
+        """
+        Starts or stops a single entry of names. Runs in a worker thread, so
+        errors are raised instead of failing the module.
+        """
+        cmd, cmdopts = self.command()
+        result = self.restapi.svc_run_command(cmd=cmd, cmdopts=cmdopts, cmdargs=[name])
+        self.log("%s %s with result %s", cmd, name, result)
+        if result != '' and 'message' not in result:
+            raise Exception("Failed to %s the remote copy [%s]" % ('start' if self.state == 'started' else 'stop', name))
+        return result
+
+    def wait_for_names(self, names):
+        """
+        Polls a single listing until all of the given relationships or
+        groups reach the requested state.
+        """
+        cmd = 'lsrcconsistgrp' if self.isgroup else 'lsrcrelationship'
+        done, data = self.restapi.svc_wait(
+            cmd, None, None, lambda data: svc_job_report(data, names, self.reached_state, STATUS_FIELDS)['complete'],
+            timeout=self.wait_timeout)
+        if not done:
+            pending = svc_job_report(data, names, self.reached_state, STATUS_FIELDS)['pending']
+            self.module.fail_json(msg="remote copy [%s] did not reach state [%s] within %d seconds"
+                                  % (', '.join(pending), self.state, self.wait_timeout))
+
+    def job_result(self, names):
+        if not self.track_job:
+            return {}
+        kind = 'rcconsistgrp' if self.isgroup else 'rcrelationship'
+        return dict(job=svc_job_handle(self.module.params['clustername'], kind, names, self.state))
+
+    def report_status(self):
+        state = 'started'
+        names = self.names or [self.name]
+        if self.job:
+            if self.job.get('kind') not in ('rcrelationship', 'rcconsistgrp') or not self.job.get('names'):
+                self.module.fail_json(msg='Parameter job is not the handle of a remote copy operation')
+            if self.job.get('cluster') != self.module.params['clustername']:
+                self.module.fail_json(msg='Parameter job is the handle of an operation on cluster [%s]'
+                                      % self.job.get('cluster'))
+            self.isgroup = self.job['kind'] == 'rcconsistgrp'
+            names = self.job['names']
+            state = self.job.get('state') or state
+
+        cmd = 'lsrcconsistgrp' if self.isgroup else 'lsrcrelationship'
+        records = self.restapi.svc_obj_info(cmd, None, None, stream=True)
+        report = svc_job_report(records, names, lambda data: self.reached_state(data, state), STATUS_FIELDS)
+        self.log("%d of %d pending, %d missing", len(report['pending']), len(names), len(report['missing']))
+        self.module.exit_json(changed=False, job_status=report)
+
+    def apply_names(self):
+        cmd = 'lsrcconsistgrp' if self.isgroup else 'lsrcrelationship'
+        existing = dict((data['name'], data) for data in self.restapi.svc_obj_info(cmd, None, None) or [])
+        results = []
+        todo = []
+        for name in self.names:
+            data = existing.get(name)
+            result = {'name': name, 'changed': False}
+            if not data:
+                result['msg'] = "[%s] does not exist." % name
+            elif self.needs_change(data):
+                result['changed'] = True
+                todo.append(name)
+            else:
+                result['state'] = data['state']
+            results.append(result)
+        self.log("%d of %d to be %s", len(todo), len(self.names), self.state)
+
+        if self.module.check_mode:
+            cmd, cmdopts = self.command()
+            for name in todo:
+                self.restapi.svc_plan_command(cmd, cmdopts, [name])
+            self.module.exit_json(msg='skipping changes due to check mode.', changed=bool(todo),
+                                  results=results, **self.job_result(self.names))
+
+        outcomes = run_concurrently(self.run_command, todo, self.parallelism)
+        errors = dict((name, to_native(outcome)) for name, outcome in zip(todo, outcomes)
+                      if isinstance(outcome, Exception))
+        for result in results:
+            if result['name'] in errors:
+                result['changed'] = False
+                result['error'] = errors[result['name']]
+        changed = len(errors) < len(todo)
+        if errors:
+            self.module.fail_json(msg="Failed to %s %d of %d remote copies [%s]"
+                                  % ('start' if self.state == 'started' else 'stop',
+                                     len(errors), len(todo), ', '.join(sorted(errors))),
+                                  results=results, changed=changed)
+        if self.wait and todo:
+            self.wait_for_names(todo)
+        self.module.exit_json(msg="%d remote copies have been %s." % (len(todo), self.state),
+                              changed=changed, results=results, **self.job_result(self.names))
+
     def apply(self):
         msg = None
         self.log("self state is %s", self.state)
+        if self.state == 'status':
+            return self.report_status()
+        if self.names:
+            return self.apply_names()
         if self.module.check_mode:
+            cmd, cmdopts = self.command()
+            self.restapi.svc_plan_command(cmd, cmdopts, [self.name])
             msg = 'skipping changes due to check mode.'
         else:
             if self.state == 'started':
                 self.start()
+                if self.wait:
+                    self.wait_for_state()
                 if not self.isgroup:
                     msg = "remote copy [%s] has been started." % self.name
                 else:
                     msg = "remote copy group [%s] has been started." % self.name
             elif self.state == 'stopped':
                 self.stop()
+                if self.wait:
+                    self.wait_for_state()
                 if not self.isgroup:
                     msg = "remote copy [%s] has been stopped." % self.name
                 else:
@@ -278,7 +620,7 @@ class IBMSVCStartStopReplication(object):
             else:
                 msg = "Invalid %s state. Supported states are 'started' and 'stopped'" % self.state
 
-        self.module.exit_json(msg=msg, changed=True)
+        self.module.exit_json(msg=msg, changed=True, **self.job_result([self.name]))
 
 
 def main():
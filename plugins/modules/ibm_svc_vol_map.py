@@ -22,23 +22,58 @@ options:
   volname:
     description:
       - Specifies the volume name for host or hostcluster mapping.
-    required: true
+      - Required unless I(volumes) is specified.
     type: str
+  volumes:
+    description:
+      - Specifies several volumes to be mapped to, or unmapped from, every host in I(hosts) or every host cluster in I(hostclusters).
+      - All existing mappings are listed once, and only the missing or, when I(state=absent),
+        the existing mappings are changed, for up to I(parallelism) mappings at a time.
+      - The result of every mapping is returned in C(mappings).
+      - Mutually exclusive with I(volname).
+    type: list
+    elements: str
+    version_added: '1.13.0'
   host:
     description:
       - Specifies the host name for host mapping.
       - This parameter is required to create or delete a volume-to-host mapping.
     type: str
+  hosts:
+    description:
+      - Specifies several hosts for host mapping of I(volumes) or I(volname).
+      - Mutually exclusive with I(host), I(hostcluster) and I(hostclusters).
+    type: list
+    elements: str
+    version_added: '1.13.0'
   hostcluster:
     description:
       - Specifies the name of the host cluster for host mapping.
       - This parameter is required to create or delete a volume-to-hostcluster mapping.
     type: str
+  hostclusters:
+    description:
+      - Specifies several host clusters for host cluster mapping of I(volumes) or I(volname).
+      - Mutually exclusive with I(host), I(hosts) and I(hostcluster).
+    type: list
+    elements: str
+    version_added: '1.13.0'
   scsi:
     description:
       - Specifies the SCSI logical unit number (LUN) ID to assign to a volume on the specified host or host cluster.
+      - When I(volumes), I(hosts) or I(hostclusters) is specified, new mappings get the lowest SCSI IDs
+        that are free on their host or host cluster, starting from I(scsi), in the order of I(volumes).
+        The default is to start from 0. The SCSI IDs of existing mappings are not changed.
       - Applies when I(state=present).
     type: int
+  parallelism:
+    description:
+      - Maximum number of mappings that are created or removed concurrently
+        when I(volumes), I(hosts) or I(hostclusters) is specified.
+      - The concurrent requests share the same REST API session.
+    type: int
+    default: 1
+    version_added: '1.13.0'
   state:
     description:
       - Creates (C(present)) or removes (C(absent)) a volume mapping.
@@ -75,6 +110,37 @@ options:
     description:
     - Path of debug log file.
     type: str
+  token_cache_path:
+    description:
+    - Directory in which authentication tokens are cached per cluster and user.
+    - Tasks that run against the same cluster as the same user reuse the cached token
+      instead of authenticating again.
+    - An expired or rejected token is replaced automatically when I(username) and I(password) are given.
+    - If not specified, tokens are not cached.
+    type: path
+    version_added: '1.13.0'
+  perf_summary:
+    description:
+    - If C(true), a summary of the REST API requests made by the task is returned in C(_perf),
+      and logged to I(log_path). It holds the number of requests, their time split into
+      phases, byte counts, and per command totals, slowest commands first.
+    - Every request is logged to I(log_path) with its timings, whether or not this is set.
+    type: bool
+    default: false
+    version_added: '1.13.0'
+  pool_size:
+    description:
+    - Maximum number of idle keep-alive connections to the cluster kept for reuse by the task.
+    type: int
+    default: 4
+    version_added: '1.13.0'
+  idle_timeout:
+    description:
+    - Seconds an idle keep-alive connection to the cluster may be reused.
+    - Older connections are closed and a new one is opened.
+    type: int
+    default: 30
+    version_added: '1.13.0'
   validate_certs:
     description:
     - Validates certification.
@@ -84,6 +150,7 @@ author:
     - Peng Wang(@wangpww)
 notes:
     - This module supports C(check_mode).
+    - In check mode, the commands that would run are returned in C(command_plan), with the round trips they take.
 '''
 
 EXAMPLES = '''
@@ -108,13 +175,60 @@ EXAMPLES = '''
     volname: volume0
     host: host4test
     state: absent
+- name: Map several volumes to every host cluster of a rollout
+  ibm.spectrum_virtualize.ibm_svc_vol_map:
+    clustername: "{{clustername}}"
+    domain: "{{domain}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    log_path: /tmp/playbook.debug
+    volumes:
+      - db_data_0
+      - db_data_1
+      - db_log_0
+    hostclusters:
+      - dbcluster0
+      - dbcluster1
+    scsi: 10
+    parallelism: 8
+    state: present
 '''
 
-RETURN = '''#'''
+RETURN = '''
+mappings:
+    description:
+        - Result of every mapping when I(volumes), I(hosts) or I(hostclusters) is specified.
+        - C(scsi) is the SCSI ID assigned to a new mapping, and C(error) is set for a mapping that could not be changed.
+    returned: when I(volumes), I(hosts) or I(hostclusters) is specified
+    type: list
+    elements: dict
+    sample: [{"volume": "db_data_0", "hostcluster": "dbcluster0", "scsi": 10, "changed": true}]
+command_plan:
+    description:
+        - Commands that would run to bring the objects to the requested state, in the order they were planned,
+          each with the cluster it would run on, its options and its arguments.
+        - Commands that would run concurrently may be listed in a different order from one run to the next.
+    returned: in check mode, when changes are needed
+    type: list
+    elements: dict
+    sample: [{"cluster": "10.10.10.1", "cmd": "mkvolumehostclustermap", "opts": {"force": true,
+              "hostcluster": "dbcluster0", "scsi": 10}, "args": ["db_data_0"]}]
+round_trips:
+    description:
+        - REST API round trips of the run, C(reads) for the C(ls) requests made and C(writes) for the commands planned.
+    returned: in check mode, when changes are needed
+    type: dict
+    sample: {"reads": 2, "writes": 1}
+'''
 
 from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi, svc_argument_spec, get_logger
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import (
+    IBMSVCRestApi,
+    get_logger,
+    run_concurrently,
+    svc_argument_spec
+)
 from ansible.module_utils._text import to_native
 
 
@@ -124,16 +238,24 @@ class IBMSVCvdiskhostmap(object):
 
         argument_spec.update(
             dict(
-                volname=dict(type='str', required=True),
+                volname=dict(type='str', required=False),
+                volumes=dict(type='list', elements='str', required=False),
                 host=dict(type='str', required=False),
+                hosts=dict(type='list', elements='str', required=False),
                 state=dict(type='str', required=True, choices=['absent',
                                                                'present']),
                 scsi=dict(type='int', required=False),
-                hostcluster=dict(type='str', required=False)
+                hostcluster=dict(type='str', required=False),
+                hostclusters=dict(type='list', elements='str', required=False),
+                parallelism=dict(type='int', default=1)
             )
         )
 
         self.module = AnsibleModule(argument_spec=argument_spec,
+                                    mutually_exclusive=[
+                                        ['volname', 'volumes'],
+                                        ['host', 'hosts', 'hostcluster', 'hostclusters']
+                                    ],
                                     supports_check_mode=True)
 
         # logging setup
@@ -149,9 +271,13 @@ class IBMSVCvdiskhostmap(object):
         self.host = self.module.params['host']
         self.hostcluster = self.module.params['hostcluster']
         self.scsi = self.module.params['scsi']
+        self.volumes = self.module.params['volumes']
+        self.hosts = self.module.params['hosts']
+        self.hostclusters = self.module.params['hostclusters']
+        self.parallelism = self.module.params['parallelism']
 
         # Handline for mandatory parameter volname
-        if not self.volname:
+        if not self.volname and not self.volumes:
             self.module.fail_json(msg="Missing mandatory parameter: volname")
 
         self.restapi = IBMSVCRestApi(
@@ -162,7 +288,11 @@ class IBMSVCvdiskhostmap(object):
             password=self.module.params['password'],
             validate_certs=self.module.params['validate_certs'],
             log_path=log_path,
-            token=self.module.params['token']
+            token=self.module.params['token'],
+            token_cache_path=self.module.params['token_cache_path'],
+            pool_size=self.module.params['pool_size'],
+            idle_timeout=self.module.params['idle_timeout'],
+            perf_summary=self.module.params['perf_summary']
         )
 
     def get_existing_vdiskhostmap(self):
@@ -206,10 +336,6 @@ class IBMSVCvdiskhostmap(object):
         return props
 
     def vdiskhostmap_create(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
-
         self.log("creating vdiskhostmap '%s' '%s'", self.volname, self.host)
 
         # Make command
@@ -222,6 +348,11 @@ class IBMSVCvdiskhostmap(object):
         self.log("creating vdiskhostmap command %s opts %s args %s",
                  cmd, cmdopts, cmdargs)
 
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(cmd, cmdopts, cmdargs)
+            self.changed = True
+            return
+
         # Run command
         result = self.restapi.svc_run_command(cmd, cmdopts, cmdargs)
         self.log("create vdiskhostmap result %s", result)
@@ -234,10 +365,6 @@ class IBMSVCvdiskhostmap(object):
             self.module.fail_json(msg="Failed to create vdiskhostmap.")
 
     def vdiskhostmap_delete(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
-
         self.log("deleting vdiskhostmap '%s'", self.volname)
 
         cmd = 'rmvdiskhostmap'
@@ -245,6 +372,11 @@ class IBMSVCvdiskhostmap(object):
         cmdopts['host'] = self.host
         cmdargs = [self.volname]
 
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(cmd, cmdopts, cmdargs)
+            self.changed = True
+            return
+
         self.restapi.svc_run_command(cmd, cmdopts, cmdargs)
 
         # Any error will have been raised in svc_run_command
@@ -252,10 +384,6 @@ class IBMSVCvdiskhostmap(object):
         self.changed = True
 
     def vdiskhostclustermap_create(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
-
         self.log("creating mkvolumehostclustermap '%s' '%s'", self.volname, self.hostcluster)
 
         # Make command
@@ -268,6 +396,11 @@ class IBMSVCvdiskhostmap(object):
         self.log("creating vdiskhostmap command %s opts %s args %s",
                  cmd, cmdopts, cmdargs)
 
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(cmd, cmdopts, cmdargs)
+            self.changed = True
+            return
+
         # Run command
         result = self.restapi.svc_run_command(cmd, cmdopts, cmdargs)
         self.log("create vdiskhostmap result %s", result)
@@ -280,10 +413,6 @@ class IBMSVCvdiskhostmap(object):
             self.module.fail_json(msg="Failed to create vdiskhostmap.")
 
     def vdiskhostclustermap_delete(self):
-        if self.module.check_mode:
-            self.changed = True
-            return
-
         self.log("deleting vdiskhostclustermap '%s'", self.volname)
 
         cmd = 'rmvolumehostclustermap'
@@ -291,16 +420,138 @@ class IBMSVCvdiskhostmap(object):
         cmdopts['hostcluster'] = self.hostcluster
         cmdargs = [self.volname]
 
+        if self.module.check_mode:
+            self.restapi.svc_plan_command(cmd, cmdopts, cmdargs)
+            self.changed = True
+            return
+
         self.restapi.svc_run_command(cmd, cmdopts, cmdargs)
 
         # Any error will have been raised in svc_run_command
         # chmvdisk does not output anything when successful.
         self.changed = True
 
+    def get_existing_mappings(self):
+        """
+        Lists the host mappings, and the host cluster mappings if needed, of
+        the whole system once. Returns the set of existing
+        (kind, host or host cluster, volume) mappings, and the SCSI IDs in
+        use on every (kind, host or host cluster).
+        """
+        mapped = set()
+        used_scsi = {}
+        for item in self.restapi.svc_obj_info('lshostvdiskmap', None, None, stream=True) or []:
+            mapped.add(('host', item['name'], item['vdisk_name']))
+            used_scsi.setdefault(('host', item['name']), set()).add(int(item['SCSI_id']))
+            if item.get('host_cluster_name'):
+                # Private mappings of a member host block the SCSI ID for its host cluster
+                used_scsi.setdefault(('hostcluster', item['host_cluster_name']), set()).add(int(item['SCSI_id']))
+        if self.hostclusters or self.hostcluster:
+            for item in self.restapi.svc_obj_info('lshostclustervolumemap', None, None, stream=True) or []:
+                mapped.add(('hostcluster', item['name'], item['volume_name']))
+                used_scsi.setdefault(('hostcluster', item['name']), set()).add(int(item['SCSI_id']))
+        self.log("%d existing mappings", len(mapped))
+        return mapped, used_scsi
+
+    def plan_mappings(self, mapped, used_scsi):
+        """
+        Returns one entry per volume and host or host cluster, and the
+        subset of them that has to be created or removed. SCSI IDs are
+        assigned in the order of the volumes, so that re-running with
+        the same input gives the same IDs.
+        """
+        if self.hostclusters or self.hostcluster:
+            kind, targets = 'hostcluster', self.hostclusters or [self.hostcluster]
+        else:
+            kind, targets = 'host', self.hosts or [self.host]
+        volumes = self.volumes or [self.volname]
+
+        results = []
+        jobs = []
+        for target in targets:
+            used = set(used_scsi.get((kind, target), ()))
+            scsi = self.scsi or 0
+            for volume in volumes:
+                result = {'volume': volume, kind: target, 'changed': False}
+                exists = (kind, target, volume) in mapped
+                if self.state == 'present' and not exists:
+                    while scsi in used:
+                        scsi += 1
+                    used.add(scsi)
+                    result['scsi'] = scsi
+                    jobs.append(result)
+                elif self.state == 'absent' and exists:
+                    jobs.append(result)
+                results.append(result)
+        return results, jobs
+
+    def mapping_command(self, job):
+        """
+        Returns the command, options and arguments creating or removing a
+        single mapping planned by plan_mappings.
+        """
+        kind = 'hostcluster' if 'hostcluster' in job else 'host'
+        if self.state == 'present':
+            cmd = 'mkvdiskhostmap' if kind == 'host' else 'mkvolumehostclustermap'
+            cmdopts = {'force': True, kind: job[kind], 'scsi': job['scsi']}
+        else:
+            cmd = 'rmvdiskhostmap' if kind == 'host' else 'rmvolumehostclustermap'
+            cmdopts = {kind: job[kind]}
+        return cmd, cmdopts, [job['volume']]
+
+    def apply_mapping(self, job):
+        """
+        Creates or removes a single mapping planned by plan_mappings. Runs in
+        a worker thread, so errors are raised instead of failing the module.
+        """
+        cmd, cmdopts, cmdargs = self.mapping_command(job)
+        self.log("%s opts %s volume %s", cmd, cmdopts, job['volume'])
+        result = self.restapi.svc_run_command(cmd, cmdopts, cmdargs)
+        if self.state == 'present' and (not result or 'message' not in result):
+            raise Exception("Failed to create vdiskhostmap.")
+        return result
+
+    def apply_bulk(self):
+        if not (self.host or self.hosts or self.hostcluster or self.hostclusters):
+            self.module.fail_json(msg="Missing parameter: host or hostcluster")
+
+        mapped, used_scsi = self.get_existing_mappings()
+        results, jobs = self.plan_mappings(mapped, used_scsi)
+        self.log("%d of %d mappings to change", len(jobs), len(results))
+
+        if self.module.check_mode:
+            for job in jobs:
+                self.restapi.svc_plan_command(*self.mapping_command(job))
+            outcomes = [None] * len(jobs)
+        else:
+            outcomes = run_concurrently(self.apply_mapping, jobs, self.parallelism)
+        failed = []
+        for job, outcome in zip(jobs, outcomes):
+            if isinstance(outcome, Exception):
+                job['error'] = to_native(outcome)
+                failed.append(job)
+            else:
+                job['changed'] = True
+
+        changed = any(result['changed'] for result in results)
+        if failed:
+            self.module.fail_json(msg="Failed to change %d of %d mappings." % (len(failed), len(jobs)),
+                                  mappings=results, changed=changed)
+        if self.module.check_mode:
+            msg = 'skipping changes due to check mode'
+        elif self.state == 'present':
+            msg = "%d volume mappings have been created." % len(jobs)
+        else:
+            msg = "%d volume mappings have been deleted." % len(jobs)
+        self.module.exit_json(msg=msg, changed=changed, mappings=results)
+
     def apply(self):
         changed = False
         msg = None
 
+        if self.volumes or self.hosts or self.hostclusters:
+            return self.apply_bulk()
+
         # Handling for volume
         if not self.volname:
             self.module.fail_json(msg="You must pass in "
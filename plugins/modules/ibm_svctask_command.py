@@ -42,8 +42,8 @@ options:
   clustername:
     description:
     - The hostname or management IP of the Spectrum Virtualize storage system.
+    - Required unless I(clusters) is specified.
     type: str
-    required: true
   username:
     description:
     - Username for the Spectrum Virtualize storage system.
@@ -58,6 +58,45 @@ options:
     description:
     - Path of debug log file.
     type: str
+  batch:
+    description:
+    - If set to C(true), the exit code, output and error output of every command that ran are returned in I(results).
+    - With or without I(batch), the commands in I(command) are run one after the other over the single SSH session
+      of the task, and processing stops at the first failing command. The error message holds the output of the
+      commands that ran, the failing command and its error output.
+    - The SSH session is not kept across tasks, every task connects and authenticates once.
+    type: bool
+    default: false
+    version_added: '1.13.0'
+  clusters:
+    description:
+    - Runs the same commands on several Spectrum Virtualize storage systems in one run, instead of on I(clustername).
+    - The storage systems are processed concurrently by a single Ansible process, up to
+      I(cluster_parallelism) at a time, and the result of every one is returned in I(clusters).
+    - The options of an entry override I(username) and I(password) for that storage system.
+    type: list
+    elements: dict
+    version_added: '1.13.0'
+    suboptions:
+      clustername:
+        description:
+        - The hostname or management IP of the Spectrum Virtualize storage system.
+        type: str
+        required: true
+      username:
+        description:
+        - Username for the Spectrum Virtualize storage system.
+        type: str
+      password:
+        description:
+        - Password for the Spectrum Virtualize storage system.
+        type: str
+  cluster_parallelism:
+    description:
+    - Maximum number of storage systems of I(clusters) that are processed concurrently.
+    type: int
+    default: 8
+    version_added: '1.13.0'
 '''
 
 EXAMPLES = '''
@@ -82,13 +121,58 @@ EXAMPLES = '''
     password:
     usesshkey: yes
     log_path: /tmp/ansible.log
+- name: Run many svctask CLI commands over a single SSH channel
+  ibm.spectrum_virtualize.ibm_svctask_command:
+    command: "{{ change_window_commands }}"
+    clustername: "{{clustername}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    batch: true
+    log_path: /tmp/ansible.log
+- name: Run the same svctask CLI commands on every storage system of the estate
+  ibm.spectrum_virtualize.ibm_svctask_command:
+    command: [
+        "svctask chsystem -ntpip {{ ntp_server }}"
+    ]
+    username: "{{username}}"
+    password: "{{password}}"
+    cluster_parallelism: 16
+    clusters:
+      - clustername: cluster1.example.com
+      - clustername: cluster2.example.com
+        password: "{{cluster2_password}}"
+    log_path: /tmp/ansible.log
 '''
 
-RETURN = '''#'''
+RETURN = '''
+results:
+    description:
+        - Exit code, output and error output of every command that ran, in order.
+        - Returned when I(batch=true).
+    returned: when batch is true
+    type: list
+    elements: dict
+    version_added: 1.13.0
+clusters:
+    description:
+        - For each storage system of I(clusters), keyed by its I(clustername),
+          the result it returns on its own.
+    returned: when clusters is specified
+    type: dict
+    sample: {"cluster1.example.com": {"msg": "", "rc": 0, "changed": true},
+             "cluster2.example.com": {"msg": "Failed to connect", "failed": true}}
+    version_added: 1.13.0
+'''
 
+import copy
 from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import svc_ssh_argument_spec, get_logger
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import (
+    svc_ssh_argument_spec,
+    svc_fleet_argument_spec,
+    svc_fleet_run,
+    get_logger
+)
 from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_ssh import IBMSVCssh
 from ansible.module_utils._text import to_native
 
@@ -108,11 +192,16 @@ class IBMSVCsshClient(object):
             dict(
                 command=dict(type='list', elements='str', required=False),
                 usesshkey=dict(type='str', required=False, default='no', choices=['yes', 'no']),
-                key_filename=dict(type='str', required=False)
+                key_filename=dict(type='str', required=False),
+                batch=dict(type='bool', default=False)
             )
         )
+        argument_spec.update(svc_fleet_argument_spec(ssh=True))
+        argument_spec['clustername']['required'] = False
 
         self.module = AnsibleModule(argument_spec=argument_spec,
+                                    mutually_exclusive=[['clustername', 'clusters']],
+                                    required_one_of=[['clustername', 'clusters']],
                                     supports_check_mode=True)
 
         # logging setup
@@ -122,6 +211,7 @@ class IBMSVCsshClient(object):
 
         # Required fields for module
         self.command = self.module.params['command']
+        self.batch = self.module.params['batch']
 
         # local SSH keys will be used in case of password less SSH connection
         self.usesshkey = self.module.params['usesshkey']
@@ -132,10 +222,15 @@ class IBMSVCsshClient(object):
         self.username = self.module.params['username']
         self.password = self.module.params['password']
         self.log_path = log_path
+        self.clusters = self.module.params['clusters']
+        self.cluster_parallelism = self.module.params['cluster_parallelism']
 
         # Handling missing mandatory parameter
         if not self.command:
             self.module.fail_json(msg='Missing mandatory parameter: command')
+        for cmd in self.command:
+            if not cmd.startswith('svctask'):
+                self.module.fail_json(msg="The command must start with svctask", changed=False)
 
         if self.password is None:
             if self.usesshkey == 'yes':
@@ -153,48 +248,76 @@ class IBMSVCsshClient(object):
             self.log("password is given")
             self.look_for_keys = False
 
-        self.ssh_client = IBMSVCssh(
+        # With clusters, every storage system is connected to in apply_fleet()
+        self.ssh_client = None if self.clusters else self.connect()
+
+    def connect(self):
+        return IBMSVCssh(
             module=self.module,
             clustername=self.module.params['clustername'],
             username=self.module.params['username'],
             password=self.module.params['password'],
-            look_for_keys=self.look_for_keys,
+            # An entry of clusters may give the password the module did not
+            look_for_keys=self.look_for_keys and self.module.params['password'] is None,
             key_filename=self.key_filename,
-            log_path=log_path
+            log_path=self.log_path
         )
 
     def send_svctask_command(self):
-        message = ""
-        if self.ssh_client.is_client_connected:
-            for cmd in self.command:
-                if not cmd.startswith('svctask'):
-                    self.ssh_client._svc_disconnect()
-                    self.module.fail_json(msg="The command must start with svctask", changed=False)
-                self.log("Executing CLI command: %s", cmd)
-                stdin, stdout, stderr = self.ssh_client.client.exec_command(cmd)
-                for line in stdout.readlines():
-                    message += line
-                    self.log(line)
-                rc = stdout.channel.recv_exit_status()
-                if rc > 0:
-                    result = stderr.read()
-                    if len(result) > 0:
-                        result = result.decode('utf-8')
-                        self.log("Error in executing CLI command: %s", cmd)
-                        self.log("%s", result)
-                        message += result
-                    else:
-                        message = "Unknown error"
-                    self.ssh_client._svc_disconnect()
-                    self.module.fail_json(msg=message, rc=rc)
-        else:
-            message = "SSH client is not connected"
+        results = self.ssh_client.svc_run_batch(self.command)
         self.ssh_client._svc_disconnect()
-        self.module.exit_json(msg=message, rc=rc, changed=True)
+        message = ''.join(result['stdout'] for result in results)
+        extra = dict(results=results) if self.batch else {}
+        failed = results[-1]
+        if failed['rc'] > 0:
+            self.log("Error in executing CLI command: %s", failed['command'])
+            self.log("%s", failed['stderr'])
+            message += "CLI command [%s] failed with rc %d" % (failed['command'], failed['rc'])
+            if failed['stderr']:
+                message += ": %s" % failed['stderr']
+            self.module.fail_json(msg=message, rc=failed['rc'], changed=len(results) > 1, **extra)
+        self.module.exit_json(msg=message, rc=0, changed=True, **extra)
+
+    def run_cluster(self, module):
+        """
+        Runs the commands on one storage system of clusters, on a copy of
+        this object bound to the SVCClusterModule of the system. Runs in a
+        worker thread, and ends with module.exit_json() or
+        module.fail_json(), which raise instead of exiting.
+        """
+        client = copy.copy(self)
+        client.module = module
+        client.clustername = module.params['clustername']
+        client.ssh_client = client.connect()
+        try:
+            if not client.ssh_client.is_client_connected:
+                module.exit_json(msg="SSH Connection failed, retry", changed=False)
+            else:
+                client.send_svctask_command()
+        finally:
+            client.ssh_client._svc_disconnect()
+
+    def apply_fleet(self):
+        if self.cluster_parallelism < 1:
+            self.module.fail_json(msg="cluster_parallelism(%d) must be greater than zero" % self.cluster_parallelism)
+        results, failed = svc_fleet_run(self.module, self.run_cluster, self.cluster_parallelism)
+        self.log("Ran commands on %d clusters, %d failed", len(results), len(failed))
+        changed = any(result.get('changed') for result in results.values())
+        if failed:
+            self.module.fail_json(msg="Failed to run commands on clusters [%s]" % ', '.join(failed),
+                                  clusters=results, changed=changed)
+        self.module.exit_json(msg="Commands run on %d clusters" % len(results), clusters=results, changed=changed)
 
 
 def main():
     v = IBMSVCsshClient()
+    if v.clusters:
+        try:
+            v.apply_fleet()
+        except Exception as e:
+            v.log("Exception in running command(): \n%s", format_exc())
+            v.module.fail_json(msg="Module failed. Error [%s]." % to_native(e))
+        return
     try:
         if not v.ssh_client.is_client_connected:
             v.log("SSH Connection failed, retry")
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# Copyright (C) 2023 IBM CORPORATION
+#
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" Offline benchmarks of IBM Spectrum Virtualize Ansible modules
+
+Runs modules in process against a local REST API stand-in serving a
+synthetic inventory from a child process, and reports per scenario the
+REST round trips, the wall time and the peak Python memory of the module
+run.
+
+Run from the directory holding ansible_collections/, for example:
+
+    PYTHONPATH=. python ansible_collections/ibm/spectrum_virtualize/tests/benchmark/run_benchmarks.py \\
+        --vdisks 10000 --hosts 2000 --latency 0.005
+
+The stand-in speaks plain HTTP unless --certfile is given, in which case
+it serves HTTPS with that certificate and the connections go through TLS
+as they do against a cluster.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from mock import patch
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import (
+    IBMSVCRestApi,
+    get_connection_pool
+)
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_svc_info import IBMSVCGatherInfo
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_svc_manage_volume import IBMSVCvolume
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_svc_vol_map import IBMSVCvdiskhostmap
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_svc_manage_migration import IBMSVCMigrate
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from svc_mock_server import SVCMockServerProcess  # noqa: E402
+
+
+class ModuleExit(Exception):
+    """ Raised instead of exiting the process when a module completes """
+    pass
+
+
+def exit_json(self, **kwargs):
+    raise ModuleExit(kwargs)
+
+
+def fail_json(self, **kwargs):
+    kwargs['failed'] = True
+    raise ModuleExit(kwargs)
+
+
+def scenarios(vdisk_count, host_count):
+    """ Module class and arguments of every scenario, by name """
+    vdisks = ['vol%d' % i for i in range(vdisk_count)]
+    hosts = ['host%d' % i for i in range(host_count)]
+    batch = 100
+    return {
+        'info_vol': (IBMSVCGatherInfo, {'gather_subset': ['vol']}),
+        'info_subsets': (IBMSVCGatherInfo, {'gather_subset': ['vol', 'host', 'hostvdiskmap', 'pool'],
+                                            'parallelism': 4}),
+        'info_topology': (IBMSVCGatherInfo, {'gather_subset': ['vol', 'host', 'hostvdiskmap', 'pool'],
+                                             'parallelism': 4, 'topology': True}),
+        'volume_single': (IBMSVCvolume, {'name': 'bench_single', 'state': 'present', 'pool': 'Pool0',
+                                         'size': '1', 'unit': 'gb'}),
+        'volume_list': (IBMSVCvolume, {'state': 'present', 'pool': 'Pool0', 'size': '1', 'unit': 'gb',
+                                       'volumes': [{'name': 'bench_vol%d' % i} for i in range(batch)],
+                                       'parallelism': 8}),
+        'vol_map_bulk': (IBMSVCvdiskhostmap, {'state': 'present', 'volumes': vdisks[-batch:],
+                                              'hosts': hosts[:10], 'parallelism': 8}),
+        'migration_volumes': (IBMSVCMigrate, {'state': 'initiate', 'remote_cluster': 'remote',
+                                              'remote_username': 'username', 'remote_password': 'password',
+                                              'remote_pool': 'Pool1', 'parallelism': 8,
+                                              'volumes': [{'source_volume': name, 'target_volume': 'tgt_' + name,
+                                                           'relationship_name': 'rel_' + name}
+                                                          for name in vdisks[:batch // 2]]})
+    }
+
+
+def run_scenario(server, module_class, args):
+    """ Run one module against the stand-in
+    :return: measurements of the run
+    :rtype: dict
+    """
+    module_args = {
+        'clustername': '127.0.0.1',
+        'username': 'username',
+        'password': 'password'
+    }
+    module_args.update(args)
+    basic._ANSIBLE_ARGS = to_bytes(json.dumps({'ANSIBLE_MODULE_ARGS': module_args}))
+    # Every scenario opens its own connections, as a module process does
+    get_connection_pool().close_all()
+    server.reset_stats()
+
+    tracemalloc.start()
+    start = time.time()
+    try:
+        module_class().apply()
+        result = {}
+    except ModuleExit as e:
+        result = e.args[0]
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    stats = server.stats()
+    requests = sorted(stats['requests'].items(), key=lambda item: (-item[1], item[0]))
+    return {
+        'failed': bool(result.get('failed')),
+        'msg': result.get('msg'),
+        'round_trips': sum(stats['requests'].values()),
+        'requests': requests,
+        'bytes_sent': stats['bytes_received'],
+        'seconds': round(elapsed, 3),
+        'peak_memory_mb': round(peak / float(1 << 20), 1)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.partition('\n')[0])
+    parser.add_argument('--vdisks', type=int, default=10000, help='volumes of the synthetic inventory')
+    parser.add_argument('--hosts', type=int, default=2000, help='hosts of the synthetic inventory')
+    parser.add_argument('--maps-per-host', type=int, default=4, help='volumes mapped to every host')
+    parser.add_argument('--latency', type=float, default=0.005, help='seconds every request waits')
+    parser.add_argument('--scenario', action='append', help='scenario to run, all by default')
+    parser.add_argument('--repeat', type=int, default=1, help='runs of every scenario, the fastest is kept')
+    parser.add_argument('--certfile', help='certificate to serve HTTPS with')
+    parser.add_argument('--keyfile', help='private key of the certificate')
+    parser.add_argument('--json', help='file to write the measurements to')
+    options = parser.parse_args(argv)
+
+    results = {}
+    with patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json):
+        available = scenarios(options.vdisks, options.hosts)
+        names = options.scenario or sorted(available)
+        for name in names:
+            runs = []
+            for i in range(options.repeat):
+                # Scenarios change the inventory, so every run gets a fresh one
+                server = SVCMockServerProcess(options.vdisks, options.hosts, options.maps_per_host,
+                                              options.latency, options.certfile, options.keyfile).start()
+                try:
+                    with patch.object(IBMSVCRestApi, 'port', property(lambda self: str(server.port))), \
+                            patch.object(IBMSVCRestApi, 'protocol', property(lambda self: server.protocol)):
+                        module_class, args = available[name]
+                        runs.append(run_scenario(server, module_class, args))
+                finally:
+                    server.stop()
+            results[name] = min(runs, key=lambda run: run['seconds'])
+
+    print('%-20s %8s %10s %10s  %s' % ('scenario', 'requests', 'seconds', 'peak MB', 'top commands'))
+    for name in sorted(results):
+        r = results[name]
+        top = ', '.join('%s=%d' % tuple(item) for item in r['requests'][:3])
+        print('%-20s %8d %10.3f %10.1f  %s%s' % (name, r['round_trips'], r['seconds'], r['peak_memory_mb'], top,
+                                                 '  FAILED: %s' % r['msg'] if r['failed'] else ''))
+    if options.json:
+        with open(options.json, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    return 1 if any(r['failed'] for r in results.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
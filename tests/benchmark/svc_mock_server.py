@@ -0,0 +1,347 @@
+# Copyright (C) 2023 IBM CORPORATION
+#
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" Local stand-in for the Spectrum Virtualize REST API, serving a synthetic inventory """
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import json
+import multiprocessing
+import ssl
+import threading
+import time
+from collections import Counter, OrderedDict
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from http.client import HTTPConnection, HTTPSConnection
+    from urllib.parse import unquote
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from httplib import HTTPConnection, HTTPSConnection
+    from urllib import unquote
+
+TOKEN = 'benchmark-token'
+NOT_FOUND = b'CMMVC5753E The specified object does not exist or is not a suitable candidate.'
+
+
+class Inventory(object):
+    """ Synthetic cluster configuration
+    Volumes are named vol<N> and spread over the pools, hosts are named
+    host<N> and every host is mapped to maps_per_host consecutive volumes.
+    Listings are kept in creation order, as the cluster lists them.
+    """
+
+    def __init__(self, vdisks=10000, hosts=2000, pools=4, maps_per_host=4):
+        self.lock = threading.Lock()
+        self.tables = dict((cmd, OrderedDict()) for cmd in (
+            'lsvdisk', 'lshost', 'lsmdiskgrp', 'lsiogrp', 'lsrcrelationship', 'lsrcconsistgrp', 'lspartnership'))
+        self.mappings = []
+        for i in range(pools):
+            self.add('lsmdiskgrp', {'id': str(i), 'name': 'Pool%d' % i, 'status': 'online',
+                                    'mdisk_count': '8', 'capacity': str(100 << 40)})
+        self.add('lsiogrp', {'id': '0', 'name': 'io_grp0', 'node_count': '2'})
+        self.add('lspartnership', {'id': '1', 'name': 'remote', 'location': 'remote',
+                                   'console_IP': '127.0.0.1:7443'})
+        for i in range(vdisks):
+            self.add_vdisk('vol%d' % i, 'Pool%d' % (i % pools), 1 << 30)
+        for i in range(hosts):
+            self.add_host('host%d' % i)
+            for j in range(maps_per_host):
+                self.add_mapping('host%d' % i, 'vol%d' % ((i * maps_per_host + j) % max(vdisks, 1)), j)
+
+    def add(self, cmd, record):
+        self.tables[cmd][record['name']] = record
+        return record
+
+    def add_vdisk(self, name, pool, capacity):
+        return self.add('lsvdisk', {
+            'id': str(len(self.tables['lsvdisk'])), 'name': name, 'IO_group_id': '0', 'IO_group_name': 'io_grp0',
+            'status': 'online', 'mdisk_grp_id': pool[len('Pool'):], 'mdisk_grp_name': pool,
+            'capacity': str(capacity), 'type': 'striped', 'FC_id': '', 'FC_name': '', 'RC_id': '', 'RC_name': '',
+            'vdisk_UID': '6005076810CA0166C%015X' % len(self.tables['lsvdisk']), 'fc_map_count': '0',
+            'copy_count': '1', 'fast_write_state': 'empty', 'se_copy_count': '0', 'RC_change': 'no',
+            'compressed_copy_count': '0', 'parent_mdisk_grp_id': pool[len('Pool'):],
+            'parent_mdisk_grp_name': pool, 'owner_id': '', 'owner_name': '', 'formatting': 'no',
+            'encrypt': 'no', 'volume_id': str(len(self.tables['lsvdisk'])), 'volume_name': name,
+            'volume_group_id': '', 'volume_group_name': '', 'function': '', 'protocol': 'scsi'
+        })
+
+    def add_host(self, name):
+        return self.add('lshost', {
+            'id': str(len(self.tables['lshost'])), 'name': name, 'port_count': '2', 'iogrp_count': '4',
+            'status': 'online', 'site_id': '', 'site_name': '', 'host_cluster_id': '', 'host_cluster_name': '',
+            'protocol': 'scsi', 'type': 'generic', 'owner_id': '', 'owner_name': '', 'portset_id': '64',
+            'portset_name': 'portset64', 'WWPN': '10000000C9%06X' % len(self.tables['lshost'])
+        })
+
+    def add_mapping(self, host, vdisk, scsi_id):
+        mapping = {'host': host, 'vdisk': vdisk, 'SCSI_id': str(scsi_id)}
+        self.mappings.append(mapping)
+        return mapping
+
+    def host_mappings(self, host=None, vdisk=None):
+        rows = []
+        for m in self.mappings:
+            if (host and m['host'] != host) or (vdisk and m['vdisk'] != vdisk):
+                continue
+            h, v = self.tables['lshost'][m['host']], self.tables['lsvdisk'][m['vdisk']]
+            rows.append({'id': h['id'], 'name': h['name'], 'SCSI_id': m['SCSI_id'], 'vdisk_id': v['id'],
+                         'vdisk_name': v['name'], 'vdisk_UID': v['vdisk_UID'], 'IO_group_id': '0',
+                         'IO_group_name': 'io_grp0', 'mapping_type': 'private', 'host_cluster_id': '',
+                         'host_cluster_name': '', 'protocol': 'scsi'})
+        return rows
+
+    def run(self, cmd, opts, args):
+        """ Run a command against the inventory
+        :return: (HTTP status, JSON serializable output or error bytes)
+        """
+        with self.lock:
+            if cmd.startswith('ls'):
+                return self.list(cmd, args)
+            return self.change(cmd, opts, args)
+
+    def list(self, cmd, args):
+        name = args[0] if args else None
+        if cmd == 'lshostvdiskmap':
+            return 200, self.host_mappings(host=name)
+        if cmd == 'lsvdiskhostmap':
+            rows = self.host_mappings(vdisk=name)
+            return 200, [dict(r, id=r['vdisk_id'], name=r['vdisk_name'], host_id=r['id'],
+                              host_name=r['name']) for r in rows]
+        if cmd == 'lsvdiskaccess':
+            return 200, [{'vdisk_id': '0', 'vdisk_name': name, 'IO_group_id': '0', 'IO_group_name': 'io_grp0'}]
+        table = self.tables.get(cmd)
+        if table is None:
+            return 200, [] if name is None else {}
+        if name is None:
+            return 200, list(table.values())
+        if name not in table:
+            return 500, NOT_FOUND
+        # The detailed view of a volume lists the volume and then its copies
+        return 200, [table[name]] if cmd == 'lsvdisk' else table[name]
+
+    def change(self, cmd, opts, args):
+        if cmd in ('mkvolume', 'mkvdisk'):
+            if opts.get('name') in self.tables['lsvdisk']:
+                return 500, b'CMMVC6035E The action failed as the object already exists.'
+            size = int(opts.get('size', 1)) << {'b': 0, 'kb': 10, 'mb': 20, 'gb': 30, 'tb': 40}[opts.get('unit', 'mb')]
+            vdisk = self.add_vdisk(opts['name'], opts.get('pool') or opts.get('mdiskgrp') or 'Pool0', size)
+            return 200, {'id': vdisk['id'], 'message': 'Volume, id [%s], successfully created' % vdisk['id']}
+        if cmd == 'mkhost':
+            host = self.add_host(opts['name'])
+            return 200, {'id': host['id'], 'message': 'Host, id [%s], successfully created' % host['id']}
+        if cmd == 'mkvdiskhostmap':
+            self.add_mapping(opts['host'], args[0], opts.get('scsi', 0))
+            return 200, {'id': '0', 'message': 'Virtual Disk to Host map, id [0], successfully created'}
+        if cmd == 'rmvdiskhostmap':
+            self.mappings = [m for m in self.mappings if not (m['host'] == opts['host'] and m['vdisk'] == args[0])]
+            return 200, ''
+        if cmd == 'mkrcrelationship':
+            rel = self.add('lsrcrelationship', {
+                'id': str(len(self.tables['lsrcrelationship'])), 'name': opts['name'],
+                'master_vdisk_name': opts['master'], 'aux_vdisk_name': opts['aux'],
+                'aux_cluster_name': opts.get('cluster', ''), 'primary': 'master',
+                'consistency_group_name': opts.get('consistgrp', ''), 'state': 'inconsistent_stopped',
+                'copy_type': 'migration' if opts.get('migration') else 'global', 'progress': '0'
+            })
+            return 200, {'id': rel['id'], 'message': 'RC Relationship, id [%s], successfully created' % rel['id']}
+        if cmd == 'startrcrelationship':
+            if args[0] in self.tables['lsrcrelationship']:
+                self.tables['lsrcrelationship'][args[0]]['state'] = 'consistent_synchronized'
+            return 200, ''
+        if cmd in ('rmvdisk', 'rmvolume', 'rmhost'):
+            table = self.tables['lshost' if cmd == 'rmhost' else 'lsvdisk']
+            if table.pop(args[0], None) is None:
+                return 500, NOT_FOUND
+            return 200, ''
+        return 200, ''
+
+
+class SVCRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Send the headers and the body of a response at once, so that the
+    # delayed ACK of the client does not stall every keep-alive request
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def reply(self, status, body):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        # Request counts, read by the benchmark run in another process
+        if self.path != '/_stats':
+            return self.reply(404, b'Not Found')
+        server = self.server
+        with server.stats_lock:
+            self.reply(200, {'requests': dict(server.requests), 'bytes_received': server.bytes_received})
+
+    def do_DELETE(self):
+        if self.path != '/_stats':
+            return self.reply(404, b'Not Found')
+        self.server.reset_stats()
+        self.reply(200, b'')
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        payload = self.rfile.read(length) if length else b''
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+
+        parts = [unquote(p) for p in self.path.split('/') if p]
+        if parts[:1] != ['rest'] or len(parts) < 2:
+            return self.reply(404, b'Not Found')
+        cmd, args = parts[1], parts[2:]
+        with server.stats_lock:
+            server.requests[cmd] += 1
+            server.bytes_received += length
+
+        if cmd == 'auth':
+            return self.reply(200, {'token': TOKEN})
+        if self.headers.get('X-Auth-Token') != TOKEN:
+            return self.reply(403, b'Forbidden')
+        opts = json.loads(payload.decode('utf-8') or 'null') or {}
+        status, body = server.inventory.run(cmd, opts, args)
+        self.reply(status, body)
+
+
+class SVCMockServer(ThreadingMixIn, HTTPServer):
+    """ Threaded REST API stand-in
+    Every request waits latency seconds before it is answered, to stand
+    for the network round trip and the time the cluster takes. Requests
+    are counted per command.
+    """
+    daemon_threads = True
+
+    def __init__(self, inventory, latency=0.0, certfile=None, keyfile=None, port=0):
+        HTTPServer.__init__(self, ('127.0.0.1', port), SVCRequestHandler)
+        self.inventory = inventory
+        self.latency = latency
+        self.stats_lock = threading.Lock()
+        self.requests = Counter()
+        self.bytes_received = 0
+        self.protocol = 'http'
+        if certfile:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certfile, keyfile)
+            self.socket = context.wrap_socket(self.socket, server_side=True)
+            self.protocol = 'https'
+        self.thread = None
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.requests = Counter()
+            self.bytes_received = 0
+
+
+def serve(options, ready):
+    """ Build the inventory and serve it until the process is terminated
+    :param options: keyword arguments of Inventory, and latency, certfile and keyfile
+    :param ready: queue the port and the protocol are put on once listening
+    """
+    options = dict(options)
+    server = SVCMockServer(Inventory(options.pop('vdisks'), options.pop('hosts'),
+                                     maps_per_host=options.pop('maps_per_host')),
+                           **options)
+    ready.put((server.port, server.protocol))
+    server.serve_forever()
+
+
+class SVCMockServerProcess(object):
+    """ Stand-in served by a child process
+    The inventory and the JSON encoding of the replies then stay out of
+    the memory and the interpreter lock of the process under measure.
+    """
+
+    def __init__(self, vdisks=10000, hosts=2000, maps_per_host=4, latency=0.0, certfile=None, keyfile=None):
+        self.options = dict(vdisks=vdisks, hosts=hosts, maps_per_host=maps_per_host, latency=latency,
+                            certfile=certfile, keyfile=keyfile)
+        self.process = None
+        self.port = None
+        self.protocol = None
+
+    def start(self):
+        ready = multiprocessing.Queue()
+        self.process = multiprocessing.Process(target=serve, args=(self.options, ready))
+        self.process.daemon = True
+        self.process.start()
+        self.port, self.protocol = ready.get(timeout=300)
+        return self
+
+    def stop(self):
+        self.process.terminate()
+        self.process.join()
+
+    def control(self, method):
+        if self.protocol == 'https':
+            # The certificate of the stand-in is the one given by the caller
+            conn = HTTPSConnection('127.0.0.1', self.port, context=ssl._create_unverified_context())
+        else:
+            conn = HTTPConnection('127.0.0.1', self.port)
+        try:
+            conn.request(method, '/_stats')
+            body = conn.getresponse().read()
+        finally:
+            conn.close()
+        return json.loads(body.decode('utf-8')) if body else None
+
+    def stats(self):
+        return self.control('GET')
+
+    def reset_stats(self):
+        self.control('DELETE')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--vdisks', type=int, default=10000, help='volumes of the synthetic inventory')
+    parser.add_argument('--hosts', type=int, default=2000, help='hosts of the synthetic inventory')
+    parser.add_argument('--maps-per-host', type=int, default=4, help='volumes mapped to every host')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds every request waits')
+    parser.add_argument('--port', type=int, default=7443, help='port to listen on')
+    parser.add_argument('--certfile', help='certificate to serve HTTPS with')
+    parser.add_argument('--keyfile', help='private key of the certificate')
+    options = parser.parse_args(argv)
+
+    server = SVCMockServer(Inventory(options.vdisks, options.hosts, maps_per_host=options.maps_per_host),
+                           options.latency, options.certfile, options.keyfile, options.port)
+    print('Serving %s://127.0.0.1:%d' % (server.protocol, server.port))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+# Copyright (C) 2023 IBM CORPORATION
+# Author(s): Sanjaikumaar M <sanjaikumaar.m@ibm.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" unit tests IBM Spectrum Virtualize Ansible action plugin: ibm_sv_desired_state """
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import unittest
+from mock import MagicMock, patch
+from ansible_collections.ibm.spectrum_virtualize.plugins.action.ibm_sv_desired_state import (
+    ActionModule,
+    SVCDesiredState
+)
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_sv_desired_state import (
+    DESIRED_STATE_KINDS
+)
+
+LISTINGS = {
+    'lshostcluster': [],
+    'lshost': [{'id': '0', 'name': 'old-host', 'host_cluster_name': '', 'site_name': '', 'portset_name': 'portset0'}],
+    'lsvdisk': [{'id': '0', 'name': 'vol0', 'capacity': '1073741824', 'mdisk_grp_name': 'Pool0',
+                 'IO_group_name': 'io_grp0', 'volume_group_name': '', 'type': 'striped', 'RC_name': ''}],
+    'lshostvdiskmap': [],
+    'lshostclustervolumemap': []
+}
+
+
+class FakeCluster(object):
+    """ Answers listings and records the commands run """
+
+    def __init__(self, fail=None):
+        self.listed = []
+        self.detailed = []
+        self.commands = []
+        self.fail = fail
+
+    def svc_obj_info(self, cmd, cmdopts, cmdargs, timeout=10, stream=False, cache=True):
+        if cmdargs is None:
+            self.listed.append(cmd)
+            return list(LISTINGS[cmd])
+        self.detailed.append((cmd, cmdargs))
+        return None
+
+    def svc_run_command(self, cmd, cmdopts, cmdargs, timeout=10):
+        if cmd == self.fail:
+            raise Exception('CMMVC5707E Required parameters are missing.')
+        self.commands.append((cmd, cmdopts, cmdargs))
+        return {'id': '1', 'message': 'created'}
+
+
+class TestIBMSVDesiredState(unittest.TestCase):
+    """ a group of related Unit Tests"""
+
+    def setUp(self):
+        self.cluster = FakeCluster()
+        for method in ('svc_obj_info', 'svc_run_command'):
+            patcher = patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+                            'ibm_svc_utils.IBMSVCRestApi.%s' % method, side_effect=getattr(self.cluster, method))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+                        'ibm_svc_utils.IBMSVCRestApi._svc_authorize', return_value='token')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def params(self, **kwargs):
+        params = dict(clustername='1.2.3.4', domain=None, username='username', password='password', token=None,
+                      validate_certs=False, log_path=None, token_cache_path=None, pool_size=4, idle_timeout=30,
+                      perf_summary=False, parallelism=4)
+        params.update((kind, None) for kind in DESIRED_STATE_KINDS)
+        params.update(
+            hostclusters=[{'name': 'hc0'}],
+            hosts=[{'name': 'host0', 'fcwwpn': '10000090FA0B2B30', 'hostcluster': 'hc0'},
+                   {'name': 'old-host', 'state': 'absent'}],
+            volumes=[{'name': 'vol0', 'pool': 'Pool0', 'size': '1', 'unit': 'gb'},
+                     {'name': 'vol1', 'pool': 'Pool0', 'size': '1', 'unit': 'gb'}],
+            mappings=[{'volume': 'vol0', 'hostcluster': 'hc0'}, {'volume': 'vol1', 'hostcluster': 'hc0'}]
+        )
+        params.update(kwargs)
+        return params
+
+    def test_apply_in_dependency_order(self):
+        result = SVCDesiredState(self.params(), check_mode=False).apply()
+
+        self.assertTrue(result['changed'])
+        self.assertFalse(result.get('failed'))
+        self.assertEqual(result['stages'], [
+            {'state': 'absent', 'kinds': ['hosts']},
+            {'state': 'present', 'kinds': ['hostclusters']},
+            {'state': 'present', 'kinds': ['hosts']},
+            {'state': 'present', 'kinds': ['volumes']},
+            {'state': 'present', 'kinds': ['mappings']}
+        ])
+        self.assertEqual([cmd for cmd, opts, args in self.cluster.commands],
+                         ['rmhost', 'mkhostcluster', 'mkhost', 'addhostclustermember', 'mkvolume',
+                          'mkvolumehostclustermap', 'mkvolumehostclustermap'])
+        self.assertEqual([opts['scsi'] for cmd, opts, args in self.cluster.commands[-2:]], [0, 1])
+
+        # Everything is listed once, and nothing is fetched one by one
+        self.assertEqual(sorted(self.cluster.listed),
+                         ['lshost', 'lshostcluster', 'lshostclustervolumemap', 'lshostvdiskmap', 'lsvdisk'])
+        self.assertEqual(self.cluster.detailed, [])
+
+        results = dict(((r['kind'], r['name']), r) for r in result['results'])
+        self.assertFalse(results[('volumes', 'vol0')]['changed'])
+        self.assertTrue(results[('volumes', 'vol1')]['changed'])
+        self.assertEqual(results[('mappings', 'vol1')]['hostcluster'], 'hc0')
+        self.assertEqual(results[('mappings', 'vol1')]['scsi'], 1)
+        self.assertEqual(results[('hosts', 'old-host')]['stage'], 0)
+
+    def test_check_mode(self):
+        result = SVCDesiredState(self.params(), check_mode=True).apply()
+
+        self.assertTrue(result['changed'])
+        self.assertFalse(result.get('failed'))
+        self.assertEqual(result['msg'], 'skipping changes due to check mode')
+        self.assertEqual(self.cluster.commands, [])
+        # The host is planned into the host cluster planned by the stage before
+        results = dict(((r['kind'], r['name']), r) for r in result['results'])
+        self.assertTrue(results[('hosts', 'host0')]['changed'])
+        # The commands are planned in dependency order, as they would run
+        self.assertEqual([(c['cmd'], c['opts'].get('name')) for c in result['command_plan']], [
+            ('rmhost', None), ('mkhostcluster', 'hc0'), ('mkhost', 'host0'), ('addhostclustermember', None),
+            ('mkvolume', 'vol1'), ('mkvolumehostclustermap', None), ('mkvolumehostclustermap', None)
+        ])
+        self.assertEqual(result['round_trips']['writes'], 7)
+
+    def test_existing_host_fetches_details(self):
+        self.cluster.svc_obj_info = MagicMock(side_effect=self.cluster.svc_obj_info)
+        params = self.params(hostclusters=None, volumes=None, mappings=None,
+                             hosts=[{'name': 'old-host', 'fcwwpn': '10000090FA0B2B30'},
+                                    {'name': 'new-host', 'fcwwpn': '10000090FA0B2B31'}])
+        result = SVCDesiredState(params, check_mode=True).apply()
+        self.assertFalse(result.get('failed'))
+        # Only the host that exists is probed for its WWPNs
+        self.assertEqual(self.cluster.detailed, [('lshost', ['old-host'])])
+
+    def test_failure_skips_later_stages(self):
+        self.cluster.fail = 'mkhostcluster'
+        result = SVCDesiredState(self.params(), check_mode=False).apply()
+
+        self.assertTrue(result['failed'])
+        self.assertEqual(result['msg'], 'Failed to reconcile hostclusters/hc0.')
+        self.assertEqual([cmd for cmd, opts, args in self.cluster.commands], ['rmhost'])
+        skipped = [(r['kind'], r['name']) for r in result['results'] if r.get('skipped')]
+        self.assertEqual(skipped, [('hosts', 'host0'), ('volumes', 'vol0'), ('volumes', 'vol1'),
+                                   ('mappings', 'vol0'), ('mappings', 'vol1')])
+
+    def test_invalid_entries(self):
+        params = self.params(
+            hosts=[{'name': 'host0', 'fcwwpn': '10000090FA0B2B30', 'colour': 'blue'}],
+            volumes=[{'name': 'vol0', 'clustername': '1.2.3.5'}, {'name': 'vol0'}],
+            mappings=[{'volume': 'vol0'}]
+        )
+        result = SVCDesiredState(params, check_mode=False).apply()
+
+        self.assertTrue(result['failed'])
+        self.assertIn('[hosts] entry 0: Unsupported parameters', result['msg'])
+        self.assertIn("[volumes] Duplicate names in [volumes]: ['vol0']", result['msg'])
+        self.assertIn('[mappings] Every entry of [mappings] requires a volume', result['msg'])
+        self.assertEqual(self.cluster.listed, [])
+        self.assertEqual(self.cluster.commands, [])
+
+    def test_action_module(self):
+        task = MagicMock()
+        task.args = dict(clustername='1.2.3.4', username='username', password='password', perf_summary=True,
+                         hosts=[{'name': 'old-host', 'state': 'absent'}])
+        task.check_mode = False
+        task.async_val = 0
+        action = ActionModule(task, MagicMock(), MagicMock(), loader=None, templar=None, shared_loader_obj=None)
+
+        result = action.run(task_vars={})
+        self.assertTrue(result['changed'])
+        self.assertEqual(result['msg'], '1 entries applied in 1 stages, 1 changed.')
+        self.assertEqual(self.cluster.commands, [('rmhost', {}, ['old-host'])])
+        self.assertIn('_perf', result)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.action.'
+           'ibm_sv_desired_state.ArgumentSpecValidator', None)
+    def test_action_module_requires_argument_spec_validator(self):
+        task = MagicMock()
+        task.args = dict(clustername='1.2.3.4', username='username', password='password',
+                         hosts=[{'name': 'old-host', 'state': 'absent'}])
+        task.check_mode = False
+        task.async_val = 0
+        action = ActionModule(task, MagicMock(), MagicMock(), loader=None, templar=None, shared_loader_obj=None)
+
+        result = action.run(task_vars={})
+        self.assertTrue(result['failed'])
+        self.assertEqual(result['msg'], 'ibm_sv_desired_state requires ansible-core 2.11 or later.')
+        self.assertEqual(self.cluster.commands, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
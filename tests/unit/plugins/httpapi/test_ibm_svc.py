@@ -0,0 +1,99 @@
+# Copyright (C) 2023 IBM CORPORATION
+# Author(s): Sanjaikumaar M <sanjaikumaar.m@ibm.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" unit tests IBM Spectrum Virtualize Ansible httpapi plugin: ibm_svc """
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import unittest
+from mock import MagicMock, patch
+from ansible.module_utils.connection import ConnectionError
+from ansible_collections.ibm.spectrum_virtualize.plugins.httpapi.ibm_svc import HttpApi
+
+
+class TestIBMSVCHttpApi(unittest.TestCase):
+    """ a group of related Unit Tests"""
+
+    def setUp(self):
+        self.options = {
+            'host': '1.2.3.4',
+            'port': None,
+            'validate_certs': False,
+            'remote_user': 'username',
+            'password': 'password'
+        }
+        self.connection = MagicMock()
+        self.connection.get_option.side_effect = self.options.get
+        self.httpapi = HttpApi(self.connection)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_login(self, svc_authorize):
+        svc_authorize.return_value = 'token'
+        self.httpapi.login('username', 'password')
+        self.assertEqual(self.httpapi.session.token, 'token')
+        self.assertEqual(self.httpapi.session.resturl, 'https://1.2.3.4:7443/rest')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_login_with_port(self, svc_authorize):
+        svc_authorize.return_value = 'token'
+        self.options['port'] = 8443
+        self.httpapi.login('username', 'password')
+        self.assertEqual(self.httpapi.session.resturl, 'https://1.2.3.4:8443/rest')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_login_failed(self, svc_authorize):
+        svc_authorize.return_value = None
+        with self.assertRaises(ConnectionError) as exc:
+            self.httpapi.login('username', 'password')
+        self.assertEqual(str(exc.exception), 'Failed to obtain access token')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_rest')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_svc_request_reuses_session(self, svc_authorize, svc_rest):
+        svc_authorize.return_value = 'token'
+        svc_rest.return_value = {'url': None, 'code': None, 'err': None, 'out': [{'name': 'vol0'}], 'data': None}
+        self.assertEqual(self.httpapi.svc_request('lsvdisk', {'bytes': True}, None)['out'], [{'name': 'vol0'}])
+        self.httpapi.send_request('lshost', cmdargs=['host0'], timeout=30)
+
+        self.assertEqual(svc_authorize.call_count, 1)
+        self.assertEqual(svc_rest.call_args[1]['cmd'], 'lshost')
+        self.assertEqual(svc_rest.call_args[1]['cmdargs'], ['host0'])
+        self.assertEqual(svc_rest.call_args[1]['timeout'], 30)
+        self.assertEqual(svc_rest.call_args[1]['headers']['X-Auth-Token'], 'token')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_rest')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_svc_request_renews_rejected_token(self, svc_authorize, svc_rest):
+        svc_authorize.side_effect = ['token', 'renewed']
+        svc_rest.side_effect = [
+            {'url': None, 'code': 403, 'err': ('HTTPError %s', 'HTTP Error 403: Forbidden'), 'out': b'', 'data': None},
+            {'url': None, 'code': None, 'err': None, 'out': [], 'data': None}
+        ]
+        self.assertEqual(self.httpapi.svc_request('lsvdisk')['out'], [])
+        self.assertEqual(svc_rest.call_args[1]['headers']['X-Auth-Token'], 'renewed')
+        self.assertEqual(self.httpapi.session.token, 'renewed')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_rest')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_svc_request_error_body_is_text(self, svc_authorize, svc_rest):
+        svc_authorize.return_value = 'token'
+        svc_rest.return_value = {'url': None, 'code': 500, 'err': ('HTTPError %s', 'HTTP Error 500'),
+                                 'out': b'CMMVC5753E The specified object does not exist.', 'data': None}
+        rest = self.httpapi.svc_request('lsvdisk', None, ['missing'])
+        self.assertEqual(rest['code'], 500)
+        self.assertEqual(rest['out'], u'CMMVC5753E The specified object does not exist.')
+
+
+if __name__ == '__main__':
+    unittest.main()
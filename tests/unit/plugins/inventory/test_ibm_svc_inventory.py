@@ -0,0 +1,172 @@
+# Copyright (C) 2023 IBM CORPORATION
+# Author(s): Sanjaikumaar M <sanjaikumaar.m@ibm.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" unit tests IBM Spectrum Virtualize Ansible inventory plugin: ibm_svc """
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+from mock import patch
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+from ansible.plugins.loader import inventory_loader
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApiError
+from ansible_collections.ibm.spectrum_virtualize.plugins.inventory.ibm_svc import InventoryModule
+
+TOPOLOGY = {
+    'lssystem': {'id': '0000020421A0002C', 'name': 'FS9500', 'code_level': '8.5.0.7', 'topology': 'hyperswap'},
+    'lsmdiskgrp': [{'id': '0', 'name': 'Pool0', 'site_name': 'site1'},
+                   {'id': '1', 'name': 'Pool1', 'site_name': ''}],
+    'lshost': [{'id': '0', 'name': 'esx0', 'protocol': 'scsi', 'host_cluster_name': 'esx', 'site_name': 'site1'},
+               {'id': '1', 'name': 'db0', 'protocol': 'nvme', 'host_cluster_name': '', 'site_name': ''}],
+    'lsvdisk': [{'id': '0', 'name': 'vol0', 'mdisk_grp_name': 'Pool0', 'IO_group_name': 'io_grp0',
+                 'volume_group_name': 'vg0', 'capacity': '1073741824'},
+                {'id': '1', 'name': 'vol1', 'mdisk_grp_name': 'many', 'IO_group_name': 'io_grp1',
+                 'volume_group_name': '', 'capacity': '1073741824'}]
+}
+
+
+def svc_obj_info(cmd, cmdopts, cmdargs, timeout=10, stream=False, cache=True):
+    out = TOPOLOGY[cmd]
+    return iter(out) if stream else out
+
+
+class TestIBMSVCInventory(unittest.TestCase):
+    """ a group of related Unit Tests"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.loader = DataLoader()
+
+    def write_config(self, **options):
+        lines = ['plugin: ibm.spectrum_virtualize.ibm_svc',
+                 'clusters:',
+                 '  - clustername: 1.2.3.4',
+                 'username: username',
+                 'password: password']
+        lines.extend('%s: %s' % item for item in options.items())
+        path = os.path.join(self.tmpdir, 'test.ibm_svc.yml')
+        with open(path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        return path
+
+    def load_plugin(self):
+        """ Set the plugin up as the inventory plugin loader does """
+        module = sys.modules[InventoryModule.__module__]
+        inventory_loader._load_config_defs(InventoryModule.NAME, module, module.__file__)
+        plugin = InventoryModule()
+        plugin._load_name = InventoryModule.NAME
+        plugin._redirected_names = [InventoryModule.NAME]
+        return plugin
+
+    def parse(self, path, cache=True):
+        plugin = self.load_plugin()
+        inventory = InventoryData()
+        plugin.parse(inventory, self.loader, path, cache=cache)
+        plugin.update_cache_if_changed()
+        return inventory
+
+    def group_hosts(self, inventory, group):
+        return sorted(host.name for host in inventory.groups[group].get_hosts())
+
+    def test_verify_file(self):
+        plugin = self.load_plugin()
+        self.assertTrue(plugin.verify_file(self.write_config()))
+        other = os.path.join(self.tmpdir, 'hosts.yml')
+        open(other, 'w').close()
+        self.assertFalse(plugin.verify_file(other))
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_groups_and_variables(self, svc_authorize, mock_svc_obj_info):
+        svc_authorize.return_value = 'token'
+        mock_svc_obj_info.side_effect = svc_obj_info
+        inventory = self.parse(self.write_config(objects='[host, volume]'))
+
+        self.assertEqual(self.group_hosts(inventory, 'svc_clusters'), ['1.2.3.4'])
+        self.assertEqual(self.group_hosts(inventory, 'svc_cluster_1_2_3_4'), ['1.2.3.4', 'db0', 'esx0', 'vol0', 'vol1'])
+        self.assertEqual(self.group_hosts(inventory, 'svc_hosts'), ['db0', 'esx0'])
+        self.assertEqual(self.group_hosts(inventory, 'svc_volumes'), ['vol0', 'vol1'])
+        self.assertEqual(self.group_hosts(inventory, 'svc_hostcluster_esx'), ['esx0'])
+        self.assertEqual(self.group_hosts(inventory, 'svc_site_site1'), ['esx0', 'vol0'])
+        self.assertEqual(self.group_hosts(inventory, 'svc_pool_Pool0'), ['vol0'])
+        self.assertEqual(self.group_hosts(inventory, 'svc_iogrp_io_grp1'), ['vol1'])
+        self.assertEqual(self.group_hosts(inventory, 'svc_volumegroup_vg0'), ['vol0'])
+        self.assertNotIn('svc_pool_many', inventory.groups)
+
+        cluster = inventory.get_host('1.2.3.4').vars
+        self.assertEqual(cluster['ansible_host'], '1.2.3.4')
+        self.assertEqual(cluster['svc_code_level'], '8.5.0.7')
+        self.assertEqual(cluster['svc_object_type'], 'cluster')
+        volume = inventory.get_host('vol0').vars
+        self.assertEqual(volume['svc_cluster'], '1.2.3.4')
+        self.assertEqual(volume['svc_object_type'], 'volume')
+        self.assertEqual(volume['svc_capacity'], '1073741824')
+        called = [c[0][0] for c in mock_svc_obj_info.call_args_list]
+        self.assertEqual(called, ['lssystem', 'lsmdiskgrp', 'lshost', 'lsvdisk'])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_prefix_cluster_and_keyed_groups(self, svc_authorize, mock_svc_obj_info):
+        svc_authorize.return_value = 'token'
+        mock_svc_obj_info.side_effect = svc_obj_info
+        path = self.write_config(prefix_cluster='true', keyed_groups='[{key: svc_protocol, prefix: protocol}]')
+        inventory = self.parse(path)
+
+        self.assertEqual(self.group_hosts(inventory, 'svc_hosts'), ['1.2.3.4_db0', '1.2.3.4_esx0'])
+        self.assertEqual(self.group_hosts(inventory, 'protocol_nvme'), ['1.2.3.4_db0'])
+        self.assertNotIn('svc_volumes', inventory.groups)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_inventory_cache(self, svc_authorize, mock_svc_obj_info):
+        svc_authorize.return_value = 'token'
+        mock_svc_obj_info.side_effect = svc_obj_info
+        path = self.write_config(cache='true', cache_plugin='jsonfile',
+                                 cache_connection=os.path.join(self.tmpdir, 'cache'), cache_timeout=600)
+
+        self.parse(path, cache=False)
+        self.assertEqual(svc_authorize.call_count, 1)
+        inventory = self.parse(path)
+        self.assertEqual(svc_authorize.call_count, 1)
+        self.assertEqual(self.group_hosts(inventory, 'svc_hostcluster_esx'), ['esx0'])
+
+        # Refreshing the cache queries the storage system again
+        self.parse(path, cache=False)
+        self.assertEqual(svc_authorize.call_count, 2)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_unreachable_cluster_not_cached(self, svc_authorize, mock_svc_obj_info):
+        svc_authorize.return_value = 'token'
+        mock_svc_obj_info.side_effect = IBMSVCRestApiError('HTTP Error 503')
+        path = self.write_config(cache='true', cache_plugin='jsonfile',
+                                 cache_connection=os.path.join(self.tmpdir, 'cache'))
+
+        with patch('ansible.plugins.inventory.display') as display:
+            inventory = self.parse(path, cache=False)
+        self.assertIn('1.2.3.4', display.warning.call_args[0][0])
+        self.assertEqual(self.group_hosts(inventory, 'svc_clusters'), [])
+
+        mock_svc_obj_info.side_effect = svc_obj_info
+        inventory = self.parse(path)
+        self.assertEqual(self.group_hosts(inventory, 'svc_clusters'), ['1.2.3.4'])
+
+
+if __name__ == '__main__':
+    unittest.main()
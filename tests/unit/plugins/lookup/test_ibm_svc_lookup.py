@@ -0,0 +1,158 @@
+# Copyright (C) 2023 IBM CORPORATION
+# Author(s): Sanjaikumaar M <sanjaikumaar.m@ibm.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" unit tests IBM Spectrum Virtualize Ansible lookup plugin: ibm_svc """
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import unittest
+import sys
+from mock import patch
+from ansible.errors import AnsibleLookupError
+from ansible.plugins.loader import lookup_loader
+from ansible_collections.ibm.spectrum_virtualize.plugins.lookup import ibm_svc
+from ansible_collections.ibm.spectrum_virtualize.plugins.lookup.ibm_svc import LookupModule
+
+PLUGIN_NAME = 'ibm.spectrum_virtualize.ibm_svc'
+VOLUMES = [{'id': str(i), 'name': 'vol%d' % i, 'vdisk_UID': '6005076810%022X' % i} for i in range(1000)]
+
+
+class TestIBMSVCLookup(unittest.TestCase):
+    """ a group of related Unit Tests"""
+
+    def setUp(self):
+        ibm_svc._sessions.clear()
+        ibm_svc._listings.clear()
+        self.addCleanup(ibm_svc._sessions.clear)
+        self.addCleanup(ibm_svc._listings.clear)
+
+    def lookup(self, *terms, **kwargs):
+        """ Run the lookup set up as the lookup plugin loader does """
+        lookup_loader._load_config_defs(PLUGIN_NAME, sys.modules[LookupModule.__module__], ibm_svc.__file__)
+        plugin = LookupModule()
+        plugin._load_name = PLUGIN_NAME
+        options = dict(clustername='1.2.3.4', username='username', password='password')
+        options.update(kwargs)
+        return plugin.run(list(terms), variables={}, **options)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_many_objects_one_listing(self, svc_authorize, svc_obj_info):
+        svc_authorize.return_value = 'token'
+        svc_obj_info.return_value = VOLUMES
+        names = ['vol%d' % i for i in range(999, -1, -1)]
+
+        uids = self.lookup('lsvdisk', names, attribute='vdisk_UID')
+        self.assertEqual(uids, [volume['vdisk_UID'] for volume in reversed(VOLUMES)])
+        # Later lookups, by name or id, reuse the session and the listing
+        self.assertEqual(self.lookup('lsvdisk', 'vol7'), [VOLUMES[7]])
+        self.assertEqual(self.lookup('lsvdisk', '8', 'vol9', attribute='name'), ['vol8', 'vol9'])
+        self.assertEqual(len(self.lookup('lsvdisk')), 1000)
+
+        self.assertEqual(svc_authorize.call_count, 1)
+        svc_obj_info.assert_called_once_with('lsvdisk', None, None, cache=False)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_listings_by_options(self, svc_authorize, svc_obj_info):
+        svc_authorize.return_value = 'token'
+        svc_obj_info.return_value = [{'id': '0', 'name': 'Pool0', 'free_capacity': '1099511627776'}]
+        self.lookup('lsmdiskgrp', 'Pool0', cmdopts={'bytes': True})
+        self.lookup('lsmdiskgrp', 'Pool0')
+        self.lookup('lsmdiskgrp', 'Pool0', clustername='1.2.3.5')
+        self.assertEqual(svc_obj_info.call_count, 3)
+        self.assertEqual(svc_authorize.call_count, 2)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_cache_timeout(self, svc_authorize, svc_obj_info):
+        svc_authorize.return_value = 'token'
+        svc_obj_info.return_value = VOLUMES
+        self.lookup('lsvdisk', 'vol0', cache_timeout=0)
+        self.lookup('lsvdisk', 'vol0', cache_timeout=0)
+        self.assertEqual(svc_obj_info.call_count, 2)
+
+        with patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils.time.time') as now:
+            now.return_value = 1000
+            self.lookup('lsvdisk', 'vol0', cache_timeout=30)
+            now.return_value = 1029
+            self.lookup('lsvdisk', 'vol0', cache_timeout=30)
+            self.assertEqual(svc_obj_info.call_count, 3)
+            now.return_value = 1030
+            self.lookup('lsvdisk', 'vol0', cache_timeout=30)
+            self.assertEqual(svc_obj_info.call_count, 4)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_detailed(self, svc_authorize, svc_obj_info):
+        svc_authorize.return_value = 'token'
+        svc_obj_info.side_effect = lambda cmd, cmdopts, cmdargs, cache: {'name': cmdargs[0],
+                                                                         'WWPN': '10000090FA0B2B3' + cmdargs[0][-1]}
+        self.assertEqual(self.lookup('lshost', 'host0', 'host1', detailed=True, attribute='WWPN'),
+                         ['10000090FA0B2B30', '10000090FA0B2B31'])
+        self.lookup('lshost', 'host1', detailed=True)
+        self.assertEqual([c[0][2] for c in svc_obj_info.call_args_list], [['host0'], ['host1']])
+
+        with self.assertRaises(AnsibleLookupError) as exc:
+            self.lookup('lshost', detailed=True)
+        self.assertEqual(str(exc.exception), 'Objects must be named to fetch their detailed view')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_missing_object(self, svc_authorize, svc_obj_info):
+        svc_authorize.return_value = 'token'
+        svc_obj_info.return_value = VOLUMES[:2]
+        with self.assertRaises(AnsibleLookupError) as exc:
+            self.lookup('lsvdisk', 'vol0', 'vol5', 'vol6')
+        self.assertEqual(str(exc.exception), 'lsvdisk found no object named vol5, vol6')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_missing_object_created_later(self, svc_authorize, svc_obj_info):
+        svc_authorize.return_value = 'token'
+        svc_obj_info.return_value = VOLUMES[:2]
+        with self.assertRaises(AnsibleLookupError):
+            self.lookup('lsvdisk', 'vol5')
+        svc_obj_info.return_value = VOLUMES[:6]
+        self.assertEqual(self.lookup('lsvdisk', 'vol5'), [VOLUMES[5]])
+        self.assertEqual(self.lookup('lsvdisk', 'vol0'), [VOLUMES[0]])
+        self.assertEqual(svc_obj_info.call_count, 2)
+
+        svc_obj_info.reset_mock()
+        svc_obj_info.side_effect = [None, {'name': 'host0'}]
+        with self.assertRaises(AnsibleLookupError):
+            self.lookup('lshost', 'host0', detailed=True)
+        self.assertEqual(self.lookup('lshost', 'host0', detailed=True), [{'name': 'host0'}])
+        self.assertEqual(self.lookup('lshost', 'host0', detailed=True), [{'name': 'host0'}])
+        self.assertEqual(svc_obj_info.call_count, 2)
+
+    def test_only_ls_commands(self):
+        with self.assertRaises(AnsibleLookupError) as exc:
+            self.lookup('rmvdisk', 'vol0')
+        self.assertEqual(str(exc.exception), "Only ls commands can be looked up, not 'rmvdisk'")
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_authentication_failed(self, svc_authorize):
+        svc_authorize.return_value = None
+        with self.assertRaises(AnsibleLookupError) as exc:
+            self.lookup('lsvdisk', 'vol0')
+        self.assertEqual(str(exc.exception), 'Failed to obtain access token')
+
+
+if __name__ == '__main__':
+    unittest.main()
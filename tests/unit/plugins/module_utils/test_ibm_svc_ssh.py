@@ -11,7 +11,7 @@ __metaclass__ = type
 import unittest
 import json
 import paramiko
-from mock import patch
+from mock import patch, MagicMock
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
 from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_ssh import IBMSVCssh
@@ -86,6 +86,39 @@ class TestIBMSVModuleUtilsSsh(unittest.TestCase):
         ret = self.sshclient._svc_disconnect()
         self.assertTrue(ret)
 
+    def mock_exec_command(self, *outputs):
+        channels = []
+        for out, rc, err in outputs:
+            stdout = MagicMock()
+            stdout.read.return_value = out
+            stdout.channel.recv_exit_status.return_value = rc
+            stderr = MagicMock()
+            stderr.read.return_value = err
+            channels.append((MagicMock(), stdout, stderr))
+        self.sshclient.client = MagicMock()
+        self.sshclient.client.exec_command.side_effect = channels
+
+    def test_svc_run_batch(self):
+        self.mock_exec_command((b'Virtual Disk, id [0], successfully created\n', 0, b''),
+                               (b'', 0, b''))
+        commands = ['svctask mkvdisk -name vol0', 'svctask chvdisk -name vol1 vol0']
+        results = self.sshclient.svc_run_batch(commands)
+        self.assertEqual([c[0][0] for c in self.sshclient.client.exec_command.call_args_list], commands)
+        self.assertEqual(results, [
+            {'command': commands[0], 'rc': 0, 'stdout': 'Virtual Disk, id [0], successfully created\n', 'stderr': ''},
+            {'command': commands[1], 'rc': 0, 'stdout': '', 'stderr': ''}
+        ])
+
+    def test_svc_run_batch_stops_at_failure(self):
+        self.mock_exec_command((b'', 0, b''),
+                               (b'', 1, b'CMMVC5753E The specified object does not exist.'),
+                               (b'', 0, b''))
+        commands = ['svctask mkvdisk -name vol0', 'svctask rmvdisk vol9', 'svctask rmvdisk vol0']
+        results = self.sshclient.svc_run_batch(commands)
+        self.assertEqual([r['rc'] for r in results], [0, 1])
+        self.assertEqual(results[1]['stderr'], 'CMMVC5753E The specified object does not exist.')
+        self.assertEqual(self.sshclient.client.exec_command.call_count, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
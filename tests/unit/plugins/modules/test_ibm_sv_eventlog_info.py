@@ -0,0 +1,187 @@
+# Copyright (C) 2023 IBM CORPORATION
+# Author(s): Sanjaikumaar M <sanjaikumaar.m@ibm.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" unit tests IBM Spectrum Virtualize Ansible module: ibm_sv_eventlog_info """
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import unittest
+import pytest
+import json
+import os
+import shutil
+import tempfile
+from mock import patch
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_sv_eventlog_info import IBMSVEventlogInfo
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module
+    creation """
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the
+    test case """
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the
+    test case """
+    pass
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over exit_json; package return data into an
+    exception """
+    if 'changed' not in kwargs:
+        kwargs['changed'] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):
+    """function to patch over fail_json; package return data into an
+    exception """
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class TestIBMSVEventlogInfo(unittest.TestCase):
+    """
+    Group of related Unit Tests
+    """
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def setUp(self, connect):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule,
+                                                 exit_json=exit_json,
+                                                 fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+        self.restapi = IBMSVCRestApi(self.mock_module_helper, '1.2.3.4',
+                                     'domain.ibm.com', 'username', 'password',
+                                     False, 'test.log', '')
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+
+    def events(self, *sequence_numbers):
+        return [{'sequence_number': str(n), 'status': 'alert', 'fixed': 'no'} for n in sequence_numbers]
+
+    def run_module(self, args):
+        module_args = {
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password'
+        }
+        module_args.update(args)
+        set_module_args(module_args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            IBMSVEventlogInfo().apply()
+        return exc.value.args[0]
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_read_all_events(self, svc_authorize_mock, svc_obj_info_mock):
+        svc_obj_info_mock.return_value = iter(self.events(12, 10, 11))
+        ret = self.run_module({})
+        self.assertFalse(ret['changed'])
+        self.assertEqual(ret['events'], self.events(10, 11, 12))
+        self.assertEqual(ret['count'], 3)
+        self.assertEqual(ret['last_sequence_number'], 12)
+        svc_obj_info_mock.assert_called_once_with(cmd='lseventlog', cmdopts=None, cmdargs=None, stream=True)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_read_new_events_with_state(self, svc_authorize_mock, svc_obj_info_mock):
+        svc_obj_info_mock.return_value = iter(self.events(10, 11))
+        ret = self.run_module({'state_path': self.path})
+        self.assertEqual(ret['last_sequence_number'], 11)
+
+        svc_obj_info_mock.return_value = iter(self.events(10, 11, 12, 13))
+        ret = self.run_module({'state_path': self.path})
+        self.assertEqual(ret['events'], self.events(12, 13))
+        self.assertEqual(ret['last_sequence_number'], 13)
+
+        svc_obj_info_mock.return_value = iter(self.events(10, 11, 12, 13))
+        ret = self.run_module({'state_path': self.path})
+        self.assertEqual(ret['events'], [])
+        self.assertEqual(ret['last_sequence_number'], 13)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_read_events_with_filters(self, svc_authorize_mock, svc_obj_info_mock):
+        svc_obj_info_mock.return_value = iter(self.events(10, 11))
+        ret = self.run_module({'since_sequence_number': 10, 'status': ['alert'], 'fixed': True})
+        self.assertEqual(ret['events'], self.events(11))
+        svc_obj_info_mock.assert_called_once_with(
+            cmd='lseventlog',
+            cmdopts={'alert': 'yes', 'message': 'no', 'monitoring': 'no', 'expired': 'no', 'fixed': 'yes'},
+            cmdargs=None,
+            stream=True
+        )
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_write_events_to_output(self, svc_authorize_mock, svc_obj_info_mock):
+        output = os.path.join(self.path, 'events.jsonl')
+        svc_obj_info_mock.return_value = iter(self.events(10, 11))
+        ret = self.run_module({'state_path': self.path, 'output_path': output})
+        self.assertEqual(ret['events'], [])
+        self.assertEqual(ret['count'], 2)
+
+        svc_obj_info_mock.return_value = iter(self.events(10, 11, 12))
+        self.run_module({'state_path': self.path, 'output_path': output})
+        with open(output) as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(lines, self.events(10, 11, 12))
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_check_mode_keeps_state(self, svc_authorize_mock, svc_obj_info_mock):
+        output = os.path.join(self.path, 'events.jsonl')
+        svc_obj_info_mock.return_value = iter(self.events(10, 11))
+        ret = self.run_module({'state_path': self.path, 'output_path': output, '_ansible_check_mode': True})
+        self.assertEqual(ret['count'], 2)
+        self.assertFalse(os.path.exists(output))
+
+        svc_obj_info_mock.return_value = iter(self.events(10, 11))
+        ret = self.run_module({'state_path': self.path})
+        self.assertEqual(ret['count'], 2)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_negative_sequence_number(self, svc_authorize_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'since_sequence_number': -1
+        })
+        with pytest.raises(AnsibleFailJson) as exc:
+            IBMSVEventlogInfo().apply()
+        self.assertEqual(exc.value.args[0]['msg'], 'since_sequence_number(-1) must not be negative')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,208 @@
+# Copyright (C) 2023 IBM CORPORATION
+# Author(s): Sanjaikumaar M <sanjaikumaar.m@ibm.com>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" unit tests IBM Spectrum Virtualize Ansible module: ibm_sv_stats_info """
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import unittest
+import pytest
+import gzip
+import json
+import itertools
+import os
+import shutil
+import tempfile
+from mock import patch
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi
+from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_sv_stats_info import IBMSVStatsInfo
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module
+    creation """
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the
+    test case """
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the
+    test case """
+    pass
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over exit_json; package return data into an
+    exception """
+    if 'changed' not in kwargs:
+        kwargs['changed'] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):
+    """function to patch over fail_json; package return data into an
+    exception """
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class TestIBMSVStatsInfo(unittest.TestCase):
+    """
+    Group of related Unit Tests
+    """
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def setUp(self, connect):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule,
+                                                 exit_json=exit_json,
+                                                 fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+        self.restapi = IBMSVCRestApi(self.mock_module_helper, '1.2.3.4',
+                                     'domain.ibm.com', 'username', 'password',
+                                     False, 'test.log', '')
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+
+    def run_module(self, args):
+        module_args = {
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password'
+        }
+        module_args.update(args)
+        set_module_args(module_args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            IBMSVStatsInfo().apply()
+        return exc.value.args[0]
+
+    def mock_clock(self, time_mock):
+        time_mock.time.side_effect = itertools.count(1000, 1)
+        time_mock.localtime.side_effect = lambda t: t
+        time_mock.strftime.side_effect = lambda fmt, t: str(t)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_sv_stats_info.time')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_sample_node_stats(self, svc_authorize_mock, svc_obj_info_mock, time_mock):
+        self.mock_clock(time_mock)
+        samples = iter([
+            [{'node_id': '1', 'node_name': 'node1', 'stat_name': 'vdisk_ms', 'stat_current': '2'},
+             {'node_id': '1', 'node_name': 'node1', 'stat_name': 'cpu_pc', 'stat_current': '7'},
+             {'node_id': '2', 'node_name': 'node2', 'stat_name': 'vdisk_ms', 'stat_current': '0.5'}],
+            [{'node_id': '1', 'node_name': 'node1', 'stat_name': 'vdisk_ms', 'stat_current': '3'}],
+            [{'node_id': '1', 'node_name': 'node1', 'stat_name': 'vdisk_ms', 'stat_current': '4'},
+             {'node_id': '2', 'node_name': 'node2', 'stat_name': 'vdisk_ms', 'stat_current': '1'}]
+        ])
+        svc_obj_info_mock.side_effect = lambda cmd, cmdopts, cmdargs, cache: next(samples)
+        ret = self.run_module({'stats': ['node'], 'metrics': ['vdisk_ms'], 'interval': 5, 'duration': 10})
+        self.assertFalse(ret['changed'])
+        self.assertEqual(ret['samples'], 3)
+        self.assertEqual(ret['series_names'], ['node1.vdisk_ms', 'node2.vdisk_ms'])
+        self.assertEqual(ret['series'], {'node1.vdisk_ms': [2, 3, 4], 'node2.vdisk_ms': [0.5, None, 1]})
+        self.assertEqual(len(ret['timestamps']), 3)
+        svc_obj_info_mock.assert_called_with(cmd='lsnodestats', cmdopts=None, cmdargs=None, cache=False)
+        # The samples are scheduled 5 seconds apart from the start
+        self.assertEqual([c[0][0] for c in time_mock.sleep.call_args_list], [3, 6])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_system_stats_history(self, svc_authorize_mock, svc_obj_info_mock):
+        svc_obj_info_mock.return_value = [
+            {'sample_time': '230512134505', 'stat_name': 'vdisk_ms', 'stat_value': '1'},
+            {'sample_time': '230512134500', 'stat_name': 'vdisk_ms', 'stat_value': '2'},
+            {'sample_time': '230512134500', 'stat_name': 'vdisk_io', 'stat_value': '300'}
+        ]
+        ret = self.run_module({'mode': 'history', 'metrics': ['vdisk_ms', 'vdisk_io']})
+        self.assertEqual(ret['timestamps'], ['230512134500', '230512134505'])
+        self.assertEqual(ret['series'], {'system.vdisk_io': [300, None], 'system.vdisk_ms': [2, 1]})
+        svc_obj_info_mock.assert_called_once_with(cmd='lssystemstats', cmdopts={'history': 'vdisk_ms:vdisk_io'},
+                                                  cmdargs=None, cache=False)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_enclosure_stats_history(self, svc_authorize_mock, svc_obj_info_mock):
+        listings = {
+            'lsenclosure': [{'id': '1'}, {'id': '2'}],
+            'lsenclosurestats': [{'enclosure_id': '1', 'sample_time': '230512134500',
+                                  'stat_name': 'power_w', 'stat_value': '500'}]
+        }
+        svc_obj_info_mock.side_effect = lambda cmd, cmdopts, cmdargs, cache=True: listings[cmd]
+        ret = self.run_module({'mode': 'history', 'stats': ['enclosure'], 'metrics': ['power_w']})
+        self.assertEqual(ret['series'], {'1.power_w': [500]})
+        svc_obj_info_mock.assert_called_with(cmd='lsenclosurestats', cmdopts={'history': 'power_w'},
+                                             cmdargs=['2'], cache=False)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_write_csv_compressed(self, svc_authorize_mock, svc_obj_info_mock):
+        output = os.path.join(self.path, 'stats.csv.gz')
+        svc_obj_info_mock.return_value = [
+            {'sample_time': '230512134500', 'stat_name': 'vdisk_ms', 'stat_value': '2'},
+            {'sample_time': '230512134505', 'stat_name': 'vdisk_io', 'stat_value': '300'}
+        ]
+        ret = self.run_module({'mode': 'history', 'metrics': ['vdisk_ms', 'vdisk_io'], 'output_path': output,
+                               'output_format': 'csv', 'compress': True})
+        self.assertEqual((ret['timestamps'], ret['series'], ret['samples']), ([], {}, 2))
+        with gzip.open(output, 'rt') as f:
+            self.assertEqual(f.read(), 'timestamp,system.vdisk_io,system.vdisk_ms\n'
+                                       '230512134500,,2\n'
+                                       '230512134505,300,\n')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_write_ndjson(self, svc_authorize_mock, svc_obj_info_mock):
+        output = os.path.join(self.path, 'stats.jsonl')
+        svc_obj_info_mock.return_value = [
+            {'sample_time': '230512134500', 'stat_name': 'vdisk_ms', 'stat_value': '2'}
+        ]
+        self.run_module({'mode': 'history', 'metrics': ['vdisk_ms'], 'output_path': output})
+        with open(output) as f:
+            self.assertEqual([json.loads(line) for line in f],
+                             [{'timestamp': '230512134500', 'system.vdisk_ms': 2}])
+
+        os.remove(output)
+        self.run_module({'mode': 'history', 'metrics': ['vdisk_ms'], 'output_path': output,
+                         '_ansible_check_mode': True})
+        self.assertFalse(os.path.exists(output))
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_history_without_metrics(self, svc_authorize_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'mode': 'history'
+        })
+        with pytest.raises(AnsibleFailJson) as exc:
+            IBMSVStatsInfo().apply()
+        self.assertEqual(exc.value.args[0]['msg'], 'Missing mandatory parameter: metrics (required when mode=history)')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,10 +12,12 @@ __metaclass__ = type
 import unittest
 import pytest
 import json
+import shutil
+import tempfile
 from mock import patch
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
-from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi, IBMSVCRestApiError
 from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_svc_info import IBMSVCGatherInfo
 
 
@@ -166,6 +168,389 @@ class TestIBMSVCGatherInfo(unittest.TestCase):
         self.assertDictEqual(exc.value.args[0]['Host'][0], host_ret[0])
         self.assertDictEqual(exc.value.args[0]['Volume'][0], vol_ret[0])
 
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_gather_info_with_parallelism(self, svc_authorize_mock,
+                                          svc_obj_info_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': 'host,vol,pool',
+            'parallelism': 3
+        })
+        listings = {
+            'lshost': [{"id": "1", "name": "ansible_host"}],
+            'lsvdisk': [{"id": "0", "name": "ansible_vol"}],
+            'lsmdiskgrp': [{"id": "0", "name": "ansible_pool"}]
+        }
+        svc_obj_info_mock.side_effect = lambda cmd, cmdopts, cmdargs, stream: listings[cmd]
+        with pytest.raises(AnsibleExitJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertFalse(exc.value.args[0]['changed'])
+        self.assertEqual(exc.value.args[0]['Host'], listings['lshost'])
+        self.assertEqual(exc.value.args[0]['Volume'], listings['lsvdisk'])
+        self.assertEqual(exc.value.args[0]['Pool'], listings['lsmdiskgrp'])
+        self.assertEqual(svc_obj_info_mock.call_count, 3)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_gather_info_with_parallelism_failure(self, svc_authorize_mock,
+                                                  svc_obj_info_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': 'host,vol',
+            'parallelism': 2
+        })
+        rest = {'code': 403, 'err': 'HTTPError', 'out': None}
+
+        def obj_info(cmd, cmdopts, cmdargs, stream):
+            if cmd == 'lsvdisk':
+                raise IBMSVCRestApiError(rest)
+            return []
+
+        svc_obj_info_mock.side_effect = obj_info
+        with pytest.raises(AnsibleFailJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertTrue(exc.value.args[0]['failed'])
+        self.assertEqual(exc.value.args[0]['msg'], rest)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_gather_info_with_invalid_parallelism(self, svc_authorize_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': 'host',
+            'parallelism': 0
+        })
+        with pytest.raises(AnsibleFailJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertTrue(exc.value.args[0]['failed'])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_gather_info_with_filters_and_attributes(self, svc_authorize_mock,
+                                                     svc_obj_info_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': 'vol',
+            'filters': 'mdisk_grp_name=Pool0',
+            'attributes': ['name', 'capacity']
+        })
+        svc_obj_info_mock.return_value = [
+            {"id": "0", "name": "vol0", "capacity": "4.00GB", "mdisk_grp_name": "Pool0"},
+            {"id": "1", "name": "vol1", "capacity": "8.00GB", "mdisk_grp_name": "Pool0"}
+        ]
+        with pytest.raises(AnsibleExitJson) as exc:
+            IBMSVCGatherInfo().apply()
+        svc_obj_info_mock.assert_called_with(cmd='lsvdisk',
+                                             cmdopts={'filtervalue': 'mdisk_grp_name=Pool0'},
+                                             cmdargs=None,
+                                             stream=True)
+        self.assertEqual(exc.value.args[0]['Volume'], [
+            {"name": "vol0", "capacity": "4.00GB"},
+            {"name": "vol1", "capacity": "8.00GB"}
+        ])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_gather_info_attributes_with_objectname(self, svc_authorize_mock,
+                                                    svc_obj_info_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': 'host',
+            'objectname': 'host0',
+            'attributes': ['name', 'status']
+        })
+        svc_obj_info_mock.return_value = {"id": "1", "name": "host0", "status": "online", "port_count": "2"}
+        with pytest.raises(AnsibleExitJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertEqual(exc.value.args[0]['Host'], {"name": "host0", "status": "online"})
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_gather_info_filters_with_multiple_subsets(self, svc_authorize_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': 'vol,host',
+            'filters': 'name=vol0'
+        })
+        with pytest.raises(AnsibleFailJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertTrue(exc.value.args[0]['failed'])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_gather_info_filters_with_objectname(self, svc_authorize_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': 'vol',
+            'objectname': 'vol0',
+            'filters': 'name=vol0'
+        })
+        with pytest.raises(AnsibleFailJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertEqual(exc.value.args[0]['msg'], 'Parameters objectname and filters are mutually exclusive')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_gather_info_with_topology(self, svc_authorize_mock,
+                                       svc_obj_info_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': 'vol,vdiskcopy,hostvdiskmap,pool,mdisk,fcmap,rcrelationship,volumegroup',
+            'topology': True
+        })
+        listings = {
+            'lsvdisk': [{"id": "0", "name": "vol0", "mdisk_grp_name": "pool0", "volume_group_name": "vg0",
+                         "capacity": "1073741824", "vdisk_UID": "6005076810CA0166C000000000000001"},
+                        {"id": "1", "name": "vol1", "mdisk_grp_name": "many", "volume_group_name": "",
+                         "capacity": "2147483648", "vdisk_UID": "6005076810CA0166C000000000000002"}],
+            'lsvdiskcopy': [{"vdisk_name": "vol0", "copy_id": "0", "mdisk_grp_name": "pool0"},
+                            {"vdisk_name": "vol1", "copy_id": "0", "mdisk_grp_name": "pool0"},
+                            {"vdisk_name": "vol1", "copy_id": "1", "mdisk_grp_name": "pool1"}],
+            'lshostvdiskmap': [{"id": "0", "name": "host0", "vdisk_name": "vol0", "SCSI_id": "0"},
+                               {"id": "0", "name": "host0", "vdisk_name": "vol1", "SCSI_id": "1"},
+                               {"id": "1", "name": "host1", "vdisk_name": "vol1", "SCSI_id": "0"}],
+            'lsmdiskgrp': [{"id": "0", "name": "pool0", "mdisk_count": "1", "overallocation": "12.5"},
+                           {"id": "1", "name": "pool1", "mdisk_count": "1", "overallocation": "0"}],
+            'lsmdisk': [{"id": "0", "name": "mdisk0", "mdisk_grp_name": "pool0"},
+                        {"id": "1", "name": "mdisk1", "mdisk_grp_name": "pool1"}],
+            'lsfcmap': [{"id": "0", "name": "fcmap0", "source_vdisk_name": "vol0", "target_vdisk_name": "vol1"}],
+            'lsrcrelationship': [{"id": "0", "name": "rcrel0", "master_vdisk_name": "vol0",
+                                  "aux_vdisk_name": "vol0_aux"}],
+            'lsvolumegroup': [{"id": "0", "name": "vg0", "volume_count": "1"}]
+        }
+        svc_obj_info_mock.side_effect = lambda cmd, cmdopts, cmdargs, stream: (item for item in listings[cmd])
+        with pytest.raises(AnsibleExitJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertEqual(exc.value.args[0]['Volume'], listings['lsvdisk'])
+        cmdopts = dict((c[1]['cmd'], c[1]['cmdopts']) for c in svc_obj_info_mock.call_args_list)
+        self.assertEqual(dict((cmd, opts) for cmd, opts in cmdopts.items() if opts),
+                         {'lsvdisk': {'bytes': True}, 'lsmdiskgrp': {'bytes': True}, 'lsmdisk': {'bytes': True}})
+        topology = exc.value.args[0]['Topology']
+        self.assertEqual(topology['volumes']['vol0'], {
+            "id": 0, "name": "vol0", "mdisk_grp_name": "pool0", "volume_group_name": "vg0",
+            "capacity": 1073741824, "vdisk_UID": "6005076810CA0166C000000000000001"
+        })
+        self.assertEqual(topology['pools']['pool0']['overallocation'], 12.5)
+        self.assertEqual(topology['volumegroups']['vg0']['volume_count'], 1)
+        self.assertEqual(topology['volume_hosts'], {'vol0': ['host0'], 'vol1': ['host0', 'host1']})
+        self.assertEqual(topology['host_volumes'], {'host0': ['vol0', 'vol1'], 'host1': ['vol1']})
+        self.assertEqual(topology['pool_volumes'], {'pool0': ['vol0', 'vol1'], 'pool1': ['vol1']})
+        self.assertEqual(topology['pool_mdisks'], {'pool0': ['mdisk0'], 'pool1': ['mdisk1']})
+        self.assertEqual(topology['volume_fcmaps'], {'vol0': ['fcmap0'], 'vol1': ['fcmap0']})
+        self.assertEqual(topology['volume_rcrelationships'], {'vol0': ['rcrel0'], 'vol0_aux': ['rcrel0']})
+        self.assertEqual(topology['volumegroup_volumes'], {'vg0': ['vol0']})
+
+    def test_normalize_keeps_identifiers(self):
+        self.assertEqual(IBMSVCGatherInfo.normalize({
+            "id": "0", "name": "rcrel0", "master_cluster_id": "0000020421600428",
+            "aux_cluster_id": "0000020421600429", "freeze_time": "", "progress": "100"
+        }), {
+            "id": 0, "name": "rcrel0", "master_cluster_id": "0000020421600428",
+            "aux_cluster_id": "0000020421600429", "freeze_time": "", "progress": 100
+        })
+        self.assertEqual(IBMSVCGatherInfo.normalize({
+            "id": "12", "name": "mdisk12", "ctrl_LUN_#": "0000000000000001", "controller_id": "0",
+            "capacity": "1099511627776", "ctrl_WWNN": "500507680100D8A4", "tier_capacity": "0.5",
+            "UID": "600507680281000e9800000000000000"
+        }), {
+            "id": 12, "name": "mdisk12", "ctrl_LUN_#": "0000000000000001", "controller_id": 0,
+            "capacity": 1099511627776, "ctrl_WWNN": "500507680100D8A4", "tier_capacity": 0.5,
+            "UID": "600507680281000e9800000000000000"
+        })
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_gather_info_topology_with_attributes(self, svc_authorize_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': 'vol',
+            'attributes': ['name'],
+            'topology': True
+        })
+        with pytest.raises(AnsibleFailJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertEqual(exc.value.args[0]['msg'], 'Parameters topology and attributes are mutually exclusive')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_gather_info_since_snapshot(self, svc_authorize_mock,
+                                        svc_obj_info_mock):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        args = {
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': 'vol,host',
+            'since_snapshot': path
+        }
+        listings = {
+            'lsvdisk': [{"id": "0", "name": "vol0"}, {"id": "1", "name": "vol1"}],
+            'lshost': [{"id": "0", "name": "host0"}]
+        }
+        svc_obj_info_mock.side_effect = lambda cmd, cmdopts, cmdargs, stream: (item for item in listings[cmd])
+
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertEqual(exc.value.args[0]['Volume'], listings['lsvdisk'])
+        self.assertEqual(exc.value.args[0]['Delta']['Volume'], {'added': ['0', '1'], 'changed': [], 'removed': []})
+
+        listings['lsvdisk'] = [{"id": "1", "name": "vol1", "capacity": "2.00GB"}, {"id": "2", "name": "vol2"}]
+        set_module_args(dict(args, _ansible_check_mode=True))
+        with pytest.raises(AnsibleExitJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertEqual(exc.value.args[0]['Volume'], [{"id": "2", "name": "vol2"},
+                                                       {"id": "1", "name": "vol1", "capacity": "2.00GB"}])
+        self.assertEqual(exc.value.args[0]['Delta']['Volume'], {'added': ['2'], 'changed': ['1'], 'removed': ['0']})
+        self.assertEqual(exc.value.args[0]['Host'], [])
+        self.assertEqual(exc.value.args[0]['Delta']['Host'], {'added': [], 'changed': [], 'removed': []})
+
+        # The check mode run did not update the snapshot
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertEqual(exc.value.args[0]['Delta']['Volume'], {'added': ['2'], 'changed': ['1'], 'removed': ['0']})
+
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertEqual(exc.value.args[0]['Volume'], [])
+        self.assertEqual(exc.value.args[0]['Delta']['Volume'], {'added': [], 'changed': [], 'removed': []})
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_gather_info_topology_with_since_snapshot(self, svc_authorize_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': 'vol',
+            'since_snapshot': '/tmp/snapshots',
+            'topology': True
+        })
+        with pytest.raises(AnsibleFailJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertEqual(exc.value.args[0]['msg'], 'Parameters topology and since_snapshot are mutually exclusive')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_gather_info_with_perf_summary(self, svc_authorize_mock,
+                                           svc_obj_info_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': 'host',
+            'perf_summary': True
+        })
+        svc_obj_info_mock.return_value = []
+        with pytest.raises(AnsibleExitJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertEqual(exc.value.args[0]['Host'], [])
+        self.assertIn('requests', exc.value.args[0]['_perf'])
+        self.assertIn('commands', exc.value.args[0]['_perf'])
+
+    @patch.object(IBMSVCRestApi, 'svc_obj_info', autospec=True)
+    @patch.object(IBMSVCRestApi, '_svc_authorize', autospec=True)
+    def test_gather_info_from_clusters(self, svc_authorize_mock, svc_obj_info_mock):
+        set_module_args({
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': ['pool'],
+            'cluster_parallelism': 2,
+            'clusters': [
+                {'clustername': 'cluster1'},
+                {'clustername': 'cluster2', 'username': 'admin2'}
+            ]
+        })
+        svc_authorize_mock.side_effect = lambda restapi: 'token-' + restapi.username
+        svc_obj_info_mock.side_effect = lambda restapi, cmd, cmdopts, cmdargs, stream: (
+            item for item in [{'name': 'Pool_' + restapi.clustername, 'token': restapi.token}])
+        with pytest.raises(AnsibleExitJson) as exc:
+            IBMSVCGatherInfo().apply()
+        clusters = exc.value.args[0]['Clusters']
+        self.assertEqual(sorted(clusters), ['cluster1', 'cluster2'])
+        self.assertEqual(clusters['cluster1']['Pool'], [{'name': 'Pool_cluster1', 'token': 'token-username'}])
+        self.assertEqual(clusters['cluster2']['Pool'], [{'name': 'Pool_cluster2', 'token': 'token-admin2'}])
+        self.assertNotIn('Volume', exc.value.args[0])
+
+    @patch.object(IBMSVCRestApi, 'svc_obj_info', autospec=True)
+    @patch.object(IBMSVCRestApi, '_svc_authorize', autospec=True)
+    def test_gather_info_from_clusters_unreachable(self, svc_authorize_mock, svc_obj_info_mock):
+        set_module_args({
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': ['pool'],
+            'clusters': [{'clustername': 'cluster1'}, {'clustername': 'cluster2'}]
+        })
+        svc_authorize_mock.side_effect = lambda restapi: None if restapi.clustername == 'cluster2' else 'token'
+        svc_obj_info_mock.side_effect = lambda restapi, cmd, cmdopts, cmdargs, stream: (
+            item for item in [{'name': 'Pool0'}])
+        with pytest.raises(AnsibleFailJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertEqual(exc.value.args[0]['msg'], 'Failed to gather info from clusters [cluster2]')
+        clusters = exc.value.args[0]['Clusters']
+        self.assertEqual(clusters['cluster1']['Pool'], [{'name': 'Pool0'}])
+        self.assertTrue(clusters['cluster2']['unreachable'])
+        self.assertEqual(clusters['cluster2']['msg'], 'Failed to obtain access token')
+
+    def test_gather_info_clustername_and_clusters(self):
+        set_module_args({
+            'clustername': 'cluster1',
+            'username': 'username',
+            'password': 'password',
+            'clusters': [{'clustername': 'cluster2'}]
+        })
+        with pytest.raises(AnsibleFailJson) as exc:
+            IBMSVCGatherInfo()
+        self.assertIn('mutually exclusive', exc.value.args[0]['msg'])
+
 
 if __name__ == '__main__':
     unittest.main()
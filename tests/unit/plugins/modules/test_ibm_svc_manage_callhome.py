@@ -8,13 +8,14 @@
 
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
+import itertools
 import unittest
 import pytest
 import json
 from mock import patch
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
-from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi, get_command_plan
 from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_svc_manage_callhome import IBMSVCCallhome
 
 
@@ -555,6 +556,65 @@ class TestIBMSVCCallhome(unittest.TestCase):
         data = ch.update_email_data()
         self.assertEqual(data, None)
 
+    def email_callhome_args(self):
+        return {
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'state': 'enabled',
+            'callhome_type': 'email',
+            'company_name': 'company_name',
+            'address': 'address',
+            'city': 'city',
+            'province': 'PRV',
+            'postalcode': '123456',
+            'country': 'US',
+            'location': 'location',
+            'contact_name': 'contact_name',
+            'contact_email': 'test@domain.com',
+            'phonenumber_primary': '1234567890',
+            'serverIP': '9.20.118.16',
+            'serverPort': 25
+        }
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_callhome.time')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_manage_support_email_user_creates_user(self, mock_svc_authorize, mock_soi, mock_src, mock_time):
+        set_module_args(self.email_callhome_args())
+        # UTC-5, callhome0 serves the US
+        mock_time.timezone = 18000
+        mock_soi.return_value = [{'id': '0', 'address': 'test@domain.com', 'user_type': 'local', 'inventory': 'off'}]
+        mock_src.return_value = {'id': '1', 'message': 'User, id [1], successfully created'}
+        ch = IBMSVCCallhome()
+        ch.manage_support_email_user()
+        mock_src.assert_called_once_with('mkemailuser', {'address': 'callhome0@de.ibm.com', 'usertype': 'support',
+                                                         'info': 'off', 'warning': 'off'}, None)
+        self.assertTrue(ch.changed)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_callhome.time')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_manage_support_email_user_updates_address(self, mock_svc_authorize, mock_soi, mock_src, mock_time):
+        set_module_args(self.email_callhome_args())
+        # UTC+1, callhome1 serves the rest of the world
+        mock_time.timezone = -3600
+        mock_soi.return_value = [{'id': '1', 'address': 'callhome0@de.ibm.com', 'user_type': 'support', 'inventory': 'off'}]
+        ch = IBMSVCCallhome()
+        ch.manage_support_email_user()
+        mock_src.assert_called_once_with('chemailuser', {'address': 'callhome1@de.ibm.com'}, ['1'])
+
     @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
            'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
     @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
@@ -809,6 +869,102 @@ class TestIBMSVCCallhome(unittest.TestCase):
         data = ch.enable_cloud_callhome()
         self.assertEqual(data, None)
 
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.time.sleep')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_callhome.IBMSVCCallhome.test_connection_cloud_callhome')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_callhome.IBMSVCCallhome.enable_cloud_callhome')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_callhome.IBMSVCCallhome.update_email_data')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_callhome.IBMSVCCallhome.manage_proxy_server')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_initiate_cloud_callhome_waits_for_enabled(self, mock_svc_authorize, mock_soi, mps, ued,
+                                                       ecc, tcc, mock_sleep):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'state': 'enabled',
+            'callhome_type': 'cloud services',
+            'company_name': 'company_name',
+            'address': 'address',
+            'city': 'city',
+            'province': 'PRV',
+            'postalcode': '123456',
+            'country': 'US',
+            'location': 'location',
+            'contact_name': 'contact_name',
+            'contact_email': 'test@domain.com',
+            'phonenumber_primary': '1234567890',
+            'serverIP': '9.20.118.16',
+            'serverPort': 25,
+            'proxy_type': 'no_proxy',
+            'wait_timeout': 10
+        })
+        mock_soi.side_effect = [
+            {'status': 'disabled', 'connection': ''},
+            {'status': 'enabling', 'connection': ''},
+            {'status': 'enabled', 'connection': ''}
+        ]
+        ch = IBMSVCCallhome()
+        msg = ch.initiate_cloud_callhome()
+        self.assertEqual(msg, 'Callhome with Cloud enabled successfully.')
+        ecc.assert_called_once_with()
+        tcc.assert_called_once_with()
+        self.assertEqual(mock_sleep.call_count, 1)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.time.sleep')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_callhome.IBMSVCCallhome.test_connection_cloud_callhome')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_callhome.IBMSVCCallhome.enable_cloud_callhome')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_callhome.IBMSVCCallhome.update_email_data')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_callhome.IBMSVCCallhome.manage_proxy_server')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_initiate_cloud_callhome_wait_timeout(self, mock_svc_authorize, mock_soi, mps, ued,
+                                                  ecc, tcc, mock_sleep):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'state': 'enabled',
+            'callhome_type': 'cloud services',
+            'company_name': 'company_name',
+            'address': 'address',
+            'city': 'city',
+            'province': 'PRV',
+            'postalcode': '123456',
+            'country': 'US',
+            'location': 'location',
+            'contact_name': 'contact_name',
+            'contact_email': 'test@domain.com',
+            'phonenumber_primary': '1234567890',
+            'serverIP': '9.20.118.16',
+            'serverPort': 25,
+            'proxy_type': 'no_proxy',
+            'wait_timeout': 10
+        })
+        mock_soi.return_value = {'status': 'disabled', 'connection': ''}
+        ch = IBMSVCCallhome()
+        with patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+                   'ibm_svc_utils.time.time', side_effect=itertools.count(0, 3)):
+            msg = ch.initiate_cloud_callhome()
+        self.assertEqual(msg, 'Callhome with Cloud is enabled. Please check connection to proxy.')
+        tcc.assert_not_called()
+
     @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
            'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
     @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
@@ -842,6 +998,56 @@ class TestIBMSVCCallhome(unittest.TestCase):
         data = ch.disable_cloud_callhome()
         self.assertEqual(data, None)
 
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_enable_cloud_callhome_check_mode_plans_commands(self, mock_svc_authorize, mock_soi, mock_src):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'state': 'enabled',
+            'callhome_type': 'cloud services',
+            'company_name': 'company_name',
+            'address': 'address',
+            'city': 'city',
+            'province': 'PRV',
+            'postalcode': '123456',
+            'country': 'US',
+            'location': 'location',
+            'contact_name': 'contact_name',
+            'contact_email': 'test@domain.com',
+            'phonenumber_primary': '1234567890',
+            'proxy_url': 'http://h-proxy3.ssd.hursley.ibm.com',
+            'proxy_port': 3128,
+            'proxy_type': 'open_proxy',
+            '_ansible_check_mode': True
+        })
+        listings = {
+            'lsproxy': {'enabled': 'no'},
+            'lscloudcallhome': {'status': 'disabled', 'connection': ''},
+            'lssystem': {'inventory_mail_interval': '0', 'enhanced_callhome': 'on'}
+        }
+        mock_soi.side_effect = lambda cmd, cmdopts, cmdargs: listings[cmd]
+        get_command_plan().reset()
+        self.addCleanup(get_command_plan().reset)
+        ch = IBMSVCCallhome()
+        with pytest.raises(AnsibleExitJson) as exc:
+            ch.apply()
+        mock_src.assert_not_called()
+        result = exc.value.args[0]
+        self.assertTrue(result['changed'])
+        self.assertEqual([c['cmd'] for c in result['command_plan']], ['mkproxy', 'chemail', 'chcloudcallhome', 'chsystem'])
+        self.assertEqual(result['command_plan'][0]['opts'], {'url': 'http://h-proxy3.ssd.hursley.ibm.com', 'port': 3128})
+        self.assertEqual(result['command_plan'][2], {'cluster': 'clustername', 'cmd': 'chcloudcallhome',
+                                                     'opts': {'enable': True}, 'args': []})
+        self.assertEqual(result['command_plan'][3]['opts'], {'enhancedcallhome': 'off', 'censorcallhome': 'off'})
+        self.assertEqual(result['round_trips']['writes'], 4)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -14,7 +14,7 @@ import json
 from mock import patch
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
-from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi, get_command_plan
 from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_svc_manage_migration import IBMSVCMigrate
 
 
@@ -194,6 +194,8 @@ class TestIBMSVCMigrate(unittest.TestCase):
         dps.return_value = "9.71.42.198"
         m = IBMSVCMigrate()
         data = m.construct_remote_rest()
+        self.assertIs(m.construct_remote_rest(), data)
+        dps.assert_called_once_with()
 
     @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
            'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
@@ -1608,6 +1610,431 @@ class TestIBMSVCMigrate(unittest.TestCase):
             m.apply()
         self.assertFalse(exc.value.args[0]['changed'])
 
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.time.sleep')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_wait_for_sync(self, auth, soi, sleep_mock):
+        set_module_args({
+            "source_volume": "tesla",
+            "target_volume": "tesla_target",
+            "clustername": "x.x.x.x",
+            "remote_cluster": "Cluster_x.x.x.x",
+            "username": "username",
+            "password": "password",
+            "state": "initiate",
+            "remote_username": "remote_username",
+            "remote_password": "remote_password",
+            "relationship_name": "migrate_tesla",
+            "remote_pool": "site2pool1",
+            "wait": True,
+            "wait_timeout": 60
+        })
+        soi.side_effect = [
+            {"name": "migrate_tesla", "state": "inconsistent_copying"},
+            {"name": "migrate_tesla", "state": "inconsistent_copying"},
+            {"name": "migrate_tesla", "state": "consistent_synchronized"}
+        ]
+        m = IBMSVCMigrate()
+        m.wait_for_sync()
+        soi.assert_called_with('lsrcrelationship', None, ['migrate_tesla'], cache=False)
+        self.assertEqual(sleep_mock.call_count, 2)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_wait')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_wait_for_sync_timeout(self, auth, wait_mock):
+        set_module_args({
+            "source_volume": "tesla",
+            "target_volume": "tesla_target",
+            "clustername": "x.x.x.x",
+            "remote_cluster": "Cluster_x.x.x.x",
+            "username": "username",
+            "password": "password",
+            "state": "initiate",
+            "remote_username": "remote_username",
+            "remote_password": "remote_password",
+            "relationship_name": "migrate_tesla",
+            "remote_pool": "site2pool1",
+            "wait": True,
+            "wait_timeout": 60
+        })
+        wait_mock.return_value = (False, {"name": "migrate_tesla", "state": "inconsistent_copying"})
+        m = IBMSVCMigrate()
+        with pytest.raises(AnsibleFailJson) as exc:
+            m.wait_for_sync()
+        self.assertEqual(exc.value.args[0]['msg'],
+                         "Migration relationship [migrate_tesla] is not synchronized after 60 seconds, "
+                         "current state [inconsistent_copying]")
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_migration.IBMSVCMigrate.create_remote_hosts')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_replicate_source_hosts_concurrently(self, auth, soi, crh):
+        set_module_args({
+            "source_volume": "tesla",
+            "target_volume": "tesla_target",
+            "clustername": "x.x.x.x",
+            "remote_cluster": "Cluster_x.x.x.x",
+            "username": "username",
+            "password": "password",
+            "state": "initiate",
+            "replicate_hosts": True,
+            "parallelism": 4,
+            "remote_username": "remote_username",
+            "remote_password": "remote_password",
+            "relationship_name": "migrate_tesla",
+            "remote_pool": "site2pool1"
+        })
+        hosts = ['host%d' % i for i in range(10)]
+        soi.side_effect = lambda cmd, cmdopts, cmdargs: {
+            'name': cmdargs[0],
+            'nodes': [{'WWPN': 'WWPN_%s' % cmdargs[0], 'state': 'active'}]
+        }
+        m = IBMSVCMigrate()
+        m.replicate_source_hosts([{'host_name': host} for host in hosts])
+        self.assertEqual(soi.call_count, 10)
+        hosts_wwpn, hosts_iscsi, target_volume = crh.call_args[0]
+        self.assertEqual(hosts_wwpn, dict(('host%d' % i, ['WWPN_host%d' % i]) for i in range(10)))
+        self.assertEqual(hosts_iscsi, {})
+        self.assertIsNone(target_volume)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_migration.IBMSVCMigrate.create_remote_hosts')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_replicate_source_hosts_reports_every_failed_host(self, auth, soi, crh):
+        set_module_args({
+            "source_volume": "tesla",
+            "target_volume": "tesla_target",
+            "clustername": "x.x.x.x",
+            "remote_cluster": "Cluster_x.x.x.x",
+            "username": "username",
+            "password": "password",
+            "state": "initiate",
+            "replicate_hosts": True,
+            "parallelism": 4,
+            "remote_username": "remote_username",
+            "remote_password": "remote_password",
+            "relationship_name": "migrate_tesla",
+            "remote_pool": "site2pool1"
+        })
+
+        def lshost(cmd, cmdopts, cmdargs):
+            if cmdargs[0] in ('host1', 'host3'):
+                raise Exception('CMMVC5753E The specified object does not exist.')
+            return {'name': cmdargs[0], 'nodes': []}
+        soi.side_effect = lshost
+        m = IBMSVCMigrate()
+        with pytest.raises(AnsibleFailJson) as exc:
+            m.replicate_source_hosts([{'host_name': 'host%d' % i} for i in range(4)])
+        self.assertEqual(exc.value.args[0]['msg'], 'Failed to get host details for hosts [host1, host3].')
+        self.assertEqual(sorted(exc.value.args[0]['host_errors']), ['host1', 'host3'])
+        crh.assert_not_called()
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_migration.IBMSVCMigrate.map_host_vol_remote')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_migration.IBMSVCMigrate.construct_remote_rest')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_migration.IBMSVCMigrate.return_remote_hosts')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_create_remote_hosts_uses_one_session(self, auth, rrh, crr, mhvr):
+        set_module_args({
+            "source_volume": "tesla",
+            "target_volume": "tesla_target",
+            "clustername": "x.x.x.x",
+            "remote_cluster": "Cluster_x.x.x.x",
+            "username": "username",
+            "password": "password",
+            "state": "initiate",
+            "replicate_hosts": True,
+            "parallelism": 4,
+            "remote_username": "remote_username",
+            "remote_password": "remote_password",
+            "relationship_name": "migrate_tesla",
+            "remote_pool": "site2pool1"
+        })
+        rrh.return_value = ['host0']
+        crr.return_value.svc_run_command.return_value = {'id': '1', 'message': 'Host, id [1], successfully created'}
+        m = IBMSVCMigrate()
+        m.create_remote_hosts({'host0': ['WWPN0'], 'host1': ['WWPN1', 'WWPN2']},
+                              {'host2': ['iqn.host2']})
+        crr.assert_called_once_with()
+        calls = sorted(c[0][1]['name'] for c in crr.return_value.svc_run_command.call_args_list)
+        self.assertEqual(calls, ['host1', 'host2'])
+        self.assertEqual(sorted(mhvr.call_args[0][0]), ['host0', 'host1', 'host2'])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_migration.IBMSVCMigrate.construct_remote_rest')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_map_host_vol_remote_partial_failure(self, auth, crr):
+        set_module_args({
+            "source_volume": "tesla",
+            "target_volume": "tesla_target",
+            "clustername": "x.x.x.x",
+            "remote_cluster": "Cluster_x.x.x.x",
+            "username": "username",
+            "password": "password",
+            "state": "initiate",
+            "replicate_hosts": True,
+            "parallelism": 4,
+            "remote_username": "remote_username",
+            "remote_password": "remote_password",
+            "relationship_name": "migrate_tesla",
+            "remote_pool": "site2pool1"
+        })
+
+        def mkvdiskhostmap(cmd, cmdopts, cmdargs):
+            if cmdopts['host'] == 'host1':
+                return ''
+            return {'id': '0', 'message': 'Virtual Disk to Host map, id [0], successfully created'}
+        crr.return_value.svc_run_command.side_effect = mkvdiskhostmap
+        m = IBMSVCMigrate()
+        with pytest.raises(AnsibleFailJson) as exc:
+            m.map_host_vol_remote(['host0', 'host1', 'host2'])
+        self.assertEqual(exc.value.args[0]['msg'], 'Failed to map the target volume for hosts [host1].')
+        self.assertEqual(exc.value.args[0]['host_errors'], {'host1': 'Failed to create vdiskhostmap.'})
+        self.assertTrue(m.changed)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_initiate_check_mode_plans_commands(self, auth, soi, src):
+        set_module_args({
+            "source_volume": "tesla",
+            "target_volume": "tesla_target",
+            "clustername": "x.x.x.x",
+            "remote_cluster": "Cluster_x.x.x.x",
+            "username": "username",
+            "password": "password",
+            "state": "initiate",
+            "replicate_hosts": True,
+            "remote_username": "remote_username",
+            "remote_password": "remote_password",
+            "relationship_name": "migrate_tesla",
+            "remote_pool": "site2pool1",
+            "_ansible_check_mode": True
+        })
+        listings = {
+            ('lspartnership', 'Cluster_x.x.x.x'): {'location': 'remote', 'console_IP': 'y.y.y.y:443'},
+            ('lsvdisk', 'tesla'): [{'name': 'tesla', 'capacity': '1073741824', 'RC_name': ''}],
+            ('lsvdiskhostmap', 'tesla'): [{'host_name': 'host0'}, {'host_name': 'host1'}],
+            ('lshost', 'host0'): {'name': 'host0', 'nodes': [{'WWPN': '2100000E1EC228B9'}]},
+            ('lshost', 'host1'): {'name': 'host1', 'nodes': [{'WWPN': '2100000E1EC228B8'}]},
+            ('lshost', None): [{'name': 'host0'}]
+        }
+        soi.side_effect = lambda cmd, cmdopts, cmdargs: listings.get((cmd, cmdargs[0] if cmdargs else None))
+        get_command_plan().reset()
+        self.addCleanup(get_command_plan().reset)
+        m = IBMSVCMigrate()
+        with pytest.raises(AnsibleExitJson) as exc:
+            m.apply()
+        src.assert_not_called()
+        result = exc.value.args[0]
+        self.assertTrue(result['changed'])
+        self.assertEqual([(c['cluster'], c['cmd'], c['opts'].get('name') or c['opts'].get('host') or c['args'][0])
+                          for c in result['command_plan']], [
+            ('y.y.y.y', 'mkvolume', 'tesla_target'),
+            ('x.x.x.x', 'mkrcrelationship', 'migrate_tesla'),
+            ('y.y.y.y', 'mkhost', 'host1'),
+            ('y.y.y.y', 'mkvdiskhostmap', 'host0'),
+            ('y.y.y.y', 'mkvdiskhostmap', 'host1'),
+            ('x.x.x.x', 'startrcrelationship', 'migrate_tesla')
+        ])
+        self.assertEqual(result['command_plan'][2]['opts'], {'name': 'host1', 'force': True, 'fcwwpn': '2100000E1EC228B8'})
+        self.assertEqual(result['round_trips']['writes'], 6)
+
+    def set_volumes_args(self, **kwargs):
+        args = {
+            "clustername": "x.x.x.x",
+            "remote_cluster": "Cluster_x.x.x.x",
+            "username": "username",
+            "password": "password",
+            "state": "initiate",
+            "remote_username": "remote_username",
+            "remote_password": "remote_password",
+            "remote_pool": "site2pool1",
+            "parallelism": 2,
+            "volumes": [
+                {"source_volume": "vol0", "target_volume": "vol0_target", "relationship_name": "migrate_vol0"},
+                {"source_volume": "vol1", "target_volume": "vol1_target", "relationship_name": "migrate_vol1"}
+            ]
+        }
+        args.update(kwargs)
+        set_module_args(args)
+
+    def fake_source_system(self, relationships=None, groups=None):
+        def svc_obj_info(cmd, cmdopts, cmdargs):
+            if cmd == 'lsrcrelationship':
+                return (relationships or {}).get(cmdargs[0])
+            if cmd == 'lsrcconsistgrp':
+                return (groups or {}).get(cmdargs[0])
+            if cmd == 'lsvdisk' and cmdargs[0] != 'missing':
+                return [{"name": cmdargs[0], "capacity": "1073741824", "RC_name": "", "mdisk_grp_name": "pool0"}]
+            return None
+        return svc_obj_info
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_migration.IBMSVCMigrate.construct_remote_rest')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_migrate_volumes(self, auth, soi, src, crr):
+        self.set_volumes_args()
+        soi.side_effect = self.fake_source_system()
+        src.return_value = {"id": "1", "message": "RC Relationship, id [1], successfully created"}
+        crr.return_value.svc_obj_info.return_value = None
+        crr.return_value.svc_run_command.return_value = {"id": "5", "message": "Volume, id [5], successfully created"}
+        m = IBMSVCMigrate()
+        with pytest.raises(AnsibleExitJson) as exc:
+            m.apply()
+        self.assertTrue(exc.value.args[0]['changed'])
+        self.assertEqual([v['changed'] for v in exc.value.args[0]['volumes']], [True, True])
+        mkvolume = sorted(c[0][1]['name'] for c in crr.return_value.svc_run_command.call_args_list)
+        self.assertEqual(mkvolume, ['vol0_target', 'vol1_target'])
+        commands = sorted((c[0][0], c[0][1].get('name') or c[1]['cmdargs'][0]) for c in src.call_args_list)
+        self.assertEqual(commands, [('mkrcrelationship', 'migrate_vol0'), ('mkrcrelationship', 'migrate_vol1'),
+                                    ('startrcrelationship', 'migrate_vol0'), ('startrcrelationship', 'migrate_vol1')])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_migration.IBMSVCMigrate.construct_remote_rest')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_migrate_volumes_reports_each_failure(self, auth, soi, src, crr):
+        self.set_volumes_args(volumes=[
+            {"source_volume": "missing", "target_volume": "vol0_target", "relationship_name": "migrate_vol0"},
+            {"source_volume": "vol1", "target_volume": "vol1_target", "relationship_name": "migrate_vol1"}
+        ])
+        soi.side_effect = self.fake_source_system()
+        src.return_value = {"id": "1", "message": "RC Relationship, id [1], successfully created"}
+        crr.return_value.svc_obj_info.return_value = None
+        crr.return_value.svc_run_command.return_value = {"id": "5", "message": "Volume, id [5], successfully created"}
+        m = IBMSVCMigrate()
+        with pytest.raises(AnsibleFailJson) as exc:
+            m.apply()
+        self.assertEqual(exc.value.args[0]['msg'], 'Failed to migrate volumes [missing].')
+        self.assertTrue(exc.value.args[0]['changed'])
+        volumes = exc.value.args[0]['volumes']
+        self.assertEqual(volumes[0]['error'], 'Source Volume [missing] does not exist.')
+        self.assertNotIn('error', volumes[1])
+        self.assertTrue(volumes[1]['changed'])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_migration.IBMSVCMigrate.construct_remote_rest')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_migrate_volumes_records_host_replication_error(self, auth, soi, src, crr):
+        self.set_volumes_args(replicate_hosts=True)
+        source_system = self.fake_source_system()
+
+        def svc_obj_info(cmd, cmdopts, cmdargs):
+            if cmd == 'lsvdiskhostmap':
+                return [{'host_name': 'host_' + cmdargs[0]}]
+            if cmd == 'lshost' and cmdargs[0] == 'host_vol0':
+                raise Exception('CMMVC5753E The specified object does not exist.')
+            if cmd == 'lshost':
+                # host_vol1 was removed since its mapping was listed
+                return None
+            return source_system(cmd, cmdopts, cmdargs)
+        soi.side_effect = svc_obj_info
+        src.return_value = {"id": "1", "message": "RC Relationship, id [1], successfully created"}
+        crr.return_value.svc_obj_info.return_value = None
+        crr.return_value.svc_run_command.return_value = {"id": "5", "message": "Volume, id [5], successfully created"}
+        m = IBMSVCMigrate()
+        with pytest.raises(AnsibleFailJson) as exc:
+            m.apply()
+        self.assertEqual(exc.value.args[0]['msg'], 'Failed to migrate volumes [vol0].')
+        volumes = exc.value.args[0]['volumes']
+        self.assertEqual(volumes[0]['error'], 'Failed to get host details for hosts [host_vol0]. '
+                                              'host_vol0: CMMVC5753E The specified object does not exist.')
+        self.assertNotIn('error', volumes[1])
+        starts = [c[1]['cmdargs'][0] for c in src.call_args_list if c[0][0] == 'startrcrelationship']
+        self.assertEqual(starts, ['migrate_vol1'])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_migration.IBMSVCMigrate.construct_remote_rest')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_migrate_volumes_consistency_group(self, auth, soi, src, crr):
+        self.set_volumes_args(consistency_group="migrate_grp")
+        soi.side_effect = self.fake_source_system()
+        src.return_value = {"id": "1", "message": "successfully created"}
+        crr.return_value.svc_obj_info.return_value = None
+        crr.return_value.svc_run_command.return_value = {"id": "5", "message": "Volume, id [5], successfully created"}
+        m = IBMSVCMigrate()
+        with pytest.raises(AnsibleExitJson) as exc:
+            m.apply()
+        self.assertTrue(exc.value.args[0]['changed'])
+        commands = [c[0][0] for c in src.call_args_list]
+        self.assertEqual(commands[0], 'mkrcconsistgrp')
+        self.assertEqual(commands[-1], 'startrcconsistgrp')
+        self.assertEqual(commands.count('startrcconsistgrp'), 1)
+        self.assertNotIn('startrcrelationship', commands)
+        for c in src.call_args_list:
+            if c[0][0] == 'mkrcrelationship':
+                self.assertEqual(c[0][1]['consistgrp'], 'migrate_grp')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.modules.'
+           'ibm_svc_manage_migration.IBMSVCMigrate.construct_remote_rest')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_migrate_volumes_idempotent(self, auth, soi, src, crr):
+        self.set_volumes_args()
+        relationship = {"copy_type": "migration", "primary": "master", "aux_cluster_name": "Cluster_x.x.x.x",
+                        "state": "consistent_synchronized"}
+        soi.side_effect = self.fake_source_system(relationships={
+            "migrate_vol0": dict(relationship, master_vdisk_name="vol0", aux_vdisk_name="vol0_target"),
+            "migrate_vol1": dict(relationship, master_vdisk_name="vol1", aux_vdisk_name="vol1_target")
+        })
+        m = IBMSVCMigrate()
+        with pytest.raises(AnsibleExitJson) as exc:
+            m.apply()
+        self.assertFalse(exc.value.args[0]['changed'])
+        src.assert_not_called()
+        crr.return_value.svc_run_command.assert_not_called()
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_migrate_volumes_mutually_exclusive(self, auth):
+        self.set_volumes_args(source_volume="vol0")
+        m = IBMSVCMigrate()
+        with pytest.raises(AnsibleFailJson) as exc:
+            m.apply()
+        self.assertEqual(exc.value.args[0]['msg'], 'Parameters [volumes] and [source_volume] are mutually exclusive')
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1541,6 +1541,172 @@ class TestIBMSVCvolume(unittest.TestCase):
             v.apply()
         self.assertFalse(exc.value.args[0]['changed'])
 
+    def listed_volume(self, name, capacity='1073741824', pool='pool0'):
+        return {'id': '0', 'name': name, 'capacity': capacity, 'mdisk_grp_name': pool,
+                'type': 'striped', 'RC_name': '', 'volume_group_name': ''}
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_volumes_create_expand_and_skip(self, auth, soi, src):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'state': 'present',
+            'pool': 'pool0',
+            'unit': 'gb',
+            'parallelism': 3,
+            'volumes': [
+                {'name': 'vol0', 'size': '1'},
+                {'name': 'vol1', 'size': '2'},
+                {'name': 'vol2', 'size': '1', 'pool': 'pool1'}
+            ]
+        })
+
+        def svc_obj_info(cmd, cmdopts, cmdargs, stream=False):
+            self.assertEqual((cmd, cmdargs, stream), ('lsvdisk', None, True))
+            return iter([self.listed_volume('vol0'), self.listed_volume('vol1'), self.listed_volume('other')])
+        soi.side_effect = svc_obj_info
+        src.return_value = {'id': '3', 'message': 'Volume, id [3], successfully created'}
+        v = IBMSVCvolume()
+        with pytest.raises(AnsibleExitJson) as exc:
+            v.apply()
+        self.assertTrue(exc.value.args[0]['changed'])
+        self.assertEqual(exc.value.args[0]['volumes'], [
+            {'name': 'vol0', 'changed': False, 'msg': 'volume [vol0] already exists.'},
+            {'name': 'vol1', 'changed': True, 'msg': 'volume [vol1] has been modified'},
+            {'name': 'vol2', 'changed': True, 'msg': 'volume [vol2] has been created'}
+        ])
+        soi.assert_called_once_with('lsvdisk', {'bytes': True}, None, stream=True)
+        commands = sorted((c[0][0], str(c[0][1].get('name', c[0][1].get('size')))) for c in src.call_args_list)
+        self.assertEqual(commands, [('expandvdisksize', '1073741824'), ('mkvolume', 'vol2')])
+        mkvolume = [c[0][1] for c in src.call_args_list if c[0][0] == 'mkvolume'][0]
+        self.assertEqual(mkvolume['pool'], 'pool1')
+        self.assertEqual(mkvolume['unit'], 'gb')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_volumes_reports_each_failure(self, auth, soi, src):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'state': 'present',
+            'unit': 'gb',
+            'volumes': [
+                {'name': 'vol0', 'size': '1'},
+                {'name': 'vol1', 'size': '1', 'pool': 'pool0'},
+                {'name': 'vol2', 'pool': 'pool0'}
+            ]
+        })
+        soi.return_value = iter([])
+        src.return_value = {'id': '3', 'message': 'Volume, id [3], successfully created'}
+        v = IBMSVCvolume()
+        with pytest.raises(AnsibleFailJson) as exc:
+            v.apply()
+        self.assertEqual(exc.value.args[0]['msg'], "Failed to manage volumes ['vol0', 'vol2'].")
+        self.assertTrue(exc.value.args[0]['changed'])
+        volumes = exc.value.args[0]['volumes']
+        self.assertEqual(volumes[0]['error'], 'Missing required parameter while creating: [pool]')
+        self.assertEqual(volumes[1]['msg'], 'volume [vol1] has been created')
+        self.assertEqual(volumes[2]['error'], 'Missing required parameter while creating: [size]')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_volumes_absent(self, auth, soi, src):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'state': 'absent',
+            'volumes': [{'name': 'vol0'}, {'name': 'vol1'}]
+        })
+        soi.return_value = iter([self.listed_volume('vol1')])
+        v = IBMSVCvolume()
+        with pytest.raises(AnsibleExitJson) as exc:
+            v.apply()
+        self.assertEqual([r['changed'] for r in exc.value.args[0]['volumes']], [False, True])
+        src.assert_called_once_with('rmvolume', None, ['vol1'])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_volumes_fetches_details_when_needed(self, auth, soi, src):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'state': 'present',
+            'pool': 'pool0',
+            'size': '1',
+            'unit': 'gb',
+            'thin': True,
+            'volumes': [{'name': 'vol0'}]
+        })
+        details = [
+            self.listed_volume('vol0'),
+            {'real_capacity': '21474836', 'compressed_copy': 'no', 'deduplicated_copy': 'no'}
+        ]
+        soi.side_effect = [iter([self.listed_volume('vol0')]), details]
+        v = IBMSVCvolume()
+        with pytest.raises(AnsibleExitJson) as exc:
+            v.apply()
+        self.assertFalse(exc.value.args[0]['changed'])
+        soi.assert_called_with('lsvdisk', {'bytes': True}, ['vol0'])
+        src.assert_not_called()
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_volumes_validation(self, auth):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'state': 'present',
+            'volumes': [{'name': 'vol0'}, {'name': 'vol0'}]
+        })
+        v = IBMSVCvolume()
+        with pytest.raises(AnsibleFailJson) as exc:
+            v.apply()
+        self.assertEqual(exc.value.args[0]['msg'], "Duplicate volume names in [volumes]: ['vol0']")
+
+        for volumes, msg in [
+            ([{'name': 'vol0', 'iogrp': 'io_grp0'}], 'Unsupported parameters'),
+            ([{'size': '1'}], 'missing required arguments: name found in volumes'),
+            ([{'name': 'vol0', 'unit': 'xb'}], 'unit must be one of')
+        ]:
+            set_module_args({
+                'clustername': 'clustername',
+                'domain': 'domain',
+                'username': 'username',
+                'password': 'password',
+                'state': 'present',
+                'volumes': volumes
+            })
+            with pytest.raises(AnsibleFailJson) as exc:
+                IBMSVCvolume()
+            self.assertIn(msg, exc.value.args[0]['msg'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -14,7 +14,7 @@ import json
 from mock import patch
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
-from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi, get_command_plan
 from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_svc_start_stop_flashcopy import IBMSVCFlashcopyStartStop
 
 
@@ -477,6 +477,266 @@ class TestIBMSVCFlashcopyStartStop(unittest.TestCase):
             obj.apply()
         self.assertEqual(False, exc.value.args[0]["changed"])
 
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.time.sleep')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_start_fc_wait(self, svc_authorize_mock, soi, src, sleep_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'name': 'test_name',
+            'state': 'started',
+            'wait': True
+        })
+        soi.side_effect = [
+            {'name': 'test_name', 'status': 'idle_or_copied', 'start_time': ''},
+            {'name': 'test_name', 'status': 'preparing', 'start_time': ''},
+            {'name': 'test_name', 'status': 'copying', 'start_time': '210112113610'}
+        ]
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj = IBMSVCFlashcopyStartStop()
+            obj.apply()
+        self.assertTrue(exc.value.args[0]['changed'])
+        soi.assert_called_with('lsfcmap', None, ['test_name'], cache=False)
+        self.assertEqual(sleep_mock.call_count, 1)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.time.sleep')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_start_fc_wait_ignores_status_before_start(self, svc_authorize_mock, soi, src, sleep_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'name': 'test_name',
+            'state': 'started',
+            'wait': True
+        })
+        soi.side_effect = [
+            {'name': 'test_name', 'status': 'idle_or_copied', 'start_time': ''},
+            {'name': 'test_name', 'status': 'idle_or_copied', 'start_time': ''},
+            {'name': 'test_name', 'status': 'idle_or_copied', 'start_time': '210112113610'}
+        ]
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj = IBMSVCFlashcopyStartStop()
+            obj.apply()
+        self.assertTrue(exc.value.args[0]['changed'])
+        self.assertEqual(soi.call_count, 3)
+        self.assertEqual(sleep_mock.call_count, 1)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_wait')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_stop_fc_wait_timeout(self, svc_authorize_mock, soi, src, wait_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'name': 'test_name',
+            'state': 'stopped',
+            'isgroup': True,
+            'wait': True,
+            'wait_timeout': 30
+        })
+        soi.return_value = {'name': 'test_name', 'status': 'copying', 'start_time': '210112113610'}
+        wait_mock.return_value = (False, {'name': 'test_name', 'status': 'stopping'})
+        with pytest.raises(AnsibleFailJson) as exc:
+            obj = IBMSVCFlashcopyStartStop()
+            obj.apply()
+        self.assertEqual(exc.value.args[0]['msg'],
+                         'fc [test_name] did not reach state [stopped] within 30 seconds, current status [stopping]')
+        self.assertEqual(wait_mock.call_args[0][:3], ('lsfcconsistgrp', None, ['test_name']))
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_start_names(self, svc_authorize_mock, soi, src):
+        set_module_args({
+            'clustername': 'clustername',
+            'username': 'username',
+            'password': 'password',
+            'names': ['fcmap0', 'fcmap1', 'fcmap2', 'fcmap3'],
+            'parallelism': 2,
+            'state': 'started',
+            'track_job': True
+        })
+        soi.return_value = [
+            {'name': 'fcmap0', 'status': 'idle_or_copied', 'start_time': ''},
+            {'name': 'fcmap1', 'status': 'copying', 'start_time': '210112113610'},
+            {'name': 'fcmap2', 'status': 'idle_or_copied', 'start_time': ''}
+        ]
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj = IBMSVCFlashcopyStartStop()
+            obj.apply()
+        result = exc.value.args[0]
+        self.assertTrue(result['changed'])
+        soi.assert_called_once_with('lsfcmap', None, None)
+        self.assertEqual(sorted(c[1]['cmdargs'] for c in src.call_args_list),
+                         [['fcmap0'], ['fcmap2']])
+        self.assertEqual([r['changed'] for r in result['results']], [True, False, True, False])
+        self.assertEqual(result['results'][1]['status'], 'copying')
+        self.assertEqual(result['job']['kind'], 'fcmap')
+        self.assertEqual(result['job']['names'], ['fcmap0', 'fcmap1', 'fcmap2', 'fcmap3'])
+        self.assertEqual(result['job']['state'], 'started')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_start_names_failure(self, svc_authorize_mock, soi, src):
+        set_module_args({
+            'clustername': 'clustername',
+            'username': 'username',
+            'password': 'password',
+            'names': ['fcmap0', 'fcmap1'],
+            'state': 'started'
+        })
+        soi.return_value = [
+            {'name': 'fcmap0', 'status': 'idle_or_copied', 'start_time': ''},
+            {'name': 'fcmap1', 'status': 'idle_or_copied', 'start_time': ''}
+        ]
+        src.side_effect = [None, Exception('CMMVC5907E')]
+        with pytest.raises(AnsibleFailJson) as exc:
+            obj = IBMSVCFlashcopyStartStop()
+            obj.apply()
+        result = exc.value.args[0]
+        self.assertEqual(result['msg'], 'Failed to start 1 of 2 fc [fcmap1]')
+        self.assertTrue(result['changed'])
+        self.assertEqual(result['results'][1]['error'], 'CMMVC5907E')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_start_names_check_mode(self, svc_authorize_mock, soi, src):
+        set_module_args({
+            'clustername': 'clustername',
+            'username': 'username',
+            'password': 'password',
+            'names': ['fcmap0', 'fcmap1', 'fcmap2'],
+            'parallelism': 2,
+            'state': 'started',
+            '_ansible_check_mode': True
+        })
+        soi.return_value = [
+            {'name': 'fcmap0', 'status': 'idle_or_copied', 'start_time': ''},
+            {'name': 'fcmap1', 'status': 'copying', 'start_time': '210112113610'},
+            {'name': 'fcmap2', 'status': 'idle_or_copied', 'start_time': ''}
+        ]
+        get_command_plan().reset()
+        self.addCleanup(get_command_plan().reset)
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj = IBMSVCFlashcopyStartStop()
+            obj.apply()
+        result = exc.value.args[0]
+        self.assertTrue(result['changed'])
+        src.assert_not_called()
+        self.assertEqual(result['command_plan'], [
+            {'cluster': 'clustername', 'cmd': 'startfcmap', 'opts': {'prep': True}, 'args': ['fcmap0']},
+            {'cluster': 'clustername', 'cmd': 'startfcmap', 'opts': {'prep': True}, 'args': ['fcmap2']}
+        ])
+        self.assertEqual(result['round_trips']['writes'], 2)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_stop_group_check_mode(self, svc_authorize_mock, soi, src):
+        set_module_args({
+            'clustername': 'clustername',
+            'username': 'username',
+            'password': 'password',
+            'name': 'fccg0',
+            'isgroup': True,
+            'force': True,
+            'state': 'stopped',
+            '_ansible_check_mode': True
+        })
+        soi.return_value = {'name': 'fccg0', 'status': 'copying', 'start_time': '210112113610'}
+        get_command_plan().reset()
+        self.addCleanup(get_command_plan().reset)
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj = IBMSVCFlashcopyStartStop()
+            obj.apply()
+        result = exc.value.args[0]
+        self.assertTrue(result['changed'])
+        src.assert_not_called()
+        self.assertEqual(result['command_plan'], [
+            {'cluster': 'clustername', 'cmd': 'stopfcconsistgrp', 'opts': {'force': True}, 'args': ['fccg0']}
+        ])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_status_job(self, svc_authorize_mock, soi):
+        set_module_args({
+            'clustername': 'clustername',
+            'username': 'username',
+            'password': 'password',
+            'state': 'status',
+            'job': {'cluster': 'clustername', 'kind': 'fcmap', 'names': ['fcmap0', 'fcmap1', 'fcmap2'],
+                    'state': 'started', 'submitted': 0}
+        })
+        soi.return_value = (r for r in [
+            {'name': 'fcmap0', 'status': 'copying', 'progress': '20', 'copy_rate': '50', 'start_time': 't'},
+            {'name': 'fcmap1', 'status': 'copying', 'progress': '0', 'copy_rate': '0', 'start_time': 't'},
+            {'name': 'fcmap2', 'status': 'idle_or_copied', 'progress': '100', 'copy_rate': '50', 'start_time': 't'}
+        ])
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj = IBMSVCFlashcopyStartStop()
+            obj.apply()
+        result = exc.value.args[0]
+        self.assertFalse(result['changed'])
+        soi.assert_called_once_with('lsfcmap', None, None, stream=True)
+        self.assertEqual(result['job_status']['pending'], ['fcmap0'])
+        self.assertFalse(result['job_status']['complete'])
+        self.assertEqual(result['job_status']['progress'], 40)
+        self.assertTrue(result['job_status']['objects']['fcmap1']['complete'])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_status_job_of_other_cluster(self, svc_authorize_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'username': 'username',
+            'password': 'password',
+            'state': 'status',
+            'job': {'cluster': 'cluster2', 'kind': 'fcmap', 'names': ['fcmap0'], 'state': 'started'}
+        })
+        with pytest.raises(AnsibleFailJson) as exc:
+            obj = IBMSVCFlashcopyStartStop()
+            obj.apply()
+        self.assertEqual(exc.value.args[0]['msg'], 'Parameter job is the handle of an operation on cluster [cluster2]')
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -14,7 +14,7 @@ import json
 from mock import patch
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
-from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi, get_command_plan
 from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_svc_start_stop_replication import IBMSVCStartStopReplication
 
 
@@ -383,6 +383,275 @@ class TestIBMSVCStartStopReplication(unittest.TestCase):
             obj.apply()
         self.assertEqual(True, exc.value.args[0]["failed"])
 
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.time.sleep')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_start_wait(self, svc_authorize_mock, svc_run_command_mock, soi, sleep_mock):
+        set_module_args({
+            'name': 'test_name',
+            'clustername': 'test_cluster',
+            'username': 'username',
+            'password': 'password',
+            'state': 'started',
+            'wait': True
+        })
+        svc_run_command_mock.return_value = ''
+        soi.side_effect = [
+            {'name': 'test_name', 'state': 'inconsistent_copying', 'cycling_mode': ''},
+            {'name': 'test_name', 'state': 'consistent_synchronized', 'cycling_mode': ''}
+        ]
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj = IBMSVCStartStopReplication()
+            obj.apply()
+        self.assertTrue(exc.value.args[0]['changed'])
+        soi.assert_called_with('lsrcrelationship', None, ['test_name'], cache=False)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_reached_state(self, svc_authorize_mock):
+        set_module_args({
+            'name': 'test_name',
+            'clustername': 'test_cluster',
+            'username': 'username',
+            'password': 'password',
+            'state': 'started',
+            'isgroup': True,
+            'wait': True
+        })
+        obj = IBMSVCStartStopReplication()
+        self.assertFalse(obj.reached_state(None))
+        self.assertFalse(obj.reached_state({'state': 'consistent_copying', 'cycling_mode': 'none'}))
+        self.assertTrue(obj.reached_state({'state': 'consistent_copying', 'cycling_mode': 'multi'}))
+        self.assertTrue(obj.reached_state({'state': 'consistent_synchronized', 'cycling_mode': 'none'}))
+        obj.state = 'stopped'
+        self.assertFalse(obj.reached_state({'state': 'consistent_synchronized'}))
+        self.assertTrue(obj.reached_state({'state': 'consistent_stopped'}))
+        self.assertTrue(obj.reached_state({'state': 'idling'}))
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_wait')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_stop_wait_timeout(self, svc_authorize_mock, svc_run_command_mock, wait_mock):
+        set_module_args({
+            'name': 'test_name',
+            'clustername': 'test_cluster',
+            'username': 'username',
+            'password': 'password',
+            'state': 'stopped',
+            'isgroup': True,
+            'wait': True,
+            'wait_timeout': 10
+        })
+        svc_run_command_mock.return_value = ''
+        wait_mock.return_value = (False, {'name': 'test_name', 'state': 'consistent_synchronized'})
+        with pytest.raises(AnsibleFailJson) as exc:
+            obj = IBMSVCStartStopReplication()
+            obj.apply()
+        self.assertIn('current state [consistent_synchronized]', exc.value.args[0]['msg'])
+        self.assertEqual(wait_mock.call_args[0][:3], ('lsrcconsistgrp', None, ['test_name']))
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.time.sleep')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_start_names_wait(self, svc_authorize_mock, svc_run_command_mock, soi, sleep_mock):
+        set_module_args({
+            'names': ['rcrel0', 'rcrel1'],
+            'clustername': 'test_cluster',
+            'username': 'username',
+            'password': 'password',
+            'state': 'started',
+            'parallelism': 2,
+            'wait': True,
+            'track_job': True
+        })
+        svc_run_command_mock.return_value = ''
+        soi.side_effect = [
+            [{'name': 'rcrel0', 'state': 'consistent_stopped', 'progress': ''},
+             {'name': 'rcrel1', 'state': 'idling', 'progress': ''}],
+            [{'name': 'rcrel0', 'state': 'consistent_synchronized', 'progress': ''},
+             {'name': 'rcrel1', 'state': 'inconsistent_copying', 'progress': '50'}],
+            [{'name': 'rcrel0', 'state': 'consistent_synchronized', 'progress': ''},
+             {'name': 'rcrel1', 'state': 'consistent_synchronized', 'progress': ''}]
+        ]
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj = IBMSVCStartStopReplication()
+            obj.apply()
+        result = exc.value.args[0]
+        self.assertTrue(result['changed'])
+        self.assertEqual(svc_run_command_mock.call_count, 2)
+        soi.assert_called_with('lsrcrelationship', None, None, cache=False)
+        self.assertEqual(soi.call_count, 3)
+        self.assertEqual(result['results'], [{'name': 'rcrel0', 'changed': True}, {'name': 'rcrel1', 'changed': True}])
+        self.assertEqual(result['job']['kind'], 'rcrelationship')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_start_names_idempotent(self, svc_authorize_mock, svc_run_command_mock, soi):
+        set_module_args({
+            'names': ['rcrel0', 'rcrel1', 'rcrel2'],
+            'clustername': 'test_cluster',
+            'username': 'username',
+            'password': 'password',
+            'state': 'started'
+        })
+        soi.return_value = [{'name': 'rcrel0', 'state': 'consistent_synchronized'},
+                            {'name': 'rcrel1', 'state': 'inconsistent_copying'}]
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj = IBMSVCStartStopReplication()
+            obj.apply()
+        result = exc.value.args[0]
+        self.assertFalse(result['changed'])
+        svc_run_command_mock.assert_not_called()
+        soi.assert_called_once_with('lsrcrelationship', None, None)
+        self.assertEqual(result['results'], [
+            {'name': 'rcrel0', 'changed': False, 'state': 'consistent_synchronized'},
+            {'name': 'rcrel1', 'changed': False, 'state': 'inconsistent_copying'},
+            {'name': 'rcrel2', 'changed': False, 'msg': '[rcrel2] does not exist.'}
+        ])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_stop_names_failure(self, svc_authorize_mock, svc_run_command_mock, soi):
+        set_module_args({
+            'names': ['rcrel0', 'rcrel1'],
+            'clustername': 'test_cluster',
+            'username': 'username',
+            'password': 'password',
+            'state': 'stopped'
+        })
+        soi.return_value = [{'name': 'rcrel0', 'state': 'consistent_synchronized'},
+                            {'name': 'rcrel1', 'state': 'consistent_copying'}]
+        svc_run_command_mock.side_effect = ['', {}]
+        with pytest.raises(AnsibleFailJson) as exc:
+            obj = IBMSVCStartStopReplication()
+            obj.apply()
+        result = exc.value.args[0]
+        self.assertEqual(result['msg'], 'Failed to stop 1 of 2 remote copies [rcrel1]')
+        self.assertEqual(result['results'][1]['error'], 'Failed to stop the remote copy [rcrel1]')
+        self.assertTrue(result['changed'])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_start_names_check_mode(self, svc_authorize_mock, svc_run_command_mock, soi):
+        set_module_args({
+            'names': ['rcrel0', 'rcrel1', 'rcrel2'],
+            'clustername': 'test_cluster',
+            'username': 'username',
+            'password': 'password',
+            'primary': 'master',
+            'state': 'started',
+            '_ansible_check_mode': True
+        })
+        soi.return_value = [{'name': 'rcrel0', 'state': 'consistent_stopped'},
+                            {'name': 'rcrel1', 'state': 'consistent_synchronized'},
+                            {'name': 'rcrel2', 'state': 'idling'}]
+        get_command_plan().reset()
+        self.addCleanup(get_command_plan().reset)
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj = IBMSVCStartStopReplication()
+            obj.apply()
+        result = exc.value.args[0]
+        self.assertTrue(result['changed'])
+        svc_run_command_mock.assert_not_called()
+        self.assertEqual(result['command_plan'], [
+            {'cluster': 'test_cluster', 'cmd': 'startrcrelationship', 'opts': {'primary': 'master'}, 'args': ['rcrel0']},
+            {'cluster': 'test_cluster', 'cmd': 'startrcrelationship', 'opts': {'primary': 'master'}, 'args': ['rcrel2']}
+        ])
+        self.assertEqual(result['round_trips']['writes'], 2)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_stop_group_check_mode(self, svc_authorize_mock, svc_run_command_mock):
+        set_module_args({
+            'name': 'rccg0',
+            'isgroup': True,
+            'clustername': 'test_cluster',
+            'username': 'username',
+            'password': 'password',
+            'access': True,
+            'state': 'stopped',
+            '_ansible_check_mode': True
+        })
+        get_command_plan().reset()
+        self.addCleanup(get_command_plan().reset)
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj = IBMSVCStartStopReplication()
+            obj.apply()
+        result = exc.value.args[0]
+        self.assertTrue(result['changed'])
+        svc_run_command_mock.assert_not_called()
+        self.assertEqual(result['command_plan'], [
+            {'cluster': 'test_cluster', 'cmd': 'stoprcconsistgrp', 'opts': {'access': True}, 'args': ['rccg0']}
+        ])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_status_names(self, svc_authorize_mock, soi):
+        set_module_args({
+            'names': ['rcrel0', 'rcrel1', 'rcrel2'],
+            'clustername': 'test_cluster',
+            'username': 'username',
+            'password': 'password',
+            'state': 'status'
+        })
+        soi.return_value = (r for r in [
+            {'name': 'rcrel0', 'state': 'consistent_synchronized', 'progress': '', 'cycling_mode': ''},
+            {'name': 'rcrel1', 'state': 'inconsistent_copying', 'progress': '30', 'cycling_mode': ''}
+        ])
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj = IBMSVCStartStopReplication()
+            obj.apply()
+        status = exc.value.args[0]['job_status']
+        soi.assert_called_once_with('lsrcrelationship', None, None, stream=True)
+        self.assertEqual(status['pending'], ['rcrel1'])
+        self.assertEqual(status['missing'], ['rcrel2'])
+        self.assertEqual(status['progress'], 30)
+        self.assertEqual(status['objects']['rcrel1'], {'state': 'inconsistent_copying', 'progress': '30',
+                                                       'cycling_mode': '', 'complete': False})
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_job_requires_status(self, svc_authorize_mock):
+        set_module_args({
+            'clustername': 'test_cluster',
+            'username': 'username',
+            'password': 'password',
+            'state': 'started',
+            'job': {'cluster': 'test_cluster', 'kind': 'rcrelationship', 'names': ['rcrel0']}
+        })
+        with pytest.raises(AnsibleFailJson) as exc:
+            IBMSVCStartStopReplication()
+        self.assertEqual(exc.value.args[0]['msg'], 'Parameter job is only supported with state=status')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -14,7 +14,7 @@ import json
 from mock import patch
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
-from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi
+from ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi, get_command_plan
 from ansible_collections.ibm.spectrum_virtualize.plugins.modules.ibm_svc_vol_map import IBMSVCvdiskhostmap
 
 
@@ -355,6 +355,151 @@ class TestIBMSVCvdiskhostmap(unittest.TestCase):
         self.assertTrue(exc.value.args[0]['changed'])
         get_existing_vdiskhostmap_mock.assert_called_with()
 
+    def fake_mappings(self, host_maps=(), cluster_maps=()):
+        def svc_obj_info(cmd, cmdopts, cmdargs, stream=False):
+            self.assertTrue(stream)
+            self.assertIsNone(cmdargs)
+            if cmd == 'lshostvdiskmap':
+                return iter([{'name': h, 'vdisk_name': v, 'SCSI_id': str(i), 'host_cluster_name': c}
+                             for h, v, i, c in host_maps])
+            return iter([{'name': c, 'volume_name': v, 'SCSI_id': str(i)} for c, v, i in cluster_maps])
+        return svc_obj_info
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_bulk_map_to_hosts(self, auth, soi, src):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'state': 'present',
+            'volumes': ['vol0', 'vol1', 'vol2'],
+            'hosts': ['host0', 'host1'],
+            'parallelism': 4
+        })
+        soi.side_effect = self.fake_mappings(host_maps=[
+            ('host0', 'vol1', 0, ''),
+            ('host0', 'other', 1, ''),
+            ('host1', 'other', 2, '')
+        ])
+        src.return_value = {'id': '0', 'message': 'Virtual Disk to Host map, id [0], successfully created'}
+        obj = IBMSVCvdiskhostmap()
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj.apply()
+        self.assertTrue(exc.value.args[0]['changed'])
+        self.assertEqual(exc.value.args[0]['mappings'], [
+            {'volume': 'vol0', 'host': 'host0', 'scsi': 2, 'changed': True},
+            {'volume': 'vol1', 'host': 'host0', 'changed': False},
+            {'volume': 'vol2', 'host': 'host0', 'scsi': 3, 'changed': True},
+            {'volume': 'vol0', 'host': 'host1', 'scsi': 0, 'changed': True},
+            {'volume': 'vol1', 'host': 'host1', 'scsi': 1, 'changed': True},
+            {'volume': 'vol2', 'host': 'host1', 'scsi': 3, 'changed': True}
+        ])
+        self.assertEqual(src.call_count, 5)
+        src.assert_any_call('mkvdiskhostmap', {'force': True, 'host': 'host1', 'scsi': 3}, ['vol2'])
+        self.assertEqual(soi.call_count, 1)
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_bulk_map_to_hostclusters(self, auth, soi, src):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'state': 'present',
+            'volumes': ['vol0', 'vol1'],
+            'hostclusters': ['hc0'],
+            'scsi': 5
+        })
+        soi.side_effect = self.fake_mappings(
+            host_maps=[('host0', 'private', 5, 'hc0'), ('host0', 'vol0', 6, 'hc0')],
+            cluster_maps=[('hc0', 'vol0', 6)]
+        )
+        src.return_value = {'id': '0', 'message': 'Volume to Host Cluster map, id [0], successfully created'}
+        obj = IBMSVCvdiskhostmap()
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj.apply()
+        self.assertEqual(exc.value.args[0]['mappings'], [
+            {'volume': 'vol0', 'hostcluster': 'hc0', 'changed': False},
+            {'volume': 'vol1', 'hostcluster': 'hc0', 'scsi': 7, 'changed': True}
+        ])
+        src.assert_called_once_with('mkvolumehostclustermap', {'force': True, 'hostcluster': 'hc0', 'scsi': 7}, ['vol1'])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_bulk_unmap_reports_failures(self, auth, soi, src):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'state': 'absent',
+            'volumes': ['vol0', 'vol1', 'vol2'],
+            'host': 'host0'
+        })
+        soi.side_effect = self.fake_mappings(host_maps=[('host0', 'vol0', 0, ''), ('host0', 'vol1', 1, '')])
+
+        def rmvdiskhostmap(cmd, cmdopts, cmdargs):
+            if cmdargs == ['vol1']:
+                raise Exception('CMMVC5842E The action failed because an object that was specified does not exist.')
+            return ''
+        src.side_effect = rmvdiskhostmap
+        obj = IBMSVCvdiskhostmap()
+        with pytest.raises(AnsibleFailJson) as exc:
+            obj.apply()
+        self.assertEqual(exc.value.args[0]['msg'], 'Failed to change 1 of 2 mappings.')
+        self.assertTrue(exc.value.args[0]['changed'])
+        mappings = exc.value.args[0]['mappings']
+        self.assertTrue(mappings[0]['changed'])
+        self.assertIn('CMMVC5842E', mappings[1]['error'])
+        self.assertFalse(mappings[2]['changed'])
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_run_command')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_bulk_check_mode(self, auth, soi, src):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'state': 'present',
+            'volname': 'vol0',
+            'hosts': ['host0', 'host1'],
+            '_ansible_check_mode': True
+        })
+        soi.side_effect = self.fake_mappings(host_maps=[('host0', 'vol0', 0, '')])
+        get_command_plan().reset()
+        self.addCleanup(get_command_plan().reset)
+        obj = IBMSVCvdiskhostmap()
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj.apply()
+        self.assertTrue(exc.value.args[0]['changed'])
+        self.assertEqual([m['changed'] for m in exc.value.args[0]['mappings']], [False, True])
+        src.assert_not_called()
+        self.assertEqual(exc.value.args[0]['command_plan'], [
+            {'cluster': 'clustername', 'cmd': 'mkvdiskhostmap', 'opts': {'force': True, 'host': 'host1', 'scsi': 0},
+             'args': ['vol0']}
+        ])
+        self.assertEqual(exc.value.args[0]['round_trips']['writes'], 1)
+
 
 if __name__ == '__main__':
     unittest.main()
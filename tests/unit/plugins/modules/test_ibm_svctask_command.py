@@ -160,6 +160,175 @@ class TestIBMSVCsshClient_svctask(unittest.TestCase):
         conn.ssh_client._svc_disconnect()
         self.assertFalse(conn.ssh_client.is_client_connected)
 
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_ssh.IBMSVCssh.svc_run_batch')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_ssh.IBMSVCssh._svc_disconnect')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_ssh.IBMSVCssh._svc_connect')
+    def test_batch(self, connect_mock, disconnect_mock, batch_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'username': 'username',
+            'password': 'password',
+            'command': ['svctask mkvdisk -name vol0', 'svctask chvdisk -name vol1 vol0'],
+            'batch': True,
+        })
+        batch_mock.return_value = [
+            {'command': 'svctask mkvdisk -name vol0', 'rc': 0, 'stdout': 'created\n', 'stderr': ''},
+            {'command': 'svctask chvdisk -name vol1 vol0', 'rc': 0, 'stdout': '', 'stderr': ''}
+        ]
+        conn = IBMSVCsshClient()
+        with pytest.raises(AnsibleExitJson) as exc:
+            conn.send_svctask_command()
+        self.assertTrue(exc.value.args[0]['changed'])
+        self.assertEqual(len(exc.value.args[0]['results']), 2)
+        batch_mock.assert_called_once_with(['svctask mkvdisk -name vol0',
+                                            'svctask chvdisk -name vol1 vol0'])
+        disconnect_mock.assert_called_with()
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_ssh.IBMSVCssh.svc_run_batch')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_ssh.IBMSVCssh._svc_disconnect')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_ssh.IBMSVCssh._svc_connect')
+    def test_commands_without_batch(self, connect_mock, disconnect_mock, batch_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'username': 'username',
+            'password': 'password',
+            'command': ['svctask mkvdisk -name vol0', 'svctask chvdisk -name vol1 vol0'],
+        })
+        batch_mock.return_value = [
+            {'command': 'svctask mkvdisk -name vol0', 'rc': 0, 'stdout': 'created\n', 'stderr': ''},
+            {'command': 'svctask chvdisk -name vol1 vol0', 'rc': 0, 'stdout': '', 'stderr': ''}
+        ]
+        conn = IBMSVCsshClient()
+        with pytest.raises(AnsibleExitJson) as exc:
+            conn.send_svctask_command()
+        self.assertTrue(exc.value.args[0]['changed'])
+        self.assertEqual(exc.value.args[0]['msg'], 'created\n')
+        self.assertNotIn('results', exc.value.args[0])
+        batch_mock.assert_called_once_with(['svctask mkvdisk -name vol0',
+                                            'svctask chvdisk -name vol1 vol0'])
+        disconnect_mock.assert_called_with()
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_ssh.IBMSVCssh.svc_run_batch')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_ssh.IBMSVCssh._svc_disconnect')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_ssh.IBMSVCssh._svc_connect')
+    def test_batch_failed(self, connect_mock, disconnect_mock, batch_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'username': 'username',
+            'password': 'password',
+            'command': ['svctask rmvdisk vol9', 'svctask rmvdisk vol0'],
+            'batch': True,
+        })
+        batch_mock.return_value = [
+            {'command': 'svctask rmvdisk vol9', 'rc': 1, 'stdout': '',
+             'stderr': 'CMMVC5753E The specified object does not exist.'}
+        ]
+        conn = IBMSVCsshClient()
+        with pytest.raises(AnsibleFailJson) as exc:
+            conn.send_svctask_command()
+        self.assertFalse(exc.value.args[0]['changed'])
+        self.assertEqual(exc.value.args[0]['rc'], 1)
+        self.assertEqual(exc.value.args[0]['msg'], 'CLI command [svctask rmvdisk vol9] failed with rc 1: '
+                                                   'CMMVC5753E The specified object does not exist.')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_ssh.IBMSVCssh.svc_run_batch')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_ssh.IBMSVCssh._svc_disconnect')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_ssh.IBMSVCssh._svc_connect')
+    def test_batch_failed_without_error_output(self, connect_mock, disconnect_mock, batch_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'username': 'username',
+            'password': 'password',
+            'command': ['svctask mkvdisk -name vol0', 'svctask chvdisk -name vol1 vol0'],
+            'batch': True,
+        })
+        batch_mock.return_value = [
+            {'command': 'svctask mkvdisk -name vol0', 'rc': 0, 'stdout': 'created\n', 'stderr': ''},
+            {'command': 'svctask chvdisk -name vol1 vol0', 'rc': 2, 'stdout': 'CMMVC5786E\n', 'stderr': ''}
+        ]
+        conn = IBMSVCsshClient()
+        with pytest.raises(AnsibleFailJson) as exc:
+            conn.send_svctask_command()
+        self.assertTrue(exc.value.args[0]['changed'])
+        self.assertEqual(exc.value.args[0]['rc'], 2)
+        self.assertEqual(exc.value.args[0]['msg'], 'created\nCMMVC5786E\nCLI command [svctask chvdisk -name vol1 vol0] failed with rc 2')
+
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_ssh.IBMSVCssh.svc_run_batch')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_ssh.IBMSVCssh._svc_disconnect')
+    @patch('ansible_collections.ibm.spectrum_virtualize.plugins.module_utils.'
+           'ibm_svc_ssh.IBMSVCssh._svc_connect')
+    def test_batch_rejects_svcinfo(self, connect_mock, disconnect_mock, batch_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'username': 'username',
+            'password': 'password',
+            'command': ['svctask mkvdisk -name vol0', 'svcinfo lsvdisk'],
+            'batch': True,
+        })
+        with pytest.raises(AnsibleFailJson) as exc:
+            IBMSVCsshClient()
+        self.assertEqual(exc.value.args[0]['msg'], 'The command must start with svctask')
+        connect_mock.assert_not_called()
+        batch_mock.assert_not_called()
+
+    @patch.object(IBMSVCssh, 'svc_run_batch', autospec=True)
+    @patch.object(IBMSVCssh, '_svc_disconnect', autospec=True)
+    @patch.object(IBMSVCssh, '_svc_connect', autospec=True)
+    def test_batch_on_clusters(self, connect_mock, disconnect_mock, batch_mock):
+        set_module_args({
+            'username': 'username',
+            'password': 'password',
+            'command': ['svctask chsystem -ntpip 10.0.0.1'],
+            'batch': True,
+            'clusters': [
+                {'clustername': 'cluster1'},
+                {'clustername': 'cluster2', 'password': 'password2'},
+                {'clustername': 'cluster3'}
+            ]
+        })
+        connect_mock.side_effect = lambda ssh: ssh.clustername != 'cluster3'
+        batch_mock.side_effect = lambda ssh, commands: [
+            {'command': commands[0], 'rc': 0, 'stdout': ssh.password + '\n', 'stderr': ''}
+        ]
+        conn = IBMSVCsshClient()
+        self.assertIsNone(conn.ssh_client)
+        with pytest.raises(AnsibleFailJson) as exc:
+            conn.apply_fleet()
+        result = exc.value.args[0]
+        self.assertEqual(result['msg'], 'Failed to run commands on clusters [cluster3]')
+        self.assertTrue(result['changed'])
+        self.assertEqual(result['clusters']['cluster1']['msg'], 'password\n')
+        self.assertEqual(result['clusters']['cluster2']['msg'], 'password2\n')
+        self.assertEqual(result['clusters']['cluster3'], {'msg': 'Failed to connect', 'failed': True})
+        self.assertEqual(set(c[0][0].clustername for c in disconnect_mock.call_args_list), {'cluster1', 'cluster2'})
+
+    @patch.object(IBMSVCssh, '_svc_connect', autospec=True)
+    def test_clusters_rejects_svcinfo(self, connect_mock):
+        set_module_args({
+            'username': 'username',
+            'password': 'password',
+            'command': ['svcinfo lssystem'],
+            'clusters': [{'clustername': 'cluster1'}]
+        })
+        with pytest.raises(AnsibleFailJson) as exc:
+            IBMSVCsshClient()
+        self.assertEqual(exc.value.args[0]['msg'], 'The command must start with svctask')
+        connect_mock.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main()